@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Adaptive Timeouts
+Per-device response times and the command timeouts derived from them
+
+VENDOR_TIMEOUTS is one table per vendor family: a CCR with 3 ports waits
+as long as a CRS326 with 26. Instead, every completed command records per
+device and command class (command with interface names masked, e.g.
+"show interface * transceiver"):
+
+- first_byte: send -> first byte
+- gap: longest silence between two reads once output started
+- total: send -> prompt
+
+Each is kept as EWMA and p99 over the last WINDOW_SIZE commands. After
+MIN_SAMPLES commands the class gets its own timeouts:
+
+    timeout = max(ewma, p99) * HEADROOM + MARGIN
+
+at least FLOORS and at most MAX_FACTOR x the vendor default. Fast devices
+give up quickly on a hung command, slow devices get more than the vendor
+default. A timeout under learned values drops the class back to the
+vendor defaults until it has been relearned.
+
+The statistics are stored per device in SQLite (device_latency_stats) and
+shown by /stats <device>.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import metrics
+
+STAGES = ('first_byte', 'gap', 'total')
+
+# Commands per class before the learned timeouts are used (0 = never)
+MIN_SAMPLES = 10
+# Commands kept for the p99
+WINDOW_SIZE = 100
+# Weight of the newest command in the EWMA
+EWMA_ALPHA = 0.2
+# timeout = max(ewma, p99) * HEADROOM + MARGIN
+HEADROOM = 3.0
+MARGIN = 1.0
+# Lower bound per timeout (seconds) and upper bound (x vendor default)
+FLOORS = {'first_byte': 3.0, 'gap': 2.0, 'total': 10.0}
+MAX_FACTOR = 2.0
+
+# Internal pseudo-commands: read like a command, but not learned or shown
+PROMPT_PROBE = '<prompt probe>'
+LIVENESS_PROBE = '<liveness probe>'
+BATCH_DRAIN = '<batch drain>'
+PROBE_COMMANDS = (PROMPT_PROBE, LIVENESS_PROBE, BATCH_DRAIN)
+
+
+def command_class(command: str) -> str:
+    """Statistics key of a command - same masking as the metric labels"""
+    return metrics.command_label(command)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # ceil, not round: with 51 samples the p99 is the slowest one
+    rank = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class LatencyStats:
+    """Response times of one command class on one device"""
+    command_class: str
+    samples: int = 0
+    ewma: Dict[str, float] = field(default_factory=dict)
+    # (first_byte, gap, total) of the last WINDOW_SIZE commands
+    window: List[Tuple[float, float, float]] = field(default_factory=list)
+    updated_at: Optional[str] = None
+
+    def observe(self, first_byte: float, gap: float, total: float):
+        values = dict(zip(STAGES, (first_byte, gap, total)))
+        for stage, value in values.items():
+            previous = self.ewma.get(stage)
+            self.ewma[stage] = value if previous is None else (
+                EWMA_ALPHA * value + (1 - EWMA_ALPHA) * previous)
+        self.window.append((first_byte, gap, total))
+        del self.window[:-WINDOW_SIZE]
+        self.samples += 1
+
+    def reset(self):
+        self.samples = 0
+        self.ewma = {}
+        self.window = []
+
+    def p99(self, stage: str) -> float:
+        index = STAGES.index(stage)
+        return percentile([sample[index] for sample in self.window], 0.99)
+
+    @property
+    def learned(self) -> bool:
+        return MIN_SAMPLES > 0 and self.samples >= MIN_SAMPLES and bool(self.window)
+
+    def timeout(self, stage: str, default: float) -> float:
+        """Timeout for one stage - the vendor default until learned"""
+        if not self.learned:
+            return default
+        observed = max(self.ewma.get(stage, 0.0), self.p99(stage))
+        learned = max(observed * HEADROOM + MARGIN, FLOORS[stage])
+        return min(learned, default * MAX_FACTOR)
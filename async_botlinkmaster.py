@@ -0,0 +1,807 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Async Device Connection Module
+asyncio-native SSH/Telnet sessions
+
+AsyncBotLinkMaster has the same public surface as BotLinkMaster, as
+coroutines:
+
+    async with AsyncBotLinkMaster(config) as bot:
+        interfaces = await bot.get_interfaces()
+        info = await bot.check_interface_with_optical('Gi0/1')
+
+A session is a few asyncio streams instead of an OS thread sleeping in a
+read loop, so one event loop can hold hundreds of devices:
+
+    await asyncio.gather(*(check(config) for config in configs))
+
+- SSH: asyncssh (optional dependency, pip install asyncssh), with the
+  same legacy KEX/cipher/key lists as the paramiko transport
+- Telnet: TelnetStream, a minimal option negotiation on asyncio streams
+  (telnetlib is removed in Python 3.13). Login is event-driven: the
+  username/password are sent as soon as the device asks for them.
+
+Vendor commands, prompt handling, parsers, metrics and the NX-OS
+description cache come from BotLinkMasterBase, the I/O-free half of
+BotLinkMaster; none of the blocking socket code is inherited.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import asyncio
+import logging
+import socket
+import time
+from typing import Optional, List, Dict, Any, AsyncIterable, AsyncIterator
+
+try:
+    import asyncssh
+    ASYNCSSH_AVAILABLE = True
+except ImportError:
+    ASYNCSSH_AVAILABLE = False
+
+from adaptive_timeouts import BATCH_DRAIN, LIVENESS_PROBE, PROMPT_PROBE
+from botlinkmaster import (
+    BotLinkMasterBase, Protocol, TelnetCodec, ANSI_ESCAPE, IAC, nxos_description_cache
+)
+from vendor_commands import (
+    expand_interface_name, parse_mikrotik_interfaces, parse_mikrotik_terse
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# TELNET
+# ============================================================================
+
+OPTION_ECHO = 1
+OPTION_SGA = 3
+
+
+class TelnetStream:
+    """
+    Telnet connection on asyncio streams
+
+    Options are negotiated as a plain line-mode client (TelnetCodec): the
+    server may echo (ECHO) and suppress go-ahead (SGA), every other
+    option is refused.
+    """
+
+    # Options the server may enable on its side
+    ACCEPTED_OPTIONS = (OPTION_ECHO, OPTION_SGA)
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._codec = TelnetCodec(writer.write, self.ACCEPTED_OPTIONS)
+
+    async def read(self, timeout: float) -> bytes:
+        """
+        Data bytes of one read, blocking up to timeout
+
+        Returns b'' if nothing arrived in time. Raises EOFError if the
+        connection was closed by the device.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        while True:
+            try:
+                raw = await asyncio.wait_for(self.reader.read(65535),
+                                             max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                return b""
+            if not raw:
+                raise EOFError("Telnet connection closed")
+            data = self._codec.feed(raw)
+            # A read with negotiation only - keep waiting for data
+            if data or loop.time() >= deadline:
+                return data
+
+    def write(self, data: bytes):
+        self.writer.write(data.replace(bytes([IAC]), bytes([IAC, IAC])))
+
+    async def drain(self):
+        await self.writer.drain()
+
+    def close(self):
+        self.writer.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing()
+
+
+# ============================================================================
+# ASYNC CONNECTION
+# ============================================================================
+
+async def aiter_lines(chunks: AsyncIterable[str]) -> AsyncIterator[str]:
+    """Async version of botlinkmaster.iter_lines()"""
+    pending = ''
+    try:
+        async for chunk in chunks:
+            pending += chunk
+            if '\n' not in chunk:
+                continue
+            *complete, pending = pending.split('\n')
+            for line in complete:
+                yield ANSI_ESCAPE.sub('', line).replace('\r', '')
+        if pending:
+            yield ANSI_ESCAPE.sub('', pending).replace('\r', '')
+    finally:
+        aclose = getattr(chunks, 'aclose', None)
+        if aclose:
+            await aclose()
+
+
+class AsyncBotLinkMaster(BotLinkMasterBase):
+    """
+    Network device connection on asyncio
+
+    The public methods of BotLinkMaster as coroutines. Session state and
+    output parsing come from BotLinkMasterBase; every method that touches
+    the connection is defined here. For SSH, client is the
+    asyncssh connection and shell the interactive process; for Telnet,
+    client is a TelnetStream.
+    """
+
+    async def connect(self) -> bool:
+        self.phase_times = {}
+        try:
+            if self.config.protocol == Protocol.SSH:
+                connected = await self._connect_ssh()
+            elif self.config.protocol == Protocol.TELNET:
+                connected = await self._connect_telnet()
+            else:
+                return False
+        except Exception as e:
+            logger.error(f"Connection failed: {str(e)}")
+            await self.disconnect()
+            return False
+
+        if self.phase_times:
+            phases = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in self.phase_times.items())
+            logger.info(f"Connect phases ({self.config.host}): {phases}")
+        return connected
+
+    async def _open_socket(self) -> socket.socket:
+        """TCP connect (non-blocking socket), timed apart from login"""
+        loop = asyncio.get_running_loop()
+        with self._phase('tcp_connect'):
+            addresses = await loop.getaddrinfo(self.config.host, self.config.port,
+                                               type=socket.SOCK_STREAM)
+            last_error = None
+            for family, sock_type, proto, _, address in addresses:
+                sock = socket.socket(family, sock_type, proto)
+                sock.setblocking(False)
+                try:
+                    await asyncio.wait_for(loop.sock_connect(sock, address), self.config.timeout)
+                    return sock
+                except (OSError, asyncio.TimeoutError) as e:
+                    sock.close()
+                    last_error = e
+            raise last_error or OSError(f"No address for {self.config.host}")
+
+    @staticmethod
+    def _asyncssh_algorithms(algorithms: List[str], preferred: Optional[str],
+                             available: List[bytes]) -> List[str]:
+        """Legacy list in BotLinkMaster order, limited to what asyncssh implements"""
+        return [a for a in BotLinkMasterBase._prefer(algorithms, preferred) if a.encode() in available]
+
+    async def _connect_ssh(self) -> bool:
+        """SSH via asyncssh with the legacy algorithm lists"""
+        if not ASYNCSSH_AVAILABLE:
+            logger.error("AsyncBotLinkMaster SSH needs asyncssh (pip install asyncssh)")
+            return False
+
+        logger.info(f"Connecting to {self.config.host}:{self.config.port} via SSH (asyncssh)...")
+        self._attempt_method = 'asyncssh'
+
+        hints = self.config.preferred_algorithms or {}
+        sock = await self._open_socket()
+        try:
+            with self._phase('ssh_handshake'):
+                self.client = await asyncio.wait_for(asyncssh.connect(
+                    self.config.host, self.config.port, sock=sock,
+                    username=self.config.username,
+                    password=self.config.password,
+                    known_hosts=None,
+                    agent_path=None,
+                    preferred_auth='password,keyboard-interactive',
+                    kex_algs=self._asyncssh_algorithms(
+                        self.LEGACY_KEX, None, asyncssh.kex.get_kex_algs()),
+                    encryption_algs=self._asyncssh_algorithms(
+                        self.LEGACY_CIPHERS, hints.get('cipher'),
+                        asyncssh.encryption.get_encryption_algs()),
+                    server_host_key_algs=self._asyncssh_algorithms(
+                        self.LEGACY_KEY_TYPES, hints.get('key_type'),
+                        asyncssh.public_key.get_public_key_algs()),
+                ), self.config.timeout)
+        except (asyncssh.Error, OSError, asyncio.TimeoutError) as e:
+            sock.close()
+            logger.error(f"SSH error: {str(e) or type(e).__name__}")
+            return False
+
+        self.shell = await self.client.create_process(
+            term_type='vt100', term_size=(200, 50), encoding=None,
+        )
+
+        if not await self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
+            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
+
+        await self._learn_prompt()
+        await self._disable_paging()
+
+        self.negotiated_algorithms = {
+            'cipher': self.client.get_extra_info('send_cipher') or '',
+        }
+        self.connected = True
+        self.connection_method = "asyncssh"
+        logger.info(f"SSH connected (asyncssh) to {self.config.host}")
+        return True
+
+    async def _connect_telnet(self) -> bool:
+        """Telnet with event-driven login (no fixed sleeps)"""
+        logger.info(f"Connecting to {self.config.host}:{self.config.port} via Telnet...")
+        self._attempt_method = 'telnet'
+
+        try:
+            sock = await self._open_socket()
+        except asyncio.TimeoutError:
+            logger.error(f"Telnet connection timeout to {self.config.host}")
+            return False
+        except ConnectionRefusedError:
+            logger.error(f"Telnet connection refused by {self.config.host}")
+            return False
+
+        reader, writer = await asyncio.open_connection(sock=sock)
+        self.client = TelnetStream(reader, writer)
+
+        login_start = time.perf_counter()
+        login_timeout = self.timeouts.get('prompt_timeout', 30)
+
+        step = await self._expect_login(login_timeout)
+        if step == 'username':
+            logger.info(f"Telnet: Sending username: {self.config.username}")
+            await self._send_line(self.config.username)
+            step = await self._expect_login(login_timeout)
+        if step == 'password':
+            logger.info("Telnet: Sending password...")
+            await self._send_line(self.config.password)
+            step = await self._expect_login(login_timeout)
+
+        self._record_phase('telnet_login', time.perf_counter() - login_start)
+
+        if step in ('username', 'password'):
+            logger.error(f"Telnet: Login rejected by {self.config.host}")
+            await self.disconnect()
+            return False
+        if step is None:
+            self._timeout('prompt')
+            logger.warning("Telnet: Timeout waiting for prompt after login, continuing anyway...")
+
+        await self._learn_prompt()
+        await self._disable_paging()
+
+        self.connected = True
+        self.connection_method = "telnet"
+        logger.info(f"Telnet connected to {self.config.host}")
+        return True
+
+    async def _expect_login(self, timeout: float) -> Optional[str]:
+        """
+        Wait for the next login step
+
+        Returns 'username', 'password', 'prompt' (logged in) or None on
+        timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        tail = b""
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+
+            data = await self._recv(remaining)
+            if not data:
+                continue
+
+            tail = self._ring_tail(tail, data)
+            text = tail.decode('utf-8', errors='ignore')
+            last_line = self._last_line(text)
+
+            for step, regex in self.TELNET_LOGIN_PROMPTS:
+                if regex.search(last_line):
+                    logger.info(f"Telnet: Got {step} prompt")
+                    return step
+            if self._is_prompt(text):
+                return 'prompt'
+
+    async def _wait_for_prompt(self, timeout: int = 30) -> bool:
+        """Wait for shell prompt to appear - checks the buffer tail only"""
+        logger.info(f"Waiting for prompt (timeout={timeout}s)...")
+        loop = asyncio.get_running_loop()
+
+        with self._phase('wait_prompt'):
+            received = 0
+            tail = b""
+            deadline = loop.time() + timeout
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                try:
+                    data = await self._recv(remaining)
+                except EOFError:
+                    logger.warning("Connection closed while waiting for prompt")
+                    return False
+
+                if not data:
+                    continue
+
+                received += len(data)
+                tail = self._ring_tail(tail, data)
+
+                if self._is_prompt(tail.decode('utf-8', errors='ignore')):
+                    logger.info(f"Prompt detected! Buffer size: {received}")
+                    return True
+
+        logger.warning(f"Prompt timeout. Buffer ({received} bytes)")
+        self._timeout('prompt')
+        return False
+
+    async def _learn_prompt(self) -> bool:
+        """Capture the exact prompt string once after login"""
+        self._prompt = None
+        with self._phase('learn_prompt'):
+            try:
+                await self._send_line("")
+                output = await self._read_until_prompt(PROMPT_PROBE, self.timeouts['idle_timeout'])
+            except Exception as e:
+                logger.warning(f"Prompt probe failed: {e}")
+                return False
+
+        last_line = self._last_line(output).strip()
+        if last_line and self._is_prompt(last_line):
+            self._prompt = last_line
+            logger.info(f"Prompt learned: {self._prompt!r}")
+            return True
+
+        logger.warning("Could not learn prompt, using prompt patterns")
+        return False
+
+    async def _disable_paging(self):
+        command = self._paging_command()
+        if command:
+            with self._phase('disable_paging'):
+                self._apply_paging_result(command, await self._execute(command, 2.0))
+
+    async def _send_line(self, line: str):
+        """Send one command line to the session"""
+        if self.config.protocol == Protocol.TELNET:
+            self.client.write(line.replace('\n', '\r\n').encode('ascii') + b"\r\n")
+            await self.client.drain()
+        else:
+            self.shell.stdin.write((line + "\n").encode('utf-8'))
+            await self.shell.stdin.drain()
+
+    async def _send_keys(self, keys: str):
+        """Send keystrokes without a line ending (pager answers)"""
+        if self.config.protocol == Protocol.TELNET:
+            self.client.write(keys.encode('ascii'))
+            await self.client.drain()
+        else:
+            self.shell.stdin.write(keys.encode('utf-8'))
+            await self.shell.stdin.drain()
+
+    async def _recv(self, timeout: float) -> bytes:
+        """
+        Read one chunk from the session, waiting up to timeout
+
+        Returns b'' if nothing arrived in time. Raises EOFError if the
+        connection was closed by the device.
+        """
+        if self.config.protocol == Protocol.TELNET:
+            return await self.client.read(timeout)
+
+        try:
+            data = await asyncio.wait_for(self.shell.stdout.read(65535), max(0.0, timeout))
+        except asyncio.TimeoutError:
+            return b""
+        if not data:
+            raise EOFError("SSH channel closed")
+        return data
+
+    async def _flush_input(self):
+        """Discard data that is already buffered before sending a command"""
+        try:
+            while await self._recv(0):
+                pass
+        except EOFError:
+            self.connected = False
+
+    async def _stream_until_prompt(self, command: str, wait_time: float,
+                                   hard_timeout: Optional[float] = None,
+                                   until_echo: Optional[str] = None,
+                                   whole: bool = False) -> AsyncIterator[str]:
+        """
+        Yield decoded command output until the device prompt comes back
+
+        Only the receive is asynchronous: timeouts, prompt, pager and echo
+        handling are BotLinkMasterBase._feed_read(), as in
+        BotLinkMaster._stream_until_prompt().
+        """
+        loop = asyncio.get_running_loop()
+        read = self._start_read(command, wait_time, loop.time(), hard_timeout, until_echo, whole)
+        while True:
+            wait = self._read_wait(read, loop.time())
+            if wait <= 0:
+                break
+            try:
+                data = await self._recv(wait)
+            except EOFError:
+                self._read_closed(read)
+                break
+            if not data:
+                continue
+
+            event = self._feed_read(read, data, loop.time())
+            if event.answer_pager:
+                await self._send_keys(' ')
+            if event.lines:
+                try:
+                    yield event.lines
+                except GeneratorExit:
+                    # Consumer stopped early - read up to the prompt, no more yields
+                    read.draining = True
+            if event.done:
+                break
+
+        rest = self._finish_read(read, loop.time())
+        if rest:
+            yield rest
+
+    async def _read_until_prompt(self, command: str, wait_time: float,
+                                 hard_timeout: Optional[float] = None,
+                                 until_echo: Optional[str] = None) -> str:
+        return ''.join([text async for text in
+                        self._stream_until_prompt(command, wait_time, hard_timeout, until_echo,
+                                                  whole=True)])
+
+    async def execute_command(self, command: str, wait_time: float = None) -> str:
+        """Execute command with vendor-specific timeout if not specified"""
+        if not self.connected:
+            return ""
+
+        if wait_time is None:
+            wait_time = self.timeouts.get('command_wait', self.timeouts['initial_wait'])
+        return await self._execute(command, wait_time)
+
+    async def _execute(self, command: str, wait_time: float) -> str:
+        try:
+            await self._flush_input()
+            logger.info(f"Executing: {command}")
+            await self._send_line(command)
+            output = await self._read_until_prompt(command, wait_time)
+            return self._clean_output(output, command)
+        except Exception as e:
+            logger.error(f"Command error: {str(e)}")
+            return ""
+
+    async def execute_batch(self, commands: List[str], wait_time: float = None) -> List[str]:
+        """Execute several commands with one round trip - see BotLinkMaster.execute_batch()"""
+        unique = list(dict.fromkeys(commands))
+        if not self._can_pipeline(unique):
+            outputs = {cmd: await self.execute_command(cmd, wait_time) for cmd in unique}
+            return [outputs[cmd] for cmd in commands]
+
+        if wait_time is None:
+            wait_time = self.timeouts.get('command_wait', self.timeouts['initial_wait'])
+
+        output = ""
+        try:
+            await self._flush_input()
+            logger.info(f"Executing batch: {' | '.join(unique)}")
+            await self._send_line('\n'.join(unique))
+            output = await self._read_until_prompt(' | '.join(unique), wait_time, until_echo=unique[-1])
+        except Exception as e:
+            logger.error(f"Batch execute error: {e}")
+
+        split = self._batch_outputs(output, unique)
+        if None in split:
+            drain_echo = self._batch_drain_echo(output, unique)
+            if drain_echo is not None and self.connected:
+                try:
+                    await self._read_until_prompt(BATCH_DRAIN, wait_time, until_echo=drain_echo or None)
+                except Exception as e:
+                    logger.error(f"Batch drain error: {e}")
+            split = [await self.execute_command(cmd, wait_time) if out is None else out
+                     for cmd, out in zip(unique, split)]
+
+        outputs = dict(zip(unique, split))
+        return [outputs[cmd] for cmd in commands]
+
+    async def stream_command(self, command: str, wait_time: float = None) -> AsyncIterator[str]:
+        """
+        Execute command and yield clean output lines as they arrive
+
+        Consume or aclose() the generator before the next command.
+        """
+        if not self.connected:
+            return
+
+        if wait_time is None:
+            wait_time = self.timeouts.get('command_wait', self.timeouts['initial_wait'])
+
+        try:
+            await self._flush_input()
+            logger.info(f"Streaming: {command}")
+            await self._send_line(command)
+        except Exception as e:
+            logger.error(f"Command error: {str(e)}")
+            return
+
+        async for line in aiter_lines(self._stream_until_prompt(command, wait_time)):
+            yield line
+
+    async def _command_lines(self, command: str, wait_time: float = None) -> List[str]:
+        """All output lines of command (input for the line parsers)"""
+        return [line async for line in self.stream_command(command, wait_time)]
+
+    # ------------------------------------------------------------------------
+    # Interfaces
+    # ------------------------------------------------------------------------
+
+    async def get_interfaces(self) -> List[Dict[str, Any]]:
+        """Get all interfaces with status"""
+        interface_parser = getattr(self.vendor_config, 'interface_parser', 'default')
+
+        interfaces = await self._get_structured_interfaces()
+        if interfaces:
+            if interface_parser == 'cisco_nxos':
+                self._merge_nxos_descriptions(interfaces, await self._get_all_nxos_descriptions())
+            return interfaces
+
+        if interface_parser == 'mikrotik':
+            return await self._get_mikrotik_interfaces()
+
+        if interface_parser == 'cisco_nxos':
+            return await self._get_cisco_nxos_interfaces()
+
+        outputs = await self.execute_batch(self._interface_listing_commands(), wait_time=5.0)
+        output = self._first_interface_listing(outputs)
+
+        if not output:
+            return []
+
+        return self._parse_default_interfaces(output)
+
+    async def _get_structured_interfaces(self) -> Optional[List[Dict[str, Any]]]:
+        cmd = self.vendor_config.structured_interface_command
+        if not cmd or self._structured_rejected:
+            return None
+
+        logger.info(f"{self.vendor_config.name}: Trying {cmd}")
+        return self._parse_structured_output(cmd, await self.execute_command(cmd))
+
+    async def _get_cisco_nxos_interfaces(self) -> List[Dict[str, Any]]:
+        outputs = await self.execute_batch(self.NXOS_INTERFACE_COMMANDS, wait_time=5.0)
+        interfaces = self._parse_nxos_listings(outputs)
+
+        if not interfaces:
+            return self._parse_default_interfaces(outputs[-1])
+
+        self._merge_nxos_descriptions(interfaces, await self._get_all_nxos_descriptions())
+        return interfaces
+
+    async def _get_all_nxos_descriptions(self) -> Dict[str, str]:
+        descriptions = await self._get_cached_nxos_descriptions()
+        return descriptions if descriptions is not None else {}
+
+    async def _get_cached_nxos_descriptions(self) -> Optional[Dict[str, str]]:
+        """NX-OS descriptions from the cache shared with BotLinkMaster"""
+        descriptions = nxos_description_cache.fresh(self._nxos_cache_key, self.NXOS_DESCRIPTION_TTL)
+        if descriptions is not None:
+            return descriptions
+
+        marker = None
+        if self.NXOS_DESCRIPTION_TTL > 0:
+            marker = self._parse_nxos_config_marker(
+                await self._command_lines(self.NXOS_CONFIG_MARKER_COMMAND, wait_time=5.0)
+            )
+        descriptions = self._nxos_revalidate(marker)
+        if descriptions is not None:
+            return descriptions
+
+        descriptions = await self._harvest_nxos_descriptions()
+        self._nxos_cache_store(descriptions, marker)
+        return descriptions
+
+    async def _harvest_nxos_descriptions(self) -> Optional[Dict[str, str]]:
+        descriptions, invalid = self._parse_nxos_descriptions(
+            await self._command_lines("show running-config | section ^interface", wait_time=10.0)
+        )
+        if invalid and not descriptions:
+            descriptions, invalid = self._parse_nxos_descriptions(
+                await self._command_lines("show running-config", wait_time=15.0)
+            )
+            if invalid and not descriptions:
+                return None
+
+        logger.info(f"NX-OS: Got {len(descriptions)//2} descriptions from running-config")
+        return descriptions
+
+    async def _get_mikrotik_interfaces(self) -> List[Dict[str, Any]]:
+        output = await self.execute_command(self.MIKROTIK_COUNT_COMMAND, wait_time=5.0)
+        expected_count = self._parse_mikrotik_count(output)
+        if expected_count:
+            logger.info(f"MikroTik: Expected approximately {expected_count} interfaces")
+
+        wait_time = self.timeouts.get('command_wait', 45.0)
+
+        for cmd in self.MIKROTIK_INTERFACE_COMMANDS:
+            logger.info(f"MikroTik: Trying {cmd}")
+            interfaces = parse_mikrotik_interfaces(
+                await self._command_lines(cmd, wait_time=wait_time), self.prompt
+            )
+            logger.info(f"MikroTik: Parsed {len(interfaces)} interfaces")
+            if interfaces:
+                return interfaces
+
+        return []
+
+    async def get_interface_status(self, interface_name: str) -> Dict[str, Any]:
+        """Get specific interface status"""
+        if self.config.vendor.lower() == 'mikrotik':
+            return await self._get_mikrotik_interface_status(interface_name)
+
+        if self.config.vendor.lower() == 'cisco_nxos':
+            return await self._get_cisco_nxos_interface_status(interface_name)
+
+        full_interface = expand_interface_name(interface_name)
+
+        cmd = self.vendor_config.show_interface.format(interface=full_interface)
+        output = await self.execute_command(cmd, wait_time=5.0)
+
+        if not output or self._is_command_error(output):
+            self._fallback('interface_name')
+            cmd = self.vendor_config.show_interface.format(interface=interface_name)
+            output = await self.execute_command(cmd, wait_time=5.0)
+
+        return self._interface_status_result(interface_name, full_interface, output)
+
+    async def _get_cisco_nxos_interface_status(self, interface_name: str) -> Dict[str, Any]:
+        result = self._new_nxos_status(interface_name)
+
+        output = await self.execute_command("show interface status", wait_time=5.0)
+        self._apply_nxos_status_table(result, output, interface_name)
+
+        descriptions = await self._get_cached_nxos_descriptions()
+        if descriptions is not None:
+            desc_from_config = self._lookup_nxos_description(descriptions, interface_name)
+        else:
+            self._fallback('nxos_config_interface')
+            desc_from_config = self._parse_nxos_config_description(await self.execute_command(
+                f"show running-config interface {interface_name}", wait_time=5.0))
+        if desc_from_config:
+            result['description'] = desc_from_config
+
+        if result['status'] == 'unknown':
+            output2 = await self.execute_command(f"show interface {interface_name}", wait_time=5.0)
+            self._apply_nxos_interface_output(result, output2)
+
+        return result
+
+    async def _get_mikrotik_interface_status(self, interface_name: str) -> Dict[str, Any]:
+        result = self._new_mikrotik_status(interface_name)
+
+        lines = await self._command_lines(self._mikrotik_single_command(interface_name), wait_time=10.0)
+        for iface in parse_mikrotik_terse(lines, self.prompt):
+            if iface['name'] == interface_name:
+                result['status'] = iface['status']
+                result['description'] = iface['description']
+                result['flags'] = iface['flags']
+                return result
+
+        self._fallback('mikrotik_listing')
+        interfaces = await self._get_mikrotik_interfaces()
+        return self._mikrotik_status_from_listing(result, interfaces, interface_name)
+
+    # ------------------------------------------------------------------------
+    # Optical
+    # ------------------------------------------------------------------------
+
+    async def get_optical_power(self, interface_name: str) -> Dict[str, Any]:
+        """Get optical power readings - learned command alone, else all candidates in one batch"""
+        full_interface = expand_interface_name(interface_name)
+        candidates = self._optical_candidates(interface_name, full_interface)
+        wait_time = self.timeouts.get('command_wait', 10.0)
+
+        learned = self._learned_optical_command(interface_name, full_interface)
+        if learned:
+            output = await self.execute_command(learned, wait_time=wait_time)
+            if output and not self._is_optical_error(output):
+                result, successful_cmd, all_output = self._select_optical([learned], [output])
+                return self._finish_optical(result, successful_cmd, interface_name,
+                                            full_interface, all_output)
+            self._learned_optical_failed(learned, output)
+            candidates.pop(learned, None)
+
+        commands = list(candidates)
+        outputs = await self.execute_batch(commands, wait_time=wait_time)
+        result, successful_cmd, all_output = self._select_optical(commands, outputs)
+        if successful_cmd:
+            self._set_optical_command(candidates[successful_cmd])
+
+        return self._finish_optical(result, successful_cmd, interface_name, full_interface, all_output)
+
+    async def get_all_optical_power(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Optical power of every interface with one bulk command (None if unsupported)"""
+        cmd = self.vendor_config.show_optical_all
+        if not cmd:
+            return None
+
+        output = await self.execute_command(cmd, wait_time=self.timeouts.get('command_wait', 10.0))
+        return self._parse_optical_bulk(cmd, output)
+
+    async def check_interface_with_optical(self, interface_name: str) -> Dict[str, Any]:
+        """Get complete interface info with optical"""
+        interface_info = await self.get_interface_status(interface_name)
+        optical_info = await self.get_optical_power(interface_name)
+        return self._merge_interface_optical(interface_name, interface_info, optical_info)
+
+    # ------------------------------------------------------------------------
+    # Session
+    # ------------------------------------------------------------------------
+
+    async def is_alive(self, timeout: float = 5.0) -> bool:
+        """Liveness probe: blank line, prompt expected back within timeout"""
+        if not self.connected or not self.client:
+            return False
+        if self.config.protocol == Protocol.TELNET and self.client.closed:
+            return False
+        if self.config.protocol == Protocol.SSH and (not self.shell or self.shell.is_closing()):
+            return False
+
+        try:
+            await self._flush_input()
+            await self._send_line("")
+            output = await self._read_until_prompt(LIVENESS_PROBE, timeout, hard_timeout=timeout)
+            return bool(output) and self._is_prompt(output[-self.PROMPT_TAIL_WINDOW:])
+        except Exception as e:
+            logger.info(f"Liveness probe failed for {self.config.host}: {e}")
+            return False
+
+    async def disconnect(self):
+        try:
+            if self.shell:
+                self.shell.close()
+                self.shell = None
+            if self.client:
+                self.client.close()
+                if self.config.protocol == Protocol.SSH:
+                    await self.client.wait_closed()
+                self.client = None
+            self.connected = False
+            logger.info(f"Disconnected from {self.config.host}")
+        except Exception as e:
+            logger.error(f"Disconnect error: {str(e)}")
+
+    def __enter__(self):
+        raise TypeError("AsyncBotLinkMaster is used with 'async with'")
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Device Session Benchmarks
+End-to-end timing of BotLinkMaster against the simulated device
+
+Usage:
+    python benchmarks/bench_device.py                         # default vendors, SSH + Telnet
+    python benchmarks/bench_device.py --vendor huawei --protocol telnet
+    python benchmarks/bench_device.py --latency 0.2 --rate 20000 --scale 10
+
+For every vendor/protocol a DeviceSimulator (benchmarks/device_sim.py) is
+started on 127.0.0.1 and BotLinkMaster runs the same operations as the
+bot: connect, get_interfaces() (/int) and check_interface_with_optical()
+(/cek). Per operation the harness reports:
+
+- total:    wall time of the operation
+- ttfb:     send of the first command -> first output byte after the echo
+- device:   time the simulator spent in latency / rate pacing
+- ours:     total - device = time spent in BotLinkMaster itself
+            (sleeps, timeouts, fallbacks, parsing)
+- cmds, bytes, KB/s
+
+Numbers are medians over --runs sessions. With --latency 0 the device
+time is zero and "ours" is exactly our own cost.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig, Protocol  # noqa: E402
+from vendor_commands import Vendor  # noqa: E402
+from device_sim import DeviceSimulator, make_profile  # noqa: E402
+
+DEFAULT_VENDORS = ['cisco_ios', 'cisco_nxos', 'huawei', 'juniper', 'mikrotik']
+
+
+class OpTiming(NamedTuple):
+    total: float
+    ttfb: Optional[float]
+    device: float
+    commands: int
+    received: int
+
+
+class SessionProbe:
+    """
+    Records sends and receives of one BotLinkMaster session
+
+    Wraps the instance's _send_line() and _recv() - the two points every
+    command passes through - without changing what they do.
+    """
+
+    def __init__(self, bot: BotLinkMaster):
+        self.sends: List[Tuple[float, str]] = []
+        self.chunks: List[Tuple[float, int]] = []
+
+        send_line, recv = bot._send_line, bot._recv
+
+        def probed_send_line(line: str):
+            self.sends.append((time.perf_counter(), line))
+            return send_line(line)
+
+        def probed_recv(timeout: float) -> bytes:
+            data = recv(timeout)
+            if data:
+                self.chunks.append((time.perf_counter(), len(data)))
+            return data
+
+        bot._send_line = probed_send_line
+        bot._recv = probed_recv
+
+    def mark(self) -> Tuple[int, int]:
+        return len(self.sends), len(self.chunks)
+
+    def since(self, mark: Tuple[int, int]) -> Tuple[List[Tuple[float, str]], List[Tuple[float, int]]]:
+        return self.sends[mark[0]:], self.chunks[mark[1]:]
+
+    @staticmethod
+    def first_output_byte(sends: List[Tuple[float, str]],
+                          chunks: List[Tuple[float, int]]) -> Optional[float]:
+        """Time from the first command to its first byte after the echo"""
+        if not sends:
+            return None
+        sent_at, line = sends[0]
+        echo = len(line) + 2
+        received = 0
+        for at, size in chunks:
+            if at < sent_at:
+                continue
+            received += size
+            if received > echo:
+                return at - sent_at
+        return None
+
+
+def timed(sim: DeviceSimulator, probe: Optional[SessionProbe], func: Callable[[], Any]) -> OpTiming:
+    mark = probe.mark() if probe else (0, 0)
+    device_before = sim.device_time
+    start = time.perf_counter()
+    func()
+    total = time.perf_counter() - start
+    device = sim.device_time - device_before
+
+    if not probe:
+        return OpTiming(total, None, device, 0, 0)
+    sends, chunks = probe.since(mark)
+    return OpTiming(
+        total=total,
+        ttfb=SessionProbe.first_output_byte(sends, chunks),
+        device=device,
+        commands=len(sends),
+        received=sum(size for _, size in chunks),
+    )
+
+
+def run_session(sim: DeviceSimulator, vendor: str, protocol: Protocol) -> Dict[str, OpTiming]:
+    """One connect + /int + /cek session, timing of every operation"""
+    port = sim.ssh_port if protocol == Protocol.SSH else sim.telnet_port
+    bot = BotLinkMaster(ConnectionConfig(
+        host='127.0.0.1', port=port, username=sim.username, password=sim.password,
+        protocol=protocol, vendor=vendor, timeout=10,
+    ))
+
+    results = {}
+    connected = []
+    results['connect'] = timed(sim, None, lambda: connected.append(bot.connect()))
+    if not connected[0]:
+        raise RuntimeError(f"connect failed ({vendor}/{protocol.value})")
+
+    probe = SessionProbe(bot)
+    interface = sim.profile.interface
+    try:
+        results['/int  get_interfaces'] = timed(sim, probe, bot.get_interfaces)
+        results['/cek  check_interface_with_optical'] = timed(
+            sim, probe, lambda: bot.check_interface_with_optical(interface))
+    finally:
+        bot.disconnect()
+    return results
+
+
+def median(values: List[float]) -> float:
+    return statistics.median(values) if values else 0.0
+
+
+def report(label: str, runs: List[Dict[str, OpTiming]]):
+    for op in runs[0]:
+        timings = [r[op] for r in runs]
+        total = median([t.total for t in timings])
+        device = median([t.device for t in timings])
+        ttfbs = [t.ttfb for t in timings if t.ttfb is not None]
+        ttfb = f"{median(ttfbs) * 1000:8.1f}" if ttfbs else f"{'-':>8}"
+        received = int(median([t.received for t in timings]))
+        rate = f"{received / total / 1024:8.1f}" if received and total else f"{'-':>8}"
+        commands = timings[0].commands or '-'
+        print(f"{label:<22} {op:<36} {total * 1000:9.1f} {ttfb} {device * 1000:9.1f} "
+              f"{(total - device) * 1000:9.1f} {commands:>5} {received:>8} {rate}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='BotLinkMaster device session benchmarks')
+    parser.add_argument('--vendor', action='append', choices=[v.value for v in Vendor],
+                        help=f"vendor to simulate (repeatable, default: {' '.join(DEFAULT_VENDORS)})")
+    parser.add_argument('--protocol', choices=['ssh', 'telnet', 'both'], default='both')
+    parser.add_argument('--runs', type=int, default=3, help='sessions per vendor/protocol (default 3)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='simulated seconds before each output (default 0.05)')
+    parser.add_argument('--login-latency', type=float, default=0.0,
+                        help='simulated seconds from login to first prompt')
+    parser.add_argument('--rate', type=float, default=0.0, help='simulated output bytes/s (0 = unlimited)')
+    parser.add_argument('--scale', type=int, default=1, help='repeat every output N times')
+    parser.add_argument('--page-lines', type=int, default=24, help='lines per page before paging is disabled')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show BotLinkMaster log')
+    args = parser.parse_args()
+
+    # botlinkmaster configures logging on import - silence it unless asked
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    protocols = [Protocol.SSH, Protocol.TELNET] if args.protocol == 'both' else [Protocol(args.protocol)]
+
+    print(f"latency {args.latency * 1000:g}ms, login latency {args.login_latency * 1000:g}ms, "
+          f"rate {args.rate or 'unlimited'} B/s, scale x{args.scale}, median of {args.runs} runs\n")
+    print(f"{'vendor':<22} {'operation':<36} {'total ms':>9} {'ttfb ms':>8} {'device ms':>9} "
+          f"{'ours ms':>9} {'cmds':>5} {'bytes':>8} {'KB/s':>8}")
+    print('-' * 122)
+
+    failed = 0
+    for vendor in args.vendor or DEFAULT_VENDORS:
+        profile = make_profile(vendor, latency=args.latency, rate=args.rate, scale=args.scale,
+                               page_lines=args.page_lines, login_latency=args.login_latency)
+        with DeviceSimulator(profile) as sim:
+            sim.start(ssh_port=0 if Protocol.SSH in protocols else None,
+                      telnet_port=0 if Protocol.TELNET in protocols else None)
+            for protocol in protocols:
+                label = f"{vendor}/{protocol.value}"
+                try:
+                    runs = [run_session(sim, vendor, protocol) for _ in range(max(1, args.runs))]
+                except Exception as e:
+                    print(f"{label:<22} FAILED: {e}")
+                    failed += 1
+                    continue
+                report(label, runs)
+        print()
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
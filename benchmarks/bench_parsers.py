@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Parser Benchmarks
+Per-call latency and memory of the output parsers, with regression check
+
+Usage:
+    python benchmarks/bench_parsers.py                  # compare with baseline.json
+    python benchmarks/bench_parsers.py --save           # write a new baseline
+    python benchmarks/bench_parsers.py -k huawei        # only matching cases
+    python benchmarks/bench_parsers.py --threshold 1.3  # fail if >30% slower
+
+Every case is timed as runs of a fixed number of calls (chosen when the
+baseline is saved so one run takes at least --run-ms), alternated with
+runs of a fixed calibration loop in the same process. The gate compares
+best case run / best calibration run, so a slower or busier machine
+shifts both and the baseline stays valid across machines. Each case is
+also run once under tracemalloc for the peak memory of a call, and a
+fingerprint of the parse result is stored, so a change in what a parser
+returns for a fixture shows up as CHANGED next to any slowdown.
+
+Exit code 1 if a case is slower (relative to the calibration loop) or
+uses more memory than baseline x threshold, or returns a different result.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig  # noqa: E402
+from vendor_commands import (  # noqa: E402
+    OpticalParser, clean_mikrotik_output, parse_cisco_nxos_interfaces, parse_mikrotik_interfaces
+)
+import fixtures  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+# Memory growth below this is noise (interned strings, dict resizes)
+MEMORY_SLACK_KIB = 16.0
+
+# Calibration loop: line splitting and regex search, like the parsers
+CALIBRATION_TEXT = '\n'.join(
+    f"Gi1/0/{i:<3} uplink-{i:<10} connected    {i % 4000:<5} a-full a-1000 "
+    f"10/100/1000BaseTX  Rx -{i % 40}.{i % 10} dBm"
+    for i in range(200)
+)
+CALIBRATION_RE = re.compile(r'(-?\d+\.\d+)\s*dBm')
+
+
+class Case(NamedTuple):
+    name: str
+    func: Callable[[], Any]
+
+
+class Measurement(NamedTuple):
+    number: int
+    ms: float
+    relative: float
+    peak_kib: float
+    result: str
+
+
+def calibration() -> float:
+    total = 0.0
+    for line in CALIBRATION_TEXT.split('\n'):
+        match = CALIBRATION_RE.search(line)
+        if match:
+            total += float(match.group(1))
+        total += len(line.split())
+    return total
+
+
+def make_bot(vendor: str) -> BotLinkMaster:
+    """BotLinkMaster without a connection - only the parsing methods are used"""
+    return BotLinkMaster(ConnectionConfig(host='bench', username='', password='', vendor=vendor))
+
+
+def build_cases() -> List[Case]:
+    cases = []
+
+    for vendor, outputs in fixtures.VENDOR_OUTPUTS.items():
+        parser = OpticalParser(vendor)
+        bot = make_bot(vendor)
+        interface, optical, table = outputs['interface'], outputs['optical'], outputs['table']
+
+        cases.append(Case(f"optical.parse_optical_power[{vendor}]",
+                          lambda p=parser, o=optical: p.parse_optical_power(o)))
+        cases.append(Case(f"optical.parse_interface_status[{vendor}]",
+                          lambda p=parser, o=interface: p.parse_interface_status(o)))
+        cases.append(Case(f"optical.parse_description[{vendor}]",
+                          lambda p=parser, o=interface: p.parse_description(o)))
+
+        if vendor == 'mikrotik':
+            func = lambda o=table: parse_mikrotik_interfaces(o)
+        elif vendor == 'cisco_nxos':
+            func = lambda o=table: parse_cisco_nxos_interfaces(o)
+        else:
+            func = lambda b=bot, o=table: b._parse_default_interfaces(o)
+        cases.append(Case(f"interfaces[{vendor}]", func))
+
+    ios_chassis = fixtures.cisco_ios_chassis_status()
+    nxos_chassis = fixtures.nxos_chassis_status()
+    mikrotik_print = fixtures.mikrotik_ethernet_print()
+    running_config = fixtures.nxos_running_config()
+    colored_config = fixtures.ansi_colored(running_config)
+    ios_bot = make_bot('cisco_ios')
+    nxos_bot = make_bot('cisco_nxos')
+
+    cases += [
+        Case("interfaces[cisco_ios 384 ports]", lambda: ios_bot._parse_default_interfaces(ios_chassis)),
+        Case("interfaces[cisco_nxos 384 ports]", lambda: parse_cisco_nxos_interfaces(nxos_chassis)),
+        Case("interfaces[mikrotik 384 ports]", lambda: parse_mikrotik_interfaces(mikrotik_print)),
+        Case("clean_mikrotik_output[384 ports]", lambda: clean_mikrotik_output(mikrotik_print)),
+        Case("_clean_output[running-config 10k lines, ANSI]",
+             lambda: nxos_bot._clean_output(colored_config, 'show running-config')),
+        Case("_parse_nxos_descriptions[running-config 10k lines]",
+             lambda: nxos_bot._parse_nxos_descriptions(running_config.split('\n'))),
+    ]
+
+    for vendor, label, output in (
+        ('cisco_nxos', 'nxos 384 details', fixtures.nxos_transceiver_details()),
+        ('huawei', 'huawei 384 brief', fixtures.huawei_transceiver_brief()),
+        ('mikrotik', 'mikrotik 48 monitor', fixtures.mikrotik_monitor_all()),
+    ):
+        parser = OpticalParser(vendor)
+        cases.append(Case(f"optical.parse_optical_table[{label}]",
+                          lambda p=parser, o=output: p.parse_optical_table(o)))
+
+    return cases
+
+
+def fingerprint(result: Any) -> str:
+    data = json.dumps(result, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:12]
+
+
+def calls_per_run(func: Callable[[], Any], run_ms: float) -> int:
+    """Number of calls that take at least `run_ms` milliseconds"""
+    number = 1
+    while True:
+        elapsed_ms = timed_run(func, number) * 1e3
+        if elapsed_ms >= run_ms:
+            return number
+        # Aim 20% above run_ms, at least doubling
+        number = max(number * 2, math.ceil(number * run_ms * 1.2 / max(elapsed_ms, 1e-3)))
+
+
+def timed_run(func: Callable[[], Any], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def measure(func: Callable[[], Any], number: int, calibration_number: int,
+            repeat: int) -> Measurement:
+    """
+    Best of `repeat` runs of `number` calls, relative to the best
+    calibration run timed in between (same process, same moment)
+    """
+    best = best_calibration = float('inf')
+    for _ in range(repeat):
+        best_calibration = min(best_calibration, timed_run(calibration, calibration_number))
+        best = min(best, timed_run(func, number))
+
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(number=number, ms=best * 1e3, relative=best / best_calibration,
+                       peak_kib=peak / 1024, result=fingerprint(result))
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f).get('cases', {})
+
+
+def load_calibration_number(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return json.load(f).get('calibration_number', 0)
+
+
+def save_baseline(path: str, results: Dict[str, Measurement], calibration_number: int):
+    data = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'calibration_number': calibration_number,
+        'cases': {
+            name: {'number': m.number, 'ms': round(m.ms, 2), 'relative': round(m.relative, 4),
+                   'peak_kib': round(m.peak_kib, 1), 'result': m.result}
+            for name, m in sorted(results.items())
+        },
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def compare(m: Measurement, base: Dict[str, Any], threshold: float) -> List[str]:
+    """Problems of one case compared with its baseline entry"""
+    problems = []
+    if m.relative > base['relative'] * threshold:
+        problems.append('SLOWER')
+    if m.peak_kib > base['peak_kib'] * threshold and m.peak_kib - base['peak_kib'] > MEMORY_SLACK_KIB:
+        problems.append('MORE MEMORY')
+    if m.result != base.get('result', m.result):
+        problems.append('CHANGED')
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='BotLinkMaster parser benchmarks')
+    parser.add_argument('-k', dest='filter', default='', help='only cases containing this text')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='write the results as new baseline')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='fail if time/memory exceeds baseline x threshold (default 1.5)')
+    parser.add_argument('--run-ms', type=float, default=20.0,
+                        help='minimum milliseconds per timing run, used by --save (default 20)')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per case (default 5)')
+    args = parser.parse_args()
+
+    # Parser log lines would be part of the measured time
+    logging.disable(logging.INFO)
+
+    baseline = {} if args.save else load_baseline(args.baseline)
+    # Same calibration workload as the baseline, otherwise the ratios differ
+    calibration_number = load_calibration_number(args.baseline) or calls_per_run(calibration, args.run_ms)
+    results: Dict[str, Measurement] = {}
+    failed = 0
+
+    print(f"{'case':<56} {'calls':>6} {'ms/run':>8} {'x calib':>8} {'peak KiB':>9} {'vs base':>8}")
+    print('-' * 106)
+
+    for case in build_cases():
+        if args.filter and args.filter.lower() not in case.name.lower():
+            continue
+
+        base = baseline.get(case.name)
+        number = base['number'] if base else calls_per_run(case.func, args.run_ms)
+        m = measure(case.func, number, calibration_number, max(1, args.repeat))
+        results[case.name] = m
+
+        if base:
+            problems = compare(m, base, args.threshold)
+            ratio = f"x{m.relative / base['relative']:.2f}"
+            status = ', '.join(problems) or 'ok'
+            failed += bool(problems)
+        else:
+            ratio = ''
+            status = 'saved' if args.save else 'new'
+
+        print(f"{case.name:<56} {m.number:>6} {m.ms:>8.1f} {m.relative:>8.3f} "
+              f"{m.peak_kib:>9.1f} {ratio:>8}  {status}")
+
+    if args.save:
+        if args.filter:
+            # Keep the other cases of the existing baseline
+            merged = {name: Measurement(**entry) for name, entry in load_baseline(args.baseline).items()}
+            merged.update(results)
+            results = merged
+        save_baseline(args.baseline, results, calibration_number)
+        print(f"\nBaseline saved: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline} - run with --save first")
+        return 0
+
+    if failed:
+        print(f"\n{failed} case(s) regressed (threshold x{args.threshold:g}). "
+              f"If the change is intended, re-run with --save.")
+        return 1
+
+    print(f"\nAll cases within x{args.threshold:g} of baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
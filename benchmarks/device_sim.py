@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Simulated Device
+Local SSH/Telnet stand-in for a network device, for benchmarks without a lab
+
+One DeviceSimulator emulates one Vendor:
+- SSH (paramiko ServerInterface, password auth, shell with pty) and Telnet
+  (Username:/Password: login) on 127.0.0.1
+- Vendor prompt, login banner and command echo
+- Paging with the vendor "--More--" prompt until the disable_paging
+  command of the vendor was sent (MikroTik: unless "without-paging")
+- Output from benchmarks/fixtures.py, chosen by the command category
+  (interface detail, optical, interface listing); other commands get the
+  vendor "invalid command" error
+- Configurable latency before the output, bytes/s and response size
+
+The time the device spends "working" (latency + rate pacing) is added up
+in DeviceSimulator.device_time, so a client can tell device time from its
+own overhead.
+
+Standalone (point BotLinkMaster or an SSH client at it):
+    python benchmarks/device_sim.py --vendor huawei --ssh-port 2222 --telnet-port 2323
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import argparse
+import logging
+import os
+import re
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Pattern, Tuple
+
+import paramiko
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from vendor_commands import Vendor, get_vendor_config  # noqa: E402
+import fixtures  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# VENDOR BEHAVIOUR
+# =============================================================================
+
+BANNERS = {
+    'cisco_ios': "\r\n**************************************************\r\n"
+                 "*  Authorized access only. Disconnect NOW if you *\r\n"
+                 "*  are not an authorized user.                   *\r\n"
+                 "**************************************************\r\n\r\n",
+    'cisco_nxos': "Cisco Nexus Operating System (NX-OS) Software\r\n"
+                  "TAC support: http://www.cisco.com/tac\r\n"
+                  "Copyright (C) 2002-2023, Cisco and/or its affiliates.\r\n\r\n",
+    'huawei': "\r\nInfo: The max number of VTY users is 10, and the number\r\n"
+              "      of current VTY users on line is 1.\r\n"
+              "      The current login time is 2026-01-05 09:12:44+07:00.\r\n",
+    'h3c': "\r\n******************************************************************************\r\n"
+           "* Copyright (c) 2004-2023 New H3C Technologies Co., Ltd. All rights reserved.*\r\n"
+           "******************************************************************************\r\n\r\n",
+    'juniper': "--- JUNOS 21.4R3-S5.4 Kernel 64-bit  JNPR-12.1-20230927.5a7bd4e_buil\r\n",
+    'mikrotik': "\r\n\r\n"
+                "  MMM      MMM       KKK                          TTTTTTTTTTT      KKK\r\n"
+                "  MMMM    MMMM       KKK                          TTTTTTTTTTT      KKK\r\n"
+                "  MMM MMMM MMM  III  KKK  KKK  RRRRRR     OOOOOO      TTT     III  KKK  KKK\r\n"
+                "  MMM  MM  MMM  III  KKKKK     RRR  RRR  OOO  OOO     TTT     III  KKKKK\r\n"
+                "  MMM      MMM  III  KKK KKK   RRRRRR    OOO  OOO     TTT     III  KKK KKK\r\n"
+                "  MMM      MMM  III  KKK  KKK  RRR  RRR   OOOOOO      TTT     III  KKK  KKK\r\n\r\n"
+                "  MikroTik RouterOS 7.16.2 (c) 1999-2024       https://www.mikrotik.com/\r\n\r\n",
+    'nokia': "\r\nSR OS Software\r\nCopyright (c) Nokia 2023.  All Rights Reserved.\r\n\r\n",
+}
+DEFAULT_BANNER = "\r\nUser Access Verification\r\n\r\n"
+
+PAGER_PROMPTS = {
+    'huawei': "  ---- More ----",
+    'h3c': "---- More ----",
+    'juniper': "---(more)---",
+    'nokia': "Press any key to continue (Q to quit)",
+    'hp_aruba': "-- MORE --, next page: Space, next line: Enter, quit: Control-C",
+    'mikrotik': "-- [Q quit|D dump|down]",
+}
+DEFAULT_PAGER = " --More-- "
+
+ERROR_MESSAGES = {
+    'huawei': "Error: Unrecognized command found at '^' position.",
+    'h3c': "% Unrecognized command found at '^' position.",
+    'juniper': "syntax error, expecting <command>.",
+    'mikrotik': "bad command name (line 1 column 1)",
+    'nokia': "Error: Bad command.",
+}
+DEFAULT_ERROR = "% Invalid input detected at '^' marker."
+
+LOGIN_PROMPTS = {
+    'juniper': "login: ",
+    'mikrotik': "Login: ",
+    'nokia': "Login: ",
+}
+DEFAULT_LOGIN_PROMPT = "Username: "
+
+
+@dataclass
+class DeviceProfile:
+    """What the simulated device looks like and how fast it answers"""
+    vendor: str
+    prompt: str
+    interface: str
+    banner: str = DEFAULT_BANNER
+    login_prompt: str = DEFAULT_LOGIN_PROMPT
+    pager_prompt: str = DEFAULT_PAGER
+    error: str = DEFAULT_ERROR
+    disable_paging: str = ""
+    # (command regex, output body) - first match wins
+    responses: List[Tuple[Pattern, str]] = field(default_factory=list)
+    latency: float = 0.0          # seconds before the first output byte
+    login_latency: float = 0.0    # seconds from login to the first prompt
+    rate: float = 0.0             # bytes/s, 0 = unlimited
+    chunk_size: int = 1024        # bytes per write
+    page_lines: int = 24          # lines per page while paging is on
+
+    def respond(self, command: str) -> Optional[str]:
+        """Output body for a command (None for an empty line)"""
+        if not command.strip():
+            return None
+        for regex, body in self.responses:
+            if regex.match(command):
+                return body
+        return self.error
+
+
+def _body(output: str, scale: int = 1) -> str:
+    """Fixture output without echoed command and trailing prompt"""
+    lines = output.split('\n')[1:-1]
+    return '\r\n'.join(lines * max(1, scale))
+
+
+def _template_regex(template: str) -> Pattern:
+    parts = [re.escape(p) for p in template.split('{interface}')]
+    return re.compile(r'(?P<interface>.+?)'.join(parts) + r'\s*$', re.IGNORECASE)
+
+
+def make_profile(vendor: str, latency: float = 0.0, rate: float = 0.0, scale: int = 1,
+                 page_lines: int = 24, login_latency: float = 0.0) -> DeviceProfile:
+    """
+    DeviceProfile for a Vendor from its VendorConfig and fixtures
+
+    Args:
+        vendor: Vendor value, e.g. 'huawei'
+        latency: Seconds the device "thinks" before each output
+        rate: Output bytes/s (0 = as fast as the socket takes it)
+        scale: Output size - every body is repeated this many times
+        page_lines: Lines per page before the pager prompt
+        login_latency: Seconds between login and the first prompt
+    """
+    config = get_vendor_config(vendor)
+    outputs = fixtures.VENDOR_OUTPUTS[vendor]
+
+    optical = [config.show_optical_interface, config.show_optical_detail, config.show_optical_all]
+    optical += config.alt_optical_commands
+    listing = [config.show_interface_brief, config.show_interface_status,
+               config.show_interface_description]
+    detail = [config.show_interface] + config.alt_interface_commands
+
+    responses = []
+    for templates, key in ((optical, 'optical'), (listing, 'table'), (detail, 'interface')):
+        body = _body(outputs[key], scale)
+        for template in templates:
+            if template:
+                responses.append((_template_regex(template), body))
+    if config.disable_paging:
+        responses.insert(0, (_template_regex(config.disable_paging), ''))
+
+    # Interface name of the fixture, e.g. "show interface Ethernet1/1" -> Ethernet1/1
+    interface = 'GigabitEthernet0/0/1'
+    for key in ('interface', 'optical'):
+        command = outputs[key].split('\n', 1)[0].rsplit('> ', 1)[-1]
+        for template in detail + optical:
+            if '{interface}' not in template:
+                continue
+            m = re.match(template.replace(' ', r'\s+').replace('{interface}', r'(.+?)') + '$', command)
+            if m:
+                interface = m.group(1)
+                break
+        else:
+            continue
+        break
+
+    return DeviceProfile(
+        vendor=vendor,
+        prompt=outputs['table'].rsplit('\n', 1)[-1],
+        interface=interface,
+        banner=BANNERS.get(vendor, DEFAULT_BANNER),
+        login_prompt=LOGIN_PROMPTS.get(vendor, DEFAULT_LOGIN_PROMPT),
+        pager_prompt=PAGER_PROMPTS.get(vendor, DEFAULT_PAGER),
+        error=ERROR_MESSAGES.get(vendor, DEFAULT_ERROR),
+        disable_paging=config.disable_paging,
+        responses=responses,
+        latency=latency,
+        login_latency=login_latency,
+        rate=rate,
+        page_lines=page_lines,
+    )
+
+
+# =============================================================================
+# CLI SESSION (shared by SSH and Telnet)
+# =============================================================================
+
+class DeviceSession:
+    """One logged-in CLI session: echo, prompt, paging, paced output"""
+
+    def __init__(self, sim: 'DeviceSimulator', send, recv):
+        """
+        Args:
+            sim: Owning simulator (profile, device_time)
+            send: Callable writing bytes to the client
+            recv: Callable reading up to n bytes (b'' = closed)
+        """
+        self.sim = sim
+        self.profile = sim.profile
+        self._send = send
+        self._recv = recv
+        self._buffer = b""
+        self.paging = True
+
+    def _busy(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+            self.sim.add_device_time(seconds)
+
+    def write(self, text: str, paced: bool = False):
+        data = text.encode('utf-8')
+        if not paced or not self.profile.rate:
+            self._send(data)
+            return
+        size = self.profile.chunk_size
+        for i in range(0, len(data), size):
+            chunk = data[i:i + size]
+            self._busy(len(chunk) / self.profile.rate)
+            self._send(chunk)
+
+    def _fill(self) -> bool:
+        data = self._recv(4096)
+        if not data:
+            return False
+        # Telnet NUL after CR, IAC negotiation is not used
+        self._buffer += data.replace(b"\x00", b"")
+        return True
+
+    def read_line(self) -> Optional[str]:
+        """One input line without line ending (None = client closed)"""
+        while True:
+            match = re.search(rb"\r\n|\r|\n", self._buffer)
+            if match:
+                line = self._buffer[:match.start()]
+                self._buffer = self._buffer[match.end():]
+                return line.decode('utf-8', errors='ignore')
+            if not self._fill():
+                return None
+
+    def read_key(self) -> Optional[str]:
+        """One keypress (pager)"""
+        if not self._buffer and not self._fill():
+            return None
+        key, self._buffer = self._buffer[:1], self._buffer[1:]
+        if key == b"\r" and self._buffer[:1] == b"\n":
+            self._buffer = self._buffer[1:]
+        return key.decode('utf-8', errors='ignore')
+
+    def run(self):
+        """Banner, prompt, then commands until the client leaves"""
+        self._busy(self.profile.login_latency)
+        self.write(self.profile.banner + self.profile.prompt)
+
+        while True:
+            command = self.read_line()
+            if command is None:
+                return
+            self.write(command + "\r\n")
+
+            if command.strip().lower() in ('exit', 'quit', 'logout', '/quit'):
+                return
+            if self.profile.disable_paging and command.strip() == self.profile.disable_paging:
+                self.paging = False
+
+            body = self.profile.respond(command)
+            if body is not None:
+                self._busy(self.profile.latency)
+                paged = (
+                    self.paging and self.profile.page_lines > 0
+                    and 'without-paging' not in command
+                )
+                if not self._write_output(body, paged):
+                    return
+            self.write(self.profile.prompt)
+
+    def _write_output(self, body: str, paged: bool) -> bool:
+        if not body:
+            return True
+        lines = body.split('\r\n')
+        if not paged:
+            self.write(body + "\r\n", paced=True)
+            return True
+
+        pager = self.profile.pager_prompt
+        step = self.profile.page_lines
+        for i in range(0, len(lines), step):
+            page = lines[i:i + step]
+            self.write('\r\n'.join(page) + "\r\n", paced=True)
+            if i + step >= len(lines):
+                break
+            self.write(pager)
+            key = self.read_key()
+            if key is None:
+                return False
+            self.write("\r" + " " * len(pager) + "\r")
+            if key.lower() == 'q':
+                break
+        return True
+
+
+# =============================================================================
+# SSH / TELNET SERVERS
+# =============================================================================
+
+class _SSHServer(paramiko.ServerInterface):
+    def __init__(self, username: str, password: str):
+        self.username = username
+        self.password = password
+        self.shell_ready = threading.Event()
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_auth_password(self, username, password):
+        if username == self.username and password == self.password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == 'session':
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, channel, term, width, height, pixelwidth, pixelheight, modes):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        self.shell_ready.set()
+        return True
+
+    def check_channel_window_change_request(self, channel, width, height, pixelwidth, pixelheight):
+        return True
+
+
+class DeviceSimulator:
+    """SSH and/or Telnet server for one DeviceProfile on 127.0.0.1"""
+
+    def __init__(self, profile: DeviceProfile, username: str = 'admin', password: str = 'admin'):
+        self.profile = profile
+        self.username = username
+        self.password = password
+        self.ssh_port: Optional[int] = None
+        self.telnet_port: Optional[int] = None
+        self.sessions = 0
+        self._device_time = 0.0
+        self._lock = threading.Lock()
+        self._sockets: List[socket.socket] = []
+        self._host_key: Optional[paramiko.PKey] = None
+        self._closed = False
+
+    @property
+    def device_time(self) -> float:
+        """Seconds spent in simulated latency and rate pacing so far"""
+        with self._lock:
+            return self._device_time
+
+    def add_device_time(self, seconds: float):
+        with self._lock:
+            self._device_time += seconds
+
+    def _listen(self, port: int, handler) -> int:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('127.0.0.1', port))
+        sock.listen(16)
+        self._sockets.append(sock)
+        threading.Thread(target=self._accept_loop, args=(sock, handler), daemon=True).start()
+        return sock.getsockname()[1]
+
+    def _accept_loop(self, sock: socket.socket, handler):
+        while not self._closed:
+            try:
+                client, _ = sock.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._handle, args=(handler, client), daemon=True).start()
+
+    def _handle(self, handler, client: socket.socket):
+        with self._lock:
+            self.sessions += 1
+        try:
+            handler(client)
+        except Exception as e:
+            logger.debug(f"Simulator session ended: {e}")
+        finally:
+            try:
+                client.close()
+            except OSError:
+                pass
+
+    def start(self, ssh_port: Optional[int] = 0, telnet_port: Optional[int] = 0) -> 'DeviceSimulator':
+        """Start the servers (port 0 = any free port, None = do not start)"""
+        if ssh_port is not None:
+            self._host_key = paramiko.RSAKey.generate(2048)
+            self.ssh_port = self._listen(ssh_port, self._serve_ssh)
+        if telnet_port is not None:
+            self.telnet_port = self._listen(telnet_port, self._serve_telnet)
+        return self
+
+    def stop(self):
+        self._closed = True
+        for sock in self._sockets:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        self._sockets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def _serve_ssh(self, client: socket.socket):
+        transport = paramiko.Transport(client)
+        transport.add_server_key(self._host_key)
+        server = _SSHServer(self.username, self.password)
+        try:
+            transport.start_server(server=server)
+            channel = transport.accept(timeout=30)
+            if channel is None or not server.shell_ready.wait(30):
+                return
+            DeviceSession(self, channel.sendall, channel.recv).run()
+            channel.close()
+        finally:
+            transport.close()
+
+    def _serve_telnet(self, client: socket.socket):
+        session = DeviceSession(self, client.sendall, client.recv)
+        session.write(self.profile.banner)
+
+        while True:
+            session.write(self.profile.login_prompt)
+            username = session.read_line()
+            if username is None:
+                return
+            session.write("\r\nPassword: ")
+            password = session.read_line()
+            if password is None:
+                return
+            if username == self.username and password == self.password:
+                break
+            session.write("\r\n% Authentication failed\r\n\r\n")
+
+        session.write("\r\n")
+        session.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BotLinkMaster simulated device')
+    parser.add_argument('--vendor', default='cisco_ios', choices=[v.value for v in Vendor])
+    parser.add_argument('--ssh-port', type=int, default=2222)
+    parser.add_argument('--telnet-port', type=int, default=2323)
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds before each output')
+    parser.add_argument('--rate', type=float, default=0.0, help='output bytes/s (0 = unlimited)')
+    parser.add_argument('--scale', type=int, default=1, help='repeat every output N times')
+    parser.add_argument('--page-lines', type=int, default=24, help='lines per page (0 = no paging)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    profile = make_profile(args.vendor, latency=args.latency, rate=args.rate,
+                           scale=args.scale, page_lines=args.page_lines)
+    sim = DeviceSimulator(profile, args.username, args.password)
+    sim.start(ssh_port=args.ssh_port, telnet_port=args.telnet_port)
+
+    logger.info(f"Simulating {args.vendor} ({profile.prompt.strip()}) - "
+                f"SSH 127.0.0.1:{sim.ssh_port}, Telnet 127.0.0.1:{sim.telnet_port}, "
+                f"user {args.username}/{args.password}, interface {profile.interface}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        sim.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1047 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Benchmark Fixtures
+Device outputs used by the parser benchmarks
+
+VENDOR_OUTPUTS holds, for every Vendor, the three outputs the bot parses
+most often:
+- 'interface': single interface detail  (show interface X)
+- 'optical':   single interface optics  (show_optical_interface/detail)
+- 'table':     interface listing        (show_interface_brief)
+
+The samples follow each vendor's CLI layout. Hostnames, descriptions,
+MAC/serial numbers and addresses are placeholders. When a vendor bug is
+reported, paste the (anonymised) output here so the fix is measured and
+the parse result is pinned in baseline.json.
+
+Large outputs (384-port chassis, 10k-line running-config) are generated
+by the functions at the bottom so the repository stays small.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import random
+from typing import Dict, List, Tuple
+
+# =============================================================================
+# CISCO IOS / IOS-XE
+# =============================================================================
+
+CISCO_IOS_INTERFACE = """\
+show interface GigabitEthernet1/0/1
+GigabitEthernet1/0/1 is up, line protocol is up (connected)
+  Hardware is Gigabit Ethernet, address is 00aa.bb01.0001 (bia 00aa.bb01.0001)
+  Description: UPLINK-TO-CORE-01 Gi1/0/48
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation ARPA, loopback not set
+  Keepalive set (10 sec)
+  Full-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+  input flow-control is off, output flow-control is unsupported
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Last input 00:00:00, output 00:00:01, output hang never
+  Last clearing of "show interface" counters never
+  Input queue: 0/75/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate 182000 bits/sec, 95 packets/sec
+  5 minute output rate 95000 bits/sec, 60 packets/sec
+     9618731 packets input, 1933219384 bytes, 0 no buffer
+     Received 212876 broadcasts (190012 multicasts)
+     0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 190012 multicast, 0 pause input
+     0 input packets with dribble condition detected
+     5291863 packets output, 1048262915 bytes, 0 underruns
+     0 output errors, 0 collisions, 1 interface resets
+     0 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out
+SW-ACC-01#"""
+
+CISCO_IOS_OPTICAL = """\
+show hw-module subslot 0/1 transceiver 0 status
+The Transceiver in slot 0 subslot 1 port 0 is enabled.
+  Module temperature                = +33.246 C
+  Transceiver Tx supply voltage     = 3291.3 mVolts
+  Transceiver Tx bias current       = 6162 uAmps
+  Transceiver Tx power              = -2.3 dBm
+  Transceiver Rx optical power      = -6.1 dBm
+RTR-EDGE-01#"""
+
+CISCO_IOS_TABLE = """\
+show interface status
+
+Port      Name               Status       Vlan       Duplex  Speed Type
+Gi1/0/1   UPLINK-TO-CORE-01  connected    trunk      a-full a-1000 10/100/1000BaseTX
+Gi1/0/2   AP-LT2-R201        connected    20         a-full a-1000 10/100/1000BaseTX
+Gi1/0/3                      notconnect   1            auto   auto 10/100/1000BaseTX
+Gi1/0/4   PRINTER-LT1        connected    30         a-full  a-100 10/100/1000BaseTX
+Gi1/0/5   CAM-LOBBY-02       err-disabled 40           auto   auto 10/100/1000BaseTX
+Gi1/0/6   old server         disabled     1            auto   auto 10/100/1000BaseTX
+Te1/1/1   DIST-01 Te1/0/1    connected    trunk        full    10G SFP-10GBase-SR
+Te1/1/2                      notconnect   1            full    10G Not Present
+SW-ACC-01#"""
+
+# =============================================================================
+# CISCO NX-OS
+# =============================================================================
+
+CISCO_NXOS_INTERFACE = """\
+show interface Ethernet1/1
+Ethernet1/1 is up
+admin state is up, Dedicated Interface
+  Hardware: 100/1000/10000 Ethernet, address: 00aa.bb02.0001 (bia 00aa.bb02.0001)
+  Description: xcon:OLT C300A 1/19/1
+  MTU 9216 bytes, BW 10000000 Kbit , DLY 10 usec
+  reliability 255/255, txload 1/255, rxload 3/255
+  Encapsulation ARPA, medium is broadcast
+  Port mode is trunk
+  full-duplex, 10 Gb/s, media type is 10G
+  Beacon is turned off
+  Auto-Negotiation is turned on  FEC mode is Auto
+  Input flow-control is off, output flow-control is off
+  Auto-mdix is turned off
+  Rate mode is dedicated
+  Switchport monitor is off
+  EtherType is 0x8100
+  EEE (efficient-ethernet) : n/a
+  Last link flapped 3week(s) 2day(s)
+  Last clearing of "show interface" counters never
+  2 interface resets
+  30 seconds input rate 118223312 bits/sec, 12120 packets/sec
+  30 seconds output rate 4431288 bits/sec, 3388 packets/sec
+NX-CORE-01# """
+
+CISCO_NXOS_OPTICAL = """\
+show interface Ethernet1/1 transceiver details
+Ethernet1/1
+    transceiver is present
+    type is 10Gbase-SR
+    name is CISCO-FINISAR
+    part number is FTLX8571D3BCL-C2
+    revision is A
+    serial number is FNS00000001
+    nominal bitrate is 10300 MBit/sec
+    Link length supported for 50/125um OM3 fiber is 300 m
+    cisco id is 3
+    cisco extended id number is 4
+
+           SFP Detail Diagnostics Information (internal calibration)
+  ----------------------------------------------------------------------------
+                Current              Alarms                  Warnings
+                Measurement     High        Low         High          Low
+  ----------------------------------------------------------------------------
+  Temperature   34.41 C        75.00 C     -5.00 C     70.00 C        0.00 C
+  Voltage        3.29 V         3.63 V      2.97 V      3.46 V        3.13 V
+  Current        6.85 mA       12.00 mA     2.00 mA    11.50 mA       2.50 mA
+  Tx Power      -2.41 dBm       1.69 dBm  -11.30 dBm   -1.30 dBm      -7.30 dBm
+  Rx Power      -5.87 dBm       1.99 dBm  -13.97 dBm   -1.00 dBm      -9.91 dBm
+  Transmit Fault Count = 0
+  ----------------------------------------------------------------------------
+  Note: ++  high-alarm; +  high-warning; --  low-alarm; -  low-warning
+NX-CORE-01# """
+
+CISCO_NXOS_TABLE = """\
+show interface status
+
+--------------------------------------------------------------------------------
+Port          Name               Status    Vlan      Duplex  Speed   Type
+--------------------------------------------------------------------------------
+mgmt0         --                 connected routed    full    1000    --
+Eth1/1        xcon:OLT C300A 1/1 connected trunk     full    10G     10Gbase-SR
+Eth1/2        xcon:OLT C300A 1/2 connected trunk     full    10G     10Gbase-SR
+Eth1/3        --                 sfpAbsent 1         auto    auto    --
+Eth1/4        BRAS-02 Te0/0/0/4  notconnec 1         auto    auto    10Gbase-LR
+Eth1/49       PEER-LINK NX-02    connected trunk     full    40G     QSFP-40G-SR4
+Po10          vPC peer-link      connected trunk     full    40G     --
+Vlan1         --                 down      routed    auto    auto    --
+NX-CORE-01# """
+
+# =============================================================================
+# HUAWEI VRP
+# =============================================================================
+
+HUAWEI_INTERFACE = """\
+display interface XGigabitEthernet0/0/1
+XGigabitEthernet0/0/1 current state : UP (ifindex: 12)
+Line protocol current state : UP
+Description:to-AGG-02 XGE0/0/3
+Switch Port, Link-type : trunk(configured),
+PVID :    1, TPID : 8100(Hex), The Maximum Frame Length is 9216
+IP Sending Frames' Format is PKTFMT_ETHNT_2, Hardware address is 00aa-bb03-0001
+Last physical up time   : 2026-09-30 04:11:52
+Last physical down time : 2026-09-30 04:11:40
+Current system time: 2026-10-17 10:00:00
+Port Mode: COMMON FIBER
+Speed : 10000,  Loopback: NONE
+Duplex: FULL,   Negotiation: DISABLE
+Mdi   : -
+Last 300 seconds input rate 84331568 bits/sec, 11021 packets/sec
+Last 300 seconds output rate 5522188 bits/sec, 5410 packets/sec
+Input peak rate 960221664 bits/sec,Record time: 2026-10-02 20:40:11
+Output peak rate 88123392 bits/sec,Record time: 2026-10-02 20:40:11
+<HW-AGG-01>"""
+
+HUAWEI_OPTICAL = """\
+display transceiver interface XGigabitEthernet0/0/1 verbose
+
+ XGigabitEthernet0/0/1 transceiver information:
+-------------------------------------------------------------------
+ Common information:
+   Transceiver Type                      :10GBASE_SR
+   Connector Type                        :LC
+   Wavelength(nm)                        :850
+   Transfer Distance(m)                  :80(OM2),300(OM3)
+   Digital Diagnostic Monitoring         :YES
+   Vendor Name                           :HUAWEI
+   Vendor Part Number                    :02310MHR
+   Ordering Name                         :
+-------------------------------------------------------------------
+ Manufacture information:
+   Manu. Serial Number                   :ABCDEF0123456789
+   Manufacturing Date                    :2019-08-12
+   Vendor Name                           :HUAWEI
+-------------------------------------------------------------------
+ Diagnostic information:
+   Temperature(°C)                       :36.00
+   Temp High Threshold(°C)               :80.00
+   Temp Low Threshold(°C)                :-5.00
+   Voltage(V)                            :3.31
+   Volt High Threshold(V)                :3.63
+   Volt Low Threshold(V)                 :2.97
+   Bias Current(mA)                      :6.72
+   Bias High Threshold(mA)               :12.00
+   Bias Low Threshold(mA)                :2.00
+   RX Power(dBm)                         :-4.86
+   RX Power High Threshold(dBm)          :2.50
+   RX Power Low Threshold(dBm)           :-13.90
+   TX Power(dBm)                         :-2.26
+   TX Power High Threshold(dBm)          :2.00
+   TX Power Low Threshold(dBm)           :-8.20
+-------------------------------------------------------------------
+<HW-AGG-01>"""
+
+HUAWEI_TABLE = """\
+display interface description
+PHY: Physical
+*down: administratively down
+(l): loopback
+(s): spoofing
+(b): BFD down
+(e): ETHOAM down
+(d): Dampening Suppressed
+Interface                     PHY     Protocol Description
+GE0/0/1                       up      up       to-server-01 bond0
+GE0/0/2                       *down   down
+GE0/0/3                       down    down     reserved OLT-02
+XGE0/0/1                      up      up       to-AGG-02 XGE0/0/3
+XGE0/0/2                      up      up(s)    to-BRAS-01
+Eth-Trunk1                    up      up       LACP to core
+Vlanif10                      up      up       MGMT
+NULL0                         up      up(s)
+<HW-AGG-01>"""
+
+# =============================================================================
+# ZTE
+# =============================================================================
+
+ZTE_INTERFACE = """\
+show interface xgei-1/1/0/1
+xgei-1/1/0/1 is up, line protocol is up
+  Description: uplink-to-core xgei-1/3/0/7
+  The port is optical
+  Duplex full, 10000Mbps
+  MTU 1600 bytes BW 10000000 Kbits
+  Last clearing of "show interface" counters never
+  120 seconds input rate :   73223120 Bps,   10221 pps
+  120 seconds output rate:    3423016 Bps,    4120 pps
+ZXR10-AGG-01#"""
+
+ZTE_OPTICAL = """\
+show transceiver interface xgei-1/1/0/1 detail
+Interface      : xgei-1/1/0/1
+  Module Type  : SFP+
+  Wavelength   : 1310nm
+  Vendor Name  : ZTE
+  Temperature  : 35.12 C
+  Voltage      : 3.30 V
+  Bias Current : 6.20 mA
+  Rx Power     : -7.35 dBm
+  Tx Power     : -2.88 dBm
+ZXR10-AGG-01#"""
+
+ZTE_TABLE = """\
+show interface brief
+Interface       Attribute  Mode    Speed  Admin Phy   Prot  Description
+xgei-1/1/0/1    optical    Duplex  10000  up    up    up    uplink-to-core
+xgei-1/1/0/2    optical    Duplex  10000  up    down  down  reserved
+gei-1/2/0/1     electric   Duplex  1000   up    up    up    OLT-C320 mgmt
+gei-1/2/0/2     electric   Duplex  auto   down  down  down
+ZXR10-AGG-01#"""
+
+# =============================================================================
+# JUNIPER JunOS
+# =============================================================================
+
+JUNIPER_INTERFACE = """\
+show interfaces xe-0/0/0
+Physical interface: xe-0/0/0, Enabled, Physical link is Up
+  Interface index: 650, SNMP ifIndex: 510
+  Description: to-PE-02 xe-1/0/0
+  Link-level type: Ethernet, MTU: 9192, LAN-PHY mode, Speed: 10Gbps, BPDU Error: None,
+  Loop Detect PDU Error: None, MAC-REWRITE Error: None, Loopback: None, Source filtering: Disabled,
+  Flow control: Enabled
+  Pad to minimum frame size: Disabled
+  Device flags   : Present Running
+  Interface flags: SNMP-Traps Internal: 0x4000
+  Link flags     : None
+  CoS queues     : 8 supported, 8 maximum usable queues
+  Current address: 00:aa:bb:05:00:01, Hardware address: 00:aa:bb:05:00:01
+  Last flapped   : 2026-09-12 08:41:03 WIB (5w0d 01:18 ago)
+  Input rate     : 912311264 bps (99120 pps)
+  Output rate    : 41211872 bps (40112 pps)
+
+{master}
+noc@MX-PE-01> """
+
+JUNIPER_OPTICAL = """\
+show interfaces diagnostics optics xe-0/0/0
+Physical interface: xe-0/0/0
+    Laser bias current                        :  6.512 mA
+    Laser output power                        :  0.5910 mW / -2.28 dBm
+    Module temperature                        :  33 degrees C / 92 degrees F
+    Module voltage                            :  3.3110 V
+    Receiver signal average optical power     :  0.2831 mW / -5.48 dBm
+    Laser bias current high alarm             :  Off
+    Laser bias current low alarm              :  Off
+    Laser output power high alarm             :  Off
+    Laser output power low alarm              :  Off
+    Module temperature high alarm             :  Off
+    Module temperature low alarm              :  Off
+    Laser rx power high alarm                 :  Off
+    Laser rx power low alarm                  :  Off
+
+{master}
+noc@MX-PE-01> """
+
+JUNIPER_TABLE = """\
+show interfaces terse
+Interface               Admin Link Proto    Local                 Remote
+xe-0/0/0                up    up
+xe-0/0/0.0              up    up   inet     10.10.0.1/30
+xe-0/0/1                up    down
+xe-0/0/2                down  down
+ge-0/0/0                up    up
+ge-0/0/0.100            up    up   inet     10.20.0.1/29
+lo0                     up    up
+lo0.0                   up    up   inet     10.255.0.1          --> 0/0
+
+{master}
+noc@MX-PE-01> """
+
+# =============================================================================
+# MIKROTIK RouterOS
+# =============================================================================
+
+MIKROTIK_INTERFACE = """\
+[admin@CRS326-AGG] > /interface ethernet monitor sfp-sfpplus1 once
+                      name: sfp-sfpplus1
+                    status: link-ok
+          auto-negotiation: done
+                      rate: 10Gbps
+               full-duplex: yes
+           tx-flow-control: no
+           rx-flow-control: no
+        sfp-module-present: yes
+               sfp-rx-loss: no
+              sfp-tx-fault: no
+                  sfp-type: SFP/SFP+/SFP28
+        sfp-connector-type: LC
+           sfp-vendor-name: MIKROTIK
+    sfp-vendor-part-number: S+85DLC03D
+            sfp-wavelength: 850nm
+           sfp-temperature: 36C
+        sfp-supply-voltage: 3.297V
+       sfp-tx-bias-current: 6mA
+              sfp-tx-power: -2.456dBm
+              sfp-rx-power: -6.021dBm
+[admin@CRS326-AGG] > """
+
+MIKROTIK_OPTICAL = MIKROTIK_INTERFACE
+
+MIKROTIK_TABLE = """\
+[admin@CRS326-AGG] > /interface ethernet print without-paging
+Flags: R - RUNNING; S - SLAVE
+Columns: NAME, MTU, MAC-ADDRESS, ARP, SWITCH
+ #    NAME          MTU  MAC-ADDRESS        ARP      SWITCH
+;;; uplink to core
+ 0 RS ether1       1500  00:AA:BB:04:00:01  enabled  switch1
+ 1 RS ether2       1500  00:AA:BB:04:00:02  enabled  switch1
+ 2  S ether3       1500  00:AA:BB:04:00:03  enabled  switch1
+;;; OLT HSGQ 1/1
+ 3 RS ether4       1500  00:AA:BB:04:00:04  enabled  switch1
+ 4 R  sfp-sfpplus1 1500  00:AA:BB:04:00:19  enabled  switch1
+ 5    sfp-sfpplus2 1500  00:AA:BB:04:00:1A  enabled  switch1
+[admin@CRS326-AGG] > """
+
+# =============================================================================
+# NOKIA SR-OS
+# =============================================================================
+
+NOKIA_INTERFACE = """\
+show port 1/1/1
+===============================================================================
+Ethernet Interface
+===============================================================================
+Description        : 10-Gig Ethernet to PE-03
+Interface          : 1/1/1                      Oper Speed       : 10 Gbps
+Link-level         : Ethernet                   Config Speed     : 10 Gbps
+Admin State        : up                         Oper Duplex      : full
+Oper State         : up                         Config Duplex    : full
+Physical Link      : Yes                        MTU              : 9212
+Single Fiber Mode  : No                         Min Frame Length : 64 Bytes
+IfIndex            : 35684352                   Hold time up     : 0 seconds
+Last State Change  : 09/30/2026 04:11:52        Hold time down   : 0 seconds
+===============================================================================
+A:SR-PE-03# """
+
+NOKIA_OPTICAL = """\
+show port 1/1/1 optical
+===============================================================================
+Transceiver Digital Diagnostic Monitoring (DDM), Internally Calibrated
+===============================================================================
+                              Value  High Alarm  High Warn  Low Warn  Low Alarm
+-------------------------------------------------------------------------------
+Temperature (C)               +36.2     +78.0     +73.0     -8.0     -13.0
+Supply Voltage (V)             3.29      3.70      3.60     3.00      2.90
+Tx Bias Current (mA)            6.4      15.0      14.0      2.0       1.0
+Tx Output Power (dBm)         -2.31      3.00      2.00     -8.00     -9.00
+Rx Optical Power (avg dBm)    -6.77      3.00      2.00    -16.00    -18.00
+===============================================================================
+A:SR-PE-03# """
+
+NOKIA_TABLE = """\
+show port
+===============================================================================
+Ports on Slot 1
+===============================================================================
+Port          Admin Link Port    Cfg  Oper LAG/ Port Port Port   C/QS/S/XFP/
+Id            State      State   MTU  MTU  Bndl Mode Encp Type   MDIMDX
+-------------------------------------------------------------------------------
+1/1/1         Up    Yes  Up      9212 9212    - netw null xcme   GIGE-LX  10KM
+1/1/2         Up    No   Down    9212 9212    - netw null xcme
+1/1/3         Down  No   Down    9212 9212    - accs dotq xcme
+===============================================================================
+A:SR-PE-03# """
+
+# =============================================================================
+# HP / ARUBA
+# =============================================================================
+
+HP_ARUBA_INTERFACE = """\
+show interface 49
+ Status and Counters - Port Counters for port 49
+
+  Name  : UPLINK-CORE
+  MAC Address      : 00aabb-060031
+  Link Status      : Up
+  Totals (Since boot or last clear) :
+   Bytes Rx        : 3,012,771,992        Bytes Tx        : 1,443,201,010
+   Unicast Rx      : 22,901,331           Unicast Tx      : 10,221,304
+   Bcast/Mcast Rx  : 99,120               Bcast/Mcast Tx  : 12,044
+HP-2920-ACC#"""
+
+HP_ARUBA_OPTICAL = """\
+show interfaces transceiver 49 detail
+Transceiver in 49
+  Interface Index    : 49
+  Type               : SFP+SR
+  Model              : J9150A
+  Connector type     : LC
+  Wavelength         : 850nm
+  Transfer distance  : 300m (50um), 80m (62.5um)
+  Diagnostic support : DOM
+  Serial number      : CN0000000A
+
+  Status
+  Temperature : 33.285C
+  Voltage : 3.3122V
+  Tx Bias : 6.596mA
+  Tx Power : 0.5734mW, -2.415dBm
+  Rx Power : 0.2956mW, -5.292dBm
+HP-2920-ACC#"""
+
+HP_ARUBA_TABLE = """\
+show interface brief
+
+  Status and Counters - Port Status
+
+                  | Intrusion                           MDI  Flow  Bcast
+  Port  Type      | Alert     Enabled Status Mode       Mode Ctrl  Limit
+  ----- --------- + --------- ------- ------ ---------- ---- ----- ------
+  1     100/1000T | No        Yes     Up     1000FDx    MDIX off   0
+  2     100/1000T | No        Yes     Down   1000FDx    Auto off   0
+  49    SFP+SR    | No        Yes     Up     10GigFD    NA   off   0
+HP-2920-ACC#"""
+
+# =============================================================================
+# FIBERHOME
+# =============================================================================
+
+FIBERHOME_INTERFACE = """\
+show interface xgigaethernet 1/0/1
+xgigaethernet 1/0/1 current state: Link: UP, Protocol: UP
+  Description: to-OLT-AN5516 uplink
+  Hardware address is 00aa.bb07.0001
+  Speed 10000M, duplex full
+  Input rate 88211200 bits/sec, 9120 packets/sec
+  Output rate 4120392 bits/sec, 3910 packets/sec
+FH-S5800#"""
+
+FIBERHOME_OPTICAL = """\
+show transceiver interface xgigaethernet 1/0/1 detail
+ Port: xgigaethernet 1/0/1
+   Vendor Name      : FIBERHOME
+   Wavelength       : 1310 nm
+   Temperature      : 38.50 C
+   Voltage          : 3.28 V
+   Bias Current     : 25.31 mA
+   Tx Power         : -1.92 dBm
+   Rx Power         : -9.44 dBm
+FH-S5800#"""
+
+FIBERHOME_TABLE = """\
+show interface brief
+Interface               Link   Protocol  Speed   Duplex  Description
+xgigaethernet 1/0/1     UP     UP        10G     full    to-OLT-AN5516 uplink
+xgigaethernet 1/0/2     DOWN   DOWN      auto    auto
+gigaethernet 1/1/1      UP     UP        1000M   full    CPE pelanggan 0812
+FH-S5800#"""
+
+# =============================================================================
+# DCN
+# =============================================================================
+
+DCN_INTERFACE = """\
+show interface ethernet1/0/25
+Ethernet1/0/25 is up, line protocol is up
+  Ethernet1/0/25 is layer 2 port, alias name is (null), index is 25
+  Description: uplink-DCN-core
+  Hardware is Gigabit-TX, address is 00-aa-bb-08-00-19
+  PVID is 1
+  MTU 1500 bytes, BW 10000000 Kbit
+  Encapsulation ARPA, Loopback not set
+  Auto-duplex: Negotiation full-duplex, Auto-speed: Negotiation 10G bits
+DCN-S4600#"""
+
+DCN_OPTICAL = """\
+show transceiver interface ethernet1/0/25 detail
+Ethernet1/0/25 transceiver detail information:
+  Base information:
+    SFP found in this port, manufactured by DCN, on Dec 11 2021.
+    Type is 10G Base-SR.  Serial Number is DCN000000001.
+  Diagnostic information:
+    Temperature                  : 34.52 (C)
+    Voltage                      : 3.30 (V)
+    Bias                         : 6.11 (mA)
+    Tx Power                     : -2.61 (dBm)
+    Rx Power                     : -6.98 (dBm)
+DCN-S4600#"""
+
+DCN_TABLE = """\
+show interface ethernet status
+Codes: A-Down - administratively down, a - operation speed auto,
+       a-FULL - operation duplex auto
+Interface Link/Protocol Speed  Duplex  Vlan Type    Alias Name
+--------- ------------- ------ ------- ---- ------- ----------
+1/0/1     UP/UP         a-1G   a-FULL  1    G-TX    server rack 3
+1/0/2     DOWN/DOWN     auto   auto    1    G-TX
+1/0/3     A-DOWN/DOWN   auto   auto    1    G-TX    cadangan
+1/0/25    UP/UP         10G    FULL    trunk SFP+   uplink-DCN-core
+DCN-S4600#"""
+
+# =============================================================================
+# H3C Comware
+# =============================================================================
+
+H3C_INTERFACE = """\
+display interface Ten-GigabitEthernet1/0/49
+Ten-GigabitEthernet1/0/49
+Current state: UP
+Line protocol state: UP
+IP packet frame type: Ethernet II, hardware address: 00aa-bb09-0031
+Description: to-CORE-H3C-01 XGE1/0/1
+Bandwidth: 10000000 kbps
+Loopback is not set
+Media type is optical fiber, Port hardware type is 10G_BASE_SR_SFP
+10Gbps-speed mode, full-duplex mode
+Link speed type is autonegotiation, link duplex type is autonegotiation
+Last 300 seconds input rate: 81234120 bytes/sec, 649872960 bits/sec, 71220 packets/sec
+Last 300 seconds output rate: 3120120 bytes/sec, 24960960 bits/sec, 9002 packets/sec
+<H3C-S5560>"""
+
+H3C_OPTICAL = """\
+display transceiver diagnosis interface Ten-GigabitEthernet1/0/49
+Ten-GigabitEthernet1/0/49 transceiver diagnostic information:
+  Current diagnostic parameters:
+    Temp.(°C)  Voltage(V)  Bias(mA)  RX power(dBm)  TX power(dBm)
+    35          3.30        6.58      -5.93          -2.37
+  Alarm thresholds:
+          Temp.(°C)  Voltage(V)  Bias(mA)  RX power(dBm)  TX power(dBm)
+    High  75          3.63        12.00     2.00           1.00
+    Low   -5          2.97        2.00      -13.90         -7.30
+<H3C-S5560>"""
+
+H3C_TABLE = """\
+display interface brief
+Brief information on interfaces in route mode:
+Link: ADM - administratively down; Stby - standby
+Protocol: (s) - spoofing
+Interface            Link Protocol Primary IP      Description
+Vlan-interface10     UP   UP       10.30.0.1       MGMT
+Brief information on interfaces in bridge mode:
+Link: ADM - administratively down; Stby - standby
+Speed: (a) - auto
+Duplex: (a)/A - auto; H - half; F - full
+Type: A - access; T - trunk; H - hybrid
+Interface            Link Speed   Duplex Type PVID Description
+GE1/0/1              UP   1G(a)   F(a)   A    10   AP-LT3-R301
+GE1/0/2              DOWN auto    A      A    1
+GE1/0/3              ADM  auto    A      A    1    disabled by NOC
+XGE1/0/49            UP   10G     F      T    1    to-CORE-H3C-01
+<H3C-S5560>"""
+
+# =============================================================================
+# RUIJIE
+# =============================================================================
+
+RUIJIE_INTERFACE = """\
+show interface TenGigabitEthernet 0/49
+Index(dec):49 (hex):31
+TenGigabitEthernet 0/49 is UP  , line protocol is UP
+Hardware is TenGigabitEthernet, address is 00d0.f8aa.0031 (bia 00d0.f8aa.0031)
+Description: uplink-to-core RG-N18K
+Interface address is: no ip address
+  MTU 1500 bytes, BW 10000000 Kbit
+  Encapsulation protocol is Ethernet-II, loopback not set
+  Keepalive interval is 10 sec , set
+  Carrier delay is 2 sec
+  Ethernet attributes:
+    Last link state change time: 2026-09-30 04:11:52
+    Priority is 0
+    Admin medium-type is Fiber, oper medium-type is Fiber
+    Admin duplex mode is AUTO, oper duplex is Full
+    Admin speed is AUTO, oper speed is 10G
+RG-S5750#"""
+
+RUIJIE_OPTICAL = """\
+show interface TenGigabitEthernet 0/49 transceiver diagnosis
+Current diagnostic parameters[AP:Average Power]:
+Port      Temp(Celsius)  Voltage(V)  Bias(mA)  Rx Power(dBm)  Tx Power(dBm)
+Te0/49    37(OK)         3.29(OK)    6.71(OK)  -6.22(OK)[AP]  -2.48(OK)[AP]
+RG-S5750#"""
+
+RUIJIE_TABLE = """\
+show interface status
+Interface                        Status    Vlan   Duplex   Speed     Type
+-------------------------------- --------  ----   -------  --------- ------
+GigabitEthernet 0/1              up        10     Full     1000M     copper
+GigabitEthernet 0/2              down      1      Unknown  Unknown   copper
+GigabitEthernet 0/3              disabled  1      Unknown  Unknown   copper
+TenGigabitEthernet 0/49          up        routed Full     10G       fiber
+RG-S5750#"""
+
+# =============================================================================
+# BDCOM
+# =============================================================================
+
+BDCOM_INTERFACE = """\
+show interface tgigaEthernet 0/1
+tgigaEthernet0/1 is up, line protocol is up
+  Hardware is tgigaEthernet, address is 00aa.bb0a.0001 (bia 00aa.bb0a.0001)
+  Description: uplink-OLT-P3310
+  MTU 1500 bytes, BW 10000000 Kbit, DLY 10 usec
+  Encapsulation ARPA, loopback not set
+  Link: UP
+  10G-speed, Full-duplex, Fiber
+BDCOM-S2900#"""
+
+BDCOM_OPTICAL = """\
+show transceiver interface tgigaEthernet 0/1 detail
+Interface      Temperature  Voltage  Bias     RX Power  TX Power
+               (C)          (V)      (mA)     (dBm)     (dBm)
+-------------- ------------ -------- -------- --------- ---------
+tg0/1          39.7         3.31     7.13     -8.02     -2.17
+Tx Power: -2.17
+Rx Power: -8.02
+BDCOM-S2900#"""
+
+BDCOM_TABLE = """\
+show interface brief
+Port       Description     Status   Vlan  Duplex  Speed  Type
+g0/1       OLT-EPON-01     up       1     full    1000   Giga-TX
+g0/2                       down     1     auto    auto   Giga-TX
+tg0/1      uplink-OLT      up       1     full    10G    10G-SFP+
+BDCOM-S2900#"""
+
+# =============================================================================
+# RAISECOM
+# =============================================================================
+
+RAISECOM_INTERFACE = """\
+show interface port 25
+Port 25 information:
+  Description: to-ISCOM-core
+  Status: UP
+  Speed: 10000M  Duplex: Full
+  MTU: 1600
+Raisecom#"""
+
+RAISECOM_OPTICAL = """\
+show transceiver 25 detail
+Port 25:
+  Vendor Name       : RAISECOM
+  Temperature       : 31.25 C
+  Voltage           : 3.30 V
+  Bias Current      : 5.91 mA
+  TxPower           : -3.02 dBm
+  RxPower           : -11.76 dBm
+Raisecom#"""
+
+RAISECOM_TABLE = """\
+show interface brief
+Port  Admin   Status  Speed   Duplex  Description
+1     enable  up      1000M   full    ONU-mgmt
+2     enable  down    auto    auto
+25    enable  up      10000M  full    to-ISCOM-core
+Raisecom#"""
+
+# =============================================================================
+# FS.COM
+# =============================================================================
+
+FS_INTERFACE = """\
+show interface eth1/0/49
+  Interface eth1/0/49
+    Description: to-FS-core S5850
+    Link: Up, Admin: Up
+    Speed 10000M, duplex full
+    Hardware is Ethernet, address is 00aa.bb0c.0031
+FS-S3900#"""
+
+FS_OPTICAL = """\
+show transceiver interface eth1/0/49
+Interface eth1/0/49 transceiver information
+  Temperature: 33.10 C
+  Voltage    : 3.31 V
+  Bias       : 6.02 mA
+  Tx Power   : -2.74 dBm
+  Rx Power   : -4.97 dBm
+FS-S3900#"""
+
+FS_TABLE = """\
+show interface status
+Port       Name              Status       Vlan  Duplex  Speed  Type
+eth1/0/1   AP-R1             connected    10    a-full  a-1G   1000BASE-T
+eth1/0/2                     notconnect   1     auto    auto   1000BASE-T
+eth1/0/49  to-FS-core S5850  connected    trunk full    10G    10GBASE-SR
+FS-S3900#"""
+
+# =============================================================================
+# ALLIED TELESIS
+# =============================================================================
+
+ALLIED_INTERFACE = """\
+show interface port1.0.25
+Interface port1.0.25
+  Scope: both
+  Link is UP, administrative state is UP
+  Status: UP
+  Hardware is Ethernet, address is 00aa.bb0d.0019
+  Description: to-x930-core
+  index 5025 metric 1 mtu 1500
+  SNMP link-status traps: Disabled
+AT-x510#"""
+
+ALLIED_OPTICAL = """\
+show system pluggable port1.0.25 diagnostics
+Port1.0.25
+                         Current                   Alarms                   Warnings
+                         Reading          Max           Min          Max           Min
+  Temp: (Degrees C)      34.828           95.000        -50.000      90.000        -45.000
+  Vcc: (Volts)           3.292            3.800         2.800        3.700         2.900
+  Tx Bias: (mA)          6.112            16.000        2.000        15.000        2.500
+  Tx Power: (mW)         0.561            1.500         0.100        1.250         0.150
+  Rx Power: (mW)         0.208            1.500         0.010        1.250         0.015
+  Rx LOS:                Rx Up
+AT-x510#"""
+
+ALLIED_TABLE = """\
+show interface brief
+Interface             Status          Protocol
+port1.0.1             admin up        running
+port1.0.2             admin up        down
+port1.0.25            admin up        running
+vlan1                 admin up        running
+AT-x510#"""
+
+# =============================================================================
+# DATACOM
+# =============================================================================
+
+DATACOM_INTERFACE = """\
+show interface gigabit-ethernet-1/1/1
+Interface gigabit-ethernet-1/1/1
+  Description: to-DM4170 uplink
+  Admin Status: UP
+  Status: UP
+  Speed: 10G  Duplex: full
+DM4100#"""
+
+DATACOM_OPTICAL = """\
+show interface gigabit-ethernet-1/1/1 transceiver detail
+Transceiver information for gigabit-ethernet-1/1/1
+  Vendor       : DATACOM
+  Temperature  : 36.1 C
+  Voltage      : 3.31 V
+  Bias Current : 7.40 mA
+  Tx Power     : -1.97 dBm
+  Rx Power     : -13.42 dBm
+DM4100#"""
+
+DATACOM_TABLE = """\
+show interface status
+Interface                  Status  Speed  Duplex  Description
+gigabit-ethernet-1/1/1     up      10G    full    to-DM4170 uplink
+gigabit-ethernet-1/1/2     down    auto   auto
+gigabit-ethernet-1/1/3     up      1G     full    pelanggan korporat A
+DM4100#"""
+
+# =============================================================================
+# GENERIC
+# =============================================================================
+
+GENERIC_INTERFACE = """\
+display interface GigabitEthernet0/0/1
+GigabitEthernet0/0/1 current state : UP
+Line protocol current state : UP
+Description: generic uplink
+Physical state : Up
+<SWITCH>"""
+
+GENERIC_OPTICAL = """\
+display transceiver interface GigabitEthernet0/0/1
+GigabitEthernet0/0/1 transceiver information:
+  Temperature      : 30.00
+  RX Power         | -7.12
+  TX Power         | -3.04
+<SWITCH>"""
+
+GENERIC_TABLE = """\
+show interface brief
+Interface              Status    Protocol  Description
+GigabitEthernet0/0/1   up        up        generic uplink
+GigabitEthernet0/0/2   down      down
+SWITCH#"""
+
+
+VENDOR_OUTPUTS: Dict[str, Dict[str, str]] = {
+    'cisco_ios': {'interface': CISCO_IOS_INTERFACE, 'optical': CISCO_IOS_OPTICAL, 'table': CISCO_IOS_TABLE},
+    'cisco_nxos': {'interface': CISCO_NXOS_INTERFACE, 'optical': CISCO_NXOS_OPTICAL, 'table': CISCO_NXOS_TABLE},
+    'huawei': {'interface': HUAWEI_INTERFACE, 'optical': HUAWEI_OPTICAL, 'table': HUAWEI_TABLE},
+    'zte': {'interface': ZTE_INTERFACE, 'optical': ZTE_OPTICAL, 'table': ZTE_TABLE},
+    'juniper': {'interface': JUNIPER_INTERFACE, 'optical': JUNIPER_OPTICAL, 'table': JUNIPER_TABLE},
+    'mikrotik': {'interface': MIKROTIK_INTERFACE, 'optical': MIKROTIK_OPTICAL, 'table': MIKROTIK_TABLE},
+    'nokia': {'interface': NOKIA_INTERFACE, 'optical': NOKIA_OPTICAL, 'table': NOKIA_TABLE},
+    'hp_aruba': {'interface': HP_ARUBA_INTERFACE, 'optical': HP_ARUBA_OPTICAL, 'table': HP_ARUBA_TABLE},
+    'fiberhome': {'interface': FIBERHOME_INTERFACE, 'optical': FIBERHOME_OPTICAL, 'table': FIBERHOME_TABLE},
+    'dcn': {'interface': DCN_INTERFACE, 'optical': DCN_OPTICAL, 'table': DCN_TABLE},
+    'h3c': {'interface': H3C_INTERFACE, 'optical': H3C_OPTICAL, 'table': H3C_TABLE},
+    'ruijie': {'interface': RUIJIE_INTERFACE, 'optical': RUIJIE_OPTICAL, 'table': RUIJIE_TABLE},
+    'bdcom': {'interface': BDCOM_INTERFACE, 'optical': BDCOM_OPTICAL, 'table': BDCOM_TABLE},
+    'raisecom': {'interface': RAISECOM_INTERFACE, 'optical': RAISECOM_OPTICAL, 'table': RAISECOM_TABLE},
+    'fs': {'interface': FS_INTERFACE, 'optical': FS_OPTICAL, 'table': FS_TABLE},
+    'allied': {'interface': ALLIED_INTERFACE, 'optical': ALLIED_OPTICAL, 'table': ALLIED_TABLE},
+    'datacom': {'interface': DATACOM_INTERFACE, 'optical': DATACOM_OPTICAL, 'table': DATACOM_TABLE},
+    'generic': {'interface': GENERIC_INTERFACE, 'optical': GENERIC_OPTICAL, 'table': GENERIC_TABLE},
+}
+
+
+# =============================================================================
+# LARGE GENERATED OUTPUTS
+# =============================================================================
+# Deterministic (fixed seed) so timings and parse results are comparable
+# between runs.
+
+CHASSIS_SLOTS = 8
+PORTS_PER_SLOT = 48
+
+DESCRIPTION_WORDS = [
+    'uplink', 'OLT', 'C300', 'BRAS', 'core', 'pelanggan', 'ONU', 'xcon', 'AGG',
+    'PE', 'backup', 'CDN', 'IX', 'tower', 'POP', 'metro', 'ring', 'A', 'B',
+]
+
+
+def _description(rng: random.Random, width: int = 0) -> str:
+    text = ' '.join(rng.choice(DESCRIPTION_WORDS) for _ in range(rng.randint(1, 4)))
+    text = f"{text} {rng.randint(1, 48)}/{rng.randint(1, 16)}"
+    return text[:width] if width else text
+
+
+def _chassis_ports() -> List[Tuple[int, int]]:
+    return [(slot, port) for slot in range(1, CHASSIS_SLOTS + 1)
+            for port in range(1, PORTS_PER_SLOT + 1)]
+
+
+def cisco_ios_chassis_status(seed: int = 1) -> str:
+    """'show interface status' of a 384-port Catalyst 9400"""
+    rng = random.Random(seed)
+    lines = ['show interface status', '',
+             'Port      Name               Status       Vlan       Duplex  Speed Type']
+    for slot, port in _chassis_ports():
+        status = rng.choice(['connected', 'connected', 'notconnect', 'disabled', 'err-disabled'])
+        name = _description(rng, 18) if rng.random() < 0.8 else ''
+        lines.append(f"{f'Gi{slot}/0/{port}':<10}{name:<19}{status:<13}{rng.randint(1, 4094):<11}"
+                     f"{'a-full':>6} {'a-1000':>6} 10/100/1000BaseTX")
+    lines.append('C9400-CORE#')
+    return '\n'.join(lines)
+
+
+def nxos_chassis_status(seed: int = 2) -> str:
+    """'show interface status' of a 384-port Nexus 9500"""
+    rng = random.Random(seed)
+    lines = ['show interface status', '', '-' * 80,
+             'Port          Name               Status    Vlan      Duplex  Speed   Type',
+             '-' * 80]
+    for slot, port in _chassis_ports():
+        status = rng.choice(['connected', 'connected', 'notconnec', 'sfpAbsent', 'disabled'])
+        name = _description(rng, 18) if rng.random() < 0.8 else '--'
+        lines.append(f"{f'Eth{slot}/{port}':<14}{name:<19}{status:<10}{'trunk':<10}"
+                     f"{'full':<8}{'10G':<8}10Gbase-SR")
+    lines.append('NX-CORE-01# ')
+    return '\n'.join(lines)
+
+
+def nxos_transceiver_details(seed: int = 3) -> str:
+    """'show interface transceiver details' for 384 ports"""
+    rng = random.Random(seed)
+    blocks = ['show interface transceiver details']
+    for slot, port in _chassis_ports():
+        rx = rng.uniform(-28.0, -1.0)
+        tx = rng.uniform(-4.0, 0.5)
+        blocks.append(f"""Ethernet{slot}/{port}
+    transceiver is present
+    type is 10Gbase-LR
+    name is CISCO-FINISAR
+    serial number is FNS{rng.randint(10000000, 99999999)}
+
+           SFP Detail Diagnostics Information (internal calibration)
+  ----------------------------------------------------------------------------
+                Current              Alarms                  Warnings
+                Measurement     High        Low         High          Low
+  ----------------------------------------------------------------------------
+  Temperature   {rng.uniform(25, 55):.2f} C        75.00 C     -5.00 C     70.00 C        0.00 C
+  Voltage        3.29 V         3.63 V      2.97 V      3.46 V        3.13 V
+  Current        {rng.uniform(4, 9):.2f} mA       12.00 mA     2.00 mA    11.50 mA       2.50 mA
+  Tx Power      {tx:.2f} dBm       1.69 dBm  -11.30 dBm   -1.30 dBm      -7.30 dBm
+  Rx Power      {rx:.2f} dBm       1.99 dBm  -13.97 dBm   -1.00 dBm      -9.91 dBm
+  Transmit Fault Count = 0
+  ----------------------------------------------------------------------------
+""")
+    blocks.append('NX-CORE-01# ')
+    return '\n'.join(blocks)
+
+
+def huawei_transceiver_brief(seed: int = 4) -> str:
+    """'display transceiver brief' style table for 384 ports"""
+    rng = random.Random(seed)
+    lines = ['display transceiver brief',
+             'Port                   RxPower(dBm)  TxPower(dBm)  Temperature(C)  Bias(mA)',
+             '-' * 78]
+    for slot, port in _chassis_ports():
+        lines.append(f"{f'XGigabitEthernet{slot}/0/{port}':<23}{rng.uniform(-28, -1):<14.2f}"
+                     f"{rng.uniform(-4, 0.5):<14.2f}{rng.uniform(25, 55):<16.1f}{rng.uniform(4, 9):.2f}")
+    lines.append('<HW-CORE-01>')
+    return '\n'.join(lines)
+
+
+def mikrotik_ethernet_print(ports: int = 384, seed: int = 5) -> str:
+    """'/interface ethernet print without-paging' with comments"""
+    rng = random.Random(seed)
+    prompt = '[admin@CCR2216-CORE] > '
+    lines = [prompt + '/interface ethernet print without-paging',
+             'Flags: R - RUNNING; S - SLAVE; X - DISABLED',
+             'Columns: NAME, MTU, MAC-ADDRESS, ARP, SWITCH',
+             ' #    NAME            MTU  MAC-ADDRESS        ARP      SWITCH']
+    for i in range(ports):
+        if rng.random() < 0.6:
+            lines.append(f";;; {_description(rng)}")
+        flags = rng.choice(['R ', 'RS', ' S', 'X ', '  '])
+        name = f"sfp28-{i + 1}" if i >= 48 else f"ether{i + 1}"
+        lines.append(f"{i:>2} {flags} {name:<15} 1500  00:AA:BB:{i // 256:02X}:{i % 256:02X}:01  "
+                     f"enabled  switch1")
+    lines.append(prompt)
+    return '\n'.join(lines)
+
+
+def mikrotik_monitor_all(ports: int = 48, seed: int = 6) -> str:
+    """'/interface ethernet monitor [find] once' - one column per port"""
+    rng = random.Random(seed)
+    names = [f"sfp-sfpplus{i + 1}" for i in range(ports)]
+    width = max(len(n) for n in names) + 2
+
+    def row(key, values):
+        return f"{key + ':':>27} " + ''.join(f"{v:<{width}}" for v in values)
+
+    lines = ['[admin@CRS326-AGG] > /interface ethernet monitor [find] once',
+             row('name', names),
+             row('status', [rng.choice(['link-ok', 'no-link']) for _ in names]),
+             row('rate', ['10Gbps'] * ports),
+             row('sfp-temperature', [f"{rng.randint(25, 55)}C" for _ in names]),
+             row('sfp-supply-voltage', [f"{rng.uniform(3.2, 3.4):.3f}V" for _ in names]),
+             row('sfp-tx-bias-current', [f"{rng.randint(4, 9)}mA" for _ in names]),
+             row('sfp-tx-power', [f"{rng.uniform(-4, 0.5):.3f}dBm" for _ in names]),
+             row('sfp-rx-power', [f"{rng.uniform(-28, -1):.3f}dBm" for _ in names]),
+             '[admin@CRS326-AGG] > ']
+    return '\n'.join(lines)
+
+
+def nxos_running_config(lines: int = 10000, seed: int = 7) -> str:
+    """'show running-config' of roughly `lines` lines (interfaces + filler)"""
+    rng = random.Random(seed)
+    out = ['show running-config', '',
+           '!Command: show running-config',
+           '!Running configuration last done at: Tue Oct 13 09:12:44 2026',
+           '!Time: Sat Oct 17 10:00:00 2026', '',
+           'version 9.3(10) Bios:version 05.45',
+           'hostname NX-CORE-01']
+    vlan = 1
+    while len(out) < lines // 3:
+        out.append(f"vlan {vlan}")
+        out.append(f"  name VLAN-{vlan}-{rng.choice(DESCRIPTION_WORDS)}")
+        vlan += 1
+    slot, port = 1, 1
+    while len(out) < lines:
+        out.append('')
+        out.append(f"interface Ethernet{slot}/{port}")
+        if rng.random() < 0.85:
+            out.append(f"  description {_description(rng)}")
+        out.append('  switchport mode trunk')
+        out.append(f"  switchport trunk allowed vlan {rng.randint(1, 2000)}-{rng.randint(2001, 4000)}")
+        out.append('  mtu 9216')
+        out.append('  no shutdown')
+        port += 1
+        if port > 64:
+            slot, port = slot + 1, 1
+    out.append('NX-CORE-01# ')
+    return '\n'.join(out)
+
+
+def ansi_colored(text: str) -> str:
+    """Wrap every other line in ANSI color codes (RouterOS / NX-OS color CLI)"""
+    lines = text.split('\n')
+    return '\r\n'.join(f"\x1b[1;32m{line}\x1b[0m" if i % 2 else line
+                       for i, line in enumerate(lines))
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """
-BotLinkMaster v4.8.8 - Network Device Connection Module
+BotLinkMaster v4.9.0 - Network Device Connection Module
 SSH/Telnet support for routers and switches
 
+CHANGELOG v4.9.0:
+- Command output ends when the device prompt returns (no fixed idle wait)
+- Learned prompt, paging mode and per-device timeouts
+- Pager prompts answered while reading, Telnet without telnetlib
+- Bulk optical power, structured interface output, execute_batch
+
 CHANGELOG v4.8.8:
 - FIX: Cisco NX-OS description terpotong - now uses show running-config interface
 - FIX: Huawei VRP/Quidway status UNKNOWN - added VRP-specific patterns
@@ -17,22 +23,30 @@ CHANGELOG v4.8.7:
 Note: OLT support will be available in v5.0.0
 
 Author: BotLinkMaster
-Version: 4.8.8
+Version: 4.9.0
 """
 
+import functools
 import paramiko
-import telnetlib
+import select
 import socket
+import threading
 import time
 import re
 import logging
+from contextlib import contextmanager
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, List, Dict, Iterable, Iterator, NamedTuple, Tuple
 
 from vendor_commands import (
     get_vendor_config, OpticalParser, expand_interface_name, 
-    get_optical_commands, parse_mikrotik_interfaces, parse_cisco_nxos_interfaces
+    get_optical_command_templates, parse_mikrotik_interfaces, parse_mikrotik_terse,
+    parse_cisco_nxos_interfaces, parse_structured_interfaces, parse_interface_table
+)
+import metrics
+from adaptive_timeouts import (
+    BATCH_DRAIN, LIVENESS_PROBE, PROBE_COMMANDS, PROMPT_PROBE, LatencyStats, command_class
 )
 
 logging.basicConfig(
@@ -41,6 +55,282 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# v4.9.0: How devices wipe the pager prompt after the keypress -
+# cursor left + spaces (Huawei), backspaces (Cisco), CR + spaces (Juniper)
+PAGER_ERASE = re.compile(r'\x1B\[\d*D *\x1B\[\d*D|\x08+ *\x08+|\r +\r')
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    v4.9.0: Split a stream of text chunks into clean lines
+    
+    ANSI codes and carriage returns are removed per complete line, so an
+    escape sequence split across two chunks is still stripped. The last
+    (unterminated) line - usually the prompt - is yielded at the end.
+    """
+    pending = ''
+    try:
+        for chunk in chunks:
+            pending += chunk
+            if '\n' not in chunk:
+                continue
+            *complete, pending = pending.split('\n')
+            for line in complete:
+                yield ANSI_ESCAPE.sub('', line).replace('\r', '')
+        if pending:
+            yield ANSI_ESCAPE.sub('', pending).replace('\r', '')
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close:
+            close()
+
+
+class ReceiveBuffer:
+    """
+    v4.9.0: Raw bytes of one command output
+    
+    Reads are appended to a bytearray instead of being decoded and
+    concatenated as strings, so a multi-megabyte output costs one copy
+    and one decode. Prompt and pager matching only decode the last
+    `window` bytes (tail). take_lines() hands out the complete lines for
+    streaming and drops them - a line break is always a UTF-8 character
+    boundary, so no incremental decoder is needed.
+    """
+    
+    def __init__(self, window: int):
+        self.window = window
+        self._data = bytearray()
+        self._tail = b""
+    
+    def append(self, data: bytes):
+        self._data += data
+        self._tail = (self._tail + data[-self.window:])[-self.window:]
+    
+    @property
+    def tail(self) -> str:
+        """
+        Last window bytes, decoded
+        
+        Bytes that are not valid UTF-8 (or a character cut at the start)
+        are kept as lone surrogates, so tail[i:] encodes back to exactly
+        the bytes it came from (see truncate_tail()).
+        """
+        return self._tail.decode('utf-8', errors='surrogateescape')
+    
+    def truncate_tail(self, index: int):
+        """Remove tail[index:] - the end of the output - from the buffer"""
+        size = len(self.tail[index:].encode('utf-8', errors='surrogateescape'))
+        size = min(size, len(self._data))
+        if size:
+            del self._data[len(self._data) - size:]
+            self._tail = self._tail[:len(self._tail) - size]
+    
+    def take_lines(self) -> str:
+        """Complete lines received so far ('' if none)"""
+        cut = self._data.rfind(b"\n") + 1
+        if not cut:
+            return ""
+        lines = self._data[:cut].decode('utf-8', errors='ignore')
+        del self._data[:cut]
+        return lines
+    
+    def take_all(self) -> str:
+        """Everything not taken yet, decoded once"""
+        text = self._data.decode('utf-8', errors='ignore')
+        self._data = bytearray()
+        return text
+
+
+class ReadEvent(NamedTuple):
+    """v4.9.0: What one chunk of command output asks the client to do"""
+    lines: str            # complete lines to hand to the consumer ('' if none)
+    answer_pager: bool    # a pager prompt was removed - send a space
+    done: bool            # the prompt is back, the read is complete
+
+
+@dataclass
+class CommandRead:
+    """
+    v4.9.0: State of one command output being read
+    
+    Created by BotLinkMasterBase._start_read() and advanced by
+    _feed_read() - no I/O, the sync and async clients only receive the
+    bytes and act on the ReadEvent. Times come from the client's clock.
+    """
+    command: str
+    stats: LatencyStats
+    first_byte_timeout: float
+    idle_timeout: float
+    start_time: float
+    hard_deadline: float
+    buffer: ReceiveBuffer
+    echo: bytes
+    whole: bool
+    last_data_time: float = 0.0
+    received: int = 0
+    first_byte_time: Optional[float] = None
+    max_gap: float = 0.0
+    outcome: str = 'timeout'
+    pages: int = 0
+    line_seen: bool = False
+    echo_seen: bool = False
+    echo_window: bytes = b""
+    # The consumer stopped early: read up to the prompt, hand out nothing
+    draining: bool = False
+
+
+# v4.9.0: Telnet commands (RFC 854)
+IAC = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+SB = 250
+SE = 240
+
+
+class TelnetCodec:
+    """
+    v4.9.0: Telnet command parser without I/O
+    
+    feed() strips telnet commands from raw socket bytes and returns the
+    data. Option requests are answered through send: options in accepted
+    may be enabled by the server, every other option is refused.
+    Subnegotiations are skipped, commands split across reads are kept
+    until the rest arrives. Reads without IAC pass through unchanged.
+    """
+    
+    def __init__(self, send: Callable[[bytes], Any], accepted: Iterable[int] = ()):
+        self.send = send
+        self.accepted = tuple(accepted)
+        self._pending = b""
+        self._in_subnegotiation = False
+        self._answered = set()
+    
+    def feed(self, raw: bytes) -> bytes:
+        if not self._pending and not self._in_subnegotiation and IAC not in raw:
+            # NUL after CR (RFC 854) is not part of the output
+            return raw.replace(b"\x00", b"")
+        
+        buffer = self._pending + raw
+        self._pending = b""
+        data = bytearray()
+        i = 0
+        end = len(buffer)
+        
+        while i < end:
+            if self._in_subnegotiation:
+                close = buffer.find(bytes([IAC, SE]), i)
+                if close < 0:
+                    # Keep a trailing IAC, it may be the start of IAC SE
+                    self._pending = buffer[-1:] if buffer[-1] == IAC else b""
+                    break
+                self._in_subnegotiation = False
+                i = close + 2
+                continue
+            
+            command_start = buffer.find(bytes([IAC]), i)
+            if command_start < 0:
+                data += buffer[i:]
+                break
+            data += buffer[i:command_start]
+            i = command_start
+            
+            if i + 1 >= end:
+                self._pending = buffer[i:]
+                break
+            command = buffer[i + 1]
+            
+            if command == IAC:
+                data.append(IAC)
+                i += 2
+            elif command in (DO, DONT, WILL, WONT):
+                if i + 2 >= end:
+                    self._pending = buffer[i:]
+                    break
+                self._answer(command, buffer[i + 2])
+                i += 3
+            elif command == SB:
+                self._in_subnegotiation = True
+                i += 2
+            else:
+                # NOP, GA, AYT, ... carry no data
+                i += 2
+        
+        return bytes(data).replace(b"\x00", b"")
+    
+    def _answer(self, command: int, option: int):
+        if command == WILL:
+            reply = DO if option in self.accepted else DONT
+        elif command == DO:
+            reply = WONT
+        else:
+            # DONT / WONT need no answer, we never enable anything
+            return
+        # Answer every request once, avoids negotiation loops
+        if (reply, option) in self._answered:
+            return
+        self._answered.add((reply, option))
+        self.send(bytes([IAC, reply, option]))
+
+
+class TelnetSocket:
+    """
+    v4.9.0: Telnet connection on a plain socket (replaces telnetlib)
+    
+    telnetlib reads 50 bytes per recv() and parses byte by byte into a
+    queue that is copied on every read - quadratic for large outputs.
+    Here every read takes up to 64 KB and goes through TelnetCodec.
+    Like telnetlib, every option the server offers is refused.
+    """
+    
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._codec = TelnetCodec(sock.sendall)
+    
+    def read(self, timeout: float) -> bytes:
+        """
+        Data bytes of one read, blocking up to timeout
+        
+        Returns b'' if nothing arrived in time. Raises EOFError if the
+        connection was closed by the device.
+        """
+        deadline = time.time() + max(0.0, timeout)
+        while True:
+            ready, _, _ = select.select([self.sock], [], [], max(0.0, deadline - time.time()))
+            if not ready:
+                return b""
+            raw = self.sock.recv(65535)
+            if not raw:
+                raise EOFError("Telnet connection closed")
+            data = self._codec.feed(raw)
+            # A read with negotiation only - keep waiting for data
+            if data or time.time() >= deadline:
+                return data
+    
+    def write(self, data: bytes):
+        self.sock.sendall(data.replace(bytes([IAC]), bytes([IAC, IAC])))
+    
+    def close(self):
+        self.sock.close()
+    
+    @property
+    def closed(self) -> bool:
+        return self.sock.fileno() < 0
+
+
+def timed_phase(phase: str):
+    """v4.9.0: Record the duration of a BotLinkMaster method as session phase"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class Protocol(Enum):
     SSH = "ssh"
@@ -57,14 +347,86 @@ class ConnectionConfig:
     timeout: int = 30
     vendor: str = "generic"
     enable_password: Optional[str] = None
+    # v4.9.0: Connection hints learned from previous sessions (not part of identity)
+    preferred_method: Optional[str] = field(default=None, compare=False)
+    preferred_algorithms: Dict[str, str] = field(default_factory=dict, compare=False)
+    # 'command' (disable_paging works) or 'pager' (pager prompts are answered)
+    paging_mode: Optional[str] = field(default=None, compare=False)
+    # True if the device rejected structured_interface_command before
+    structured_rejected: bool = field(default=False, compare=False)
+    # Optical command template that found readings before (see _optical_candidates)
+    optical_command: Optional[str] = field(default=None, compare=False)
+    # v4.9.0: Device name for metric labels (host if empty)
+    name: str = field(default="", compare=False)
+    # v4.9.0: Response times per command class from previous sessions
+    latency_stats: Dict[str, LatencyStats] = field(default_factory=dict, compare=False)
     
     def __post_init__(self):
         if self.port is None:
             self.port = 22 if self.protocol == Protocol.SSH else 23
 
 
-class BotLinkMaster:
-    """Main class for network device connections and monitoring"""
+@dataclass
+class NxosDescriptionEntry:
+    """v4.9.0: Parsed running-config descriptions of one NX-OS device"""
+    descriptions: Dict[str, str]
+    marker: Optional[str]
+    checked_at: float
+
+
+class NxosDescriptionCache:
+    """
+    v4.9.0: NX-OS descriptions per device (host:port), shared by all sessions
+    
+    Sessions run in worker threads, every access goes through the lock.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, NxosDescriptionEntry] = {}
+        self._lock = threading.Lock()
+    
+    def fresh(self, key: str, ttl: float) -> Optional[Dict[str, str]]:
+        """Descriptions checked less than ttl seconds ago, else None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry.checked_at < ttl:
+                return entry.descriptions
+            return None
+    
+    def revalidate(self, key: str, marker: Optional[str]) -> Optional[Dict[str, str]]:
+        """Cached descriptions if the config marker did not change (checked again now)"""
+        if not marker:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or entry.marker != marker:
+                return None
+            entry.checked_at = time.time()
+            return entry.descriptions
+    
+    def store(self, key: str, descriptions: Dict[str, str], marker: Optional[str]):
+        with self._lock:
+            self._entries[key] = NxosDescriptionEntry(
+                descriptions=descriptions, marker=marker, checked_at=time.time()
+            )
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+nxos_description_cache = NxosDescriptionCache()
+
+
+class BotLinkMasterBase:
+    """
+    v4.9.0: Session state, vendor settings and output parsing - no I/O
+    
+    Shared by BotLinkMaster (blocking) and AsyncBotLinkMaster (asyncio).
+    Nothing here reads from or writes to the device: every method that
+    does lives in the client classes, so neither client inherits the
+    other's I/O.
+    """
     
     # v4.8.7: Extended legacy key types for CRS326 compatibility
     LEGACY_KEY_TYPES = [
@@ -150,6 +512,48 @@ class BotLinkMaster:
         ],
     }
     
+    # v4.9.0: Prompts that mark command completion on any vendor
+    COMPLETION_PROMPT_PATTERNS = [
+        r'\[[\w\-@]+\]\s*[/\w]*[>#]\s*$',   # MikroTik: [admin@router] >
+        r'[\w\-]+[>#]\s*$',                 # Cisco/Generic: Router#
+        r'<[\w\-]+>\s*$',                   # Huawei: <Router>
+        r'\[[\w\-~]+\]\s*$',                # Huawei config: [Router]
+    ]
+    
+    # v4.9.0: Only the end of the buffer is checked for a prompt
+    PROMPT_TAIL_WINDOW = 256
+    
+    # v4.9.0: Candidate commands are written back-to-back and the output
+    # is split on the prompt (see execute_batch)
+    PIPELINE_COMMANDS = True
+    
+    # v4.9.0: Telnet login prompts, checked on the last line of the buffer
+    TELNET_LOGIN_PROMPTS = [
+        ('username', re.compile(r'(?:[Ll]ogin|[Uu]ser(?:name)?)\s*:\s*$')),
+        ('password', re.compile(r'[Pp]assword\s*:\s*$')),
+    ]
+    
+    # v4.9.0: NX-OS descriptions are harvested once per device and reused
+    # for NXOS_DESCRIPTION_TTL seconds, then revalidated with the
+    # "last done" line of running-config (refetched only if it changed)
+    NXOS_DESCRIPTION_TTL = 600
+    NXOS_CONFIG_MARKER_COMMAND = 'show running-config | include "Running configuration last done"'
+    
+    # v4.9.0: Listing commands in the order they are tried (shared with
+    # AsyncBotLinkMaster)
+    NXOS_INTERFACE_COMMANDS = [
+        "show interface status",
+        "show interface brief",
+        "show interface description",
+    ]
+    # v4.8.7: Commands optimized for CRS326
+    MIKROTIK_INTERFACE_COMMANDS = [
+        "/interface ethernet print without-paging",
+        "/interface print brief without-paging",
+        "/interface print without-paging",
+    ]
+    MIKROTIK_COUNT_COMMAND = "/interface ethernet print count-only"
+    
     def __init__(self, config: ConnectionConfig):
         self.config = config
         self.client = None
@@ -159,306 +563,1362 @@ class BotLinkMaster:
         self.vendor_config = get_vendor_config(config.vendor)
         self.optical_parser = OpticalParser(config.vendor)
         self.connection_method = None
+        self.negotiated_algorithms: Dict[str, str] = {}
+        self._prompt: Optional[str] = None
+        # v4.9.0: Set once the device rejected structured_interface_command
+        # (also in an earlier session: config.structured_rejected)
+        self._structured_rejected = config.structured_rejected
+        self._structured_rejected_saved = config.structured_rejected
+        # v4.9.0: Set once a pipelined batch could not be split
+        self._batch_rejected = False
+        # v4.9.0: Seconds per phase of the last connect (also exported as metrics)
+        self.phase_times: Dict[str, float] = {}
+        self._attempt_method: Optional[str] = None
+        # v4.9.0: Learned per command class, drives the command timeouts
+        self.latency_stats = config.latency_stats
+        self._latency_updated = set()
+        # v4.9.0: 'command' or 'pager', see _set_paging_mode()
+        self.paging_mode: Optional[str] = None
+        self._paging_mode_saved = config.paging_mode
+        # v4.9.0: Optical command template that worked, sent alone next time
+        self.optical_command = config.optical_command
+        self._optical_command_saved = config.optical_command
         
         vendor_key = config.vendor.lower()
+        self.timeouts = self.vendor_timeouts(vendor_key)
         
-        # v4.8.7: Match vendor timeouts more flexibly
         if 'mikrotik' in vendor_key:
-            self.timeouts = self.VENDOR_TIMEOUTS['mikrotik']
             self.prompt_patterns = self.PROMPT_PATTERNS['mikrotik']
         elif 'huawei' in vendor_key:
-            self.timeouts = self.VENDOR_TIMEOUTS['huawei']
             self.prompt_patterns = self.PROMPT_PATTERNS['huawei']
         elif 'cisco' in vendor_key:
-            if 'nxos' in vendor_key:
-                self.timeouts = self.VENDOR_TIMEOUTS['cisco_nxos']
-            else:
-                self.timeouts = self.VENDOR_TIMEOUTS['cisco_ios']
             self.prompt_patterns = self.PROMPT_PATTERNS['cisco']
         else:
-            self.timeouts = self.VENDOR_TIMEOUTS['default']
             self.prompt_patterns = self.PROMPT_PATTERNS['default']
+        
+        self._prompt_regexes = [
+            re.compile(p) for p in self.prompt_patterns + self.COMPLETION_PROMPT_PATTERNS
+        ]
     
-    def connect(self) -> bool:
-        try:
-            if self.config.protocol == Protocol.SSH:
-                return self._connect_ssh()
-            elif self.config.protocol == Protocol.TELNET:
-                return self._connect_telnet()
-            return False
-        except Exception as e:
-            logger.error(f"Connection failed: {str(e)}")
-            return False
+    @classmethod
+    def vendor_timeouts(cls, vendor: str) -> Dict[str, float]:
+        """v4.9.0: Default timeouts of a vendor, before any learning"""
+        vendor_key = vendor.lower()
+        # v4.8.7: Match vendor timeouts more flexibly
+        if 'mikrotik' in vendor_key:
+            return cls.VENDOR_TIMEOUTS['mikrotik']
+        if 'huawei' in vendor_key:
+            return cls.VENDOR_TIMEOUTS['huawei']
+        if 'cisco' in vendor_key:
+            return cls.VENDOR_TIMEOUTS['cisco_nxos' if 'nxos' in vendor_key else 'cisco_ios']
+        return cls.VENDOR_TIMEOUTS['default']
     
-    def _connect_ssh(self) -> bool:
-        """Connect via SSH with legacy algorithm support - v4.8.7"""
+    @property
+    def metric_labels(self) -> Dict[str, str]:
+        """v4.9.0: vendor / device / connection_method labels of this session"""
+        return {
+            'vendor': self.config.vendor,
+            'device': self.config.name or self.config.host,
+            'connection_method': (self.connection_method or self._attempt_method
+                                  or self.config.protocol.value),
+        }
+    
+    def _record_phase(self, phase: str, seconds: float):
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+        metrics.DEVICE_PHASE_SECONDS.labels(phase=phase, **self.metric_labels).observe(seconds)
+    
+    @contextmanager
+    def _phase(self, phase: str):
+        """v4.9.0: Timing span of one session phase"""
+        start = time.perf_counter()
         try:
-            logger.info(f"Connecting to {self.config.host}:{self.config.port} via SSH...")
-            
-            # v4.8.7: Try transport method first (better for legacy devices like CRS326)
-            try:
-                return self._connect_ssh_transport()
-            except Exception as e:
-                logger.warning(f"Transport method failed: {e}")
-            
-            # Try standard method
-            try:
-                return self._connect_ssh_standard()
-            except Exception as e:
-                logger.warning(f"Standard method failed: {e}")
-            
-            # Try alternative method
-            return self._connect_ssh_alternative()
-            
-        except Exception as e:
-            logger.error(f"SSH error: {str(e)}")
-            return False
+            yield
+        finally:
+            self._record_phase(phase, time.perf_counter() - start)
     
-    def _connect_ssh_transport(self) -> bool:
-        """SSH via Transport for legacy devices - v4.8.7 improved"""
-        self.transport = paramiko.Transport((self.config.host, self.config.port))
-        self.transport.set_keepalive(30)
-        
-        # v4.8.7: Set extended algorithms for CRS326 compatibility
-        self.transport._preferred_keys = self.LEGACY_KEY_TYPES
-        self.transport._preferred_kex = self.LEGACY_KEX
-        self.transport._preferred_ciphers = self.LEGACY_CIPHERS
-        
-        self.transport.connect(
-            username=self.config.username,
-            password=self.config.password,
-        )
-        
-        self.shell = self.transport.open_session()
-        self.shell.get_pty(term='vt100', width=200, height=50)
-        self.shell.invoke_shell()
-        
-        # Wait for prompt
-        if not self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
-            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
+    def _fallback(self, kind: str):
+        """v4.9.0: Count a fallback to a slower or alternative method"""
+        metrics.FALLBACKS.labels(vendor=self.config.vendor, kind=kind).inc()
+    
+    def _timeout(self, kind: str):
+        metrics.TIMEOUTS.labels(kind=kind, **self.metric_labels).inc()
+    
+    def _record_negotiated(self, transport):
+        """v4.9.0: Remember algorithms negotiated with the device"""
+        if not transport:
+            return
+        self.negotiated_algorithms = {
+            'cipher': transport.local_cipher or '',
+            'key_type': transport.host_key_type or '',
+        }
+    
+    @staticmethod
+    def _prefer(algorithms: List[str], preferred: Optional[str]) -> List[str]:
+        if preferred and preferred in algorithms:
+            return [preferred] + [a for a in algorithms if a != preferred]
+        return list(algorithms)
+    
+    @property
+    def prompt(self) -> Optional[str]:
+        """
+        v4.9.0: Literal device prompt learned after login
         
-        self._disable_paging()
+        e.g. "[admin@CRS326] >", "<HUAWEI-CORE>", "N9K-SPINE1#".
+        None if the prompt could not be learned.
+        """
+        return self._prompt
+    
+    @staticmethod
+    def _last_line(text: str) -> str:
+        return ANSI_ESCAPE.sub('', text).replace('\r', '\n').rsplit('\n', 1)[-1]
+    
+    def _ring_tail(self, tail: bytes, data: bytes) -> bytes:
+        """v4.9.0: Last PROMPT_TAIL_WINDOW bytes of tail + data"""
+        window = self.PROMPT_TAIL_WINDOW
+        return (tail + data[-window:])[-window:]
+    
+    def _is_prompt(self, tail: str) -> bool:
+        """v4.9.0: True if the buffer tail ends with the device prompt"""
+        if self._prompt:
+            return ANSI_ESCAPE.sub('', tail).rstrip().endswith(self._prompt)
         
-        self.connected = True
-        self.connection_method = "transport"
-        logger.info(f"SSH connected (transport) to {self.config.host}")
-        return True
+        last_line = self._last_line(tail)
+        if not last_line.strip():
+            return False
+        for regex in self._prompt_regexes:
+            if regex.search(last_line):
+                return True
+        return False
     
-    def _connect_ssh_standard(self) -> bool:
-        """Standard SSH connection"""
-        self.client = paramiko.SSHClient()
-        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    def _strip_pager(self, buffer: ReceiveBuffer, tail: str) -> bool:
+        """v4.9.0: Remove a pager prompt at the end of buffer - True if there was one"""
+        for regex in self.vendor_config.patterns.pager:
+            match = regex.search(tail)
+            if match:
+                buffer.truncate_tail(len(tail[:match.start()].rstrip(' ')))
+                return True
+        return False
+    
+    def _record_pager(self, command: str, pages: int):
+        """v4.9.0: The device paged although paging should be off"""
+        logger.info(f"Answered {pages} pager prompt(s) for '{command}'")
+        if self.paging_mode != 'pager':
+            logger.info("Paging is still on, answering the pager from now on")
+            self.paging_mode = 'pager'
+            self._fallback('pager')
+    
+    def _latency_stats_for(self, command: str) -> LatencyStats:
+        if command in PROBE_COMMANDS:
+            # Vendor defaults, never learned (see _record_latency)
+            return LatencyStats(command_class=command)
+        key = command_class(command)
+        stats = self.latency_stats.get(key)
+        if stats is None:
+            stats = self.latency_stats[key] = LatencyStats(command_class=key)
+        return stats
+    
+    def _command_timeouts(self, stats: LatencyStats, wait_time: float,
+                          hard_timeout: Optional[float]) -> Tuple[float, float, float]:
+        """
+        v4.9.0: (first_byte, idle, hard) timeouts of one command
         
-        self.client.connect(
-            hostname=self.config.host,
-            port=self.config.port,
-            username=self.config.username,
-            password=self.config.password,
-            timeout=self.config.timeout,
-            look_for_keys=False,
-            allow_agent=False,
-            disabled_algorithms={'pubkeys': ['rsa-sha2-256', 'rsa-sha2-512']}
+        Vendor defaults until the command class has been learned on this
+        device, then derived from its response times (adaptive_timeouts).
+        An explicit hard_timeout (liveness probe) is kept as is.
+        """
+        idle_timeout = self.timeouts['idle_timeout']
+        first_byte_timeout = max(wait_time, idle_timeout)
+        explicit_hard = hard_timeout is not None
+        if not explicit_hard:
+            hard_timeout = self.timeouts['hard_timeout']
+        
+        if stats.learned:
+            first_byte_timeout = stats.timeout('first_byte', first_byte_timeout)
+            idle_timeout = stats.timeout('gap', idle_timeout)
+            if not explicit_hard:
+                hard_timeout = stats.timeout('total', hard_timeout)
+        return first_byte_timeout, idle_timeout, hard_timeout
+    
+    def _record_latency(self, stats: LatencyStats, outcome: str, first_byte: Optional[float],
+                        gap: float, total: float):
+        """v4.9.0: Learn from a command that returned its prompt"""
+        if stats.command_class in PROBE_COMMANDS:
+            return
+        if outcome == 'prompt' and first_byte is not None:
+            stats.observe(first_byte, gap, total)
+        elif outcome == 'timeout' and stats.learned:
+            logger.info(f"Timeout with learned timeouts for '{stats.command_class}', "
+                        f"back to vendor defaults")
+            stats.reset()
+        else:
+            return
+        self._latency_updated.add(stats.command_class)
+    
+    def take_latency_updates(self) -> List[LatencyStats]:
+        """v4.9.0: Statistics changed since the last call (to be persisted)"""
+        updated = [self.latency_stats[key] for key in self._latency_updated
+                   if key in self.latency_stats]
+        self._latency_updated = set()
+        return updated
+    
+    def _start_read(self, command: str, wait_time: float, now: float,
+                    hard_timeout: Optional[float] = None,
+                    until_echo: Optional[str] = None, whole: bool = False) -> CommandRead:
+        """v4.9.0: Begin reading the output of command (sent at now)"""
+        stats = self._latency_stats_for(command)
+        first_byte_timeout, idle_timeout, hard_timeout = self._command_timeouts(
+            stats, wait_time, hard_timeout)
+        return CommandRead(
+            command=command, stats=stats,
+            first_byte_timeout=first_byte_timeout, idle_timeout=idle_timeout,
+            start_time=now, hard_deadline=now + hard_timeout, last_data_time=now,
+            buffer=ReceiveBuffer(self.PROMPT_TAIL_WINDOW),
+            echo=until_echo.encode('utf-8') if until_echo else b"", whole=whole,
         )
+    
+    def _read_wait(self, read: CommandRead, now: float) -> float:
+        """
+        v4.9.0: Seconds the next receive may wait for data
         
-        self.shell = self.client.invoke_shell(width=200, height=50)
-        
-        if not self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
-            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
-        
-        self._disable_paging()
+        wait_time / idle_timeout until the first byte after the echoed
+        command line, then idle_timeout of silence, never past the hard
+        timeout. 0 once a limit is reached (logged and counted here).
+        """
+        if read.first_byte_time is None:
+            silence, since = read.first_byte_timeout, read.start_time
+        else:
+            silence, since = read.idle_timeout, read.last_data_time
+        deadline = min(read.hard_deadline, since + silence)
+        if now < deadline:
+            return deadline - now
+        
+        labels = self.metric_labels
+        if now >= read.hard_deadline:
+            logger.warning(f"Hard timeout for '{read.command}'")
+            metrics.HARD_TIMEOUTS.labels(command=metrics.command_label(read.command),
+                                         **labels).inc()
+        elif read.first_byte_time is not None:
+            logger.info(f"Idle timeout for '{read.command}', no prompt seen")
+            metrics.TIMEOUTS.labels(kind='idle', **labels).inc()
+        else:
+            logger.warning(f"No response for '{read.command}' after {silence:.1f}s")
+            metrics.TIMEOUTS.labels(kind='first_byte', **labels).inc()
+        return 0.0
+    
+    def _read_closed(self, read: CommandRead):
+        """v4.9.0: The device closed the connection during the read"""
+        logger.warning(f"Connection closed during '{read.command}'")
+        self.connected = False
+        read.outcome = 'closed'
+    
+    def _feed_read(self, read: CommandRead, data: bytes, now: float) -> ReadEvent:
+        """
+        v4.9.0: Advance a command read by one received chunk
+        
+        Tracks first byte and gaps, removes pager prompts (the client
+        answers them) and hands out complete lines - the unterminated last
+        line is held back until it is known not to be a pager prompt. The
+        prompt only completes the read after the echoed command line (or
+        the until_echo text), so a prompt redraw before the echo does not
+        end it early.
+        """
+        if read.first_byte_time is not None:
+            read.max_gap = max(read.max_gap, now - read.last_data_time)
+        elif read.line_seen:
+            read.first_byte_time = now
+        else:
+            # The echoed command line is not the answer: the first byte
+            # is the first one after the end of the echo line
+            newline = data.find(b"\n")
+            if newline >= 0:
+                read.line_seen = True
+                if newline + 1 < len(data):
+                    read.first_byte_time = now
+        read.received += len(data)
+        read.last_data_time = now
+        read.buffer.append(data)
+        tail = read.buffer.tail
+        
+        paged = self._strip_pager(read.buffer, tail)
+        if paged:
+            read.pages += 1
+        lines = ""
+        if not read.whole:
+            lines = read.buffer.take_lines()
+            if read.pages:
+                lines = PAGER_ERASE.sub('', lines)
+            if read.draining:
+                lines = ""
+        if paged:
+            return ReadEvent(lines, True, False)
+        
+        if not read.echo_seen:
+            if read.echo:
+                read.echo_window += data
+                if read.echo not in read.echo_window:
+                    read.echo_window = read.echo_window[-len(read.echo):]
+                    return ReadEvent(lines, False, False)
+            elif not read.line_seen:
+                return ReadEvent(lines, False, False)
+            read.echo_seen = True
+        
+        if self._is_prompt(tail):
+            read.outcome = 'prompt'
+            return ReadEvent(lines, False, True)
+        return ReadEvent(lines, False, False)
+    
+    def _finish_read(self, read: CommandRead, now: float) -> str:
+        """v4.9.0: Record the read (latency, pager, metrics) - returns the rest of the output"""
+        rest = read.buffer.take_all()
+        if read.pages:
+            rest = PAGER_ERASE.sub('', rest)
+            self._record_pager(read.command, read.pages)
+        elapsed = now - read.start_time
+        logger.info(f"Command '{read.command}': received {read.received} bytes in {elapsed:.2f}s")
+        first_byte = read.first_byte_time and read.first_byte_time - read.start_time
+        self._record_latency(read.stats, read.outcome, first_byte, read.max_gap, elapsed)
+        
+        # v4.9.0: Waiting for the device (first byte) vs reading the output
+        labels = self.metric_labels
+        command_label = metrics.command_label(read.command)
+        command_seconds = metrics.DEVICE_COMMAND_SECONDS
+        if read.first_byte_time is not None:
+            command_seconds.labels(command=command_label, stage='first_byte', **labels).observe(
+                read.first_byte_time - read.start_time)
+            command_seconds.labels(command=command_label, stage='read', **labels).observe(
+                now - read.first_byte_time)
+        command_seconds.labels(command=command_label, stage='total', **labels).observe(elapsed)
+        return "" if read.draining else rest
+    
+    def _paging_command(self) -> Optional[str]:
+        """
+        v4.9.0: disable_paging command to send (None = answer the pager)
         
-        self.connected = True
-        self.connection_method = "standard"
-        logger.info(f"SSH connected (standard) to {self.config.host}")
+        paging_mode 'command': disable_paging was accepted, output is never
+        paged. 'pager': the vendor has no disable_paging (MikroTik) or the
+        device rejected it (e.g. missing privilege) - pager prompts are
+        answered while reading. A device known as 'pager' from an earlier
+        session (config.paging_mode) skips the command.
+        """
+        command = self.vendor_config.disable_paging
+        if not command or self.config.paging_mode == 'pager':
+            self.paging_mode = 'pager'
+            return None
+        return command
+    
+    def _apply_paging_result(self, command: str, output: str):
+        if output and self._is_command_error(output):
+            logger.info(f"'{command}' rejected, answering the pager instead")
+            self.paging_mode = 'pager'
+            self._fallback('pager')
+        else:
+            self.paging_mode = 'command'
+    
+    def take_paging_update(self) -> Optional[str]:
+        """v4.9.0: Paging mode if it changed since the last call (to be persisted)"""
+        if not self.paging_mode or self.paging_mode == self._paging_mode_saved:
+            return None
+        self._paging_mode_saved = self.paging_mode
+        return self.paging_mode
+    
+    def take_structured_update(self) -> bool:
+        """v4.9.0: True once after the device rejected structured output (to be persisted)"""
+        if not self._structured_rejected or self._structured_rejected_saved:
+            return False
+        self._structured_rejected_saved = True
         return True
     
-    def _connect_ssh_alternative(self) -> bool:
-        """Alternative SSH connection"""
-        logger.info("Trying alternative SSH...")
-        
-        self.client = paramiko.SSHClient()
-        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        
-        self.client.connect(
-            hostname=self.config.host,
-            port=self.config.port,
-            username=self.config.username,
-            password=self.config.password,
-            timeout=self.config.timeout,
-            look_for_keys=False,
-            allow_agent=False,
-        )
-        
-        self.shell = self.client.invoke_shell(width=200, height=50)
-        
-        if not self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
-            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
-        
-        self._disable_paging()
+    @staticmethod
+    def _split_batch_output(output: str, commands: List[str], prompt: str) -> List[Optional[str]]:
+        """
+        v4.9.0: Per-command outputs of a pipelined batch
         
-        self.connected = True
-        self.connection_method = "alternative"
-        logger.info(f"SSH connected (alternative) to {self.config.host}")
-        return True
+        Each output is the echoed command, its output lines and the prompt -
+        the text a single execute_command() returns. An output is only
+        complete once the next command's echo (or, for the last command,
+        the final prompt) follows it; None for commands whose output was
+        not recovered (read timed out, echo not found).
+        """
+        lines = output.replace('\r', '').split('\n')
+        
+        echoes = []
+        index = 0
+        for i, cmd in enumerate(commands):
+            while index < len(lines):
+                line = lines[index].strip()
+                if line.startswith(prompt):
+                    line = line[len(prompt):].strip()
+                elif i:
+                    # Later commands are echoed after the prompt
+                    line = None
+                if line == cmd:
+                    break
+                index += 1
+            else:
+                break
+            echoes.append(index)
+            index += 1
+        
+        bounds = echoes[1:]
+        if len(echoes) == len(commands):
+            end = len(lines) - 1
+            while end > echoes[-1] and not lines[end].strip():
+                end -= 1
+            if end > echoes[-1] and lines[end].strip() == prompt:
+                bounds.append(end)
+        
+        outputs: List[Optional[str]] = [
+            '\n'.join([cmd] + lines[start + 1:stop] + [prompt])
+            for cmd, start, stop in zip(commands, echoes, bounds)
+        ]
+        return outputs + [None] * (len(commands) - len(outputs))
     
-    def _wait_for_prompt(self, timeout: int = 30) -> bool:
-        """Wait for shell prompt to appear - v4.8.7 improved"""
-        logger.info(f"Waiting for prompt (timeout={timeout}s)...")
+    def _can_pipeline(self, unique: List[str]) -> bool:
+        """
+        v4.9.0: True if unique (deduplicated) commands can be sent as one batch
         
-        buffer = ""
-        start_time = time.time()
+        Not if the prompt is unknown, paging is not disabled on the device
+        (typed-ahead lines would answer the pager) or an earlier batch of
+        this session could not be split.
+        """
+        return (len(unique) >= 2 and self.connected and bool(self._prompt)
+                and not self._batch_rejected and bool(self.PIPELINE_COMMANDS)
+                and self.paging_mode == 'command')
+    
+    def _batch_outputs(self, output: str, unique: List[str]) -> List[Optional[str]]:
+        """
+        v4.9.0: Per-command outputs of a batch (None = run again on its own)
         
-        while time.time() - start_time < timeout:
-            if self.shell.recv_ready():
-                try:
-                    data = self.shell.recv(65535).decode('utf-8', errors='ignore')
-                    buffer += data
-                    
-                    # Check for prompt patterns
-                    for pattern in self.prompt_patterns:
-                        if re.search(pattern, buffer):
-                            logger.info(f"Prompt detected! Buffer size: {len(buffer)}")
-                            return True
-                    
-                    # MikroTik: ] > or ] # at end of line
-                    if re.search(r'\]\s*[>#]\s*$', buffer):
-                        logger.info("MikroTik prompt detected!")
-                        return True
-                    
-                    # Cisco/Generic: hostname# or hostname>
-                    if re.search(r'[\w\-]+[>#]\s*$', buffer):
-                        logger.info("Generic prompt detected!")
-                        return True
-                    
-                    # Huawei: <hostname> or [hostname]
-                    if re.search(r'[<\[][\w\-~]+[>\]]\s*$', buffer):
-                        logger.info("Huawei prompt detected!")
-                        return True
-                        
-                except Exception as e:
-                    logger.warning(f"Error reading data: {e}")
-            
-            time.sleep(0.2)
+        A batch that could not be fully split is remembered: the session
+        runs commands one by one from then on.
+        """
+        split = self._split_batch_output(ANSI_ESCAPE.sub('', output), unique, self._prompt)
+        missing = split.count(None)
+        if missing:
+            logger.info(f"Batch output: {missing} of {len(unique)} commands not recovered, "
+                        f"running them one by one")
+            self._batch_rejected = True
+            self._fallback('batch')
+        return split
+    
+    def _batch_drain_echo(self, output: str, unique: List[str]) -> Optional[str]:
+        """
+        v4.9.0: Is the device still answering a batch whose read stopped early?
         
-        logger.warning(f"Prompt timeout. Buffer ({len(buffer)} bytes)")
-        return False
+        None if the output ends with the prompt after the last command's
+        echo - the device is idle. Otherwise the text to read up to
+        (until_echo) before anything else is sent: the last command if it
+        was not echoed yet, else '' (up to the next prompt).
+        """
+        output = ANSI_ESCAPE.sub('', output)
+        if unique[-1] not in output:
+            return unique[-1]
+        if self._is_prompt(output.rstrip('\r\n')[-self.PROMPT_TAIL_WINDOW:]):
+            return None
+        return ''
     
-    def _connect_telnet(self) -> bool:
-        """Connect via Telnet - v4.8.7 fixed for MikroTik and other vendors"""
-        try:
-            logger.info(f"Connecting to {self.config.host}:{self.config.port} via Telnet...")
-            
-            self.client = telnetlib.Telnet(
-                self.config.host,
-                self.config.port,
-                timeout=self.config.timeout
-            )
-            
-            login_timeout = self.timeouts.get('prompt_timeout', 30)
-            
-            # Read initial data (banner, etc)
-            time.sleep(1)
-            initial_data = b""
-            try:
-                initial_data = self.client.read_very_eager()
-            except:
-                pass
-            
-            initial_str = initial_data.decode('utf-8', errors='ignore')
-            logger.info(f"Telnet: Initial data ({len(initial_data)} bytes): {initial_str[:200]}")
-            
-            # Determine if we need to login based on initial data or wait for prompt
-            need_login = False
-            need_password = False
-            
-            # Check initial data for login prompt
-            initial_lower = initial_str.lower()
-            if any(p in initial_lower for p in ['login:', 'login :', 'username:', 'username :', 'user:', 'user :']):
-                need_login = True
-            elif any(p in initial_lower for p in ['password:', 'password :']):
-                need_password = True
-            
-            # If no prompt in initial data, wait for it
-            if not need_login and not need_password:
-                logger.info("Telnet: Waiting for login prompt...")
-                try:
-                    # Wait specifically for login or password prompt
-                    login_patterns = [
-                        rb'[Ll]ogin\s*:', rb'[Uu]sername\s*:', rb'[Uu]ser\s*:',
-                        rb'[Pp]assword\s*:',
-                        rb'[>#\]]\s*$',  # Already at command prompt
-                    ]
-                    idx, match, data = self.client.expect(login_patterns, timeout=login_timeout)
-                    
-                    data_str = data.decode('utf-8', errors='ignore').lower()
-                    logger.info(f"Telnet: Got prompt, pattern index: {idx}")
-                    
-                    if idx in [0, 1, 2]:  # Login/Username prompt
-                        need_login = True
-                    elif idx == 3:  # Password prompt
-                        need_password = True
-                    elif idx == 4:  # Already at command prompt
-                        logger.info("Telnet: Already at command prompt, no login needed")
-                        need_login = False
-                        need_password = False
-                    else:
-                        # Check string content
-                        if 'login' in data_str or 'username' in data_str:
-                            need_login = True
-                        elif 'password' in data_str:
-                            need_password = True
-                            
-                except Exception as e:
-                    logger.warning(f"Telnet: Error waiting for prompt: {e}")
-                    # Try sending username anyway for some devices
-                    need_login = True
-            
-            # Send username if needed
-            if need_login:
-                logger.info(f"Telnet: Sending username: {self.config.username}")
-                self.client.write(self.config.username.encode('ascii') + b"\r\n")
-                time.sleep(0.5)
-                
-                # Wait for password prompt
-                try:
-                    idx, match, data = self.client.expect(
-                        [rb'[Pp]assword\s*:', rb'[>#\]]\s*$'],
-                        timeout=login_timeout
-                    )
-                    data_str = data.decode('utf-8', errors='ignore').lower()
-                    
-                    if idx == 0 or 'password' in data_str:
-                        need_password = True
-                    else:
-                        logger.info("Telnet: No password required")
-                        
-                except Exception as e:
-                    logger.warning(f"Telnet: Error waiting for password prompt: {e}")
-                    # Assume password is needed
-                    need_password = True
-            
-            # Send password if needed
-            if need_password:
-                logger.info("Telnet: Sending password...")
-                self.client.write(self.config.password.encode('ascii') + b"\r\n")
-                time.sleep(1)
+    def _clean_output(self, output: str, command: str) -> str:
+        """Clean command output"""
+        return ANSI_ESCAPE.sub('', output)
+    
+    def _interface_listing_commands(self) -> List[str]:
+        """v4.9.0: brief -> description -> alt_interface_commands"""
+        commands = [self.vendor_config.show_interface_brief,
+                    self.vendor_config.show_interface_description]
+        commands.extend(cmd for cmd in self.vendor_config.alt_interface_commands
+                        if '{interface}' not in cmd)
+        return commands
+    
+    def _first_interface_listing(self, outputs: List[str]) -> str:
+        """v4.9.0: First usable listing of the chain (the last output if none)"""
+        output = ""
+        for i, output in enumerate(outputs):
+            if output and 'Invalid' not in output:
+                break
+            # brief -> description -> alternatives
+            if i < 2:
+                self._fallback('interface_command')
+        return output
+    
+    def _parse_nxos_listings(self, outputs: List[str]) -> List[Dict[str, Any]]:
+        """v4.9.0: Interfaces from the first NX-OS listing that parses"""
+        for cmd, output in zip(self.NXOS_INTERFACE_COMMANDS, outputs):
+            with self._phase('parse'):
+                interfaces = parse_cisco_nxos_interfaces(ANSI_ESCAPE.sub('', output).split('\n'))
+            if interfaces:
+                logger.info(f"Cisco NX-OS: Parsed {len(interfaces)} interfaces from {cmd}")
+                return interfaces
+            logger.info(f"Cisco NX-OS: No interfaces from {cmd}")
+        return []
+    
+    def _parse_structured_output(self, cmd: str, output: str) -> Optional[List[Dict[str, Any]]]:
+        """v4.9.0: Decode structured_interface_command output (None = use text)"""
+        if not output:
+            return None
+        
+        with self._phase('parse'):
+            interfaces = parse_structured_interfaces(self.vendor_config.structured_format, output)
+        if interfaces is None:
+            logger.info(f"{self.vendor_config.name}: Structured output not supported, using text parser")
+            self._structured_rejected = True
+            self._fallback('structured')
+        else:
+            logger.info(f"{self.vendor_config.name}: Parsed {len(interfaces)} interfaces from {cmd}")
+        return interfaces
+    
+    @staticmethod
+    def _merge_nxos_descriptions(interfaces: List[Dict[str, Any]], descriptions: Dict[str, str]):
+        if descriptions:
+            for iface in interfaces:
+                iface_name = iface.get('name', '')
+                # Try exact match first
+                if iface_name in descriptions:
+                    iface['description'] = descriptions[iface_name]
+                else:
+                    # Try normalized match (Eth1/1 vs Ethernet1/1)
+                    normalized = iface_name.replace('Eth', 'Ethernet')
+                    if normalized in descriptions:
+                        iface['description'] = descriptions[normalized]
+            logger.info(f"Cisco NX-OS: Enhanced {len(descriptions)} descriptions from running-config")
+    
+    @property
+    def _nxos_cache_key(self) -> str:
+        return f"{self.config.host}:{self.config.port}"
+    
+    def _nxos_revalidate(self, marker: Optional[str]) -> Optional[Dict[str, str]]:
+        """v4.9.0: Cached descriptions if the config marker did not change"""
+        descriptions = nxos_description_cache.revalidate(self._nxos_cache_key, marker)
+        if descriptions is not None:
+            logger.info(f"NX-OS: running-config unchanged, reusing {len(descriptions)//2} descriptions")
+        return descriptions
+    
+    def _nxos_cache_store(self, descriptions: Optional[Dict[str, str]], marker: Optional[str]):
+        if descriptions is not None and self.NXOS_DESCRIPTION_TTL > 0:
+            nxos_description_cache.store(self._nxos_cache_key, descriptions, marker)
+    
+    @staticmethod
+    def _parse_nxos_config_marker(lines: Iterable[str]) -> Optional[str]:
+        marker = None
+        for line in lines:
+            line_stripped = line.strip()
+            # Skip the echoed command, which contains the same words
+            if line_stripped.startswith('!Running configuration last done'):
+                marker = line_stripped
+        return marker
+    
+    @staticmethod
+    def _lookup_nxos_description(descriptions: Dict[str, str], interface_name: str) -> str:
+        """v4.9.0: Description of one interface from the harvested map"""
+        for name in (interface_name, expand_interface_name(interface_name)):
+            if name in descriptions:
+                return descriptions[name]
+        
+        expanded = expand_interface_name(interface_name).lower()
+        for name, desc in descriptions.items():
+            if name.lower() == expanded:
+                return desc
+        return ''
+    
+    @staticmethod
+    def _parse_nxos_descriptions(lines: Iterable[str]) -> Tuple[Dict[str, str], bool]:
+        """
+        v4.9.0: {interface: description} from running-config lines
+        
+        Returns (descriptions, invalid) - invalid is True if the device
+        rejected the command.
+        """
+        descriptions = {}
+        invalid = False
+        current_interface = None
+        
+        for line in lines:
+            line_stripped = line.strip()
+            
+            if 'Invalid' in line_stripped:
+                invalid = True
+            
+            # Detect interface line: "interface Ethernet1/1"
+            if line_stripped.lower().startswith('interface '):
+                current_interface = line_stripped[10:].strip()
+                # Normalize: remove any trailing characters
+                if current_interface:
+                    logger.debug(f"NX-OS: Found interface {current_interface}")
+            
+            # Detect description line: "  description xcon:OLT C300A 1/19/1"
+            elif current_interface and line_stripped.lower().startswith('description '):
+                desc = line_stripped[12:].strip()
+                if desc:
+                    descriptions[current_interface] = desc
+                    # Also store with short name (Eth1/1 format)
+                    short_name = current_interface.replace('Ethernet', 'Eth')
+                    descriptions[short_name] = desc
+                    logger.debug(f"NX-OS: {current_interface} -> {desc}")
+            
+            # Reset on new interface or end of interface block
+            elif line_stripped.startswith('!') or (line_stripped and not line_stripped.startswith(' ') and not line_stripped.lower().startswith('interface')):
+                if current_interface and line_stripped.startswith('!'):
+                    current_interface = None
+        
+        return descriptions, invalid
+    
+    @staticmethod
+    def _parse_mikrotik_count(output: str) -> int:
+        """v4.9.0: Number printed by "print count-only" (0 if none)"""
+        if output:
+            lines = output.strip().split('\n')
+            for line in reversed(lines):
+                line = line.strip()
+                if not line or line.endswith('>') or line.endswith('#'):
+                    continue
+                if line.isdigit():
+                    count = int(line)
+                    logger.info(f"MikroTik: ethernet count-only returned {count}")
+                    return count
+            
+            match = re.search(r'\b(\d+)\b', output)
+            if match:
+                count = int(match.group(1))
+                return count
+        return 0
+    
+    @timed_phase('parse')
+    def _parse_default_interfaces(self, output: str) -> List[Dict[str, Any]]:
+        """
+        Default interface parsing
+        
+        v4.9.0: Tables with a Port/Interface header are split by column
+        offsets (parse_interface_table); other lines use the old
+        whitespace split below.
+        """
+        return parse_interface_table(output, self._parse_default_interface_line)
+    
+    @staticmethod
+    def _parse_default_interface_line(line: str) -> Optional[Dict[str, Any]]:
+        """One line of interface output without a recognised table header"""
+        line = line.strip()
+        
+        if not line or '---' in line or '===' in line:
+            return None
+        
+        lower_line = line.lower()
+        if any(h in lower_line for h in ['interface', 'port', 'status', 'protocol']):
+            if not any(c.isdigit() for c in line[:20]):
+                return None
+        
+        parts = line.split()
+        iface_name = parts[0]
+        
+        if not any(c.isdigit() for c in iface_name) and '/' not in iface_name:
+            return None
+        
+        if iface_name.endswith('#') or iface_name.endswith('>'):
+            return None
+        
+        interface = {
+            'name': iface_name,
+            'status': 'unknown',
+            'description': '',
+        }
+        
+        if ' up ' in lower_line or lower_line.endswith(' up'):
+            interface['status'] = 'up'
+        elif ' down ' in lower_line or lower_line.endswith(' down'):
+            interface['status'] = 'down'
+        
+        if len(parts) >= 3:
+            desc_start = -1
+            for i, part in enumerate(parts[1:], 1):
+                if part.lower() in ['up', 'down']:
+                    desc_start = i + 1
+                    break
+            if desc_start > 0 and desc_start < len(parts):
+                interface['description'] = ' '.join(parts[desc_start:])
+        
+        return interface
+    
+    def _interface_status_result(self, interface_name: str, full_interface: str,
+                                 output: str) -> Dict[str, Any]:
+        """v4.9.0: get_interface_status() result from "show interface X" output"""
+        with self._phase('parse'):
+            return {
+                'name': interface_name,
+                'full_name': full_interface,
+                'status': self.optical_parser.parse_interface_status(output),
+                'description': self.optical_parser.parse_description(output),
+                'raw_output': output,
+            }
+    
+    def _is_command_error(self, output: str) -> bool:
+        """
+        v4.8.8: Check if output indicates a command error (not statistics)
+        
+        Problem: Huawei "display interface" output contains "Total Error: 709822"
+        in statistics, which triggered false positive with "'Error' in output"
+        
+        Solution: Only check first 5 lines for actual error patterns
+        """
+        if not output:
+            return True
+        
+        # Only check first 5 lines - command errors appear at the start
+        first_lines = '\n'.join(output.split('\n')[:5])
+        
+        # These patterns indicate actual command errors
+        error_indicators = [
+            'Invalid',           # "Invalid input", "Invalid command"
+            'Error:',            # "Error: Wrong parameter" (note colon)
+            'Unrecognized',      # "Unrecognized command"
+            '% ',                # Cisco style "% Invalid input"
+            'Wrong parameter',   # Huawei "Wrong parameter found"
+            'Unknown command',   # Generic
+            'Incomplete command', # Incomplete command error
+        ]
+        
+        for indicator in error_indicators:
+            if indicator in first_lines:
+                return True
+        
+        return False
+    
+    @staticmethod
+    def _new_nxos_status(interface_name: str) -> Dict[str, Any]:
+        return {
+            'name': interface_name,
+            'full_name': interface_name,
+            'status': 'unknown',
+            'description': '',
+            'raw_output': '',
+        }
+    
+    @staticmethod
+    def _apply_nxos_status_table(result: Dict[str, Any], output: str, interface_name: str):
+        """v4.9.0: Status/description of one interface from the status table"""
+        result['raw_output'] = output
+        
+        if output:
+            for line in output.split('\n'):
+                line_lower = line.lower()
+                iface_lower = interface_name.lower()
+                
+                if iface_lower in line_lower or iface_lower.replace('/', '') in line_lower:
+                    parts = line.split()
+                    if len(parts) >= 3:
+                        # v4.8.7: Get description from parts[1] - may be truncated
+                        # v4.8.8: Will be overridden below from running-config
+                        if len(parts) >= 2 and parts[1] != '--':
+                            result['description'] = parts[1]
+                        
+                        if 'connected' in line_lower and 'notconnect' not in line_lower:
+                            result['status'] = 'up'
+                        elif 'notconnect' in line_lower:
+                            result['status'] = 'down'
+                        elif 'disabled' in line_lower:
+                            result['status'] = 'down'
+                        elif 'sfp not' in line_lower or 'xcvr not' in line_lower:
+                            result['status'] = 'down'
+                        
+                        if result['status'] != 'unknown':
+                            break
+    
+    def _apply_nxos_interface_output(self, result: Dict[str, Any], output: str):
+        """v4.9.0: Status fallback from "show interface X" output"""
+        if output:
+            result['raw_output'] = output
+            result['status'] = self.optical_parser.parse_interface_status(output)
+            # Only use description from here if we don't have one from config
+            if not result['description']:
+                result['description'] = self.optical_parser.parse_description(output)
+    
+    @staticmethod
+    def _parse_nxos_config_description(output: str) -> str:
+        """v4.9.0: Description line of "show running-config interface X" output"""
+        if not output:
+            return ''
+        
+        # Parse description line from running-config
+        # Format: "  description FS(OTB-B T1C1)"
+        for line in output.split('\n'):
+            line_stripped = line.strip()
+            if line_stripped.lower().startswith('description '):
+                # Extract everything after "description "
+                desc = line_stripped[12:].strip()
+                logger.info(f"NX-OS: Got description from running-config: {desc}")
+                return desc
+        
+        return ''
+    
+    @staticmethod
+    def _new_mikrotik_status(interface_name: str) -> Dict[str, Any]:
+        return {
+            'name': interface_name,
+            'full_name': interface_name,
+            'status': 'unknown',
+            'description': '',
+            'flags': '',
+            'raw_output': '',
+        }
+    
+    @staticmethod
+    def _mikrotik_status_from_listing(result: Dict[str, Any], interfaces: List[Dict[str, Any]],
+                                      interface_name: str) -> Dict[str, Any]:
+        """v4.9.0: Fill result from the full interface listing"""
+        if not interfaces:
+            logger.warning(f"MikroTik: No interfaces returned")
+            return result
+        
+        iface_lower = interface_name.lower()
+        
+        for iface in interfaces:
+            if iface.get('name', '').lower() == iface_lower:
+                result['status'] = iface.get('status', 'unknown')
+                result['description'] = iface.get('description', '')
+                result['flags'] = iface.get('flags', '')
+                logger.info(f"MikroTik: Found {interface_name}, flags='{result['flags']}', status={result['status']}")
+                return result
+        
+        logger.warning(f"MikroTik: Interface '{interface_name}' not found in {len(interfaces)} interfaces")
+        return result
+    
+    @staticmethod
+    def _mikrotik_single_command(interface_name: str) -> str:
+        name = interface_name.replace('\\', '\\\\').replace('"', '\\"')
+        return f'/interface print terse without-paging where name="{name}"'
+    
+    def _optical_candidates(self, interface_name: str, full_interface: str) -> Dict[str, str]:
+        """
+        v4.9.0: Optical commands to try -> their template, full interface name first
+        
+        The template is what optical_command remembers: {interface} for
+        the full name, {name} for the name as given.
+        """
+        candidates: Dict[str, str] = {}
+        templates = get_optical_command_templates(self.config.vendor)
+        for name, placeholder in ((full_interface, '{interface}'), (interface_name, '{name}')):
+            for template in templates:
+                candidates.setdefault(template.format(interface=name),
+                                      template.replace('{interface}', placeholder))
+        return candidates
+    
+    def _optical_commands(self, interface_name: str, full_interface: str) -> List[str]:
+        """v4.9.0: Optical commands to try, full interface name first, no duplicates"""
+        return list(self._optical_candidates(interface_name, full_interface))
+    
+    def _learned_optical_command(self, interface_name: str, full_interface: str) -> Optional[str]:
+        """v4.9.0: The command that found optical readings before on this device (or None)"""
+        if not self.optical_command:
+            return None
+        return self.optical_command.format(interface=full_interface, name=interface_name)
+    
+    def _set_optical_command(self, template: Optional[str]):
+        if template != self.optical_command:
+            logger.info(f"Optical command for {self.config.host}: {template or 'forgotten'}")
+        self.optical_command = template
+    
+    def _learned_optical_failed(self, learned: str, output: str):
+        """v4.9.0: The learned optical command gave no readings - back to all candidates"""
+        if output:
+            # Rejected (not just slow): do not send it first again
+            logger.info(f"Learned optical command rejected: {learned}")
+            self._set_optical_command(None)
+        self._fallback('optical_command')
+    
+    def take_optical_update(self) -> Optional[str]:
+        """
+        v4.9.0: Optical command template if it changed since the last call
+        
+        '' if a learned command was rejected and forgotten (to be persisted).
+        """
+        current = self.optical_command or ''
+        if current == (self._optical_command_saved or ''):
+            return None
+        self._optical_command_saved = self.optical_command
+        return current
+    
+    @staticmethod
+    def _is_optical_error(output: str) -> bool:
+        return any(err in output for err in ['Invalid', 'Error', 'Unrecognized', '% '])
+    
+    @staticmethod
+    def _optical_section(cmd: str, output: str) -> str:
+        """v4.9.0: One command's output as shown in all_output"""
+        return f"\n{'='*50}\n{cmd}\n{'='*50}\n{output}\n"
+    
+    def _select_optical(self, commands: List[str], outputs: List[str]
+                        ) -> Tuple[Optional[Dict[str, Any]], Optional[str], str]:
+        """
+        v4.9.0: First candidate whose output has optical readings
+        
+        Returns (parsed result, command, all_output so far). A fallback is
+        counted only when an earlier candidate was rejected.
+        """
+        all_output = ""
+        rejected = None
+        for cmd, output in zip(commands, outputs):
+            if rejected:
+                logger.info(f"No optical with '{rejected}', trying: {cmd}")
+                self._fallback('optical_command')
+            else:
+                logger.info(f"Trying optical: {cmd}")
+            rejected = cmd
+            
+            if not output or self._is_optical_error(output):
+                continue
+            
+            all_output += self._optical_section(cmd, output)
+            with self._phase('parse'):
+                parsed = self.optical_parser.parse_optical_power(output)
+            
+            if parsed['found']:
+                logger.info(f"Found optical with: {cmd}")
+                return parsed, cmd, all_output
+        return None, None, all_output
+    
+    def _finish_optical(self, result: Optional[Dict[str, Any]], successful_cmd: Optional[str],
+                        interface_name: str, full_interface: str, all_output: str) -> Dict[str, Any]:
+        """v4.9.0: get_optical_power() result - combined parse if no command matched"""
+        if not result or not result.get('found'):
+            result = self.optical_parser.parse_optical_power(all_output)
+            successful_cmd = 'combined' if result.get('found') else 'none'
+        
+        result['interface'] = interface_name
+        result['full_interface'] = full_interface
+        result['all_output'] = all_output
+        result['command_used'] = successful_cmd
+        
+        return result
+    
+    def _parse_optical_bulk(self, cmd: str, output: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """v4.9.0: get_all_optical_power() result from show_optical_all output"""
+        if not output or self._is_command_error(output):
+            logger.info(f"Bulk optical not available with: {cmd}")
+            self._fallback('optical_bulk')
+            return None
+        
+        with self._phase('parse'):
+            results = self.optical_parser.parse_optical_table(output)
+        for name, result in results.items():
+            result['interface'] = name
+            result['full_interface'] = name
+            result['command_used'] = cmd
+        
+        logger.info(f"Bulk optical: {len(results)} interfaces from {cmd}")
+        return results
+    
+    @staticmethod
+    def _merge_interface_optical(interface_name: str, interface_info: Dict[str, Any],
+                                 optical_info: Dict[str, Any]) -> Dict[str, Any]:
+        """v4.9.0: check_interface_with_optical() result"""
+        return {
+            'name': interface_name,
+            'full_name': interface_info.get('full_name', interface_name),
+            'status': interface_info.get('status', 'unknown'),
+            'description': interface_info.get('description', ''),
+            'flags': interface_info.get('flags', ''),
+            'rx_power': optical_info.get('rx_power'),
+            'tx_power': optical_info.get('tx_power'),
+            'rx_power_dbm': optical_info.get('rx_power_dbm', 'N/A'),
+            'tx_power_dbm': optical_info.get('tx_power_dbm', 'N/A'),
+            'optical_status': optical_info.get('signal_status', 'unknown'),
+            'command_used': optical_info.get('command_used', 'unknown'),
+            'raw_output': optical_info.get('all_output', ''),
+            'found': optical_info.get('found', False),
+        }
+
+
+
+class BotLinkMaster(BotLinkMasterBase):
+    """Main class for network device connections and monitoring"""
+    
+    def connect(self) -> bool:
+        self.phase_times = {}
+        try:
+            if self.config.protocol == Protocol.SSH:
+                connected = self._connect_ssh()
+            elif self.config.protocol == Protocol.TELNET:
+                connected = self._connect_telnet()
+            else:
+                return False
+        except Exception as e:
+            logger.error(f"Connection failed: {str(e)}")
+            return False
+        
+        # v4.9.0: Where the connect time went
+        if self.phase_times:
+            phases = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in self.phase_times.items())
+            logger.info(f"Connect phases ({self.config.host}): {phases}")
+        return connected
+    
+    # v4.9.0: SSH connection methods in default fallback order
+    SSH_METHODS = ['transport', 'standard', 'alternative']
+    
+    def _connect_ssh(self) -> bool:
+        """
+        Connect via SSH with legacy algorithm support - v4.8.7
+        
+        v4.9.0: The method that worked last time for this device
+        (config.preferred_method) is tried first.
+        """
+        try:
+            logger.info(f"Connecting to {self.config.host}:{self.config.port} via SSH...")
+            
+            methods = {
+                'transport': self._connect_ssh_transport,
+                'standard': self._connect_ssh_standard,
+                'alternative': self._connect_ssh_alternative,
+            }
             
-            # Wait for command prompt after login
-            logger.info("Telnet: Waiting for command prompt after login...")
-            if not self._wait_for_prompt_telnet(timeout=login_timeout):
-                # Try one more time with longer wait
-                time.sleep(2)
-                if not self._wait_for_prompt_telnet(timeout=10):
-                    logger.warning("Telnet: Timeout waiting for prompt after login, continuing anyway...")
+            # v4.8.7: Transport method first by default (better for legacy devices like CRS326)
+            order = list(self.SSH_METHODS)
+            preferred = self.config.preferred_method
+            if preferred in methods:
+                order.remove(preferred)
+                order.insert(0, preferred)
+                logger.info(f"SSH: Trying cached method '{preferred}' first")
+            
+            last_error = None
+            for name in order:
+                if last_error:
+                    self._fallback('ssh_method')
+                self._attempt_method = name
+                try:
+                    return methods[name]()
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"{name.capitalize()} method failed: {e}")
+                    self._reset_ssh()
+            
+            logger.error(f"SSH error: {str(last_error)}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"SSH error: {str(e)}")
+            return False
+    
+    def _reset_ssh(self):
+        """v4.9.0: Close leftovers of a failed SSH attempt before the next one"""
+        for obj in (self.shell, self.transport, self.client):
+            if obj:
+                try:
+                    obj.close()
+                except Exception:
+                    pass
+        self.shell = None
+        self.transport = None
+        self.client = None
+    
+    def _open_socket(self) -> socket.socket:
+        """v4.9.0: TCP connect, timed apart from SSH KEX/auth"""
+        with self._phase('tcp_connect'):
+            return socket.create_connection((self.config.host, self.config.port),
+                                            timeout=self.config.timeout)
+    
+    def _connect_ssh_transport(self) -> bool:
+        """SSH via Transport for legacy devices - v4.8.7 improved"""
+        self.transport = paramiko.Transport(self._open_socket())
+        self.transport.set_keepalive(30)
+        
+        # v4.8.7: Set extended algorithms for CRS326 compatibility
+        # v4.9.0: Algorithms negotiated last time are offered first
+        hints = self.config.preferred_algorithms or {}
+        self.transport._preferred_keys = self._prefer(self.LEGACY_KEY_TYPES, hints.get('key_type'))
+        self.transport._preferred_kex = self.LEGACY_KEX
+        self.transport._preferred_ciphers = self._prefer(self.LEGACY_CIPHERS, hints.get('cipher'))
+        
+        with self._phase('ssh_handshake'):
+            self.transport.connect(
+                username=self.config.username,
+                password=self.config.password,
+            )
+        
+        self.shell = self.transport.open_session()
+        self.shell.get_pty(term='vt100', width=200, height=50)
+        self.shell.invoke_shell()
+        
+        # Wait for prompt
+        if not self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
+            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
+        
+        self._learn_prompt()
+        self._disable_paging()
+        
+        self._record_negotiated(self.transport)
+        self.connected = True
+        self.connection_method = "transport"
+        logger.info(f"SSH connected (transport) to {self.config.host}")
+        return True
+    
+    def _connect_ssh_standard(self) -> bool:
+        """Standard SSH connection"""
+        self.client = paramiko.SSHClient()
+        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
+        sock = self._open_socket()
+        with self._phase('ssh_handshake'):
+            self.client.connect(
+                hostname=self.config.host,
+                port=self.config.port,
+                username=self.config.username,
+                password=self.config.password,
+                timeout=self.config.timeout,
+                look_for_keys=False,
+                allow_agent=False,
+                disabled_algorithms={'pubkeys': ['rsa-sha2-256', 'rsa-sha2-512']},
+                sock=sock,
+            )
+        
+        self.shell = self.client.invoke_shell(width=200, height=50)
+        
+        if not self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
+            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
+        
+        self._learn_prompt()
+        self._disable_paging()
+        
+        self._record_negotiated(self.client.get_transport())
+        self.connected = True
+        self.connection_method = "standard"
+        logger.info(f"SSH connected (standard) to {self.config.host}")
+        return True
+    
+    def _connect_ssh_alternative(self) -> bool:
+        """Alternative SSH connection"""
+        logger.info("Trying alternative SSH...")
+        
+        self.client = paramiko.SSHClient()
+        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        
+        sock = self._open_socket()
+        with self._phase('ssh_handshake'):
+            self.client.connect(
+                hostname=self.config.host,
+                port=self.config.port,
+                username=self.config.username,
+                password=self.config.password,
+                timeout=self.config.timeout,
+                look_for_keys=False,
+                allow_agent=False,
+                sock=sock,
+            )
+        
+        self.shell = self.client.invoke_shell(width=200, height=50)
+        
+        if not self._wait_for_prompt(timeout=self.timeouts.get('prompt_timeout', 30)):
+            logger.warning("Timeout waiting for initial prompt, continuing anyway...")
+        
+        self._learn_prompt()
+        self._disable_paging()
+        
+        self._record_negotiated(self.client.get_transport())
+        self.connected = True
+        self.connection_method = "alternative"
+        logger.info(f"SSH connected (alternative) to {self.config.host}")
+        return True
+    
+    @timed_phase('wait_prompt')
+    def _wait_for_prompt(self, timeout: int = 30) -> bool:
+        """Wait for shell prompt to appear - v4.9.0: event-driven, checks tail only"""
+        logger.info(f"Waiting for prompt (timeout={timeout}s)...")
+        
+        received = 0
+        tail = b""
+        deadline = time.time() + timeout
+        
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
             
-            # Clear any remaining data in buffer
-            time.sleep(0.5)
             try:
-                remaining = self.client.read_very_eager()
-                if remaining:
-                    logger.info(f"Telnet: Cleared {len(remaining)} bytes from buffer")
-            except:
-                pass
+                data = self._recv(remaining)
+            except EOFError:
+                logger.warning("Connection closed while waiting for prompt")
+                return False
+            except Exception as e:
+                logger.warning(f"Error reading data: {e}")
+                continue
+            
+            if not data:
+                continue
+            
+            received += len(data)
+            # Only the tail is kept and decoded, not the banner/MOTD
+            tail = self._ring_tail(tail, data)
+            
+            if self._is_prompt(tail.decode('utf-8', errors='ignore')):
+                logger.info(f"Prompt detected! Buffer size: {received}")
+                return True
+        
+        logger.warning(f"Prompt timeout. Buffer ({received} bytes)")
+        self._timeout('prompt')
+        return False
+    
+    @timed_phase('learn_prompt')
+    def _learn_prompt(self) -> bool:
+        """
+        v4.9.0: Capture the exact prompt string once after login
+        
+        Sends an empty line and pins the prompt that comes back. Afterwards
+        command completion is a suffix comparison on the buffer tail.
+        """
+        self._prompt = None
+        try:
+            self._send_line("")
+            output = self._read_until_prompt(PROMPT_PROBE, self.timeouts['idle_timeout'])
+        except Exception as e:
+            logger.warning(f"Prompt probe failed: {e}")
+            return False
+        
+        last_line = self._last_line(output).strip()
+        if last_line and self._is_prompt(last_line):
+            self._prompt = last_line
+            logger.info(f"Prompt learned: {self._prompt!r}")
+            return True
+        
+        logger.warning("Could not learn prompt, using prompt patterns")
+        return False
+    
+    def _send_line(self, line: str):
+        """v4.9.0: Send one command line (or several, newline separated) to the session"""
+        if self.config.protocol == Protocol.TELNET:
+            self.client.write(line.replace('\n', '\r\n').encode('ascii') + b"\r\n")
+        else:
+            self.shell.send(line + "\n")
+    
+    def _send_keys(self, keys: str):
+        """v4.9.0: Send keystrokes without a line ending (pager answers)"""
+        if self.config.protocol == Protocol.TELNET:
+            self.client.write(keys.encode('ascii'))
+        else:
+            self.shell.send(keys)
+    
+    def _recv(self, timeout: float) -> bytes:
+        """
+        v4.9.0: Read one chunk from the session, blocking up to timeout
+        
+        Returns b'' if nothing arrived in time. Raises EOFError if the
+        connection was closed by the device.
+        """
+        if self.config.protocol == Protocol.TELNET:
+            return self.client.read(timeout)
+        
+        self.shell.settimeout(max(0.0, timeout))
+        try:
+            data = self.shell.recv(65535)
+        except socket.timeout:
+            return b""
+        if not data:
+            raise EOFError("SSH channel closed")
+        return data
+    
+    def _stream_until_prompt(self, command: str, wait_time: float,
+                             hard_timeout: Optional[float] = None,
+                             until_echo: Optional[str] = None,
+                             whole: bool = False) -> Iterator[str]:
+        """
+        v4.9.0: Yield decoded command output until the device prompt comes back
+        
+        Returns as soon as the prompt reappears at the end of the buffer.
+        Timeouts are upper bounds only:
+        - wait_time / idle_timeout: maximum wait for the first output byte
+          after the echoed command line
+        - idle_timeout: maximum silence once output has started
+        - hard_timeout: maximum total time for the command
+        Once the device answered a command class often enough, these come
+        from its own response times instead (see _command_timeouts()).
+        
+        Reads are collected as bytes (ReceiveBuffer), prompt and pager are
+        matched on the last PROMPT_TAIL_WINDOW bytes only. Output is yielded
+        per complete line: the unterminated last line is held back until it
+        is known not to be a pager prompt. If the consumer stops early, the
+        rest of the output is read and discarded up to the prompt so the
+        session stays in sync for the next command.
+        
+        A pager prompt ("--More--", "---- More ----", vendor pager_patterns)
+        is answered with a space and removed, together with the sequence
+        the device uses to erase it.
+        
+        until_echo: the prompt only ends the read once this text (the last
+        command of a batch) has been echoed.
+        whole: keep the whole output and decode it once, as a single yield
+        at the end (_read_until_prompt).
+        
+        The state machine is BotLinkMasterBase._feed_read(), shared with
+        AsyncBotLinkMaster - this loop only receives and answers the pager.
+        """
+        read = self._start_read(command, wait_time, time.time(), hard_timeout, until_echo, whole)
+        while True:
+            wait = self._read_wait(read, time.time())
+            if wait <= 0:
+                break
+            try:
+                data = self._recv(wait)
+            except EOFError:
+                self._read_closed(read)
+                break
+            if not data:
+                continue
+            
+            event = self._feed_read(read, data, time.time())
+            if event.answer_pager:
+                self._send_keys(' ')
+            if event.lines:
+                try:
+                    yield event.lines
+                except GeneratorExit:
+                    read.draining = True
+            if event.done:
+                break
+        
+        rest = self._finish_read(read, time.time())
+        if rest:
+            yield rest
+    
+    def _read_until_prompt(self, command: str, wait_time: float,
+                           hard_timeout: Optional[float] = None,
+                           until_echo: Optional[str] = None) -> str:
+        """Whole command output as one string - see _stream_until_prompt()"""
+        return ''.join(self._stream_until_prompt(command, wait_time, hard_timeout, until_echo,
+                                                 whole=True))
+    
+    def _connect_telnet(self) -> bool:
+        """
+        Connect via Telnet - v4.8.7 fixed for MikroTik and other vendors
+        
+        v4.9.0: Plain socket (TelnetSocket) and event-driven login: each
+        step waits for the username/password/command prompt on the last
+        line instead of fixed sleeps.
+        """
+        try:
+            logger.info(f"Connecting to {self.config.host}:{self.config.port} via Telnet...")
+            self._attempt_method = 'telnet'
+            
+            self.client = TelnetSocket(self._open_socket())
+            login_start = time.perf_counter()
+            
+            login_timeout = self.timeouts.get('prompt_timeout', 30)
+            
+            step = self._expect_login(login_timeout)
+            if step == 'username':
+                logger.info(f"Telnet: Sending username: {self.config.username}")
+                self._send_line(self.config.username)
+                step = self._expect_login(login_timeout)
+            if step == 'password':
+                logger.info("Telnet: Sending password...")
+                self._send_line(self.config.password)
+                step = self._expect_login(login_timeout)
+            
+            # v4.9.0: Banner and username/password exchange
+            self._record_phase('telnet_login', time.perf_counter() - login_start)
+            
+            if step in ('username', 'password'):
+                logger.error(f"Telnet: Login rejected by {self.config.host}")
+                self.disconnect()
+                return False
+            if step is None:
+                self._timeout('prompt')
+                logger.warning("Telnet: Timeout waiting for prompt after login, continuing anyway...")
+            
+            self._learn_prompt()
             
             # Disable paging
             self._disable_paging_telnet()
@@ -478,38 +1938,53 @@ class BotLinkMaster:
             logger.error(f"Telnet error: {str(e)}")
             return False
     
-    def _wait_for_prompt_telnet(self, timeout: int = 30) -> bool:
-        """Wait for Telnet shell prompt to appear - v4.8.7"""
-        logger.info(f"Telnet: Waiting for prompt (timeout={timeout}s)...")
-        
-        # Prompt patterns as bytes for telnetlib
-        prompt_regexes = [
-            rb'\[[\w\-@]+\]\s*[>#]\s*$',      # MikroTik: [admin@router] >
-            rb'[\w\-]+[>#]\s*$',               # Cisco/Generic: Router#
-            rb'<[\w\-]+>\s*$',                 # Huawei: <Router>
-            rb'\[[\w\-~]+\]\s*$',              # Huawei config: [Router]
-            rb'[\w\-]+\$\s*$',                 # Linux: user$
-        ]
+    def _expect_login(self, timeout: float) -> Optional[str]:
+        """
+        v4.9.0: Wait for the next Telnet login step
         
-        try:
-            idx, match, data = self.client.expect(prompt_regexes, timeout=timeout)
-            if idx >= 0:
-                logger.info(f"Telnet: Prompt detected! Pattern index: {idx}")
-                return True
-        except EOFError:
-            logger.warning("Telnet: Connection closed while waiting for prompt")
-        except Exception as e:
-            logger.warning(f"Telnet: Error waiting for prompt: {e}")
+        Returns 'username', 'password', 'prompt' (logged in) or None on
+        timeout. Only the last line of the buffer tail is checked, so a
+        banner mentioning "login:" does not count.
+        """
+        deadline = time.time() + timeout
+        tail = b""
         
-        return False
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            
+            try:
+                data = self._recv(remaining)
+            except EOFError:
+                logger.warning("Telnet: Connection closed during login")
+                return None
+            if not data:
+                continue
+            
+            tail = self._ring_tail(tail, data)
+            text = tail.decode('utf-8', errors='ignore')
+            last_line = self._last_line(text)
+            
+            for step, regex in self.TELNET_LOGIN_PROMPTS:
+                if regex.search(last_line):
+                    logger.info(f"Telnet: Got {step} prompt")
+                    return step
+            if self._is_prompt(text):
+                logger.info("Telnet: Prompt detected!")
+                return 'prompt'
     
+    @timed_phase('disable_paging')
     def _disable_paging(self):
-        if self.vendor_config.disable_paging:
-            self._execute_ssh(self.vendor_config.disable_paging, 2.0)
+        command = self._paging_command()
+        if command:
+            self._apply_paging_result(command, self._execute_ssh(command, 2.0))
     
+    @timed_phase('disable_paging')
     def _disable_paging_telnet(self):
-        if self.vendor_config.disable_paging:
-            self._execute_telnet(self.vendor_config.disable_paging, 2.0)
+        command = self._paging_command()
+        if command:
+            self._apply_paging_result(command, self._execute_telnet(command, 2.0))
     
     def execute_command(self, command: str, wait_time: float = None) -> str:
         """Execute command with vendor-specific timeout if not specified"""
@@ -529,81 +2004,102 @@ class BotLinkMaster:
             logger.error(f"Command error: {str(e)}")
             return ""
     
-    def _execute_ssh(self, command: str, wait_time: float) -> str:
-        """Execute SSH command with idle-time based reading - v4.8.7 improved"""
+    def stream_command(self, command: str, wait_time: float = None) -> Iterator[str]:
+        """
+        v4.9.0: Execute command and yield clean output lines as they arrive
+        
+        channel bytes -> ReceiveBuffer (complete lines decoded once, cut at
+        b"\n") -> line splitter -> ANSI strip. Parsers consume the lines
+        directly, the full output is never joined. Consume or close the
+        generator before the next command.
+        """
+        if not self.connected:
+            return
+        
+        if wait_time is None:
+            wait_time = self.timeouts.get('command_wait', self.timeouts['initial_wait'])
+        
         try:
-            # Clear any pending data in buffer first
+            self._flush_input()
+            logger.info(f"Streaming: {command}")
+            self._send_line(command)
+        except Exception as e:
+            logger.error(f"Command error: {str(e)}")
+            return
+        
+        yield from iter_lines(self._stream_until_prompt(command, wait_time))
+    
+    def execute_batch(self, commands: List[str], wait_time: float = None) -> List[str]:
+        """
+        v4.9.0: Execute several commands with one round trip
+        
+        The commands are written back-to-back, the combined output is read
+        once and split per command on the learned prompt: every command
+        after the first starts with "<prompt><command>". Returns one output
+        per command (duplicates run once), like execute_command().
+        
+        Runs the commands one by one if the prompt is unknown, paging is
+        not disabled on the device (typed-ahead lines would answer the
+        pager) or the output could not be split - the latter is remembered
+        for the session. Then only the commands whose output was not
+        recovered run again, after the rest of the batch has been read.
+        """
+        unique = list(dict.fromkeys(commands))
+        if not self._can_pipeline(unique):
+            outputs = {cmd: self.execute_command(cmd, wait_time) for cmd in unique}
+            return [outputs[cmd] for cmd in commands]
+        
+        if wait_time is None:
+            wait_time = self.timeouts.get('command_wait', self.timeouts['initial_wait'])
+        
+        output = ""
+        try:
+            self._flush_input()
+            logger.info(f"Executing batch: {' | '.join(unique)}")
+            self._send_line('\n'.join(unique))
+            output = self._read_until_prompt(' | '.join(unique), wait_time, until_echo=unique[-1])
+        except Exception as e:
+            logger.error(f"Batch execute error: {e}")
+        
+        split = self._batch_outputs(output, unique)
+        if None in split:
+            # The device may still be answering the batch: read the rest
+            # first, so it neither delays nor leaks into the reruns
+            drain_echo = self._batch_drain_echo(output, unique)
+            if drain_echo is not None and self.connected:
+                try:
+                    self._read_until_prompt(BATCH_DRAIN, wait_time, until_echo=drain_echo or None)
+                except Exception as e:
+                    logger.error(f"Batch drain error: {e}")
+            split = [self.execute_command(cmd, wait_time) if out is None else out
+                     for cmd, out in zip(unique, split)]
+        
+        outputs = dict(zip(unique, split))
+        return [outputs[cmd] for cmd in commands]
+    
+    def _flush_input(self):
+        """Discard pending data before sending a command"""
+        if self.config.protocol == Protocol.TELNET:
+            try:
+                while self._recv(0):
+                    pass
+            except:
+                pass
+        else:
             while self.shell.recv_ready():
                 self.shell.recv(65535)
+    
+    def _execute_ssh(self, command: str, wait_time: float) -> str:
+        """Execute SSH command - v4.9.0: returns as soon as the prompt is back"""
+        try:
+            # Clear any pending data in buffer first
+            self._flush_input()
             
             # Send command
             logger.info(f"Executing: {command}")
-            self.shell.send(command + "\n")
+            self._send_line(command)
             
-            # Initial wait for command to be processed
-            time.sleep(wait_time)
-
-            output = ""
-            last_data_time = time.time()
-            
-            idle_timeout = self.timeouts['idle_timeout']
-            hard_timeout = time.time() + self.timeouts['hard_timeout']
-            
-            consecutive_empty_reads = 0
-            max_consecutive_empty = 20  # v4.8.7: Increased from 15
-
-            while True:
-                if self.shell.recv_ready():
-                    data = self.shell.recv(65535).decode("utf-8", errors="ignore")
-                    
-                    if data:
-                        output += data
-                        last_data_time = time.time()
-                        consecutive_empty_reads = 0
-                        
-                        # Check if we got a prompt (command complete)
-                        if re.search(r'\]\s*[>#/]\s*$', output):
-                            time.sleep(0.5)
-                            if self.shell.recv_ready():
-                                extra = self.shell.recv(65535).decode("utf-8", errors="ignore")
-                                if extra:
-                                    output += extra
-                            break
-                        
-                        continue
-                    else:
-                        consecutive_empty_reads += 1
-                
-                now = time.time()
-                idle_time = now - last_data_time
-
-                if output and idle_time >= idle_timeout:
-                    # Multiple extra reads to ensure we got everything
-                    for _ in range(7):  # v4.8.7: Increased from 5
-                        time.sleep(0.5)
-                        if self.shell.recv_ready():
-                            extra = self.shell.recv(65535).decode("utf-8", errors="ignore")
-                            if extra:
-                                output += extra
-                                logger.info(f"SSH: Captured extra {len(extra)} bytes after idle timeout")
-                    break
-                
-                if consecutive_empty_reads >= max_consecutive_empty:
-                    time.sleep(1.0)
-                    if self.shell.recv_ready():
-                        extra = self.shell.recv(65535).decode("utf-8", errors="ignore")
-                        if extra:
-                            output += extra
-                            logger.info(f"SSH: Captured {len(extra)} bytes on final attempt")
-                    break
-
-                if now >= hard_timeout:
-                    logger.warning(f"SSH hard timeout for '{command}'")
-                    break
-
-                time.sleep(0.2)
-
-            logger.info(f"Command '{command}': received {len(output)} bytes total")
+            output = self._read_until_prompt(command, wait_time)
             
             return self._clean_output(output, command)
 
@@ -612,107 +2108,16 @@ class BotLinkMaster:
             return ""
     
     def _execute_telnet(self, command: str, wait_time: float) -> str:
-        """Execute Telnet command with idle-time based reading - v4.8.7 improved"""
+        """Execute Telnet command - v4.9.0: returns as soon as the prompt is back"""
         try:
             # Clear any pending data in buffer first
-            try:
-                self.client.read_very_eager()
-            except:
-                pass
-            
-            # Send command
-            logger.info(f"Telnet executing: {command}")
-            self.client.write(command.encode('ascii') + b"\r\n")
-            
-            # Initial wait for command to be processed
-            time.sleep(wait_time)
-            
-            output = ""
-            last_data_time = time.time()
-            
-            idle_timeout = self.timeouts['idle_timeout']
-            hard_timeout = time.time() + self.timeouts['hard_timeout']
-            
-            consecutive_empty_reads = 0
-            max_consecutive_empty = 20
-            
-            # Prompt patterns for detecting command completion
-            prompt_patterns = [
-                r'\[[\w\-@]+\]\s*[>#/]\s*$',    # MikroTik
-                r'[\w\-]+[>#]\s*$',              # Cisco/Generic
-                r'<[\w\-]+>\s*$',                # Huawei
-                r'\[[\w\-~]+\]\s*$',             # Huawei config
-            ]
-            
-            while True:
-                try:
-                    # Read available data (non-blocking with short timeout)
-                    data = self.client.read_very_eager().decode('utf-8', errors='ignore')
-                    
-                    if data:
-                        output += data
-                        last_data_time = time.time()
-                        consecutive_empty_reads = 0
-                        
-                        # Check if we got a prompt (command complete)
-                        for pattern in prompt_patterns:
-                            if re.search(pattern, output):
-                                # Extra read to ensure all data captured
-                                time.sleep(0.3)
-                                try:
-                                    extra = self.client.read_very_eager().decode('utf-8', errors='ignore')
-                                    if extra:
-                                        output += extra
-                                except:
-                                    pass
-                                logger.info(f"Telnet: Prompt detected, command complete")
-                                return self._clean_output(output, command)
-                    else:
-                        consecutive_empty_reads += 1
-                    
-                except EOFError:
-                    logger.warning("Telnet: Connection closed during command execution")
-                    break
-                except Exception as e:
-                    consecutive_empty_reads += 1
-                
-                now = time.time()
-                idle_time = now - last_data_time
-                
-                # Check idle timeout
-                if output and idle_time >= idle_timeout:
-                    # Multiple extra reads to ensure we got everything
-                    for _ in range(5):
-                        time.sleep(0.3)
-                        try:
-                            extra = self.client.read_very_eager().decode('utf-8', errors='ignore')
-                            if extra:
-                                output += extra
-                                logger.info(f"Telnet: Captured extra {len(extra)} bytes after idle timeout")
-                        except:
-                            pass
-                    break
-                
-                # Check consecutive empty reads
-                if consecutive_empty_reads >= max_consecutive_empty:
-                    time.sleep(0.5)
-                    try:
-                        extra = self.client.read_very_eager().decode('utf-8', errors='ignore')
-                        if extra:
-                            output += extra
-                            logger.info(f"Telnet: Captured {len(extra)} bytes on final attempt")
-                    except:
-                        pass
-                    break
-                
-                # Check hard timeout
-                if now >= hard_timeout:
-                    logger.warning(f"Telnet hard timeout for '{command}'")
-                    break
-                
-                time.sleep(0.2)
+            self._flush_input()
             
-            logger.info(f"Telnet command '{command}': received {len(output)} bytes total")
+            # Send command
+            logger.info(f"Telnet executing: {command}")
+            self._send_line(command)
+            
+            output = self._read_until_prompt(command, wait_time)
             
             return self._clean_output(output, command)
             
@@ -720,37 +2125,30 @@ class BotLinkMaster:
             logger.error(f"Telnet execute error: {str(e)}")
             return ""
     
-    def _clean_output(self, output: str, command: str) -> str:
-        """Clean command output"""
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        output = ansi_escape.sub('', output)
-        return output
-    
     def get_interfaces(self) -> List[Dict[str, Any]]:
         """Get all interfaces with status"""
         interfaces = []
         
         interface_parser = getattr(self.vendor_config, 'interface_parser', 'default')
         
+        # v4.9.0: Machine-readable listing first, text scraping as fallback
+        interfaces = self._get_structured_interfaces()
+        if interfaces:
+            if interface_parser == 'cisco_nxos':
+                self._apply_nxos_descriptions(interfaces)
+            return interfaces
+        interfaces = []
+        
         if interface_parser == 'mikrotik':
             return self._get_mikrotik_interfaces()
         
         if interface_parser == 'cisco_nxos':
             return self._get_cisco_nxos_interfaces()
         
-        cmd = self.vendor_config.show_interface_brief
-        output = self.execute_command(cmd, wait_time=5.0)
-        
-        if not output or 'Invalid' in output:
-            cmd = self.vendor_config.show_interface_description
-            output = self.execute_command(cmd, wait_time=5.0)
-        
-        if not output or 'Invalid' in output:
-            for alt_cmd in self.vendor_config.alt_interface_commands:
-                if '{interface}' not in alt_cmd:
-                    output = self.execute_command(alt_cmd, wait_time=5.0)
-                    if output and 'Invalid' not in output:
-                        break
+        # v4.9.0: The whole fallback chain in one round trip
+        commands = self._interface_listing_commands()
+        outputs = self.execute_batch(commands, wait_time=5.0)
+        output = self._first_interface_listing(outputs)
         
         if not output:
             return interfaces
@@ -759,45 +2157,35 @@ class BotLinkMaster:
     
     def _get_cisco_nxos_interfaces(self) -> List[Dict[str, Any]]:
         """Get Cisco NX-OS interfaces - v4.8.8: Full descriptions from running-config"""
-        commands = [
-            "show interface status",
-            "show interface brief",
-            "show interface description",
-        ]
+        # v4.9.0: All candidates in one round trip
+        outputs = self.execute_batch(self.NXOS_INTERFACE_COMMANDS, wait_time=5.0)
+        interfaces = self._parse_nxos_listings(outputs)
         
-        interfaces = []
+        if not interfaces:
+            return self._parse_default_interfaces(outputs[-1])
         
-        for cmd in commands:
-            logger.info(f"Cisco NX-OS: Trying {cmd}")
-            output = self.execute_command(cmd, wait_time=5.0)
-            
-            if output and ('Eth' in output or 'Po' in output or 'Vlan' in output):
-                logger.info(f"Cisco NX-OS: Got data from {cmd}")
-                interfaces = parse_cisco_nxos_interfaces(output)
-                if interfaces:
-                    logger.info(f"Cisco NX-OS: Parsed {len(interfaces)} interfaces")
-                    break
+        self._apply_nxos_descriptions(interfaces)
+        return interfaces
+    
+    def _get_structured_interfaces(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        v4.9.0: Interfaces from the vendor's machine-readable output
         
-        if not interfaces:
-            return self._parse_default_interfaces(output if output else "")
+        Returns None if the vendor has no structured mode or the device
+        rejected it (remembered, and persisted by the session pool).
+        """
+        cmd = self.vendor_config.structured_interface_command
+        if not cmd or self._structured_rejected:
+            return None
         
+        logger.info(f"{self.vendor_config.name}: Trying {cmd}")
+        return self._parse_structured_output(cmd, self.execute_command(cmd))
+    
+    def _apply_nxos_descriptions(self, interfaces: List[Dict[str, Any]]):
+        """v4.9.0: Replace descriptions with the full ones from running-config"""
         # v4.8.8 FIX: Get full descriptions from running-config
         # This fixes truncated descriptions like "xcon:OLT" instead of "xcon:OLT C300A 1/19/1"
-        descriptions = self._get_all_nxos_descriptions()
-        if descriptions:
-            for iface in interfaces:
-                iface_name = iface.get('name', '')
-                # Try exact match first
-                if iface_name in descriptions:
-                    iface['description'] = descriptions[iface_name]
-                else:
-                    # Try normalized match (Eth1/1 vs Ethernet1/1)
-                    normalized = iface_name.replace('Eth', 'Ethernet')
-                    if normalized in descriptions:
-                        iface['description'] = descriptions[normalized]
-            logger.info(f"Cisco NX-OS: Enhanced {len(descriptions)} descriptions from running-config")
-        
-        return interfaces
+        self._merge_nxos_descriptions(interfaces, self._get_all_nxos_descriptions())
     
     def _get_all_nxos_descriptions(self) -> Dict[str, str]:
         """
@@ -805,55 +2193,76 @@ class BotLinkMaster:
         
         Returns dict of {interface_name: description}
         This is more efficient than calling running-config per interface.
+        
+        v4.9.0: Served from the per-device cache (see NXOS_DESCRIPTION_TTL)
         """
-        descriptions = {}
+        descriptions = self._get_cached_nxos_descriptions()
+        return descriptions if descriptions is not None else {}
+    
+    def _get_cached_nxos_descriptions(self) -> Optional[Dict[str, str]]:
+        """
+        v4.9.0: Descriptions from the per-device cache, harvested if needed
+        
+        Within NXOS_DESCRIPTION_TTL the cached map is returned without
+        touching the device. After that the config marker is compared and
+        running-config is only read again if the config changed.
+        
+        Returns None if running-config could not be read.
+        """
+        descriptions = nxos_description_cache.fresh(self._nxos_cache_key, self.NXOS_DESCRIPTION_TTL)
+        if descriptions is not None:
+            return descriptions
+        
+        marker = self._get_nxos_config_marker() if self.NXOS_DESCRIPTION_TTL > 0 else None
+        descriptions = self._nxos_revalidate(marker)
+        if descriptions is not None:
+            return descriptions
         
+        descriptions = self._harvest_nxos_descriptions()
+        self._nxos_cache_store(descriptions, marker)
+        return descriptions
+    
+    def _get_nxos_config_marker(self) -> Optional[str]:
+        """
+        v4.9.0: "!Running configuration last done at: ..." line
+        
+        Changes whenever the configuration is changed. None if the device
+        does not print it (older NX-OS) - the cache is then refreshed
+        after every TTL.
+        """
+        try:
+            return self._parse_nxos_config_marker(
+                self.stream_command(self.NXOS_CONFIG_MARKER_COMMAND, wait_time=5.0)
+            )
+        except Exception as e:
+            logger.warning(f"NX-OS: Failed to read config marker: {e}")
+            return None
+    
+    def _harvest_nxos_descriptions(self) -> Optional[Dict[str, str]]:
+        """v4.9.0: Read all descriptions from running-config (None on failure)"""
         try:
             # Get running-config with interface sections
             cmd = "show running-config | section ^interface"
-            output = self.execute_command(cmd, wait_time=10.0)
+            # v4.9.0: running-config is parsed line by line as it streams in
+            descriptions, invalid = self._parse_nxos_descriptions(
+                self.stream_command(cmd, wait_time=10.0)
+            )
             
-            if not output or 'Invalid' in output:
+            if invalid and not descriptions:
                 # Fallback: try without section filter
                 cmd = "show running-config"
-                output = self.execute_command(cmd, wait_time=15.0)
-            
-            if not output:
-                return descriptions
-            
-            current_interface = None
-            
-            for line in output.split('\n'):
-                line_stripped = line.strip()
-                
-                # Detect interface line: "interface Ethernet1/1"
-                if line_stripped.lower().startswith('interface '):
-                    current_interface = line_stripped[10:].strip()
-                    # Normalize: remove any trailing characters
-                    if current_interface:
-                        logger.debug(f"NX-OS: Found interface {current_interface}")
-                
-                # Detect description line: "  description xcon:OLT C300A 1/19/1"
-                elif current_interface and line_stripped.lower().startswith('description '):
-                    desc = line_stripped[12:].strip()
-                    if desc:
-                        descriptions[current_interface] = desc
-                        # Also store with short name (Eth1/1 format)
-                        short_name = current_interface.replace('Ethernet', 'Eth')
-                        descriptions[short_name] = desc
-                        logger.debug(f"NX-OS: {current_interface} -> {desc}")
-                
-                # Reset on new interface or end of interface block
-                elif line_stripped.startswith('!') or (line_stripped and not line_stripped.startswith(' ') and not line_stripped.lower().startswith('interface')):
-                    if current_interface and line_stripped.startswith('!'):
-                        current_interface = None
+                descriptions, invalid = self._parse_nxos_descriptions(
+                    self.stream_command(cmd, wait_time=15.0)
+                )
+                if invalid and not descriptions:
+                    return None
             
             logger.info(f"NX-OS: Got {len(descriptions)//2} descriptions from running-config")
+            return descriptions
             
         except Exception as e:
             logger.warning(f"NX-OS: Failed to get descriptions from running-config: {e}")
-        
-        return descriptions
+            return None
     
     def _get_mikrotik_interfaces(self) -> List[Dict[str, Any]]:
         """Get MikroTik interfaces - v4.8.7 improved for CRS326"""
@@ -862,112 +2271,35 @@ class BotLinkMaster:
         if expected_count:
             logger.info(f"MikroTik: Expected approximately {expected_count} interfaces")
         
-        # v4.8.7: Commands optimized for CRS326
-        commands = [
-            "/interface ethernet print without-paging",
-            "/interface print brief without-paging",
-            "/interface print without-paging",
-        ]
-        
         # v4.8.7: Use longer wait time for CRS326 and large switches
         wait_time = self.timeouts.get('command_wait', 45.0)
         
-        for cmd in commands:
+        for cmd in self.MIKROTIK_INTERFACE_COMMANDS:
             logger.info(f"MikroTik: Trying {cmd}")
             
-            output = self.execute_command(cmd, wait_time=wait_time)
+            # v4.9.0: Parse lines as they arrive (no full output string)
+            interfaces = parse_mikrotik_interfaces(
+                self.stream_command(cmd, wait_time=wait_time), self.prompt
+            )
+            logger.info(f"MikroTik: Parsed {len(interfaces)} interfaces")
             
-            if output and re.search(r'^\s*\d+\s+', output, re.MULTILINE):
-                logger.info(f"MikroTik: Got {len(output)} bytes from {cmd}")
-                
-                interfaces = parse_mikrotik_interfaces(output)
-                logger.info(f"MikroTik: Parsed {len(interfaces)} interfaces")
-                
-                if interfaces:
-                    logger.info(f"MikroTik: First interface: {interfaces[0]['name']}")
-                    logger.info(f"MikroTik: Last interface: {interfaces[-1]['name']}")
-                    return interfaces
+            if interfaces:
+                logger.info(f"MikroTik: First interface: {interfaces[0]['name']}")
+                logger.info(f"MikroTik: Last interface: {interfaces[-1]['name']}")
+                return interfaces
         
         return []
     
     def _get_mikrotik_interface_count(self) -> int:
         """Get expected interface count from MikroTik"""
         try:
-            cmd = "/interface ethernet print count-only"
-            output = self.execute_command(cmd, wait_time=5.0)
-            
-            if output:
-                lines = output.strip().split('\n')
-                for line in reversed(lines):
-                    line = line.strip()
-                    if not line or line.endswith('>') or line.endswith('#'):
-                        continue
-                    if line.isdigit():
-                        count = int(line)
-                        logger.info(f"MikroTik: ethernet count-only returned {count}")
-                        return count
-                
-                match = re.search(r'\b(\d+)\b', output)
-                if match:
-                    count = int(match.group(1))
-                    return count
+            output = self.execute_command(self.MIKROTIK_COUNT_COMMAND, wait_time=5.0)
+            return self._parse_mikrotik_count(output)
         except Exception as e:
             logger.warning(f"MikroTik: Failed to get count: {e}")
         
         return 0
     
-    def _parse_default_interfaces(self, output: str) -> List[Dict[str, Any]]:
-        """Default interface parsing"""
-        interfaces = []
-        lines = output.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line or '---' in line or '===' in line:
-                continue
-            
-            lower_line = line.lower()
-            if any(h in lower_line for h in ['interface', 'port', 'status', 'protocol']):
-                if not any(c.isdigit() for c in line[:20]):
-                    continue
-            
-            parts = line.split()
-            if len(parts) >= 1:
-                iface_name = parts[0]
-                
-                if not any(c.isdigit() for c in iface_name) and '/' not in iface_name:
-                    continue
-                
-                if iface_name.endswith('#') or iface_name.endswith('>'):
-                    continue
-                
-                interface = {
-                    'name': iface_name,
-                    'status': 'unknown',
-                    'description': '',
-                }
-                
-                line_lower = line.lower()
-                
-                if ' up ' in line_lower or line_lower.endswith(' up'):
-                    interface['status'] = 'up'
-                elif ' down ' in line_lower or line_lower.endswith(' down'):
-                    interface['status'] = 'down'
-                
-                if len(parts) >= 3:
-                    desc_start = -1
-                    for i, part in enumerate(parts[1:], 1):
-                        if part.lower() in ['up', 'down']:
-                            desc_start = i + 1
-                            break
-                    if desc_start > 0 and desc_start < len(parts):
-                        interface['description'] = ' '.join(parts[desc_start:])
-                
-                interfaces.append(interface)
-        
-        return interfaces
-    
     def get_interface_status(self, interface_name: str) -> Dict[str, Any]:
         """Get specific interface status"""
         
@@ -986,90 +2318,29 @@ class BotLinkMaster:
         # Old check "'Error' in output" was too broad - caught "Total Error:" in statistics
         # New check only looks at first few lines for actual command errors
         if not output or self._is_command_error(output):
+            self._fallback('interface_name')
             cmd = self.vendor_config.show_interface.format(interface=interface_name)
             output = self.execute_command(cmd, wait_time=5.0)
         
-        return {
-            'name': interface_name,
-            'full_name': full_interface,
-            'status': self.optical_parser.parse_interface_status(output),
-            'description': self.optical_parser.parse_description(output),
-            'raw_output': output,
-        }
-    
-    def _is_command_error(self, output: str) -> bool:
-        """
-        v4.8.8: Check if output indicates a command error (not statistics)
-        
-        Problem: Huawei "display interface" output contains "Total Error: 709822"
-        in statistics, which triggered false positive with "'Error' in output"
-        
-        Solution: Only check first 5 lines for actual error patterns
-        """
-        if not output:
-            return True
-        
-        # Only check first 5 lines - command errors appear at the start
-        first_lines = '\n'.join(output.split('\n')[:5])
-        
-        # These patterns indicate actual command errors
-        error_indicators = [
-            'Invalid',           # "Invalid input", "Invalid command"
-            'Error:',            # "Error: Wrong parameter" (note colon)
-            'Unrecognized',      # "Unrecognized command"
-            '% ',                # Cisco style "% Invalid input"
-            'Wrong parameter',   # Huawei "Wrong parameter found"
-            'Unknown command',   # Generic
-            'Incomplete command', # Incomplete command error
-        ]
-        
-        for indicator in error_indicators:
-            if indicator in first_lines:
-                return True
-        
-        return False
+        return self._interface_status_result(interface_name, full_interface, output)
     
     def _get_cisco_nxos_interface_status(self, interface_name: str) -> Dict[str, Any]:
         """Get Cisco NX-OS interface status"""
-        result = {
-            'name': interface_name,
-            'full_name': interface_name,
-            'status': 'unknown',
-            'description': '',
-            'raw_output': '',
-        }
+        result = self._new_nxos_status(interface_name)
         
         output = self.execute_command("show interface status", wait_time=5.0)
-        result['raw_output'] = output
-        
-        if output:
-            for line in output.split('\n'):
-                line_lower = line.lower()
-                iface_lower = interface_name.lower()
-                
-                if iface_lower in line_lower or iface_lower.replace('/', '') in line_lower:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # v4.8.7: Get description from parts[1] - may be truncated
-                        # v4.8.8: Will be overridden below from running-config
-                        if len(parts) >= 2 and parts[1] != '--':
-                            result['description'] = parts[1]
-                        
-                        if 'connected' in line_lower and 'notconnect' not in line_lower:
-                            result['status'] = 'up'
-                        elif 'notconnect' in line_lower:
-                            result['status'] = 'down'
-                        elif 'disabled' in line_lower:
-                            result['status'] = 'down'
-                        elif 'sfp not' in line_lower or 'xcvr not' in line_lower:
-                            result['status'] = 'down'
-                        
-                        if result['status'] != 'unknown':
-                            break
+        self._apply_nxos_status_table(result, output, interface_name)
         
         # v4.8.8 FIX: Get description from running-config (source of truth)
         # This overrides any truncated description from show interface status
-        desc_from_config = self._get_nxos_description_from_config(interface_name)
+        # v4.9.0: Looked up in the cached running-config harvest; a
+        # per-interface running-config is only read if that failed
+        descriptions = self._get_cached_nxos_descriptions()
+        if descriptions is not None:
+            desc_from_config = self._lookup_nxos_description(descriptions, interface_name)
+        else:
+            self._fallback('nxos_config_interface')
+            desc_from_config = self._get_nxos_description_from_config(interface_name)
         if desc_from_config:
             result['description'] = desc_from_config
         
@@ -1077,13 +2348,7 @@ class BotLinkMaster:
         if result['status'] == 'unknown':
             cmd = f"show interface {interface_name}"
             output2 = self.execute_command(cmd, wait_time=5.0)
-            
-            if output2:
-                result['raw_output'] = output2
-                result['status'] = self.optical_parser.parse_interface_status(output2)
-                # Only use description from here if we don't have one from config
-                if not result['description']:
-                    result['description'] = self.optical_parser.parse_description(output2)
+            self._apply_nxos_interface_output(result, output2)
         
         return result
     
@@ -1100,127 +2365,127 @@ class BotLinkMaster:
         try:
             cmd = f"show running-config interface {interface_name}"
             output = self.execute_command(cmd, wait_time=5.0)
-            
-            if not output:
-                return ''
-            
-            # Parse description line from running-config
-            # Format: "  description FS(OTB-B T1C1)"
-            for line in output.split('\n'):
-                line_stripped = line.strip()
-                if line_stripped.lower().startswith('description '):
-                    # Extract everything after "description "
-                    desc = line_stripped[12:].strip()
-                    logger.info(f"NX-OS: Got description from running-config: {desc}")
-                    return desc
-            
-            return ''
+            return self._parse_nxos_config_description(output)
         except Exception as e:
             logger.warning(f"NX-OS: Failed to get description from running-config: {e}")
             return ''
     
     def _get_mikrotik_interface_status(self, interface_name: str) -> Dict[str, Any]:
         """Get MikroTik interface status"""
-        result = {
-            'name': interface_name,
-            'full_name': interface_name,
-            'status': 'unknown',
-            'description': '',
-            'flags': '',
-            'raw_output': '',
-        }
-        
-        interfaces = self._get_mikrotik_interfaces()
-        
-        if not interfaces:
-            logger.warning(f"MikroTik: No interfaces returned")
+        result = self._new_mikrotik_status(interface_name)
+        
+        # v4.9.0: Ask for this interface only - the full listing below is
+        # the fallback (unknown name, different case, old RouterOS)
+        iface = self._get_mikrotik_single_interface(interface_name)
+        if iface:
+            result['status'] = iface['status']
+            result['description'] = iface['description']
+            result['flags'] = iface['flags']
+            logger.info(f"MikroTik: Found {interface_name}, flags='{result['flags']}', status={result['status']}")
             return result
         
-        iface_lower = interface_name.lower()
-        
-        for iface in interfaces:
-            if iface.get('name', '').lower() == iface_lower:
-                result['status'] = iface.get('status', 'unknown')
-                result['description'] = iface.get('description', '')
-                result['flags'] = iface.get('flags', '')
-                logger.info(f"MikroTik: Found {interface_name}, flags='{result['flags']}', status={result['status']}")
-                return result
-        
-        logger.warning(f"MikroTik: Interface '{interface_name}' not found in {len(interfaces)} interfaces")
-        return result
+        self._fallback('mikrotik_listing')
+        interfaces = self._get_mikrotik_interfaces()
+        return self._mikrotik_status_from_listing(result, interfaces, interface_name)
+    
+    def _get_mikrotik_single_interface(self, interface_name: str) -> Optional[Dict[str, Any]]:
+        """v4.9.0: One interface via "print terse where name=..." (None if not found)"""
+        cmd = self._mikrotik_single_command(interface_name)
+        try:
+            for iface in parse_mikrotik_terse(self.stream_command(cmd, wait_time=10.0), self.prompt):
+                if iface['name'] == interface_name:
+                    return iface
+        except Exception as e:
+            logger.warning(f"MikroTik: Single interface query failed: {e}")
+        return None
     
     def get_optical_power(self, interface_name: str) -> Dict[str, Any]:
-        """Get optical power readings"""
-        full_interface = expand_interface_name(interface_name)
-        
-        commands = get_optical_commands(self.config.vendor, full_interface)
-        
-        if full_interface != interface_name:
-            commands.extend(get_optical_commands(self.config.vendor, interface_name))
-        
-        seen = set()
-        unique_commands = []
-        for cmd in commands:
-            if cmd not in seen:
-                seen.add(cmd)
-                unique_commands.append(cmd)
+        """
+        Get optical power readings
         
-        all_output = ""
-        result = None
-        successful_cmd = None
+        v4.9.0: The first lookup sends every candidate command in one
+        batch; the one that found readings is remembered (optical_command,
+        also saved as session hint) and sent alone on later lookups.
+        """
+        full_interface = expand_interface_name(interface_name)
+        candidates = self._optical_candidates(interface_name, full_interface)
         
         # v4.8.7: Use command_wait timeout
         wait_time = self.timeouts.get('command_wait', 10.0)
         
-        for cmd in unique_commands:
-            logger.info(f"Trying optical: {cmd}")
-            output = self.execute_command(cmd, wait_time=wait_time)
-            
-            if output:
-                if any(err in output for err in ['Invalid', 'Error', 'Unrecognized', '% ']):
-                    continue
-                
-                all_output += f"\n{'='*50}\n{cmd}\n{'='*50}\n{output}\n"
-                
-                parsed = self.optical_parser.parse_optical_power(output)
-                
-                if parsed['found']:
-                    result = parsed
-                    successful_cmd = cmd
-                    logger.info(f"Found optical with: {cmd}")
-                    break
-        
-        if not result or not result.get('found'):
-            result = self.optical_parser.parse_optical_power(all_output)
-            successful_cmd = 'combined' if result.get('found') else 'none'
+        learned = self._learned_optical_command(interface_name, full_interface)
+        if learned:
+            output = self.execute_command(learned, wait_time=wait_time)
+            if output and not self._is_optical_error(output):
+                result, successful_cmd, all_output = self._select_optical([learned], [output])
+                return self._finish_optical(result, successful_cmd, interface_name,
+                                            full_interface, all_output)
+            self._learned_optical_failed(learned, output)
+            candidates.pop(learned, None)
+        
+        # v4.9.0: All candidates in one round trip, evaluated in order
+        commands = list(candidates)
+        outputs = self.execute_batch(commands, wait_time=wait_time)
+        result, successful_cmd, all_output = self._select_optical(commands, outputs)
+        if successful_cmd:
+            self._set_optical_command(candidates[successful_cmd])
+        
+        return self._finish_optical(result, successful_cmd, interface_name, full_interface, all_output)
+    
+    def get_all_optical_power(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        v4.9.0: Optical power of every interface with one bulk command
         
-        result['interface'] = interface_name
-        result['full_interface'] = full_interface
-        result['all_output'] = all_output
-        result['command_used'] = successful_cmd
+        Runs the vendor "all transceivers" command (show_optical_all) once
+        instead of N x get_optical_power(). Returns {interface: readings}
+        (empty if no interface has optics), or None if the device does not
+        support the bulk command.
+        """
+        cmd = self.vendor_config.show_optical_all
+        if not cmd:
+            return None
         
-        return result
+        wait_time = self.timeouts.get('command_wait', 10.0)
+        output = self.execute_command(cmd, wait_time=wait_time)
+        return self._parse_optical_bulk(cmd, output)
     
     def check_interface_with_optical(self, interface_name: str) -> Dict[str, Any]:
         """Get complete interface info with optical"""
         interface_info = self.get_interface_status(interface_name)
         optical_info = self.get_optical_power(interface_name)
+        return self._merge_interface_optical(interface_name, interface_info, optical_info)
+    
+    def is_alive(self, timeout: float = 5.0) -> bool:
+        """
+        v4.9.0: Liveness probe for a long-lived session
         
-        return {
-            'name': interface_name,
-            'full_name': interface_info.get('full_name', interface_name),
-            'status': interface_info.get('status', 'unknown'),
-            'description': interface_info.get('description', ''),
-            'flags': interface_info.get('flags', ''),
-            'rx_power': optical_info.get('rx_power'),
-            'tx_power': optical_info.get('tx_power'),
-            'rx_power_dbm': optical_info.get('rx_power_dbm', 'N/A'),
-            'tx_power_dbm': optical_info.get('tx_power_dbm', 'N/A'),
-            'optical_status': optical_info.get('signal_status', 'unknown'),
-            'command_used': optical_info.get('command_used', 'unknown'),
-            'raw_output': optical_info.get('all_output', ''),
-            'found': optical_info.get('found', False),
-        }
+        Checks the transport, then sends a blank line and expects the
+        prompt back within timeout.
+        """
+        if not self.connected:
+            return False
+        
+        try:
+            if self.config.protocol == Protocol.SSH:
+                transport = self.transport
+                if transport is None and self.client:
+                    transport = self.client.get_transport()
+                if not transport or not transport.is_active() or not self.shell or self.shell.closed:
+                    return False
+                while self.shell.recv_ready():
+                    self.shell.recv(65535)
+            else:
+                if not self.client or self.client.closed:
+                    return False
+                while self._recv(0):
+                    pass
+            
+            self._send_line("")
+            output = self._read_until_prompt(LIVENESS_PROBE, timeout, hard_timeout=timeout)
+            return bool(output) and self._is_prompt(output[-self.PROMPT_TAIL_WINDOW:])
+        except Exception as e:
+            logger.info(f"Liveness probe failed for {self.config.host}: {e}")
+            return False
     
     def disconnect(self):
         try:
@@ -1248,12 +2513,17 @@ class BotLinkMaster:
 
 if __name__ == "__main__":
     print("=" * 60)
-    print("BotLinkMaster v4.8.8 - Network Device Connection Module")
+    print("BotLinkMaster v4.9.0 - Network Device Connection Module")
     print("=" * 60)
     print("\nSupported Vendors:")
     from vendor_commands import get_supported_vendors
     for i, v in enumerate(get_supported_vendors(), 1):
         print(f"  {i:2}. {v}")
+    print("\nv4.9.0:")
+    print("  - Telnet login on a plain socket, no telnetlib (removed in Python 3.13)")
+    print("  - Paging, SSH method and structured output learned per device")
+    print("  - NX-OS descriptions cached and revalidated against running-config")
+    print("  - Async sessions: async_botlinkmaster.AsyncBotLinkMaster")
     print("\nv4.8.8 Fixes (Minimal):")
     print("  - Cisco NX-OS: Description from show running-config interface")
     print("  - Huawei VRP/Quidway: Added status patterns for non-CloudEngine")
@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 """
-BotLinkMaster v4.8.8 - Database Module
+BotLinkMaster v4.9.0 - Database Module
 SQLite database with support for multiple devices per IP (port forwarding)
 
 Author: BotLinkMaster
-Version: 4.8.7
+Version: 4.9.0
 """
 
+import json
 import sqlite3
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Optional, List
 from datetime import datetime
 
+from adaptive_timeouts import LatencyStats, PROBE_COMMANDS, STAGES
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,15 +47,50 @@ class InterfaceCache:
     rx_power: Optional[float]
     tx_power: Optional[float]
     cached_at: Optional[str] = None
+    optical_at: Optional[str] = None
+    listed: bool = False
+
+
+@dataclass
+class InterfaceSample:
+    device_name: str
+    interface_name: str
+    status: Optional[str]
+    rx_power: Optional[float]
+    tx_power: Optional[float]
+    sampled_at: Optional[str] = None
+
+
+@dataclass
+class SessionHint:
+    device_name: str
+    connection_method: Optional[str]
+    cipher: Optional[str]
+    key_type: Optional[str]
+    # v4.9.0: 'command' (disable_paging works) or 'pager' (answer the pager)
+    paging_mode: Optional[str] = None
+    # v4.9.0: Device rejected structured_interface_command, use the text parser
+    structured_rejected: bool = False
+    # v4.9.0: Optical command template that found readings ({interface}/{name})
+    optical_command: Optional[str] = None
+    failures: int = 0
+    updated_at: Optional[str] = None
 
 
 class DatabaseManager:
+    # v4.9.0: Forget a cached connection method after this many failures
+    SESSION_HINT_MAX_FAILURES = 3
+    
     def __init__(self, db_path: str = "botlinkmaster.db"):
         self.db_path = db_path
         self.conn = None
+        # v4.9.0: One connection shared by the bot, the device executor
+        # threads and the poller - every cursor use holds this lock
+        self._lock = threading.RLock()
         self._connect()
-        self._create_tables()
-        self._migrate_tables()
+        with self._lock:
+            self._create_tables()
+            self._migrate_tables()
     
     def _connect(self):
         try:
@@ -93,10 +132,63 @@ class DatabaseManager:
                 rx_power REAL,
                 tx_power REAL,
                 cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                optical_at TIMESTAMP,
+                listed INTEGER DEFAULT 0,
                 UNIQUE(device_name, interface_name)
             )
         ''')
         
+        # v4.9.0: Append-only optical history written by the poller
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS interface_samples (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                device_name TEXT NOT NULL,
+                interface_name TEXT NOT NULL,
+                status TEXT,
+                rx_power REAL,
+                tx_power REAL,
+                sampled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_interface_samples_lookup
+            ON interface_samples (device_name, interface_name, sampled_at)
+        ''')
+        
+        # v4.9.0: Connection method/algorithms and paging mode that worked per device
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS device_session_hints (
+                device_name TEXT PRIMARY KEY,
+                connection_method TEXT,
+                cipher TEXT,
+                key_type TEXT,
+                paging_mode TEXT,
+                structured_rejected INTEGER DEFAULT 0,
+                optical_command TEXT,
+                failures INTEGER DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # v4.9.0: Response times per device and command class (adaptive timeouts)
+        # EWMA/p99 columns for /stats, window = last commands as JSON
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS device_latency_stats (
+                device_name TEXT NOT NULL,
+                command_class TEXT NOT NULL,
+                samples INTEGER DEFAULT 0,
+                first_byte_ewma REAL,
+                first_byte_p99 REAL,
+                gap_ewma REAL,
+                gap_p99 REAL,
+                total_ewma REAL,
+                total_p99 REAL,
+                window TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (device_name, command_class)
+            )
+        ''')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS settings (
                 key TEXT PRIMARY KEY,
@@ -140,18 +232,70 @@ class DatabaseManager:
                 self.conn.commit()
             except:
                 pass
+        
+        # v4.9.0: Separate optical timestamp + full interface listing marker
+        if 'optical_at' not in columns:
+            try:
+                cursor.execute("ALTER TABLE interface_cache ADD COLUMN optical_at TIMESTAMP")
+                cursor.execute("ALTER TABLE interface_cache ADD COLUMN listed INTEGER DEFAULT 0")
+                self.conn.commit()
+            except:
+                pass
+        
+        # v4.9.0: Paging mode per device
+        cursor.execute("PRAGMA table_info(device_session_hints)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        if 'paging_mode' not in columns:
+            try:
+                cursor.execute("ALTER TABLE device_session_hints ADD COLUMN paging_mode TEXT")
+                self.conn.commit()
+            except:
+                pass
+        
+        # v4.9.0: Structured output rejected per device
+        if 'structured_rejected' not in columns:
+            try:
+                cursor.execute("ALTER TABLE device_session_hints ADD COLUMN structured_rejected INTEGER DEFAULT 0")
+                self.conn.commit()
+            except:
+                pass
+        
+        # v4.9.0: Optical command that worked per device
+        if 'optical_command' not in columns:
+            try:
+                cursor.execute("ALTER TABLE device_session_hints ADD COLUMN optical_command TEXT")
+                self.conn.commit()
+            except:
+                pass
+        
+        # v4.9.0: kex was never known (paramiko drops it after the handshake)
+        if 'kex' in columns:
+            try:
+                cursor.execute("ALTER TABLE device_session_hints DROP COLUMN kex")
+                self.conn.commit()
+            except:
+                pass
+        
+        # v4.9.0: Prompt/liveness probes were stored like commands before
+        cursor.execute(f'''
+            DELETE FROM device_latency_stats
+            WHERE command_class IN ({','.join('?' * len(PROBE_COMMANDS))})
+        ''', PROBE_COMMANDS)
+        self.conn.commit()
     
     def add_device(self, name: str, host: str, username: str, password: str,
                    protocol: str = 'ssh', port: Optional[int] = None,
                    description: Optional[str] = None, location: Optional[str] = None,
                    vendor: Optional[str] = 'generic') -> Optional[Device]:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO devices (name, host, username, password, protocol, port, description, location, vendor)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (name, host, username, password, protocol, port, description, location, vendor or 'generic'))
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT INTO devices (name, host, username, password, protocol, port, description, location, vendor)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (name, host, username, password, protocol, port, description, location, vendor or 'generic'))
+                self.conn.commit()
             return self.get_device(name)
         except sqlite3.IntegrityError:
             logger.warning(f"Device already exists: {name}")
@@ -162,9 +306,10 @@ class DatabaseManager:
     
     def get_device(self, name: str) -> Optional[Device]:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM devices WHERE name = ?', (name,))
-            row = cursor.fetchone()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT * FROM devices WHERE name = ?', (name,))
+                row = cursor.fetchone()
             if row:
                 return Device(
                     id=row['id'], name=row['name'], host=row['host'],
@@ -181,9 +326,10 @@ class DatabaseManager:
     
     def get_all_devices(self) -> List[Device]:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM devices ORDER BY name')
-            rows = cursor.fetchall()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT * FROM devices ORDER BY name')
+                rows = cursor.fetchall()
             return [Device(
                 id=r['id'], name=r['name'], host=r['host'],
                 username=r['username'], password=r['password'],
@@ -207,12 +353,13 @@ class DatabaseManager:
             set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
             values = list(updates.values()) + [name]
             
-            cursor = self.conn.cursor()
-            cursor.execute(f'''
-                UPDATE devices SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                WHERE name = ?
-            ''', values)
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute(f'''
+                    UPDATE devices SET {set_clause}, updated_at = CURRENT_TIMESTAMP
+                    WHERE name = ?
+                ''', values)
+                self.conn.commit()
             return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Error updating device: {e}")
@@ -220,111 +367,429 @@ class DatabaseManager:
     
     def delete_device(self, name: str) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM interface_cache WHERE device_name = ?', (name,))
-            cursor.execute('DELETE FROM devices WHERE name = ?', (name,))
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('DELETE FROM interface_cache WHERE device_name = ?', (name,))
+                cursor.execute('DELETE FROM interface_samples WHERE device_name = ?', (name,))
+                cursor.execute('DELETE FROM device_session_hints WHERE device_name = ?', (name,))
+                cursor.execute('DELETE FROM device_latency_stats WHERE device_name = ?', (name,))
+                cursor.execute('DELETE FROM devices WHERE name = ?', (name,))
+                self.conn.commit()
             return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Error deleting device: {e}")
             return False
     
+    def _upsert_interface(self, cursor, device_name: str, interface_name: str,
+                          status: Optional[str], protocol_status: Optional[str],
+                          description: Optional[str], rx_power: Optional[float],
+                          tx_power: Optional[float], listed: Optional[bool] = None):
+        """
+        v4.9.0: Insert/update one cached interface
+        
+        Fields passed as None keep their cached value, so a status read does
+        not erase the optical reading (optical_at only moves with rx/tx) and
+        an optical read without status does not make the cached status look
+        fresh (cached_at only moves with the status or a full listing).
+        """
+        has_optical = rx_power is not None or tx_power is not None
+        has_status = status is not None or listed is not None
+        cursor.execute('''
+            INSERT INTO interface_cache
+            (device_name, interface_name, status, protocol_status, description,
+             rx_power, tx_power, cached_at, optical_at, listed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CASE WHEN ? THEN CURRENT_TIMESTAMP END,
+                    CASE WHEN ? THEN CURRENT_TIMESTAMP END, COALESCE(?, 0))
+            ON CONFLICT(device_name, interface_name) DO UPDATE SET
+                status = COALESCE(excluded.status, status),
+                protocol_status = COALESCE(excluded.protocol_status, protocol_status),
+                description = COALESCE(excluded.description, description),
+                rx_power = CASE WHEN ? THEN excluded.rx_power ELSE rx_power END,
+                tx_power = CASE WHEN ? THEN excluded.tx_power ELSE tx_power END,
+                optical_at = COALESCE(excluded.optical_at, optical_at),
+                listed = CASE WHEN ? IS NULL THEN listed ELSE excluded.listed END,
+                cached_at = COALESCE(excluded.cached_at, cached_at)
+        ''', (device_name, interface_name, status, protocol_status, description,
+              rx_power, tx_power, has_status, has_optical, listed,
+              has_optical, has_optical, listed))
+    
     def cache_interface(self, device_name: str, interface_name: str,
                        status: Optional[str] = None, protocol_status: Optional[str] = None,
                        description: Optional[str] = None,
                        rx_power: Optional[float] = None,
                        tx_power: Optional[float] = None) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO interface_cache 
-                (device_name, interface_name, status, protocol_status, description, rx_power, tx_power, cached_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (device_name, interface_name, status, protocol_status, description, rx_power, tx_power))
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                self._upsert_interface(cursor, device_name, interface_name, status,
+                                       protocol_status, description, rx_power, tx_power)
+                self.conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error caching interface: {e}")
             return False
     
+    def _replace_interface_list(self, cursor, device_name: str, interfaces: List[dict]):
+        names = []
+        for iface in interfaces:
+            name = iface.get('name') or iface.get('interface')
+            if not name:
+                continue
+            names.append(name)
+            self._upsert_interface(cursor, device_name, name, iface.get('status'),
+                                   None, iface.get('description'),
+                                   iface.get('rx_power'), iface.get('tx_power'),
+                                   listed=True)
+        placeholders = ','.join('?' * len(names))
+        cursor.execute(f'''
+            DELETE FROM interface_cache
+            WHERE device_name = ? AND listed = 1 AND interface_name NOT IN ({placeholders})
+        ''', [device_name] + names)
+    
+    def cache_interface_list(self, device_name: str, interfaces: List[dict]) -> bool:
+        """
+        v4.9.0: Cache the full interface listing of a device
+        
+        Interfaces no longer listed by the device are removed.
+        Keys: name or interface, status, description, rx_power, tx_power
+        """
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                self._replace_interface_list(cursor, device_name, interfaces)
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error caching interface list: {e}")
+            return False
+    
     def get_device_interfaces(self, device_name: str) -> List[InterfaceCache]:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM interface_cache WHERE device_name = ?
-                ORDER BY interface_name
-            ''', (device_name,))
-            rows = cursor.fetchall()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    SELECT * FROM interface_cache WHERE device_name = ?
+                    ORDER BY id
+                ''', (device_name,))
+                rows = cursor.fetchall()
             return [InterfaceCache(
                 id=r['id'], device_name=r['device_name'],
                 interface_name=r['interface_name'], status=r['status'],
                 protocol_status=r['protocol_status'], description=r['description'],
                 rx_power=r['rx_power'] if 'rx_power' in r.keys() else None,
                 tx_power=r['tx_power'] if 'tx_power' in r.keys() else None,
-                cached_at=r['cached_at']
+                cached_at=r['cached_at'],
+                optical_at=r['optical_at'] if 'optical_at' in r.keys() else None,
+                listed=bool(r['listed']) if 'listed' in r.keys() else False
             ) for r in rows]
         except Exception as e:
             logger.error(f"Error getting interfaces: {e}")
             return []
     
+    def record_interface_samples(self, device_name: str, rows: List[dict]) -> bool:
+        """
+        v4.9.0: Store one poll of a device
+        
+        Rows are the full interface listing and replace the cached one;
+        rows with optical readings are also appended to interface_samples
+        (history for the trend).
+        Row keys: interface, status, description, rx_power, tx_power
+        """
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                self._replace_interface_list(cursor, device_name, rows)
+                cursor.executemany('''
+                    INSERT INTO interface_samples
+                    (device_name, interface_name, status, rx_power, tx_power)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [(device_name, r['interface'], r.get('status'),
+                       r.get('rx_power'), r.get('tx_power'))
+                      for r in rows if r.get('rx_power') is not None or r.get('tx_power') is not None])
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error recording interface samples: {e}")
+            return False
+    
+    def get_interface_samples(self, device_name: str, interface_name: str,
+                              limit: int = 12) -> List[InterfaceSample]:
+        """v4.9.0: Latest samples of one interface, oldest first"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    SELECT * FROM interface_samples
+                    WHERE device_name = ? AND interface_name = ? COLLATE NOCASE
+                    ORDER BY sampled_at DESC, id DESC LIMIT ?
+                ''', (device_name, interface_name, limit))
+                rows = cursor.fetchall()
+            return [InterfaceSample(
+                device_name=r['device_name'], interface_name=r['interface_name'],
+                status=r['status'], rx_power=r['rx_power'], tx_power=r['tx_power'],
+                sampled_at=r['sampled_at']
+            ) for r in reversed(rows)]
+        except Exception as e:
+            logger.error(f"Error getting interface samples: {e}")
+            return []
+    
+    def prune_interface_samples(self, keep_days: float) -> int:
+        """v4.9.0: Delete samples older than keep_days, returns rows deleted"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    DELETE FROM interface_samples
+                    WHERE sampled_at < datetime('now', ?)
+                ''', (f'-{keep_days} days',))
+                deleted = cursor.rowcount
+                self.conn.commit()
+            return deleted
+        except Exception as e:
+            logger.error(f"Error pruning interface samples: {e}")
+            return 0
+    
+    def get_session_hint(self, device_name: str) -> Optional[SessionHint]:
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT * FROM device_session_hints WHERE device_name = ?',
+                               (device_name,))
+                row = cursor.fetchone()
+            if row:
+                return SessionHint(
+                    device_name=row['device_name'],
+                    connection_method=row['connection_method'],
+                    cipher=row['cipher'], key_type=row['key_type'],
+                    paging_mode=row['paging_mode'],
+                    structured_rejected=bool(row['structured_rejected']),
+                    optical_command=row['optical_command'],
+                    failures=row['failures'] or 0, updated_at=row['updated_at']
+                )
+            return None
+        except Exception as e:
+            logger.error(f"Error getting session hint: {e}")
+            return None
+    
+    def save_session_hint(self, device_name: str, connection_method: str,
+                          cipher: Optional[str] = None,
+                          key_type: Optional[str] = None) -> bool:
+        """Store the connection method that worked - resets the failure count"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT INTO device_session_hints
+                    (device_name, connection_method, cipher, key_type, failures, updated_at)
+                    VALUES (?, ?, ?, ?, 0, CURRENT_TIMESTAMP)
+                    ON CONFLICT(device_name) DO UPDATE SET
+                        connection_method = excluded.connection_method,
+                        cipher = excluded.cipher,
+                        key_type = excluded.key_type,
+                        failures = 0,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', (device_name, connection_method, cipher, key_type))
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving session hint: {e}")
+            return False
+    
+    def save_paging_mode(self, device_name: str, paging_mode: str) -> bool:
+        """v4.9.0: Store how paging is handled on the device (SSH and Telnet)"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT INTO device_session_hints (device_name, paging_mode, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(device_name) DO UPDATE SET
+                        paging_mode = excluded.paging_mode,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', (device_name, paging_mode))
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving paging mode: {e}")
+            return False
+    
+    def save_structured_rejected(self, device_name: str, rejected: bool = True) -> bool:
+        """v4.9.0: Remember that a device rejected structured_interface_command"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT INTO device_session_hints (device_name, structured_rejected, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(device_name) DO UPDATE SET
+                        structured_rejected = excluded.structured_rejected,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', (device_name, int(rejected)))
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving structured output hint: {e}")
+            return False
+    
+    def save_optical_command(self, device_name: str, template: Optional[str]) -> bool:
+        """v4.9.0: Store the optical command template that found readings (None forgets it)"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT INTO device_session_hints (device_name, optical_command, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(device_name) DO UPDATE SET
+                        optical_command = excluded.optical_command,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', (device_name, template))
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving optical command: {e}")
+            return False
+    
+    def record_session_hint_failure(self, device_name: str) -> bool:
+        """
+        Count a failure of the cached connection method
+        
+        Returns True if the hint was invalidated (too many failures).
+        """
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    UPDATE device_session_hints
+                    SET failures = failures + 1, updated_at = CURRENT_TIMESTAMP
+                    WHERE device_name = ?
+                ''', (device_name,))
+                cursor.execute('''
+                    DELETE FROM device_session_hints
+                    WHERE device_name = ? AND failures >= ?
+                ''', (device_name, self.SESSION_HINT_MAX_FAILURES))
+                invalidated = cursor.rowcount > 0
+                self.conn.commit()
+            if invalidated:
+                logger.info(f"Session hint for {device_name} invalidated after repeated failures")
+            return invalidated
+        except Exception as e:
+            logger.error(f"Error recording session hint failure: {e}")
+            return False
+    
+    def get_latency_stats(self, device_name: str) -> List[LatencyStats]:
+        """v4.9.0: Learned response times of a device, slowest command first"""
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    SELECT * FROM device_latency_stats WHERE device_name = ?
+                    ORDER BY total_p99 DESC
+                ''', (device_name,))
+                rows = cursor.fetchall()
+            return [LatencyStats(
+                command_class=r['command_class'],
+                samples=r['samples'] or 0,
+                ewma={stage: r[f'{stage}_ewma'] for stage in STAGES
+                      if r[f'{stage}_ewma'] is not None},
+                window=[tuple(sample) for sample in json.loads(r['window'] or '[]')],
+                updated_at=r['updated_at'],
+            ) for r in rows]
+        except Exception as e:
+            logger.error(f"Error getting latency stats: {e}")
+            return []
+    
+    def save_latency_stats(self, device_name: str, stats: List[LatencyStats]) -> bool:
+        """v4.9.0: Store the statistics of the given command classes"""
+        if not stats:
+            return True
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO device_latency_stats
+                    (device_name, command_class, samples,
+                     first_byte_ewma, first_byte_p99, gap_ewma, gap_p99, total_ewma, total_p99,
+                     window, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', [(device_name, s.command_class, s.samples,
+                       s.ewma.get('first_byte'), s.p99('first_byte'),
+                       s.ewma.get('gap'), s.p99('gap'),
+                       s.ewma.get('total'), s.p99('total'),
+                       json.dumps([[round(v, 4) for v in sample] for sample in s.window]))
+                      for s in stats])
+                self.conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error saving latency stats: {e}")
+            return False
+    
     def get_setting(self, key: str, default: str = '') -> str:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-            row = cursor.fetchone()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
+                row = cursor.fetchone()
             return row['value'] if row else default
         except:
             return default
     
     def set_setting(self, key: str, value: str) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO settings (key, value, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (key, value))
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO settings (key, value, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                ''', (key, value))
+                self.conn.commit()
             return True
         except:
             return False
     
     def add_allowed_user(self, chat_id: int, username: str = None, is_admin: bool = False) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO allowed_users (chat_id, username, is_admin)
-                VALUES (?, ?, ?)
-            ''', (chat_id, username, 1 if is_admin else 0))
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO allowed_users (chat_id, username, is_admin)
+                    VALUES (?, ?, ?)
+                ''', (chat_id, username, 1 if is_admin else 0))
+                self.conn.commit()
             return True
         except:
             return False
     
     def remove_allowed_user(self, chat_id: int) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM allowed_users WHERE chat_id = ?', (chat_id,))
-            self.conn.commit()
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('DELETE FROM allowed_users WHERE chat_id = ?', (chat_id,))
+                self.conn.commit()
             return cursor.rowcount > 0
         except:
             return False
     
     def get_allowed_users(self) -> List[dict]:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT * FROM allowed_users')
-            return [dict(r) for r in cursor.fetchall()]
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT * FROM allowed_users')
+                rows = cursor.fetchall()
+            return [dict(r) for r in rows]
         except:
             return []
     
     def is_user_allowed(self, chat_id: int) -> bool:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT 1 FROM allowed_users WHERE chat_id = ?', (chat_id,))
-            return cursor.fetchone() is not None
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute('SELECT 1 FROM allowed_users WHERE chat_id = ?', (chat_id,))
+                row = cursor.fetchone()
+            return row is not None
         except:
             return False
     
     def close(self):
-        if self.conn:
-            self.conn.close()
+        with self._lock:
+            if self.conn:
+                self.conn.close()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Device Session Executor
+Runs blocking device sessions (SSH/Telnet) off the Telegram event loop
+
+Each device session (connect, execute_command, parsing) is blocking code
+built on paramiko and plain Telnet sockets. The executor runs it in a bounded thread pool
+so the bot keeps answering other operators while one device is slow.
+
+Limits:
+- Global cap: maximum number of device sessions running at once
+- Per-host limit: maximum sessions to the same host:port at once
+
+SingleFlight coalesces identical concurrent requests (same device,
+operation and interface) into one device call shared by all callers.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceExecutor:
+    """Bounded worker pool for blocking device sessions"""
+
+    def __init__(self, max_workers: int = 20, per_host_limit: int = 2):
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='device-session'
+        )
+        # Semaphores are created lazily inside the running event loop
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+
+    @property
+    def running(self) -> int:
+        """Number of device sessions currently executing"""
+        return self._running
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted sessions still waiting for a worker or host slot"""
+        with self._lock:
+            return max(0, self._pending - self._running)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'running': self._running,
+                'queued': max(0, self._pending - self._running),
+                'max_workers': self.max_workers,
+                'per_host_limit': self.per_host_limit,
+            }
+
+    def _host_semaphore(self, key: str) -> asyncio.Semaphore:
+        sem = self._host_semaphores.get(key)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[key] = sem
+        return sem
+
+    def _call(self, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    async def run(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run blocking func(*args, **kwargs) in the worker pool and await result
+
+        Args:
+            key: Host key for the per-host limit (e.g. "10.0.0.1:22")
+            func: Blocking callable (device session)
+        """
+        with self._lock:
+            queued = max(0, self._pending - self._running)
+            self._pending += 1
+
+        if queued:
+            logger.info(f"Device executor: {queued} sessions queued, {self._running} running")
+
+        try:
+            async with self._host_semaphore(key):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._pool, self._call, func, args, kwargs)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self, wait: bool = False):
+        logger.info("Device executor: shutting down")
+        self._pool.shutdown(wait=wait)
+
+
+class SingleFlight:
+    """Share one in-flight call between identical concurrent requests"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Avoid "exception was never retrieved" if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func() - or the identical call already in flight
+
+        Args:
+            key: Identity of the request, e.g. (device, "optical", interface)
+            func: Coroutine factory, only called if no identical call is running
+
+        All callers receive the same result (or exception). A caller that
+        is cancelled does not cancel the shared call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.coalesced += 1
+            logger.info(f"Single-flight: joined in-flight request {key}")
+        return await asyncio.shield(task)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Fleet Sweep
+Parallel interface + optical collection over every device
+
+Used by /sweep to answer questions like "which optics across the whole
+fleet are below -25 dBm" in one command. Devices are processed through a
+bounded concurrency pool and results are reported as they arrive.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from botlinkmaster import BotLinkMaster
+from vendor_commands import expand_interface_name
+
+logger = logging.getLogger(__name__)
+
+# Worst first - order used to sort the sweep report
+SIGNAL_SEVERITY = ['critical', 'very_weak', 'weak', 'fair', 'good', 'excellent', 'unknown']
+
+# Logical interfaces that never carry an optic
+NON_PHYSICAL_PREFIXES = (
+    'vlan', 'vlanif', 'loopback', 'lo', 'null', 'bridge', 'bond', 'port-channel', 'po',
+    'tunnel', 'eth-trunk', 'bdif', 'nve', 'ppp', 'l2tp', 'ovpn', 'pppoe', 'inloopback',
+)
+
+
+@dataclass
+class DeviceSweepResult:
+    device: str
+    vendor: str
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+def is_physical_interface(name: str) -> bool:
+    """True if the interface may have a transceiver"""
+    lower = name.lower()
+    if not any(c.isdigit() for c in lower):
+        return False
+    for prefix in NON_PHYSICAL_PREFIXES:
+        if lower.startswith(prefix) and (len(lower) == len(prefix) or not lower[len(prefix)].isalpha()):
+            return False
+    return True
+
+
+def sweep_device(bot: BotLinkMaster, all_interfaces: bool = False) -> List[Dict[str, Any]]:
+    """
+    Collect interface status + optical power from one connected device
+
+    Uses the bulk optical command (one round trip) and falls back to
+    per-interface get_optical_power() if the device does not support it.
+    Blocking - run through DeviceExecutor.
+
+    Args:
+        all_interfaces: Also return interfaces without optical readings
+                        (rx_power/tx_power None) - used by the poller
+    """
+    rows = []
+    interfaces = bot.get_interfaces()
+
+    # None = no bulk command on this device, {} = no interface has optics
+    bulk = bot.get_all_optical_power()
+    if bulk is not None:
+        bulk = {expand_interface_name(name).lower(): optical for name, optical in bulk.items()}
+
+    for iface in interfaces:
+        name = iface.get('name', '')
+        optical = None
+
+        if is_physical_interface(name):
+            if bulk is None:
+                optical = bot.get_optical_power(name)
+                if not optical.get('found'):
+                    optical = None
+            else:
+                optical = bulk.get(expand_interface_name(name).lower())
+
+        if not optical:
+            if all_interfaces and name:
+                optical = {}
+            else:
+                continue
+
+        rows.append({
+            'interface': name,
+            'status': iface.get('status', 'unknown'),
+            'description': iface.get('description', ''),
+            'rx_power': optical.get('rx_power'),
+            'tx_power': optical.get('tx_power'),
+            'signal_status': optical.get('signal_status', 'unknown'),
+        })
+
+    return rows
+
+
+def severity_rank(signal_status: str) -> int:
+    try:
+        return SIGNAL_SEVERITY.index(signal_status)
+    except ValueError:
+        return len(SIGNAL_SEVERITY)
+
+
+def sort_report_rows(results: List[DeviceSweepResult]) -> List[Dict[str, Any]]:
+    """Flatten sweep results into one list, worst signal first"""
+    rows = []
+    for result in results:
+        for row in result.rows:
+            rows.append(dict(row, device=result.device))
+
+    rows.sort(key=lambda r: (
+        severity_rank(r['signal_status']),
+        r['rx_power'] if r['rx_power'] is not None else 0.0,
+        r['device'],
+        r['interface'],
+    ))
+    return rows
+
+
+async def run_sweep(devices: List[Any],
+                    worker: Callable[[Any], Awaitable[DeviceSweepResult]],
+                    concurrency: int = 10,
+                    on_result: Optional[Callable[[DeviceSweepResult, int, int], Awaitable[None]]] = None
+                    ) -> List[DeviceSweepResult]:
+    """
+    Run worker(device) for every device with at most `concurrency` in flight
+
+    Args:
+        devices: Devices from DatabaseManager.get_all_devices()
+        worker: Coroutine returning DeviceSweepResult for one device
+        concurrency: Maximum devices processed at once
+        on_result: Awaited after each device as on_result(result, done, total)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total = len(devices)
+    results: List[DeviceSweepResult] = []
+
+    async def guarded(device):
+        async with semaphore:
+            start = time.time()
+            try:
+                result = await worker(device)
+            except Exception as e:
+                logger.error(f"Sweep: {device.name} failed: {e}")
+                result = DeviceSweepResult(device=device.name, vendor=device.vendor or 'generic',
+                                           error=str(e))
+            result.elapsed = time.time() - start
+            return result
+
+    tasks = [asyncio.ensure_future(guarded(d)) for d in devices]
+    try:
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            results.append(result)
+            if on_result:
+                await on_result(result, len(results), total)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return results
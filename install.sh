@@ -1,13 +1,13 @@
 #!/bin/bash
 #
-# BotLinkMaster v4.8.8 - Installation Script
+# BotLinkMaster v4.9.0 - Installation Script
 # 
 # Usage: chmod +x install.sh && ./install.sh
 #
 
 set -e
 
-VERSION="4.8.7"
+VERSION="4.9.0"
 
 echo "=============================================="
 echo "BotLinkMaster v${VERSION} - Installation Script"
@@ -123,7 +123,7 @@ else
         echo -e "${GREEN}✓ Created .env from .env.example${NC}"
     else
         cat > .env << 'EOF'
-# BotLinkMaster v4.8.8 Configuration
+# BotLinkMaster v4.9.0 Configuration
 
 # Telegram Bot Token from @BotFather (REQUIRED)
 TELEGRAM_BOT_TOKEN=
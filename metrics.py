@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Metrics
+Per-phase timing of device sessions, exported for Prometheus
+
+Spans are recorded around every phase of a device session:
+- tcp_connect, ssh_handshake (KEX + auth), telnet_login
+- wait_prompt, learn_prompt, disable_paging
+- parse (output parsers)
+and every command (first_byte = send -> first byte, read = first byte ->
+prompt, total). The Telegram side records the handler time and the reply.
+
+Histograms are labelled by vendor, device, connection_method and command
+(interface names replaced by "*" to keep the label set small). Counters
+count fallbacks, timeouts and hard timeouts.
+
+prometheus_client is optional: without it every metric is a no-op and
+start_metrics_server() only logs a warning. The endpoint is enabled with
+METRICS_PORT (0 = off) and listens on METRICS_ADDR (default 127.0.0.1).
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import functools
+import logging
+import re
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+try:
+    from prometheus_client import Counter, Histogram, start_http_server
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Device phases take milliseconds (LAN) up to minutes (hard timeouts)
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 20.0, 30.0, 60.0, 120.0)
+
+SESSION_LABELS = ('vendor', 'device', 'connection_method')
+
+
+class _NoopMetric:
+    """Stand-in for Histogram/Counter when prometheus_client is missing"""
+
+    def labels(self, *args, **kwargs) -> '_NoopMetric':
+        return self
+
+    def observe(self, amount: float):
+        pass
+
+    def inc(self, amount: float = 1):
+        pass
+
+
+if PROMETHEUS_AVAILABLE:
+    DEVICE_PHASE_SECONDS = Histogram(
+        'botlinkmaster_device_phase_seconds',
+        'Duration of device session phases',
+        SESSION_LABELS + ('phase',), buckets=SECONDS_BUCKETS,
+    )
+    DEVICE_COMMAND_SECONDS = Histogram(
+        'botlinkmaster_device_command_seconds',
+        'Duration of device commands (first_byte, read, total)',
+        SESSION_LABELS + ('command', 'stage'), buckets=SECONDS_BUCKETS,
+    )
+    TELEGRAM_SECONDS = Histogram(
+        'botlinkmaster_telegram_seconds',
+        'Duration of Telegram command handlers and replies',
+        ('command', 'stage'), buckets=SECONDS_BUCKETS,
+    )
+    FALLBACKS = Counter(
+        'botlinkmaster_fallbacks_total',
+        'Fallbacks to a slower or alternative method',
+        ('vendor', 'kind'),
+    )
+    TIMEOUTS = Counter(
+        'botlinkmaster_timeouts_total',
+        'Reads that ended on a timeout instead of the prompt',
+        SESSION_LABELS + ('kind',),
+    )
+    HARD_TIMEOUTS = Counter(
+        'botlinkmaster_hard_timeouts_total',
+        'Commands that hit hard_timeout',
+        SESSION_LABELS + ('command',),
+    )
+else:
+    DEVICE_PHASE_SECONDS = DEVICE_COMMAND_SECONDS = TELEGRAM_SECONDS = _NoopMetric()
+    FALLBACKS = TIMEOUTS = HARD_TIMEOUTS = _NoopMetric()
+
+
+# Words with digits or quotes are interface names / values:
+# "show interface Gi0/1 transceiver" -> "show interface * transceiver"
+_VARIABLE_WORD = re.compile(r'"[^"]*"|\S*\d\S*')
+
+
+def command_label(command: str) -> str:
+    """Command with interface names replaced by '*' (bounded label values)"""
+    return ' '.join(_VARIABLE_WORD.sub('*', command).split())[:80]
+
+
+@contextmanager
+def span(histogram, **labels) -> Iterator[None]:
+    """Observe the duration of the with-block (also when it raises)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+
+
+def telegram_handler(command: str) -> Callable:
+    """Decorator: total time of a Telegram command handler"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(TELEGRAM_SECONDS, command=command, stage='handler'):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_metrics_server(port: int, addr: str = '127.0.0.1') -> bool:
+    """Serve /metrics on addr:port (port <= 0 disables it)"""
+    if port <= 0:
+        return False
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("METRICS_PORT is set but prometheus_client is not installed "
+                       "(pip install prometheus_client)")
+        return False
+    try:
+        start_http_server(port, addr=addr)
+    except OSError as e:
+        logger.error(f"Metrics: cannot listen on {addr}:{port}: {e}")
+        return False
+    logger.info(f"Metrics: Prometheus endpoint on http://{addr}:{port}/metrics")
+    return True
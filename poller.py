@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Interface Poller
+Background collection of interface status + optical power
+
+Every POLL_INTERVAL seconds (+/- POLL_JITTER) all devices are polled with
+at most POLL_CONCURRENCY devices in flight. Results refresh interface_cache
+and are appended to interface_samples, so /redaman can show the trend of
+an optic without extra device sessions.
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional
+
+from database import DatabaseManager, Device
+from fleet_sweep import DeviceSweepResult, run_sweep
+
+logger = logging.getLogger(__name__)
+
+
+class InterfacePoller:
+    """asyncio scheduler polling every device on a fixed interval"""
+
+    def __init__(self, db: DatabaseManager,
+                 worker: Callable[[Device], Awaitable[DeviceSweepResult]],
+                 interval: float = 300, jitter: float = 30, concurrency: int = 5,
+                 retention_days: float = 7):
+        """
+        Args:
+            db: DatabaseManager for interface_cache / interface_samples
+            worker: Coroutine collecting one device (rows with all interfaces)
+            interval: Seconds between polls (<= 0 disables the poller)
+            jitter: Random +/- seconds added to every interval
+            concurrency: Devices polled at once
+            retention_days: Keep interface_samples for this many days
+        """
+        self.db = db
+        self.worker = worker
+        self.interval = interval
+        self.jitter = max(0.0, jitter)
+        self.concurrency = max(1, concurrency)
+        self.retention_days = retention_days
+        self.last_poll: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def _next_delay(self) -> float:
+        return max(1.0, self.interval + random.uniform(-self.jitter, self.jitter))
+
+    def start(self):
+        """Start the poll loop on the running event loop"""
+        if not self.enabled or self._task:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._loop())
+        logger.info(f"Poller: every {self.interval:g}s (+/-{self.jitter:g}s), "
+                    f"{self.concurrency} devices at once")
+
+    async def stop(self):
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self):
+        # Spread the first poll so a restart does not hit every device at once
+        await asyncio.sleep(random.uniform(0, self.jitter))
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Poller: poll failed: {e}")
+            await asyncio.sleep(self._next_delay())
+
+    async def _on_result(self, result: DeviceSweepResult, done: int, total: int):
+        if result.error:
+            logger.warning(f"Poller: {result.device} - {result.error}")
+            return
+        # sqlite writes off the event loop, Telegram handlers keep running
+        await asyncio.to_thread(self.db.record_interface_samples, result.device, result.rows)
+
+    async def poll_once(self):
+        """Poll all devices once"""
+        devices = await asyncio.to_thread(self.db.get_all_devices)
+        if not devices:
+            return
+
+        started = time.time()
+        results = await run_sweep(devices, self.worker, self.concurrency, self._on_result)
+        self.last_poll = time.time()
+
+        failed = sum(1 for r in results if r.error)
+        samples = sum(1 for r in results for row in r.rows if row.get('rx_power') is not None)
+        logger.info(f"Poller: {len(results)} devices, {failed} failed, "
+                    f"{samples} optical samples in {self.last_poll - started:.1f}s")
+
+        if self.retention_days > 0:
+            pruned = await asyncio.to_thread(self.db.prune_interface_samples, self.retention_days)
+            if pruned:
+                logger.info(f"Poller: pruned {pruned} old samples")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+BotLinkMaster v4.9.0 - Session Pool
+Keeps authenticated SSH/Telnet shells alive per device
+
+Opening a session costs TCP + SSH handshake, auth, PTY, prompt detection
+and paging setup (2-10 s). The pool keeps one logged-in BotLinkMaster per
+device name so repeated /cek and /redaman skip the login entirely.
+
+- Max idle / max lifetime eviction (background reaper thread)
+- Liveness probe (blank line, expects prompt) before reusing an idle shell
+- Transparent reconnect when the transport died
+- One in-flight command per channel (per-device lock)
+- Learned response times (adaptive timeouts), paging mode and structured
+  output support loaded on open and saved after every operation
+
+Author: BotLinkMaster
+Version: 4.9.0
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, Optional
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledSession:
+    name: str
+    config: ConnectionConfig
+    bot: Optional[BotLinkMaster] = None
+    created_at: float = 0.0
+    last_used: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    retired: bool = False
+
+
+class SessionPool:
+    """Pool of logged-in device sessions keyed by device name"""
+
+    def __init__(self, max_idle: float = 300, max_lifetime: float = 3600,
+                 probe_after: float = 10, probe_timeout: float = 5.0,
+                 reap_interval: float = 30, db=None):
+        """
+        Args:
+            max_idle: Close sessions unused for this many seconds (0 = no pooling)
+            max_lifetime: Close sessions older than this many seconds
+            probe_after: Run the liveness probe if idle longer than this
+            probe_timeout: Seconds to wait for the prompt during the probe
+            reap_interval: Seconds between eviction passes
+            db: Optional DatabaseManager to cache the SSH method and the
+                response times per device
+        """
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.probe_after = probe_after
+        self.probe_timeout = probe_timeout
+        self.reap_interval = reap_interval
+        self.db = db
+        self._sessions: Dict[str, PooledSession] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+    def _start_reaper(self):
+        if self._reaper or self.max_idle <= 0:
+            return
+        self._reaper = threading.Thread(
+            target=self._reap_loop, name='session-pool-reaper', daemon=True
+        )
+        self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._stop.wait(self.reap_interval):
+            self.evict_expired()
+
+    def _entry(self, name: str, config: ConnectionConfig) -> PooledSession:
+        with self._lock:
+            entry = self._sessions.get(name)
+            if entry is None:
+                entry = PooledSession(name=name, config=config)
+                self._sessions[name] = entry
+            self._start_reaper()
+            return entry
+
+    def _is_expired(self, entry: PooledSession, now: float) -> bool:
+        if now - entry.created_at >= self.max_lifetime:
+            return True
+        return now - entry.last_used >= self.max_idle
+
+    def _close(self, entry: PooledSession, reason: str):
+        if entry.bot:
+            logger.info(f"Session pool: closing {entry.name} ({reason})")
+            entry.bot.disconnect()
+            entry.bot = None
+
+    def _apply_session_hint(self, name: str, config: ConnectionConfig) -> ConnectionConfig:
+        """Try what worked last time first: SSH method, paging mode, interface listing, optical command"""
+        if not self.db:
+            return config
+        hint = self.db.get_session_hint(name)
+        if not hint:
+            return config
+        if hint.paging_mode:
+            config = replace(config, paging_mode=hint.paging_mode)
+        if hint.structured_rejected:
+            config = replace(config, structured_rejected=True)
+        if hint.optical_command:
+            config = replace(config, optical_command=hint.optical_command)
+        if config.protocol != Protocol.SSH or not hint.connection_method:
+            return config
+        algorithms = {k: v for k, v in (('cipher', hint.cipher), ('key_type', hint.key_type)) if v}
+        return replace(config, preferred_method=hint.connection_method,
+                       preferred_algorithms=algorithms)
+
+    def _update_session_hint(self, name: str, bot: BotLinkMaster):
+        if not self.db or bot.config.protocol != Protocol.SSH:
+            return
+        if bot.connected:
+            algorithms = bot.negotiated_algorithms
+            self.db.save_session_hint(
+                name, bot.connection_method,
+                cipher=algorithms.get('cipher'),
+                key_type=algorithms.get('key_type'),
+            )
+        elif bot.config.preferred_method:
+            self.db.record_session_hint_failure(name)
+
+    def _apply_latency_stats(self, name: str, config: ConnectionConfig) -> ConnectionConfig:
+        """Start with the response times learned in earlier sessions"""
+        if not self.db:
+            return config
+        stats = self.db.get_latency_stats(name)
+        return replace(config, latency_stats={s.command_class: s for s in stats})
+
+    def _save_learned(self, name: str, bot: Optional[BotLinkMaster]):
+        """Persist response times, paging mode, structured output support and optical command"""
+        if not self.db or not bot:
+            return
+        self.db.save_latency_stats(name, bot.take_latency_updates())
+        paging_mode = bot.take_paging_update()
+        if paging_mode:
+            self.db.save_paging_mode(name, paging_mode)
+        if bot.take_structured_update():
+            self.db.save_structured_rejected(name)
+        optical_command = bot.take_optical_update()
+        if optical_command is not None:
+            self.db.save_optical_command(name, optical_command or None)
+
+    def _open(self, entry: PooledSession) -> BotLinkMaster:
+        config = self._apply_latency_stats(entry.name, entry.config)
+        bot = BotLinkMaster(self._apply_session_hint(entry.name, config))
+        bot.connect()
+        self._update_session_hint(entry.name, bot)
+        now = time.time()
+        entry.bot = bot
+        entry.created_at = now
+        entry.last_used = now
+        if bot.connected:
+            logger.info(f"Session pool: opened {entry.name} ({bot.connection_method})")
+        return bot
+
+    def _ensure_session(self, entry: PooledSession, config: ConnectionConfig) -> BotLinkMaster:
+        """Return a usable session for entry - caller holds entry.lock"""
+        now = time.time()
+
+        if entry.bot and entry.config != config:
+            self._close(entry, "device config changed")
+        entry.config = config
+
+        if entry.bot and self._is_expired(entry, now):
+            self._close(entry, "expired")
+
+        if entry.bot and entry.bot.connected:
+            if now - entry.last_used < self.probe_after:
+                return entry.bot
+            if entry.bot.is_alive(self.probe_timeout):
+                return entry.bot
+            self._close(entry, "liveness probe failed")
+        elif entry.bot:
+            self._close(entry, "transport closed")
+
+        return self._open(entry)
+
+    @contextmanager
+    def session(self, name: str, config: ConnectionConfig) -> Iterator[BotLinkMaster]:
+        """
+        Borrow the device session for one operation
+
+        Usage:
+            with pool.session(device.name, config) as bot:
+                if bot.connected:
+                    bot.get_interfaces()
+        """
+        entry = self._entry(name, config)
+        with entry.lock:
+            bot = self._ensure_session(entry, config)
+            try:
+                yield bot
+            except Exception:
+                self._close(entry, "error during operation")
+                raise
+            finally:
+                entry.last_used = time.time()
+                # bot, not entry.bot: a failed operation has closed the
+                # session, but what it learned is still worth keeping
+                self._save_learned(name, bot)
+                if entry.retired:
+                    self._close(entry, "removed")
+                elif entry.bot and (self.max_idle <= 0 or not entry.bot.connected):
+                    self._close(entry, "not pooled")
+
+    def evict_expired(self):
+        """Close idle or too old sessions that are not in use"""
+        now = time.time()
+        with self._lock:
+            entries = list(self._sessions.values())
+        for entry in entries:
+            if not entry.bot or not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                if entry.bot and self._is_expired(entry, now):
+                    self._close(entry, "idle eviction")
+            finally:
+                entry.lock.release()
+
+    def close(self, name: str):
+        """Close and forget the session for a device (e.g. device deleted)"""
+        with self._lock:
+            entry = self._sessions.pop(name, None)
+        if not entry:
+            return
+        entry.retired = True
+        # If the session is busy it is closed when the operation finishes
+        if entry.lock.acquire(blocking=False):
+            try:
+                self._close(entry, "removed")
+            finally:
+                entry.lock.release()
+
+    def close_all(self):
+        self._stop.set()
+        with self._lock:
+            entries = list(self._sessions.values())
+            self._sessions.clear()
+        # Not waiting for in-flight operations - the process is stopping
+        for entry in entries:
+            self._close(entry, "shutdown")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = list(self._sessions.values())
+        return {
+            'sessions': sum(1 for e in entries if e.bot and e.bot.connected),
+            'in_use': sum(1 for e in entries if e.lock.locked()),
+        }
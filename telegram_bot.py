@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """
-BotLinkMaster v4.8.8 - Telegram Bot
+BotLinkMaster v4.9.0 - Telegram Bot
 Network device monitoring with multi-vendor optical power support
 
+CHANGELOG v4.9.0:
+- Device sessions run in a bounded executor, pooled per device
+- /sweep fleet optical report, /stats response times
+- /int, /cek, /redaman served from interface_cache with a TTL
+- Background poller and Prometheus metrics endpoint
+
 CHANGELOG v4.8.8:
 - FIX: Cisco NX-OS description from running-config (avoids truncation)
 - FIX: Huawei VRP/Quidway status patterns (non-CloudEngine)
@@ -14,18 +20,29 @@ CHANGELOG v4.8.7:
 - IMPROVED: Extended timeouts for large switches
 
 Author: BotLinkMaster
-Version: 4.8.8
+Version: 4.9.0
 """
 
 import os
+import time
 import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from botlinkmaster import BotLinkMaster, ConnectionConfig, Protocol
-from database import DatabaseManager
-from vendor_commands import get_supported_vendors, get_vendor_config
+import adaptive_timeouts
+from botlinkmaster import BotLinkMasterBase, ConnectionConfig, Protocol
+from database import DatabaseManager, Device, InterfaceCache
+from device_executor import DeviceExecutor, SingleFlight
+from fleet_sweep import DeviceSweepResult, run_sweep, sort_report_rows, sweep_device
+from poller import InterfacePoller
+import metrics
+from session_pool import SessionPool
+from vendor_commands import (
+    classify_signal, expand_interface_name, get_vendor_config
+)
 from timezone_config import (
     tz_manager, get_timezone_examples_text, get_timezone_by_continent,
     validate_timezone, get_current_time
@@ -54,6 +71,48 @@ if env_ids:
                 pass
 
 
+# v4.9.0: Logged-in sessions are reused across commands
+session_pool = SessionPool(
+    max_idle=float(os.getenv('SESSION_MAX_IDLE', '300')),
+    max_lifetime=float(os.getenv('SESSION_MAX_LIFETIME', '3600')),
+    db=db,
+)
+
+# v4.9.0: Device sessions run in a bounded worker pool, not on the event loop.
+# A pooled session runs one operation at a time (SessionPool per-device lock),
+# so a second slot per host would only park a worker thread on that lock.
+device_executor = DeviceExecutor(
+    max_workers=int(os.getenv('DEVICE_MAX_WORKERS', '20')),
+    per_host_limit=(1 if session_pool.max_idle > 0
+                    else int(os.getenv('DEVICE_PER_HOST_LIMIT', '2'))),
+)
+
+# v4.9.0: Identical concurrent queries share one device call
+single_flight = SingleFlight()
+
+# v4.9.0: Devices processed at once by /sweep (keep below DEVICE_MAX_WORKERS)
+SWEEP_CONCURRENCY = int(os.getenv('SWEEP_CONCURRENCY', '10'))
+
+# v4.9.0: Answer from interface_cache if the data is younger than this
+# (seconds, 0 = always read live). "!" or "fresh" forces a live read.
+CACHE_TTL_INT = float(os.getenv('CACHE_TTL_INT', '300'))
+CACHE_TTL_CEK = float(os.getenv('CACHE_TTL_CEK', '30'))
+CACHE_TTL_REDAMAN = float(os.getenv('CACHE_TTL_REDAMAN', '120'))
+
+FRESH_FLAGS = ('!', 'fresh')
+
+# v4.9.0: Cisco NX-OS running-config descriptions cache (seconds, 0 = off)
+BotLinkMasterBase.NXOS_DESCRIPTION_TTL = float(os.getenv('NXOS_DESCRIPTION_TTL', '600'))
+
+# v4.9.0: Prometheus /metrics endpoint (0 = off, needs prometheus_client)
+METRICS_PORT = int(os.getenv('METRICS_PORT', '0'))
+METRICS_ADDR = os.getenv('METRICS_ADDR', '127.0.0.1')
+
+# v4.9.0: Commands per command class before learned timeouts replace the
+# vendor defaults (0 = always use the vendor defaults)
+adaptive_timeouts.MIN_SAMPLES = int(os.getenv('ADAPTIVE_TIMEOUT_SAMPLES', '10'))
+
+
 def is_authorized(chat_id: int) -> bool:
     if not ALLOWED_CHAT_IDS and not db.get_allowed_users():
         return True
@@ -82,7 +141,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     chat_id = update.effective_chat.id
     await update.message.reply_text(
-        f"🤖 BotLinkMaster v4.8.8\n"
+        f"🤖 BotLinkMaster v4.9.0\n"
         f"━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
         f"Bot monitoring perangkat jaringan.\n"
         f"Support 18 vendor router & switch.\n\n"
@@ -102,7 +161,7 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     await update.message.reply_text(
-        "🔧 BANTUAN BOTLINKMASTER v4.8.8\n"
+        "🔧 BANTUAN BOTLINKMASTER v4.9.0\n"
         "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
         "📋 INFO:\n"
         "/start - Info bot + Chat ID\n"
@@ -119,8 +178,11 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "/int [device] - List interface\n"
         "/int [device] [page] - Halaman\n"
         "/cek [device] [interface] - Status\n"
-        "/redaman [device] [interface] - Optical\n\n"
-        "💡 /int = /interfaces (sama)\n\n"
+        "/redaman [device] [interface] - Optical\n"
+        "/sweep [dBm] - Optical semua device\n"
+        "/stats [device] - Waktu respon & timeout\n\n"
+        "💡 /int = /interfaces (sama)\n"
+        "💡 Tambah ! untuk baca live (tanpa cache)\n\n"
         "⚙️ CONFIG:\n"
         "/vendors - Daftar vendor\n"
         "/timezone - Info timezone\n"
@@ -363,12 +425,171 @@ async def delete_device(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     name = ' '.join(context.args)
+    session_pool.close(name)
     if db.delete_device(name):
         await update.message.reply_text(f"✅ '{name}' dihapus")
     else:
         await update.message.reply_text(f"❌ '{name}' tidak ditemukan")
 
 
+# =============================================================================
+# INTERFACE CACHE
+# =============================================================================
+
+def split_fresh_flag(args: List[str]) -> Tuple[List[str], bool]:
+    """Remove "!" / "fresh" from command args - returns (args, fresh)"""
+    rest = [a for a in args if a.lower() not in FRESH_FLAGS]
+    return rest, len(rest) != len(args)
+
+
+def cache_age(timestamp: Optional[str]) -> Optional[float]:
+    """Age in seconds of a SQLite CURRENT_TIMESTAMP value (UTC)"""
+    if not timestamp:
+        return None
+    try:
+        cached = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return max(0.0, (datetime.now(timezone.utc) - cached).total_seconds())
+
+
+def format_age(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f} detik"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} menit"
+    return f"{seconds / 3600:.1f} jam"
+
+
+def find_cached_interface(device_name: str, interface_name: str) -> Optional[InterfaceCache]:
+    """Cached row of an interface - matches Gi0/1 with GigabitEthernet0/1"""
+    wanted = expand_interface_name(interface_name).lower()
+    for row in db.get_device_interfaces(device_name):
+        if expand_interface_name(row.interface_name).lower() == wanted:
+            return row
+    return None
+
+
+def get_cached_interfaces(device_name: str, ttl: float) -> Tuple[Optional[List[Dict[str, Any]]], float]:
+    """Cached interface listing if every row is younger than ttl"""
+    if ttl <= 0:
+        return None, 0.0
+    rows = [r for r in db.get_device_interfaces(device_name) if r.listed]
+    ages = [cache_age(r.cached_at) for r in rows]
+    if not rows or any(a is None or a > ttl for a in ages):
+        return None, 0.0
+    interfaces = [{
+        'name': r.interface_name,
+        'status': r.status or 'unknown',
+        'description': r.description or '',
+        'flags': '',
+    } for r in rows]
+    return interfaces, max(ages)
+
+
+def flight_interface_key(interface_name: str) -> str:
+    """Gi0/1 and GigabitEthernet0/1 share one in-flight request"""
+    return expand_interface_name(interface_name).lower()
+
+
+def cached_interface_name(device_name: str, interface_name: str) -> str:
+    row = find_cached_interface(device_name, interface_name)
+    return row.interface_name if row else interface_name
+
+
+# =============================================================================
+# DEVICE SESSIONS (blocking - run via device_executor)
+# =============================================================================
+
+def build_connection_config(device: Device) -> ConnectionConfig:
+    return ConnectionConfig(
+        host=device.host,
+        username=device.username,
+        password=device.password,
+        protocol=Protocol.SSH if device.protocol == 'ssh' else Protocol.TELNET,
+        port=device.port,
+        vendor=device.vendor or 'generic',
+        name=device.name,
+    )
+
+
+def device_key(device: Device) -> str:
+    """Key for the per-host limit - host:port (devices may share one IP)"""
+    port = device.port or (22 if device.protocol == 'ssh' else 23)
+    return f"{device.host}:{port}"
+
+
+def fetch_interfaces(device: Device) -> Optional[List[Dict[str, Any]]]:
+    """Returns None if connection failed"""
+    with session_pool.session(device.name, build_connection_config(device)) as bot:
+        if not bot.connected:
+            return None
+        interfaces = bot.get_interfaces()
+    if interfaces:
+        db.cache_interface_list(device.name, interfaces)
+    return interfaces
+
+
+def fetch_interface_status(device: Device, interface_name: str) -> Optional[Dict[str, Any]]:
+    """Returns None if connection failed"""
+    with session_pool.session(device.name, build_connection_config(device)) as bot:
+        if not bot.connected:
+            return None
+        info = bot.get_interface_status(interface_name)
+    if info.get('status', 'unknown') != 'unknown':
+        db.cache_interface(device.name, cached_interface_name(device.name, interface_name),
+                           status=info['status'], description=info.get('description') or None)
+    return info
+
+
+def fetch_optical(device: Device, interface_name: str) -> Optional[Dict[str, Any]]:
+    """Returns None if connection failed"""
+    with session_pool.session(device.name, build_connection_config(device)) as bot:
+        if not bot.connected:
+            return None
+        optical = bot.check_interface_with_optical(interface_name)
+    status = optical.get('status', 'unknown')
+    if status != 'unknown' or optical.get('found'):
+        db.cache_interface(device.name, cached_interface_name(device.name, interface_name),
+                           status=status if status != 'unknown' else None,
+                           description=optical.get('description') or None,
+                           rx_power=optical.get('rx_power'), tx_power=optical.get('tx_power'))
+    return optical
+
+
+def fetch_sweep(device: Device, all_interfaces: bool = False) -> DeviceSweepResult:
+    result = DeviceSweepResult(device=device.name, vendor=device.vendor or 'generic')
+    with session_pool.session(device.name, build_connection_config(device)) as bot:
+        if not bot.connected:
+            result.error = "Gagal koneksi"
+            return result
+        result.rows = sweep_device(bot, all_interfaces=all_interfaces)
+    return result
+
+
+async def poll_device(device: Device) -> DeviceSweepResult:
+    return await device_executor.run(device_key(device), fetch_sweep, device, True)
+
+
+# v4.9.0: Background poller (POLL_INTERVAL=0 disables it)
+interface_poller = InterfacePoller(
+    db,
+    poll_device,
+    interval=float(os.getenv('POLL_INTERVAL', '0')),
+    jitter=float(os.getenv('POLL_JITTER', '30')),
+    concurrency=int(os.getenv('POLL_CONCURRENCY', '5')),
+    retention_days=float(os.getenv('POLL_RETENTION_DAYS', '7')),
+)
+
+
+def get_optical_trend(device_name: str, interface_name: str, limit: int = 6) -> list:
+    """Poller samples of an interface (name as listed by the device)"""
+    return db.get_interface_samples(
+        device_name, cached_interface_name(device_name, interface_name), limit
+    )
+
+
+@metrics.telegram_handler('int')
 async def list_interfaces(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     List all interfaces with pagination
@@ -382,20 +603,26 @@ async def list_interfaces(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "📡 LIST INTERFACE\n\n"
             "Gunakan:\n"
             "/interfaces [device]\n"
-            "/interfaces [device] [page]\n\n"
+            "/interfaces [device] [page]\n"
+            "/interfaces [device] ! (baca live)\n\n"
             "Contoh:\n"
             "/interfaces SW-SECAPA\n"
             "/interfaces router-1 2"
         )
         return
     
-    device_name = context.args[0]
+    args, fresh = split_fresh_flag(context.args)
+    if not args:
+        await update.message.reply_text("Gunakan: /interfaces [device] [page]")
+        return
+    
+    device_name = args[0]
     page = 1
     
     # Parse page number
-    if len(context.args) >= 2:
+    if len(args) >= 2:
         try:
-            page = max(1, int(context.args[1]))
+            page = max(1, int(args[1]))
         except ValueError:
             pass
     
@@ -404,83 +631,89 @@ async def list_interfaces(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"❌ '{device_name}' tidak ditemukan")
         return
     
-    msg = await update.message.reply_text(f"⏳ Mengambil interface dari {device_name}...")
+    # v4.9.0: Cached listing first, device session only if stale
+    msg = None
+    interfaces, age = (None, 0.0) if fresh else get_cached_interfaces(device_name, CACHE_TTL_INT)
     
     try:
-        config = ConnectionConfig(
-            host=device.host,
-            username=device.username,
-            password=device.password,
-            protocol=Protocol.SSH if device.protocol == 'ssh' else Protocol.TELNET,
-            port=device.port,
-            vendor=device.vendor or 'generic'
-        )
-        
-        with BotLinkMaster(config) as bot:
-            if not bot.connected:
-                await msg.edit_text(f"❌ Gagal koneksi ke {device_name}")
-                return
-            
-            interfaces = bot.get_interfaces()
-            
-            if not interfaces:
-                await msg.edit_text(
-                    f"❌ Tidak dapat mengambil interface.\n"
-                    f"Coba /cek untuk interface spesifik."
+        if interfaces is None:
+            msg = await update.message.reply_text(f"⏳ Mengambil interface dari {device_name}...")
+            with metrics.span(metrics.TELEGRAM_SECONDS, command='int', stage='device'):
+                interfaces = await single_flight.run(
+                    (device_name, 'interfaces', ''),
+                    lambda: device_executor.run(device_key(device), fetch_interfaces, device)
                 )
-                return
-            
-            # Pagination settings
-            per_page = 20
-            total = len(interfaces)
-            
-            # If total <= 25, show all in one page
-            if total <= 25:
-                per_page = total
-                page = 1
-            
-            total_pages = max(1, (total + per_page - 1) // per_page)
-            page = min(page, total_pages)
-            
-            start = (page - 1) * per_page
-            end = min(start + per_page, total)
-            
-            up_count = sum(1 for i in interfaces if i['status'] == 'up')
-            down_count = sum(1 for i in interfaces if i['status'] == 'down')
-            
-            text = f"📡 INTERFACE {device_name}\n"
-            text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            text += f"📊 Total: {total} | 🟢 Up: {up_count} | 🔴 Down: {down_count}\n"
-            
-            if total > 25:
-                text += f"📄 Halaman {page}/{total_pages}\n"
-            
-            text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            
-            for iface in interfaces[start:end]:
-                status = iface['status']
-                flags = iface.get('flags', '')
-                icon = "🟢" if status == 'up' else "🔴" if status == 'down' else "⚪"
-                
-                if flags:
-                    text += f"{icon} {iface['name']} [{flags}]\n"
-                else:
-                    text += f"{icon} {iface['name']}\n"
-                
-                if iface.get('description'):
-                    desc = iface['description'][:30]
-                    text += f"   {desc}\n"
+        
+        reply = msg.edit_text if msg else update.message.reply_text
+        
+        if interfaces is None:
+            await reply(f"❌ Gagal koneksi ke {device_name}")
+            return
+        
+        if not interfaces:
+            await reply(
+                f"❌ Tidak dapat mengambil interface.\n"
+                f"Coba /cek untuk interface spesifik."
+            )
+            return
+        
+        # Pagination settings
+        per_page = 20
+        total = len(interfaces)
+        
+        # If total <= 25, show all in one page
+        if total <= 25:
+            per_page = total
+            page = 1
+        
+        total_pages = max(1, (total + per_page - 1) // per_page)
+        page = min(page, total_pages)
+        
+        start = (page - 1) * per_page
+        end = min(start + per_page, total)
+        
+        up_count = sum(1 for i in interfaces if i['status'] == 'up')
+        down_count = sum(1 for i in interfaces if i['status'] == 'down')
+        
+        text = f"📡 INTERFACE {device_name}\n"
+        text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        text += f"📊 Total: {total} | 🟢 Up: {up_count} | 🔴 Down: {down_count}\n"
+        
+        if total > 25:
+            text += f"📄 Halaman {page}/{total_pages}\n"
+        
+        text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+        
+        for iface in interfaces[start:end]:
+            status = iface['status']
+            flags = iface.get('flags', '')
+            icon = "🟢" if status == 'up' else "🔴" if status == 'down' else "⚪"
             
-            if total > 25 and total_pages > 1:
-                text += f"\n📄 /interfaces {device_name} [1-{total_pages}]"
+            if flags:
+                text += f"{icon} {iface['name']} [{flags}]\n"
+            else:
+                text += f"{icon} {iface['name']}\n"
             
-            await msg.edit_text(text)
+            if iface.get('description'):
+                desc = iface['description'][:30]
+                text += f"   {desc}\n"
+        
+        if total > 25 and total_pages > 1:
+            text += f"\n📄 /interfaces {device_name} [1-{total_pages}]"
+        
+        if not msg:
+            text += f"\n🕒 Data cache {format_age(age)} lalu - /int {device_name} ! untuk live"
+        
+        with metrics.span(metrics.TELEGRAM_SECONDS, command='int', stage='reply'):
+            await reply(text)
             
     except Exception as e:
         logger.error(f"Error: {e}")
-        await msg.edit_text(f"❌ Error: {str(e)}")
+        if msg:
+            await msg.edit_text(f"❌ Error: {str(e)}")
 
 
+@metrics.telegram_handler('cek')
 async def check_interface(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not await check_auth(update):
         return
@@ -488,60 +721,82 @@ async def check_interface(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if len(context.args) < 2:
         await update.message.reply_text(
             "📡 CEK STATUS\n\n"
-            "Gunakan: /cek [device] [interface]\n\n"
+            "Gunakan: /cek [device] [interface]\n"
+            "Tambah ! untuk baca live (tanpa cache)\n\n"
             "Contoh:\n"
             "/cek router-1 Gi0/0\n"
             "/cek SW-MIKROTIK sfp-sfpplus1"
         )
         return
     
-    device_name = context.args[0]
-    interface_name = ' '.join(context.args[1:])
+    args, fresh = split_fresh_flag(context.args)
+    if len(args) < 2:
+        await update.message.reply_text("Gunakan: /cek [device] [interface]")
+        return
+    
+    device_name = args[0]
+    interface_name = ' '.join(args[1:])
     
     device = db.get_device(device_name)
     if not device:
         await update.message.reply_text(f"❌ '{device_name}' tidak ditemukan")
         return
     
-    msg = await update.message.reply_text(f"⏳ Mengecek {interface_name}...")
+    # v4.9.0: Cached status first, device session only if stale
+    msg = None
+    info = None
+    age = None
+    if not fresh and CACHE_TTL_CEK > 0:
+        cached = find_cached_interface(device_name, interface_name)
+        age = cache_age(cached.cached_at) if cached and cached.status else None
+        if age is not None and age <= CACHE_TTL_CEK:
+            info = {'status': cached.status, 'description': cached.description or '', 'flags': ''}
     
     try:
-        config = ConnectionConfig(
-            host=device.host,
-            username=device.username,
-            password=device.password,
-            protocol=Protocol.SSH if device.protocol == 'ssh' else Protocol.TELNET,
-            port=device.port,
-            vendor=device.vendor or 'generic'
-        )
+        if info is None:
+            msg = await update.message.reply_text(f"⏳ Mengecek {interface_name}...")
+            with metrics.span(metrics.TELEGRAM_SECONDS, command='cek', stage='device'):
+                info = await single_flight.run(
+                    (device_name, 'status', flight_interface_key(interface_name)),
+                    lambda: device_executor.run(
+                        device_key(device), fetch_interface_status, device, interface_name
+                    )
+                )
         
-        with BotLinkMaster(config) as bot:
-            if not bot.connected:
-                await msg.edit_text(f"❌ Gagal koneksi ke {device_name}")
-                return
-            
-            info = bot.get_interface_status(interface_name)
-            status = info.get('status', 'unknown')
-            flags = info.get('flags', '')
-            icon = "🟢 UP" if status == 'up' else "🔴 DOWN" if status == 'down' else "⚪ UNKNOWN"
-            
-            text = f"📡 STATUS INTERFACE\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            text += f"📦 Device: {device_name}\n"
-            text += f"🔌 Interface: {interface_name}\n"
-            text += f"📶 Status: {icon}\n"
-            if flags:
-                text += f"🏷️ Flags: {flags}\n"
-            if info.get('description'):
-                text += f"📝 {info['description']}\n"
-            text += f"\n💡 /redaman {device_name} {interface_name}"
-            
-            await msg.edit_text(text)
+        reply = msg.edit_text if msg else update.message.reply_text
+        
+        if info is None:
+            await reply(f"❌ Gagal koneksi ke {device_name}")
+            return
+        
+        status = info.get('status', 'unknown')
+        flags = info.get('flags', '')
+        icon = "🟢 UP" if status == 'up' else "🔴 DOWN" if status == 'down' else "⚪ UNKNOWN"
+        
+        text = f"📡 STATUS INTERFACE\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+        text += f"📦 Device: {device_name}\n"
+        text += f"🔌 Interface: {interface_name}\n"
+        text += f"📶 Status: {icon}\n"
+        if flags:
+            text += f"🏷️ Flags: {flags}\n"
+        if info.get('description'):
+            text += f"📝 {info['description']}\n"
+        if not msg:
+            text += f"🕒 Data cache {format_age(age)} lalu\n"
+        text += f"\n💡 /redaman {device_name} {interface_name}"
+        if not msg:
+            text += f"\n💡 /cek {device_name} {interface_name} ! (live)"
+        
+        with metrics.span(metrics.TELEGRAM_SECONDS, command='cek', stage='reply'):
+            await reply(text)
             
     except Exception as e:
         logger.error(f"Error: {e}")
-        await msg.edit_text(f"❌ Error: {str(e)}")
+        if msg:
+            await msg.edit_text(f"❌ Error: {str(e)}")
 
 
+@metrics.telegram_handler('redaman')
 async def check_optical(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not await check_auth(update):
         return
@@ -549,15 +804,21 @@ async def check_optical(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if len(context.args) < 2:
         await update.message.reply_text(
             "🔍 CEK OPTICAL / REDAMAN\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "Gunakan: /redaman [device] [interface]\n\n"
+            "Gunakan: /redaman [device] [interface]\n"
+            "Tambah ! untuk baca live (tanpa cache)\n\n"
             "Contoh:\n"
             "/redaman router-1 Gi0/0\n"
             "/redaman SW-MIKROTIK sfp-sfpplus1"
         )
         return
     
-    device_name = context.args[0]
-    interface_name = ' '.join(context.args[1:])
+    args, fresh = split_fresh_flag(context.args)
+    if len(args) < 2:
+        await update.message.reply_text("Gunakan: /redaman [device] [interface]")
+        return
+    
+    device_name = args[0]
+    interface_name = ' '.join(args[1:])
     
     device = db.get_device(device_name)
     if not device:
@@ -567,95 +828,323 @@ async def check_optical(update: Update, context: ContextTypes.DEFAULT_TYPE):
     vendor = device.vendor or 'generic'
     vendor_cfg = get_vendor_config(vendor)
     
-    msg = await update.message.reply_text(
-        f"⏳ Mengecek optical...\n\n"
-        f"📦 {device_name} ({vendor_cfg.name})\n"
-        f"🔌 {interface_name}"
-    )
+    # v4.9.0: Cached optical reading first (poller / earlier /redaman)
+    msg = None
+    optical = None
+    age = None
+    if not fresh and CACHE_TTL_REDAMAN > 0:
+        cached = find_cached_interface(device_name, interface_name)
+        age = cache_age(cached.optical_at) if cached and cached.rx_power is not None else None
+        if age is not None and age <= CACHE_TTL_REDAMAN:
+            optical = {
+                'status': cached.status or 'unknown',
+                'description': cached.description or '',
+                'flags': '',
+                'rx_power': cached.rx_power,
+                'tx_power': cached.tx_power,
+                'rx_power_dbm': f"{cached.rx_power:.2f} dBm",
+                'tx_power_dbm': f"{cached.tx_power:.2f} dBm" if cached.tx_power is not None else 'N/A',
+                'optical_status': classify_signal(cached.rx_power),
+                'found': True,
+            }
     
     try:
-        config = ConnectionConfig(
-            host=device.host,
-            username=device.username,
-            password=device.password,
-            protocol=Protocol.SSH if device.protocol == 'ssh' else Protocol.TELNET,
-            port=device.port,
-            vendor=vendor
-        )
-        
-        with BotLinkMaster(config) as bot:
-            if not bot.connected:
-                await msg.edit_text(
-                    f"❌ GAGAL KONEKSI\n\n"
-                    f"📦 {device_name}\n"
-                    f"🌐 {device.host}:{device.port}"
+        if optical is None:
+            msg = await update.message.reply_text(
+                f"⏳ Mengecek optical...\n\n"
+                f"📦 {device_name} ({vendor_cfg.name})\n"
+                f"🔌 {interface_name}"
+            )
+            with metrics.span(metrics.TELEGRAM_SECONDS, command='redaman', stage='device'):
+                optical = await single_flight.run(
+                    (device_name, 'optical', flight_interface_key(interface_name)),
+                    lambda: device_executor.run(
+                        device_key(device), fetch_optical, device, interface_name
+                    )
                 )
-                return
-            
-            optical = bot.check_interface_with_optical(interface_name)
-            
-            status = optical.get('status', 'unknown')
-            flags = optical.get('flags', '')
-            description = optical.get('description', '')
-            link_icon = "🟢 UP" if status == 'up' else "🔴 DOWN" if status == 'down' else "⚪ UNKNOWN"
-            
-            signal = optical.get('optical_status', 'unknown')
-            signal_map = {
-                'excellent': '🟢 EXCELLENT',
-                'good': '🟢 GOOD',
-                'fair': '🟡 FAIR',
-                'weak': '🟠 WEAK',
-                'very_weak': '🔴 VERY WEAK',
-                'critical': '🔴 CRITICAL',
-            }
-            signal_icon = signal_map.get(signal, '⚪ UNKNOWN')
-            
-            text = f"🔍 OPTICAL POWER\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            text += f"📦 {device_name} ({vendor_cfg.name})\n"
-            text += f"🔌 {interface_name}\n"
-            if description:
-                text += f"📝 {description}\n"
-            text += f"📶 Link: {link_icon}\n"
-            if flags:
-                text += f"🏷️ Flags: {flags}\n"
-            text += "\n"
-            
-            text += f"📊 OPTICAL:\n"
-            text += f"   TX Power: {optical.get('tx_power_dbm', 'N/A')}\n"
-            text += f"   RX Power: {optical.get('rx_power_dbm', 'N/A')}\n"
-            text += f"   Signal: {signal_icon}\n\n"
-            
-            text += f"📋 REFERENSI:\n"
-            text += f"   Excellent: > -8 dBm\n"
-            text += f"   Good: -8 to -14 dBm\n"
-            text += f"   Fair: -14 to -20 dBm\n"
-            text += f"   Weak: -20 to -25 dBm\n"
-            text += f"   Critical: < -25 dBm\n"
-            
-            if not optical.get('found'):
-                text += f"\n⚠️ Data optical tidak ditemukan.\n"
-                text += f"Pastikan interface memiliki SFP.\n"
-            
-            await msg.edit_text(text)
+        
+        reply = msg.edit_text if msg else update.message.reply_text
+        
+        if optical is None:
+            await reply(
+                f"❌ GAGAL KONEKSI\n\n"
+                f"📦 {device_name}\n"
+                f"🌐 {device.host}:{device.port}"
+            )
+            return
+        
+        status = optical.get('status', 'unknown')
+        flags = optical.get('flags', '')
+        description = optical.get('description', '')
+        link_icon = "🟢 UP" if status == 'up' else "🔴 DOWN" if status == 'down' else "⚪ UNKNOWN"
+        
+        signal = optical.get('optical_status', 'unknown')
+        signal_map = {
+            'excellent': '🟢 EXCELLENT',
+            'good': '🟢 GOOD',
+            'fair': '🟡 FAIR',
+            'weak': '🟠 WEAK',
+            'very_weak': '🔴 VERY WEAK',
+            'critical': '🔴 CRITICAL',
+        }
+        signal_icon = signal_map.get(signal, '⚪ UNKNOWN')
+        
+        text = f"🔍 OPTICAL POWER\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+        text += f"📦 {device_name} ({vendor_cfg.name})\n"
+        text += f"🔌 {interface_name}\n"
+        if description:
+            text += f"📝 {description}\n"
+        text += f"📶 Link: {link_icon}\n"
+        if flags:
+            text += f"🏷️ Flags: {flags}\n"
+        text += "\n"
+        
+        text += f"📊 OPTICAL:\n"
+        text += f"   TX Power: {optical.get('tx_power_dbm', 'N/A')}\n"
+        text += f"   RX Power: {optical.get('rx_power_dbm', 'N/A')}\n"
+        text += f"   Signal: {signal_icon}\n"
+        if not msg:
+            text += f"   🕒 Data cache {format_age(age)} lalu (! untuk live)\n"
+        text += "\n"
+        
+        text += f"📋 REFERENSI:\n"
+        text += f"   Excellent: > -8 dBm\n"
+        text += f"   Good: -8 to -14 dBm\n"
+        text += f"   Fair: -14 to -20 dBm\n"
+        text += f"   Weak: -20 to -25 dBm\n"
+        text += f"   Critical: < -25 dBm\n"
+        
+        if not optical.get('found'):
+            text += f"\n⚠️ Data optical tidak ditemukan.\n"
+            text += f"Pastikan interface memiliki SFP.\n"
+        
+        # v4.9.0: RX history from the background poller
+        trend = [s for s in get_optical_trend(device_name, interface_name) if s.rx_power is not None]
+        if trend:
+            text += f"\n📈 TREN RX (poller):\n"
+            for sample in trend:
+                text += f"   {sample.sampled_at[5:16]}  {sample.rx_power:.2f} dBm\n"
+            if len(trend) >= 2:
+                delta = trend[-1].rx_power - trend[0].rx_power
+                text += f"   Δ {delta:+.2f} dB\n"
+        
+        with metrics.span(metrics.TELEGRAM_SECONDS, command='redaman', stage='reply'):
+            await reply(text)
             
     except Exception as e:
         logger.error(f"Error: {e}")
-        await msg.edit_text(f"❌ Error: {str(e)}")
+        if msg:
+            await msg.edit_text(f"❌ Error: {str(e)}")
 
 
-async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    logger.error(f"Error: {context.error}")
+SWEEP_SIGNAL_LABELS = {
+    'excellent': '🟢', 'good': '🟢', 'fair': '🟡',
+    'weak': '🟠', 'very_weak': '🔴', 'critical': '🔴',
+}
 
+_sweep_running = False
 
-def main():
-    token = os.getenv('TELEGRAM_BOT_TOKEN')
-    if not token:
-        print("ERROR: TELEGRAM_BOT_TOKEN tidak ditemukan di .env")
+
+@metrics.telegram_handler('sweep')
+async def sweep_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    v4.9.0: Optical sweep over all devices
+    /sweep         - Report interfaces with signal fair or worse
+    /sweep -25     - Report interfaces with RX <= -25 dBm
+    """
+    global _sweep_running
+    
+    if not await check_auth(update):
+        return
+    
+    threshold = None
+    if context.args:
+        try:
+            threshold = float(context.args[0])
+        except ValueError:
+            await update.message.reply_text(
+                "Gunakan: /sweep [threshold dBm]\n\n"
+                "Contoh:\n"
+                "/sweep - signal fair atau lebih buruk\n"
+                "/sweep -25 - RX <= -25 dBm"
+            )
+            return
+    
+    if _sweep_running:
+        await update.message.reply_text("⏳ Sweep lain sedang berjalan, coba lagi nanti.")
         return
     
-    logger.info("Starting BotLinkMaster v4.8.8...")
+    devices = db.get_all_devices()
+    if not devices:
+        await update.message.reply_text("📭 Belum ada perangkat. Gunakan /add")
+        return
     
-    app = Application.builder().token(token).build()
+    _sweep_running = True
+    started = time.time()
+    msg = await update.message.reply_text(f"⏳ Sweep {len(devices)} perangkat...")
+    state = {'last_edit': 0.0, 'failed': 0}
+    
+    async def worker(device: Device) -> DeviceSweepResult:
+        return await device_executor.run(device_key(device), fetch_sweep, device)
+    
+    async def on_result(result: DeviceSweepResult, done: int, total: int):
+        if result.error:
+            state['failed'] += 1
+        now = time.time()
+        # Telegram rate limit - edit progress at most every 3 seconds
+        if done < total and now - state['last_edit'] < 3:
+            return
+        state['last_edit'] = now
+        try:
+            await msg.edit_text(
+                f"⏳ Sweep: {done}/{total} perangkat\n"
+                f"❌ Gagal: {state['failed']}\n"
+                f"⏱️ {now - started:.0f}s"
+            )
+        except Exception as e:
+            logger.debug(f"Sweep progress edit failed: {e}")
+    
+    try:
+        results = await run_sweep(devices, worker, SWEEP_CONCURRENCY, on_result)
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        await msg.edit_text(f"❌ Error: {str(e)}")
+        return
+    finally:
+        _sweep_running = False
+    
+    rows = sort_report_rows(results)
+    if threshold is not None:
+        report = [r for r in rows if r['rx_power'] is not None and r['rx_power'] <= threshold]
+        title = f"RX <= {threshold:g} dBm"
+    else:
+        report = [r for r in rows if r['signal_status'] in ('critical', 'very_weak', 'weak', 'fair')]
+        title = "Signal fair atau lebih buruk"
+    
+    failed = [r.device for r in results if r.error]
+    
+    text = f"🔍 SWEEP OPTICAL\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    text += f"📦 Perangkat: {len(results)} | ❌ Gagal: {len(failed)}\n"
+    text += f"🔌 Optical terbaca: {len(rows)}\n"
+    text += f"⏱️ Durasi: {time.time() - started:.0f}s\n"
+    text += f"📋 {title}: {len(report)}\n"
+    text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    
+    lines = []
+    for r in report:
+        icon = SWEEP_SIGNAL_LABELS.get(r['signal_status'], '⚪')
+        rx = f"{r['rx_power']:.2f}" if r['rx_power'] is not None else 'N/A'
+        lines.append(f"{icon} {r['device']} {r['interface']} RX {rx} dBm")
+    if failed:
+        lines.append("")
+        lines.append("❌ Gagal: " + ", ".join(failed))
+    
+    # Telegram message limit is 4096 characters
+    chunks = []
+    current = text
+    for line in lines:
+        if len(current) + len(line) + 1 > 4000:
+            chunks.append(current)
+            current = ""
+        current += line + "\n"
+    chunks.append(current)
+    
+    await msg.edit_text(chunks[0])
+    for chunk in chunks[1:]:
+        await update.message.reply_text(chunk)
+
+
+# =============================================================================
+# RESPONSE TIMES
+# =============================================================================
+
+@metrics.telegram_handler('stats')
+async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """v4.9.0: Learned response times and timeouts of one device"""
+    if not await check_auth(update):
+        return
+    
+    if not context.args:
+        await update.message.reply_text("Gunakan: /stats [device]")
+        return
+    
+    device = db.get_device(' '.join(context.args))
+    if not device:
+        await update.message.reply_text("❌ Perangkat tidak ditemukan")
+        return
+    
+    stats = db.get_latency_stats(device.name)
+    if not stats:
+        await update.message.reply_text(
+            f"📊 {device.name}\n\nBelum ada data waktu respon.\n"
+            f"Jalankan /int atau /cek terlebih dahulu."
+        )
+        return
+    
+    defaults = BotLinkMasterBase.vendor_timeouts(device.vendor or 'generic')
+    idle_default = defaults['idle_timeout']
+    hard_default = defaults['hard_timeout']
+    
+    text = f"📊 WAKTU RESPON {device.name}\n━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    text += f"⚙️ Default vendor: idle {idle_default:g}s | hard {hard_default:g}s\n"
+    text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    
+    lines = []
+    for s in stats:
+        lines.append(f"💻 {s.command_class}")
+        lines.append(f"   Sampel: {s.samples}")
+        for stage, label in (('first_byte', 'Byte pertama'), ('gap', 'Jeda'), ('total', 'Total')):
+            lines.append(f"   {label}: {s.ewma.get(stage, 0.0):.2f}s (p99 {s.p99(stage):.2f}s)")
+        if s.learned:
+            lines.append(f"   ⏱️ Timeout: idle {s.timeout('gap', idle_default):.1f}s | "
+                         f"hard {s.timeout('total', hard_default):.1f}s")
+        elif adaptive_timeouts.MIN_SAMPLES > 0:
+            lines.append(f"   ⏱️ Timeout: default vendor "
+                         f"({s.samples}/{adaptive_timeouts.MIN_SAMPLES} sampel)")
+        else:
+            lines.append("   ⏱️ Timeout: default vendor (adaptif nonaktif)")
+        lines.append("")
+    
+    # Telegram message limit is 4096 characters
+    chunks = []
+    current = text
+    for line in lines:
+        if len(current) + len(line) + 1 > 4000:
+            chunks.append(current)
+            current = ""
+        current += line + "\n"
+    chunks.append(current)
+    
+    for chunk in chunks:
+        await update.message.reply_text(chunk)
+
+
+async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    logger.error(f"Error: {context.error}")
+
+
+async def post_init(application: Application):
+    interface_poller.start()
+    metrics.start_metrics_server(METRICS_PORT, METRICS_ADDR)
+
+
+async def post_shutdown(application: Application):
+    await interface_poller.stop()
+    device_executor.shutdown(wait=False)
+    session_pool.close_all()
+
+
+def build_application(token: str) -> Application:
+    # v4.9.0: Process updates concurrently (one per device worker), otherwise
+    # PTB handles one update at a time and a slow device blocks everyone
+    app = (
+        Application.builder()
+        .token(token)
+        .concurrent_updates(device_executor.max_workers)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
     app.add_handler(CommandHandler("start", start))
     app.add_handler(CommandHandler("help", help_command))
@@ -674,17 +1163,31 @@ def main():
     app.add_handler(CommandHandler("cek", check_interface))
     app.add_handler(CommandHandler("redaman", check_optical))
     app.add_handler(CommandHandler("optical", check_optical))
+    app.add_handler(CommandHandler("sweep", sweep_command))
+    app.add_handler(CommandHandler("stats", stats_command))
     
     app.add_error_handler(error_handler)
+    return app
+
+
+def main():
+    token = os.getenv('TELEGRAM_BOT_TOKEN')
+    if not token:
+        print("ERROR: TELEGRAM_BOT_TOKEN tidak ditemukan di .env")
+        return
+    
+    logger.info("Starting BotLinkMaster v4.9.0...")
+    
+    app = build_application(token)
     
     print("\n" + "=" * 50)
-    print("BotLinkMaster v4.8.8 Started!")
+    print("BotLinkMaster v4.9.0 Started!")
     print("=" * 50)
     print(f"\nTimezone: {tz_manager.get_timezone()}")
     print(f"Time: {tz_manager.get_current_time()}")
-    print("\nv4.8.8 Fixes (Minimal):")
-    print("  - Cisco NX-OS: Description from running-config")
-    print("  - Huawei VRP/Quidway: Non-CloudEngine status patterns")
+    print("\nv4.9.0:")
+    print("  - Device executor + session pool (no event loop blocking)")
+    print("  - /sweep, /stats, interface cache, background poller")
     print("\nNote: OLT support will be available in v5.0.0")
     print("\n[Press Ctrl+C to stop]\n")
     
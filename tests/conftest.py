@@ -0,0 +1,25 @@
+"""
+Shared test setup: modules live in the repository root, and importing
+telegram_bot opens botlinkmaster.db / botlinkmaster.log in the working
+directory, so the bot module is imported from a temporary directory.
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture(scope='session')
+def bot_module(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp('bot')
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        yield importlib.import_module('telegram_bot')
+    finally:
+        os.chdir(cwd)
@@ -0,0 +1,114 @@
+"""Adaptive timeouts: what is learned, and the vendor defaults it starts from"""
+
+import pytest
+
+from adaptive_timeouts import (
+    FLOORS, LIVENESS_PROBE, MAX_FACTOR, MIN_SAMPLES, PROMPT_PROBE, WINDOW_SIZE, LatencyStats,
+    percentile
+)
+from botlinkmaster import BotLinkMaster, BotLinkMasterBase, ConnectionConfig
+from database import DatabaseManager
+
+
+def make_bot(vendor='cisco_ios'):
+    return BotLinkMaster(ConnectionConfig(host='10.0.0.1', username='admin',
+                                          password='secret', vendor=vendor))
+
+
+def test_probes_are_not_learned():
+    bot = make_bot()
+    for probe in (PROMPT_PROBE, LIVENESS_PROBE):
+        bot._record_latency(bot._latency_stats_for(probe), 'prompt', 0.1, 0.01, 0.2)
+    bot._record_latency(bot._latency_stats_for('show clock'), 'prompt', 0.1, 0.01, 0.2)
+
+    assert [s.command_class for s in bot.take_latency_updates()] == ['show clock']
+    assert set(bot.latency_stats) == {'show clock'}
+
+
+def test_vendor_timeouts_match_the_session_defaults():
+    for vendor in ('cisco_ios', 'cisco_nxos', 'huawei_vrp', 'mikrotik', 'zte', 'generic'):
+        assert BotLinkMasterBase.vendor_timeouts(vendor) is make_bot(vendor).timeouts
+    assert (BotLinkMasterBase.vendor_timeouts('Cisco_NXOS')
+            is BotLinkMasterBase.VENDOR_TIMEOUTS['cisco_nxos'])
+
+
+def test_stored_probe_stats_are_dropped(tmp_path):
+    path = str(tmp_path / 'stats.db')
+    db = DatabaseManager(path)
+    db.save_latency_stats('sw-acc', [LatencyStats(PROMPT_PROBE, 1, {'total': 0.1}, [(0.1, 0.0, 0.1)]),
+                                     LatencyStats('show clock', 1, {'total': 0.2}, [(0.1, 0.0, 0.2)])])
+    db.close()
+
+    assert [s.command_class for s in DatabaseManager(path).get_latency_stats('sw-acc')] == ['show clock']
+
+
+def learned_stats(first_byte, gap, total, count=MIN_SAMPLES):
+    stats = LatencyStats('show interface * transceiver')
+    for _ in range(count):
+        stats.observe(first_byte, gap, total)
+    return stats
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 0.99) == 0.0
+    assert percentile([4.0], 0.99) == 4.0
+    assert percentile([float(i) for i in range(100, 0, -1)], 0.99) == 99.0
+    assert percentile([float(i) for i in range(1, 11)], 0.99) == 10.0
+    assert percentile([float(i) for i in range(1, 11)], 0.5) == 5.0
+
+
+def test_ewma_weights_the_newest_command():
+    stats = LatencyStats('show clock')
+    stats.observe(1.0, 0.1, 2.0)
+    assert stats.ewma == {'first_byte': 1.0, 'gap': 0.1, 'total': 2.0}
+    stats.observe(2.0, 0.1, 3.0)
+    assert stats.ewma['first_byte'] == pytest.approx(1.2)
+    assert stats.ewma['total'] == pytest.approx(2.2)
+
+
+def test_window_keeps_the_last_commands():
+    stats = learned_stats(0.1, 0.01, 0.2, count=WINDOW_SIZE + 5)
+    assert len(stats.window) == WINDOW_SIZE and stats.samples == WINDOW_SIZE + 5
+
+
+def test_vendor_default_until_learned():
+    stats = learned_stats(0.5, 0.1, 1.0, count=MIN_SAMPLES - 1)
+    assert not stats.learned
+    assert stats.timeout('total', 60.0) == 60.0
+    stats.observe(0.5, 0.1, 1.0)
+    assert stats.learned
+
+
+def test_learned_timeout_headroom_floor_and_cap():
+    # max(ewma, p99) * 3 + 1
+    assert learned_stats(2.0, 1.0, 8.0).timeout('first_byte', 30.0) == pytest.approx(7.0)
+    assert learned_stats(2.0, 1.0, 8.0).timeout('total', 60.0) == pytest.approx(25.0)
+    # Fast device: never below the floor
+    assert learned_stats(0.05, 0.01, 0.1).timeout('gap', 15.0) == FLOORS['gap']
+    # Slow device: more than the default, at most MAX_FACTOR x
+    assert learned_stats(20.0, 5.0, 50.0).timeout('total', 60.0) == 60.0 * MAX_FACTOR
+
+
+def test_p99_outlier_raises_the_timeout_above_the_ewma():
+    stats = learned_stats(1.0, 0.2, 4.0, count=50)
+    stats.observe(1.0, 0.2, 12.0)
+    assert stats.ewma['total'] < 6.0
+    assert stats.p99('total') == 12.0
+    assert stats.timeout('total', 60.0) == pytest.approx(37.0)
+
+
+def test_timeout_under_learned_values_returns_to_the_defaults():
+    bot = make_bot()
+    stats = bot._latency_stats_for('show interface Gi0/1 transceiver')
+    for _ in range(MIN_SAMPLES):
+        bot._record_latency(stats, 'prompt', 0.2, 0.05, 0.4)
+    first_byte, idle, hard = bot._command_timeouts(stats, 10.0, None)
+    assert (first_byte, idle) == (FLOORS['first_byte'], FLOORS['gap'])
+    assert hard == FLOORS['total']
+
+    bot._record_latency(stats, 'timeout', None, 0.0, hard)
+    assert not stats.learned
+    assert bot._command_timeouts(stats, 10.0, None) == (
+        max(10.0, bot.timeouts['idle_timeout']), bot.timeouts['idle_timeout'],
+        bot.timeouts['hard_timeout'])
+    assert [s.samples for s in bot.take_latency_updates()] == [0]
@@ -0,0 +1,50 @@
+"""AsyncBotLinkMaster shares parsing with BotLinkMaster, not its blocking I/O"""
+
+import asyncio
+import inspect
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'benchmarks'))
+
+import device_sim  # noqa: E402
+from async_botlinkmaster import AsyncBotLinkMaster  # noqa: E402
+from botlinkmaster import BotLinkMaster, BotLinkMasterBase, ConnectionConfig, Protocol  # noqa: E402
+
+
+def test_no_blocking_method_is_inherited():
+    assert not issubclass(AsyncBotLinkMaster, BotLinkMaster)
+    assert issubclass(AsyncBotLinkMaster, BotLinkMasterBase)
+    for name, attr in vars(BotLinkMaster).items():
+        if not inspect.isfunction(attr) or name in ('__enter__', '__exit__'):
+            continue
+        assert not hasattr(BotLinkMasterBase, name), name
+        if hasattr(AsyncBotLinkMaster, name):
+            method = getattr(AsyncBotLinkMaster, name)
+            assert inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method), name
+
+
+@pytest.fixture
+def simulator():
+    sim = device_sim.DeviceSimulator(device_sim.make_profile('cisco_ios'))
+    sim.start(ssh_port=None, telnet_port=0)
+    yield sim
+    sim.stop()
+
+
+def test_telnet_session(simulator):
+    config = ConnectionConfig(host='127.0.0.1', port=simulator.telnet_port,
+                              username='admin', password='admin',
+                              protocol=Protocol.TELNET, vendor='cisco_ios')
+
+    async def session():
+        async with AsyncBotLinkMaster(config) as bot:
+            assert bot.prompt == 'SW-ACC-01#'
+            interfaces = await bot.get_interfaces()
+            assert await bot.is_alive()
+        return interfaces
+
+    assert asyncio.run(session())
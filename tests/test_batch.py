@@ -0,0 +1,74 @@
+"""execute_batch: demultiplexing, and recovery when the batch read stops early"""
+
+import time
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig
+
+
+class ScriptedShell(BotLinkMaster):
+    """
+    BotLinkMaster on a scripted device: script items are bytes to
+    receive or a float pause; single commands are answered from replies
+    """
+
+    def __init__(self, script, replies):
+        super().__init__(ConnectionConfig(host='10.0.0.1', username='admin',
+                                          password='secret', vendor='cisco_ios'))
+        self.timeouts = {'idle_timeout': 0.2, 'hard_timeout': 5.0,
+                         'command_wait': 0.3, 'initial_wait': 0.3}
+        self.connected = True
+        self._prompt = 'SW#'
+        self.paging_mode = 'command'
+        self.script = list(script)
+        self.replies = replies
+        self.sent = []
+
+    def _flush_input(self):
+        pass
+
+    def _send_line(self, line):
+        self.sent.append(line)
+        if line in self.replies:
+            self.script.append(self.replies[line])
+
+    def _recv(self, timeout):
+        if not self.script:
+            time.sleep(timeout)
+            return b""
+        item = self.script[0]
+        if isinstance(item, float):
+            wait = min(item, timeout)
+            time.sleep(wait)
+            if item - wait > 0.001:
+                self.script[0] = item - wait
+            else:
+                self.script.pop(0)
+            return b""
+        return self.script.pop(0)
+
+
+def test_batch_is_split_per_command():
+    bot = ScriptedShell([b"show a\r\nA-OUT\r\nSW#show b\r\nB-OUT\r\nSW#"], {})
+    assert bot.execute_batch(['show a', 'show b', 'show a']) == [
+        'show a\nA-OUT\nSW#', 'show b\nB-OUT\nSW#', 'show a\nA-OUT\nSW#']
+    assert bot.sent == ['show a\nshow b']
+    assert not bot._batch_rejected
+
+
+def test_only_unrecovered_commands_rerun_after_the_rest_is_read():
+    bot = ScriptedShell(
+        [b"show a\r\nA-OUT\r\nSW#show b\r\nB-1\r\n", 0.3,
+         b"B-2\r\nSW#show c\r\nC-OUT\r\nSW#"],
+        {'show b': b"show b\r\nB-FRESH\r\nSW#", 'show c': b"show c\r\nC-FRESH\r\nSW#"},
+    )
+    outputs = bot.execute_batch(['show a', 'show b', 'show c'])
+
+    assert bot.sent == ['show a\nshow b\nshow c', 'show b', 'show c']
+    assert outputs == ['show a\nA-OUT\nSW#', 'show b\r\nB-FRESH\r\nSW#', 'show c\r\nC-FRESH\r\nSW#']
+    assert bot._batch_rejected
+
+
+def test_split_keeps_outputs_completed_before_the_cut():
+    split = BotLinkMaster._split_batch_output(
+        "show a\nA-OUT\nSW#show b\nB-1", ['show a', 'show b', 'show c'], 'SW#')
+    assert split == ['show a\nA-OUT\nSW#', None, None]
@@ -0,0 +1,57 @@
+"""The sans-IO command read shared by BotLinkMaster and AsyncBotLinkMaster"""
+
+from botlinkmaster import BotLinkMasterBase, ConnectionConfig
+
+
+def make_base(vendor='cisco_ios'):
+    base = BotLinkMasterBase(ConnectionConfig(host='10.0.0.1', username='admin',
+                                              password='secret', vendor=vendor))
+    base._prompt = 'SW-ACC-01#'
+    return base
+
+
+def test_prompt_before_the_echo_does_not_end_the_read():
+    base = make_base()
+    read = base._start_read('show clock', 10.0, now=0.0)
+
+    assert base._feed_read(read, b'SW-ACC-01#', 0.1) == ('', False, False)
+    assert base._feed_read(read, b'show clock\r\n', 0.2) == ('SW-ACC-01#show clock\r\n', False, False)
+    assert read.first_byte_time is None
+    assert base._feed_read(read, b'*09:15:01.123 UTC Mon Mar 3 2025\r\nSW-ACC-01#', 0.5).done
+    assert read.first_byte_time == 0.5
+    assert base._finish_read(read, 0.6) == 'SW-ACC-01#'
+    assert read.outcome == 'prompt'
+
+
+def test_pager_prompt_is_removed_and_answered():
+    base = make_base()
+    read = base._start_read('show interfaces status', 10.0, now=0.0)
+    base._feed_read(read, b'show interfaces status\r\n', 0.1)
+
+    event = base._feed_read(read, b'Gi1/0/1  connected\r\n --More-- ', 0.2)
+    assert event == ('Gi1/0/1  connected\r\n', True, False)
+    event = base._feed_read(read, b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08          '
+                                  b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08Gi1/0/2  notconnect\r\n'
+                                  b'SW-ACC-01#', 0.3)
+    assert event == ('Gi1/0/2  notconnect\r\n', False, True)
+    assert read.pages == 1
+
+
+def test_until_echo_waits_for_the_last_batch_command():
+    base = make_base()
+    read = base._start_read('show clock | show version', 10.0, now=0.0, until_echo='show version')
+
+    assert not base._feed_read(read, b'show clock\r\n09:15\r\nSW-ACC-01#', 0.1).done
+    assert not base._feed_read(read, b'show ver', 0.2).done
+    assert base._feed_read(read, b'sion\r\nIOS 15.2\r\nSW-ACC-01#', 0.3).done
+
+
+def test_read_wait_switches_from_first_byte_to_idle_timeout():
+    base = make_base()
+    read = base._start_read('show clock', 30.0, now=100.0)
+    idle = read.idle_timeout
+
+    assert base._read_wait(read, 100.0) == read.first_byte_timeout
+    base._feed_read(read, b'show clock\r\n09:15', 101.0)
+    assert base._read_wait(read, 101.0) == idle
+    assert base._read_wait(read, 101.0 + idle) == 0.0
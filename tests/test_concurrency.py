@@ -0,0 +1,56 @@
+"""Telegram updates for different devices are processed concurrently"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+
+class FakeMessage:
+    def __init__(self, replies):
+        self.replies = replies
+
+    async def reply_text(self, text):
+        self.replies.append(text)
+        return self
+
+    async def edit_text(self, text):
+        self.replies.append(text)
+        return self
+
+
+def make_update(replies):
+    return SimpleNamespace(effective_chat=SimpleNamespace(id=1), message=FakeMessage(replies))
+
+
+def test_handlers_for_different_hosts_overlap(bot_module, monkeypatch):
+    bot_module.db.add_device('sw-a', '10.0.0.1', 'admin', 'secret', 'ssh', 22)
+    bot_module.db.add_device('sw-b', '10.0.0.2', 'admin', 'secret', 'ssh', 22)
+
+    # Each device session waits until the other one is running too. If the
+    # updates were processed one after another the barrier would time out.
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fetch_interface_status(device, interface_name):
+        both_running.wait()
+        return {'status': 'up', 'description': device.name, 'flags': ''}
+
+    monkeypatch.setattr(bot_module, 'fetch_interface_status', fetch_interface_status)
+
+    app = bot_module.build_application('123456:TEST-TOKEN')
+    assert app.update_processor.max_concurrent_updates == bot_module.device_executor.max_workers
+
+    async def process(device_name):
+        replies = []
+        update = make_update(replies)
+        context = SimpleNamespace(args=[device_name, 'Gi0/1', '!'])
+        await app.update_processor.process_update(
+            update, bot_module.check_interface(update, context)
+        )
+        return replies
+
+    async def main():
+        return await asyncio.gather(process('sw-a'), process('sw-b'))
+
+    for device_name, replies in zip(('sw-a', 'sw-b'), asyncio.run(main())):
+        assert 'Status: 🟢 UP' in replies[-1], replies
+        assert device_name in replies[-1]
@@ -0,0 +1,38 @@
+"""DatabaseManager shares one sqlite connection between threads"""
+
+import threading
+
+from database import DatabaseManager
+
+
+def test_concurrent_device_and_cache_writes(tmp_path):
+    db = DatabaseManager(str(tmp_path / 'threads.db'))
+    errors = []
+
+    def devices(worker):
+        for i in range(50):
+            name = f'sw-{worker}-{i}'
+            if not db.add_device(name, '10.0.0.1', 'admin', 'secret', vendor='cisco_ios'):
+                errors.append(('add', name))
+            db.get_all_devices()
+            if not db.delete_device(name):
+                errors.append(('delete', name))
+
+    def cache(worker):
+        for i in range(50):
+            rows = [{'interface': f'Gi0/{n}', 'status': 'up', 'rx_power': -3.0 - n}
+                    for n in range(8)]
+            if not db.record_interface_samples(f'sw-{worker}', rows):
+                errors.append(('samples', worker))
+            db.get_device_interfaces(f'sw-{worker}')
+
+    threads = [threading.Thread(target=target, args=(n,))
+               for n in range(4) for target in (devices, cache)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert db.get_all_devices() == []
+    assert len(db.get_device_interfaces('sw-0')) == 8
@@ -0,0 +1,98 @@
+"""DeviceExecutor: global and per-host limits, queue depth"""
+
+import asyncio
+import threading
+
+from device_executor import DeviceExecutor
+
+
+def test_pooled_sessions_get_one_slot_per_host(bot_module):
+    assert bot_module.session_pool.max_idle > 0
+    assert bot_module.device_executor.per_host_limit == 1
+
+
+def test_second_call_to_a_host_waits_without_a_worker():
+    executor = DeviceExecutor(max_workers=4, per_host_limit=1)
+    release = threading.Event()
+    started = []
+
+    def session(name):
+        started.append(name)
+        release.wait(5)
+        return name
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.run('10.0.0.1:22', session, 'first'))
+        second = asyncio.ensure_future(executor.run('10.0.0.1:22', session, 'second'))
+        while not started:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        seen = (list(started), executor.running, executor.queue_depth)
+        release.set()
+        return seen, await asyncio.gather(first, second)
+
+    try:
+        seen, results = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    assert seen == (['first'], 1, 1)
+    assert results == ['first', 'second']
+
+
+def run_blocked(executor, keys):
+    """Start one blocking session per key; returns (started, running, queued) and the results"""
+    release = threading.Event()
+    started = []
+    lock = threading.Lock()
+
+    def session(key):
+        with lock:
+            started.append(key)
+        release.wait(5)
+        return key
+
+    async def scenario():
+        tasks = [asyncio.ensure_future(executor.run(key, session, key)) for key in keys]
+        while not started:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        seen = (len(started), executor.running, executor.queue_depth)
+        release.set()
+        return seen, await asyncio.gather(*tasks)
+
+    try:
+        return asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+
+def test_global_cap_queues_sessions_to_other_hosts():
+    seen, results = run_blocked(DeviceExecutor(max_workers=2, per_host_limit=2),
+                                [f'10.0.0.{i}:22' for i in range(1, 6)])
+    assert seen == (2, 2, 3)
+    assert results == [f'10.0.0.{i}:22' for i in range(1, 6)]
+
+
+def test_per_host_limit_allows_parallel_sessions_to_one_host():
+    seen, _ = run_blocked(DeviceExecutor(max_workers=8, per_host_limit=2), ['10.0.0.1:22'] * 3)
+    assert seen == (2, 2, 1)
+
+
+def test_failed_session_frees_its_slot():
+    executor = DeviceExecutor(max_workers=1, per_host_limit=1)
+
+    def fail():
+        raise ConnectionError('refused')
+
+    async def scenario():
+        try:
+            await executor.run('10.0.0.1:22', fail)
+        except ConnectionError:
+            pass
+        return await executor.run('10.0.0.1:22', lambda: 'ok')
+
+    try:
+        assert asyncio.run(scenario()) == 'ok'
+        assert executor.stats() == {'running': 0, 'queued': 0, 'max_workers': 1, 'per_host_limit': 1}
+    finally:
+        executor.shutdown()
@@ -0,0 +1,62 @@
+"""First-byte latency is measured from the output, not the command echo"""
+
+import time
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig
+
+OUTPUT_DELAY = 0.5
+
+
+class ScriptedBot(BotLinkMaster):
+    """BotLinkMaster whose session replays (delay, data) chunks"""
+
+    def __init__(self, chunks):
+        super().__init__(ConnectionConfig(host='10.0.0.1', username='admin',
+                                          password='secret', vendor='cisco_ios'))
+        self.connected = True
+        self._prompt = 'SW-ACC-01#'
+        self.chunks = list(chunks)
+        self.started = None
+        self.recorded = None
+
+    def _recv(self, timeout):
+        if self.started is None:
+            self.started = time.time()
+        if not self.chunks:
+            time.sleep(timeout)
+            return b""
+        delay, data = self.chunks[0]
+        wait = self.started + delay - time.time()
+        if wait > timeout:
+            time.sleep(timeout)
+            return b""
+        time.sleep(max(0.0, wait))
+        self.chunks.pop(0)
+        return data
+
+    def _record_latency(self, stats, outcome, first_byte, gap, total):
+        self.recorded = (outcome, first_byte, gap, total)
+
+
+def test_first_byte_starts_after_the_echo_line():
+    bot = ScriptedBot([
+        (0.0, b"show version\r\n"),
+        (OUTPUT_DELAY, b"Cisco IOS Software, Version 15.2\r\n"),
+        (OUTPUT_DELAY + 0.05, b"uptime is 3 weeks\r\nSW-ACC-01#"),
+    ])
+    output = bot._read_until_prompt('show version', wait_time=5.0)
+
+    outcome, first_byte, gap, total = bot.recorded
+    assert 'uptime is 3 weeks' in output
+    assert outcome == 'prompt'
+    assert first_byte >= OUTPUT_DELAY * 0.9
+    assert gap < OUTPUT_DELAY / 2
+
+
+def test_output_in_the_echo_chunk_counts_as_first_byte():
+    bot = ScriptedBot([(0.0, b"show clock\r\n10:00:00 UTC\r\nSW-ACC-01#")])
+    bot._read_until_prompt('show clock', wait_time=5.0)
+
+    outcome, first_byte, gap, total = bot.recorded
+    assert outcome == 'prompt'
+    assert first_byte < OUTPUT_DELAY / 2
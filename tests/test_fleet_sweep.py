@@ -0,0 +1,32 @@
+"""sweep_device falls back to per-interface optics only without a bulk command"""
+
+from fleet_sweep import sweep_device
+
+
+class FakeBot:
+    def __init__(self, bulk):
+        self.bulk = bulk
+        self.per_interface = []
+
+    def get_interfaces(self):
+        return [{'name': 'Gi0/1', 'status': 'up'}, {'name': 'Gi0/2', 'status': 'down'}]
+
+    def get_all_optical_power(self):
+        return self.bulk
+
+    def get_optical_power(self, name):
+        self.per_interface.append(name)
+        return {'found': True, 'rx_power': -5.0, 'tx_power': -2.0, 'signal_status': 'good'}
+
+
+def test_bulk_without_optics_does_not_fall_back():
+    bot = FakeBot(bulk={})
+    assert sweep_device(bot) == []
+    assert bot.per_interface == []
+
+
+def test_unsupported_bulk_falls_back_per_interface():
+    bot = FakeBot(bulk=None)
+    rows = sweep_device(bot)
+    assert bot.per_interface == ['Gi0/1', 'Gi0/2']
+    assert [row['rx_power'] for row in rows] == [-5.0, -5.0]
@@ -0,0 +1,15 @@
+"""The device clients import without telnetlib (removed in Python 3.13)"""
+
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_clients_import_without_telnetlib():
+    code = ("import sys; sys.modules['telnetlib'] = None; "
+            "import botlinkmaster, async_botlinkmaster")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,33 @@
+"""interface_cache timestamps only move with the data they describe"""
+
+from database import DatabaseManager
+
+
+def test_optical_write_without_status_keeps_status_age(tmp_path):
+    db = DatabaseManager(str(tmp_path / 'cache.db'))
+    db.cache_interface('sw-a', 'Gi0/1', status='up')
+    db.conn.execute("UPDATE interface_cache SET cached_at = '2020-01-01 00:00:00'")
+    db.conn.commit()
+
+    db.cache_interface('sw-a', 'Gi0/1', status=None, rx_power=-5.2, tx_power=-2.1)
+
+    row = db.get_device_interfaces('sw-a')[0]
+    assert row.status == 'up'
+    assert row.rx_power == -5.2
+    assert row.optical_at is not None
+    assert row.cached_at == '2020-01-01 00:00:00'
+
+    db.cache_interface('sw-a', 'Gi0/1', status='down')
+    row = db.get_device_interfaces('sw-a')[0]
+    assert row.status == 'down'
+    assert row.cached_at != '2020-01-01 00:00:00'
+
+
+def test_optical_only_row_has_no_status_age(tmp_path):
+    db = DatabaseManager(str(tmp_path / 'cache.db'))
+    db.cache_interface('sw-a', 'Gi0/2', rx_power=-7.0)
+
+    row = db.get_device_interfaces('sw-a')[0]
+    assert row.status is None
+    assert row.cached_at is None
+    assert row.optical_at is not None
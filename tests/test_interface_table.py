@@ -0,0 +1,91 @@
+"""Interface tables are split by the header column offsets"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import fixtures  # noqa: E402
+from vendor_commands import (  # noqa: E402
+    build_interface_table, parse_interface_row, parse_interface_table
+)
+
+IOS_HEADER = "Port      Name               Status       Vlan       Duplex  Speed Type"
+HUAWEI_HEADER = "Interface                     PHY     Protocol Description"
+
+
+def test_columns_from_header_words():
+    assert build_interface_table(IOS_HEADER) == [
+        (0, 'interface'), (10, 'description'), (29, 'status'), (42, 'vlan'),
+        (53, 'duplex'), (61, 'speed'), (67, 'type'),
+    ]
+    assert build_interface_table("Vlan  Name  Status") is None
+    assert build_interface_table("Port  Vlan  Duplex") is None
+
+
+def test_columns_from_segmented_separator():
+    header = "Port          Admin Link Port    Cfg  Oper"
+    separator = "------------  ----- ---- ------- ---- ----"
+    columns = build_interface_table(header, separator)
+    assert columns[:3] == [(0, 'interface'), (14, None), (20, 'status')]
+
+
+def test_chassis_fixture_keeps_multi_word_descriptions():
+    table = fixtures.cisco_ios_chassis_status()
+    rows = [line for line in table.splitlines() if line.startswith('Gi')]
+    interfaces = parse_interface_table(table)
+    assert len(interfaces) == len(rows) == 384
+    assert [i['description'] for i in interfaces] == [row[10:29].strip() for row in rows]
+    assert {i['status'] for i in interfaces} == {'up', 'down'}
+
+
+def test_huawei_fixture_with_blank_description_and_flags():
+    interfaces = parse_interface_table(fixtures.HUAWEI_TABLE)
+    assert interfaces[1] == {'name': 'GE0/0/2', 'status': 'down', 'description': ''}
+    assert interfaces[4] == {'name': 'XGE0/0/2', 'status': 'up', 'description': 'to-BRAS-01'}
+    assert len(interfaces) == 8
+
+
+def test_blank_status_falls_back_to_protocol():
+    columns = build_interface_table(HUAWEI_HEADER)
+    row = parse_interface_row("GE0/0/7                               up       uplink", columns)
+    assert row == {'name': 'GE0/0/7', 'status': 'up', 'description': 'uplink'}
+    row = parse_interface_row("GE0/0/8                                        spare", columns)
+    assert row == {'name': 'GE0/0/8', 'status': 'unknown', 'description': 'spare'}
+
+
+def test_overflowing_name_and_right_aligned_speed():
+    columns = build_interface_table(HUAWEI_HEADER)
+    row = parse_interface_row(
+        "TwentyFiveGigabitEthernet0/0/2 down    down     to ODC-07", columns)
+    assert row == {'name': 'TwentyFiveGigabitEthernet0/0/2', 'status': 'down',
+                   'description': 'to ODC-07'}
+
+    columns = build_interface_table(IOS_HEADER)
+    row = parse_interface_row(
+        "Te1/1/1   uplink             connected    trunk        full    10G SFP-10GBase-SR", columns)
+    assert (row['vlan'], row['duplex'], row['speed']) == ('trunk', 'full', '10G')
+
+
+def test_wrapped_description_is_not_a_row():
+    output = "\n".join([
+        HUAWEI_HEADER,
+        "GE0/0/1                       up      up       to ODC-07 Kantor Cabang Utama",
+        "                                                 Gedung Selatan lantai 2",
+        "GE0/0/2                       down    down     reserved",
+    ])
+    assert [i['name'] for i in parse_interface_table(output)] == ['GE0/0/1', 'GE0/0/2']
+
+
+def test_non_ascii_descriptions():
+    columns = build_interface_table(IOS_HEADER)
+    row = parse_interface_row(
+        "Gi1/0/6   Pelanggan Café –Ñ  notconnect   1            auto   auto 10/100/1000BaseTX", columns)
+    assert (row['description'], row['status'], row['vlan']) == ('Pelanggan Café –Ñ', 'down', '1')
+
+    # CJK characters are two columns wide on the device terminal
+    row = parse_interface_row(
+        "Gi1/0/5   上联到核心-A        connected    trunk      a-full a-1000 10/100/1000BaseTX", columns)
+    assert row == {'name': 'Gi1/0/5', 'status': 'up', 'description': '上联到核心-A',
+                   'vlan': 'trunk', 'duplex': 'a-full', 'speed': 'a-1000',
+                   'type': '10/100/1000BaseTX'}
@@ -0,0 +1,88 @@
+"""Metrics: labels, spans, and the no-op fallback without prometheus_client"""
+
+import asyncio
+import importlib.util
+import sys
+
+import pytest
+
+import metrics
+from botlinkmaster import BotLinkMasterBase, ConnectionConfig
+
+
+@pytest.fixture
+def no_prometheus(monkeypatch):
+    """Separate copy of the metrics module, loaded as if prometheus_client were missing"""
+    monkeypatch.setitem(sys.modules, 'prometheus_client', None)
+    spec = importlib.util.spec_from_file_location('metrics_without_prometheus', metrics.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_command_label_hides_interface_names():
+    assert metrics.command_label('show interface Gi0/1 transceiver') == 'show interface * transceiver'
+    assert metrics.command_label('/interface print terse where name="ether 1"') == \
+        '/interface print terse where name=*'
+    assert len(metrics.command_label('show ' + 'x' * 200)) == 80
+
+
+def test_without_prometheus_every_metric_is_a_noop(no_prometheus, caplog):
+    assert not no_prometheus.PROMETHEUS_AVAILABLE
+    no_prometheus.DEVICE_PHASE_SECONDS.labels(vendor='x', phase='parse').observe(1.0)
+    no_prometheus.FALLBACKS.labels(vendor='x', kind='pager').inc()
+    with no_prometheus.span(no_prometheus.TELEGRAM_SECONDS, command='cek', stage='handler'):
+        pass
+    assert not no_prometheus.start_metrics_server(9400)
+    assert 'prometheus_client is not installed' in caplog.text
+
+
+def test_client_records_without_prometheus(no_prometheus, monkeypatch):
+    monkeypatch.setattr(sys.modules['botlinkmaster'], 'metrics', no_prometheus)
+    base = BotLinkMasterBase(ConnectionConfig(host='10.0.0.1', username='admin',
+                                              password='secret', vendor='cisco_ios'))
+    base._prompt = 'SW#'
+    read = base._start_read('show clock', 10.0, now=0.0)
+    base._feed_read(read, b'show clock\r\n09:15\r\nSW#', 0.1)
+    assert base._finish_read(read, 0.2) == 'SW#'
+    base._fallback('pager')
+
+
+def test_disabled_port_starts_nothing():
+    assert not metrics.start_metrics_server(0)
+
+
+@pytest.fixture
+def sample():
+    """Current value of a sample in the default registry (skipped without prometheus_client)"""
+    registry = pytest.importorskip('prometheus_client').REGISTRY
+    return lambda name, **labels: registry.get_sample_value(name, labels) or 0.0
+
+
+def test_span_observes_when_the_block_raises(sample):
+    labels = {'command': 'test-span', 'stage': 'handler'}
+    before = sample('botlinkmaster_telegram_seconds_count', **labels)
+    with pytest.raises(ValueError):
+        with metrics.span(metrics.TELEGRAM_SECONDS, **labels):
+            raise ValueError
+    assert sample('botlinkmaster_telegram_seconds_count', **labels) == before + 1
+
+
+def test_telegram_handler_decorator(sample):
+    @metrics.telegram_handler('test-handler')
+    async def handler(value):
+        return value * 2
+
+    labels = {'command': 'test-handler', 'stage': 'handler'}
+    before = sample('botlinkmaster_telegram_seconds_count', **labels)
+    assert asyncio.run(handler(21)) == 42
+    assert handler.__name__ == 'handler'
+    assert sample('botlinkmaster_telegram_seconds_count', **labels) == before + 1
+
+
+def test_fallbacks_are_counted_per_vendor_and_kind(sample):
+    base = BotLinkMasterBase(ConnectionConfig(host='10.0.0.1', username='admin',
+                                              password='secret', vendor='datacom'))
+    before = sample('botlinkmaster_fallbacks_total', vendor='datacom', kind='pager')
+    base._fallback('pager')
+    assert sample('botlinkmaster_fallbacks_total', vendor='datacom', kind='pager') == before + 1
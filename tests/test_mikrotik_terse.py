@@ -0,0 +1,72 @@
+"""parse_mikrotik_terse: key=value rows, same result as the column parser"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import fixtures  # noqa: E402
+from botlinkmaster import BotLinkMaster  # noqa: E402
+from vendor_commands import parse_mikrotik_interfaces, parse_mikrotik_terse  # noqa: E402
+
+PROMPT = '[admin@CCR2216-CORE] >'
+ROW = re.compile(r'^\s*(\d+) (..) (\S+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)$')
+
+
+def as_terse(table: str) -> str:
+    """Same ports as "/interface ethernet print" output, in "print terse" form"""
+    lines = [f'{PROMPT} /interface print terse without-paging']
+    comment = ''
+    for line in table.splitlines():
+        if line.startswith(';;; '):
+            comment = line[4:]
+            continue
+        match = ROW.match(line)
+        if not match:
+            continue
+        index, flags, name, mtu, mac, arp, switch = match.groups()
+        fields = f"name={name} default-name={name} type=ether mtu={mtu} mac-address={mac}"
+        if comment:
+            fields = f"comment={comment} {fields}"
+        lines.append(f"{index:>2} {flags} {fields}")
+        comment = ''
+    lines.append(f'{PROMPT} ')
+    return '\r\n'.join(lines)
+
+
+def test_same_interfaces_as_the_column_parser():
+    table = fixtures.mikrotik_ethernet_print()
+    terse = parse_mikrotik_terse(as_terse(table), PROMPT)
+    columns = parse_mikrotik_interfaces(table)
+    assert len(terse) == 384
+    assert [{**row, 'type': ''} for row in terse] == columns
+    assert {row['type'] for row in terse} == {'ether'}
+
+
+def test_comment_with_spaces_and_slashes_stays_whole():
+    output = ' 3 RS comment=OLT HSGQ 1/1 ke ODC-07 name=ether4 default-name=ether4 type=ether\n'
+    assert parse_mikrotik_terse(output) == [{
+        'name': 'ether4', 'status': 'up', 'description': 'OLT HSGQ 1/1 ke ODC-07',
+        'flags': 'RS', 'type': 'ether',
+    }]
+
+
+def test_rows_without_flags_or_name_and_line_streams():
+    lines = iter([
+        '\x1b[m 0    name=sfp-sfpplus2 type=ether\r',
+        ' 1 X  type=bridge',
+        'Flags: X - DISABLED; R - RUNNING',
+        f'{PROMPT} ',
+    ])
+    assert parse_mikrotik_terse(lines, PROMPT) == [
+        {'name': 'sfp-sfpplus2', 'status': 'down', 'description': '', 'flags': '', 'type': 'ether'},
+    ]
+    assert parse_mikrotik_terse('') == []
+
+
+def test_single_interface_command_quotes_the_name():
+    assert BotLinkMaster._mikrotik_single_command('sfp-sfpplus1') == \
+        '/interface print terse without-paging where name="sfp-sfpplus1"'
+    assert BotLinkMaster._mikrotik_single_command('uplink "core"') == \
+        '/interface print terse without-paging where name="uplink \\"core\\""'
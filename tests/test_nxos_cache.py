@@ -0,0 +1,70 @@
+"""NX-OS running-config descriptions are cached per device"""
+
+import threading
+import time
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig, nxos_description_cache
+
+MARKER = '!Running configuration last done at: Mon Oct 12 09:15:01 2026'
+
+
+class NxosBot(BotLinkMaster):
+    """BotLinkMaster counting the running-config reads"""
+
+    def __init__(self, host='10.0.0.1'):
+        super().__init__(ConnectionConfig(host=host, username='admin', password='secret',
+                                          vendor='cisco_nxos'))
+        self.harvests = 0
+        self.marker = MARKER
+
+    def _get_nxos_config_marker(self):
+        return self.marker
+
+    def _harvest_nxos_descriptions(self):
+        self.harvests += 1
+        return {'Ethernet1/1': 'UPLINK-CORE', 'Eth1/1': 'UPLINK-CORE'}
+
+
+def setup_function():
+    nxos_description_cache.clear()
+
+
+def test_descriptions_are_revalidated_with_the_config_marker(monkeypatch):
+    bot = NxosBot()
+    assert bot._get_all_nxos_descriptions()['Ethernet1/1'] == 'UPLINK-CORE'
+    assert bot._get_all_nxos_descriptions()['Ethernet1/1'] == 'UPLINK-CORE'
+    assert bot.harvests == 1
+
+    # TTL expired, config unchanged: no new harvest
+    monkeypatch.setattr(BotLinkMaster, 'NXOS_DESCRIPTION_TTL', 0.001)
+    time.sleep(0.01)
+    assert bot._get_all_nxos_descriptions()['Ethernet1/1'] == 'UPLINK-CORE'
+    assert bot.harvests == 1
+
+    # Config changed: harvested again
+    bot.marker = MARKER.replace('09:15:01', '10:00:00')
+    time.sleep(0.01)
+    bot._get_all_nxos_descriptions()
+    assert bot.harvests == 2
+
+
+def test_concurrent_sessions_share_the_cache():
+    bots = [NxosBot() for _ in range(8)]
+    bots[0]._get_all_nxos_descriptions()
+    errors = []
+
+    def read(bot):
+        try:
+            for _ in range(200):
+                assert bot._get_all_nxos_descriptions()['Eth1/1'] == 'UPLINK-CORE'
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read, args=(bot,)) for bot in bots]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert sum(bot.harvests for bot in bots) == 1
@@ -0,0 +1,69 @@
+"""optical_command fallbacks and the learned optical command"""
+
+from botlinkmaster import BotLinkMaster, ConnectionConfig
+
+OPTICS = "  RX Power(dBm)     :-5.20\n  TX Power(dBm)     :-2.10\n"
+REJECTED = "Error: Unrecognized command found at '^' position.\n"
+
+
+class BatchBot(BotLinkMaster):
+    """BotLinkMaster answering execute_batch() with canned outputs"""
+
+    def __init__(self, outputs):
+        super().__init__(ConnectionConfig(host='10.0.0.1', username='admin',
+                                          password='secret', vendor='huawei'))
+        self.outputs = outputs
+        self.fallbacks = []
+        self.sent = []
+
+    def execute_batch(self, commands, wait_time=None):
+        self.sent.append(list(commands))
+        return (self.outputs + [""] * len(commands))[:len(commands)]
+
+    def execute_command(self, command, wait_time=None):
+        self.sent.append([command])
+        return self.outputs.pop(0)
+
+    def _fallback(self, kind):
+        self.fallbacks.append(kind)
+
+
+def test_first_candidate_found_counts_no_fallback():
+    bot = BatchBot([OPTICS, OPTICS, OPTICS])
+    result = bot.get_optical_power('GigabitEthernet0/0/1')
+    assert result['found']
+    assert result['command_used'] == 'display transceiver interface GigabitEthernet0/0/1'
+    assert bot.fallbacks == []
+
+
+def test_rejected_candidates_count_one_fallback_each():
+    bot = BatchBot([REJECTED, "", OPTICS])
+    result = bot.get_optical_power('GigabitEthernet0/0/1')
+    assert result['rx_power'] == -5.2
+    assert bot.fallbacks == ['optical_command', 'optical_command']
+
+
+def test_command_that_worked_is_sent_alone_next_time():
+    bot = BatchBot([REJECTED, OPTICS])
+    bot.get_optical_power('GigabitEthernet0/0/1')
+    assert bot.optical_command == 'display interface {interface} transceiver verbose'
+    assert bot.take_optical_update() == bot.optical_command
+    assert bot.take_optical_update() is None
+
+    bot.outputs = [OPTICS]
+    result = bot.get_optical_power('GigabitEthernet0/0/2')
+    assert result['found']
+    assert bot.sent[-1] == ['display interface GigabitEthernet0/0/2 transceiver verbose']
+    assert len(bot.sent) == 2
+
+
+def test_rejected_learned_command_is_forgotten():
+    bot = BatchBot([REJECTED, OPTICS])
+    bot.optical_command = bot._optical_command_saved = 'display transceiver interface {name} verbose'
+    result = bot.get_optical_power('GigabitEthernet0/0/1')
+    assert result['rx_power'] == -5.2
+    assert bot.sent[0] == ['display transceiver interface GigabitEthernet0/0/1 verbose']
+    assert 'display transceiver interface GigabitEthernet0/0/1 verbose' not in bot.sent[1]
+    assert bot.sent[1][0] == 'display transceiver interface GigabitEthernet0/0/1'
+    assert bot.optical_command == 'display transceiver interface {interface}'
+    assert bot.take_optical_update() == 'display transceiver interface {interface}'
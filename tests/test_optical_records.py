@@ -0,0 +1,80 @@
+"""iter_optical_records: one pass over bulk optical output, one record per port"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import fixtures  # noqa: E402
+from vendor_commands import OpticalParser, OpticalRecord  # noqa: E402
+
+CISCO_TABLE = """\
+show interface transceiver
+If device is externally calibrated, only calibrated values are printed.
+++ : high alarm, +  : high warning, -  : low warning, -- : low alarm.
+NA or N/A: not applicable, Tx: transmit, Rx: receive.
+mA: milliamperes, dBm: decibels (milliwatts).
+
+                                 Optical   Optical
+           Temperature  Voltage  Tx Power  Rx Power
+Port       (Celsius)    (Volts)  (dBm)     (dBm)
+---------  -----------  -------  --------  --------
+Gi1/0/1      33.5       3.29      -5.1      -7.2
+Gi1/0/2      31.0       3.28      -5.4     -29.9 --
+Gi1/0/3      30.2       3.30      -4.9       N/A
+SW-ACC-01#"""
+
+
+def test_nxos_detail_blocks():
+    output = fixtures.nxos_transceiver_details()
+    expected = {
+        name: float(rx)
+        for name, rx in re.findall(r'^(Ethernet\S+)\n.*?Rx Power\s+(-?\d+\.\d+)', output, re.M | re.S)
+    }
+    records = list(OpticalParser('cisco_nxos').iter_optical_records(output))
+    assert len(records) == 384
+    assert {r.interface: r.rx_power for r in records} == expected
+    assert records[0].voltage == 3.29 and records[0].bias is not None
+
+
+def test_huawei_brief_table():
+    output = fixtures.huawei_transceiver_brief()
+    rows = [line.split() for line in output.splitlines() if line.startswith('XGigabitEthernet')]
+    records = list(OpticalParser('huawei').iter_optical_records(output))
+    assert [(r.interface, r.rx_power, r.tx_power, r.temperature, r.bias) for r in records] == \
+        [(name, float(rx), float(tx), float(temp), float(bias)) for name, rx, tx, temp, bias in rows]
+
+
+def test_mikrotik_monitor_columns():
+    output = fixtures.mikrotik_monitor_all()
+    values = {line.split(':')[0].strip(): line.split(':', 1)[1].split()
+              for line in output.splitlines()[1:-1]}
+    records = list(OpticalParser('mikrotik').iter_optical_records(output))
+    assert [r.interface for r in records] == values['name']
+    assert [r.rx_power for r in records] == [float(v[:-3]) for v in values['sfp-rx-power']]
+    assert [r.voltage for r in records] == [float(v[:-1]) for v in values['sfp-supply-voltage']]
+
+
+def test_table_with_alarm_flags_and_missing_rx():
+    records = list(OpticalParser('cisco_ios').iter_optical_records(CISCO_TABLE))
+    assert records == [
+        OpticalRecord('Gi1/0/1', -7.2, -5.1, 33.5, None, 3.29),
+        OpticalRecord('Gi1/0/2', -29.9, -5.4, 31.0, None, 3.28),
+        OpticalRecord('Gi1/0/3', None, -4.9, 30.2, None, 3.30),
+    ]
+
+
+def test_lines_are_read_once():
+    lines = iter(fixtures.huawei_transceiver_brief().splitlines())
+    records = OpticalParser('huawei').iter_optical_records(lines)
+    assert next(records).interface == 'XGigabitEthernet1/0/1'
+    assert sum(1 for _ in records) == 383
+
+
+def test_parse_optical_table_keeps_ports_with_readings():
+    table = OpticalParser('cisco_ios').parse_optical_table(CISCO_TABLE)
+    assert list(table) == ['Gi1/0/1', 'Gi1/0/2', 'Gi1/0/3']
+    assert table['Gi1/0/1']['rx_power_dbm'] == '-7.20 dBm'
+    assert table['Gi1/0/3']['rx_power_dbm'] == 'N/A'
+    assert OpticalParser('cisco_ios').parse_optical_table('') == {}
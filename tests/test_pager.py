@@ -0,0 +1,98 @@
+"""Pager prompts are answered while reading and leave no trace in the output"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import device_sim  # noqa: E402
+from botlinkmaster import PAGER_ERASE, BotLinkMaster, BotLinkMasterBase, ConnectionConfig, Protocol  # noqa: E402
+
+HUAWEI_PAGER = b'  ---- More ----'
+# Cursor left + spaces + cursor left (Huawei), backspaces (Cisco), CR + spaces (Juniper)
+HUAWEI_ERASE = b'\x1b[42D                                          \x1b[42D'
+CISCO_ERASE = b'\x08' * 9 + b' ' * 9 + b'\x08' * 9
+JUNIPER_ERASE = b'\r' + b' ' * 12 + b'\r'
+
+
+@pytest.mark.parametrize('erase', [HUAWEI_ERASE, CISCO_ERASE, JUNIPER_ERASE])
+def test_erase_sequences(erase):
+    text = (erase + b'GE0/0/2  down').decode()
+    assert PAGER_ERASE.sub('', text) == 'GE0/0/2  down'
+
+
+def read_pages(vendor, prompt, chunks):
+    base = BotLinkMasterBase(ConnectionConfig(host='10.0.0.1', username='admin',
+                                              password='secret', vendor=vendor))
+    base._prompt = prompt
+    read = base._start_read('display interface brief', 10.0, now=0.0)
+    lines, answers = '', 0
+    for i, chunk in enumerate(chunks, 1):
+        event = base._feed_read(read, chunk, i * 0.1)
+        lines += event.lines
+        answers += event.answer_pager
+        if event.done:
+            break
+    return lines + base._finish_read(read, 1.0), answers, read, base
+
+
+def test_huawei_pages_join_without_pager_or_erase():
+    output, answers, read, base = read_pages('huawei', '<HW-AGG-01>', [
+        b'display interface brief\r\nGE0/0/1  up\r\n' + HUAWEI_PAGER,
+        HUAWEI_ERASE + b'GE0/0/2  down\r\n' + HUAWEI_PAGER,
+        HUAWEI_ERASE + b'GE0/0/3  up\r\n<HW-AGG-01>',
+    ])
+    assert output == 'display interface brief\r\nGE0/0/1  up\r\nGE0/0/2  down\r\nGE0/0/3  up\r\n<HW-AGG-01>'
+    assert answers == read.pages == 2
+    assert base.paging_mode == 'pager'
+
+
+def test_pager_prompt_split_across_reads():
+    output, answers, _, _ = read_pages('cisco_ios', 'SW-ACC-01#', [
+        b'display interface brief\r\nGi1/0/1  connected\r\n --Mo',
+        b're-- ',
+        CISCO_ERASE + b'Gi1/0/2  notconnect\r\nSW-ACC-01#',
+    ])
+    assert answers == 1
+    assert '--More--' not in output and '\x08' not in output
+    assert 'Gi1/0/1  connected\r\nGi1/0/2  notconnect\r\n' in output
+
+
+def test_pager_text_inside_a_line_is_kept():
+    output, answers, _, _ = read_pages('cisco_ios', 'SW-ACC-01#', [
+        b'display interface brief\r\nGi1/0/1  desc --More-- here\r\nSW-ACC-01#',
+    ])
+    assert answers == 0
+    assert 'Gi1/0/1  desc --More-- here' in output
+
+
+def profile(vendor, reject_disable_paging):
+    p = device_sim.make_profile(vendor, page_lines=4)
+    if reject_disable_paging:
+        p.responses = [r for r in p.responses if not r[0].match(p.disable_paging)]
+        p.disable_paging = ''
+    return p
+
+
+@pytest.mark.parametrize('vendor', ['cisco_ios', 'huawei', 'juniper'])
+def test_rejected_disable_paging_gives_the_same_output(vendor):
+    results = []
+    for reject in (False, True):
+        sim = device_sim.DeviceSimulator(profile(vendor, reject)).start(ssh_port=None, telnet_port=0)
+        bot = BotLinkMaster(ConnectionConfig(host='127.0.0.1', port=sim.telnet_port,
+                                             username='admin', password='admin',
+                                             protocol=Protocol.TELNET, vendor=vendor))
+        try:
+            assert bot.connect()
+            interfaces = bot.get_interfaces()
+            # Juniper's "syntax error" is only noticed at the first pager prompt
+            results.append((bot.paging_mode, interfaces))
+        finally:
+            bot.disconnect()
+            sim.stop()
+
+    (mode_off, paging_off), (mode_pager, paged) = results
+    assert (mode_off, mode_pager) == ('command', 'pager')
+    assert paged == paging_off and len(paged) > 4
@@ -0,0 +1,69 @@
+"""PatternBank: compiled once per VendorConfig, first matching pattern wins"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import fixtures  # noqa: E402
+from vendor_commands import OpticalParser, PatternBank, get_vendor_config  # noqa: E402
+
+# (rx, tx, status, description) of the benchmark fixtures
+EXPECTED = {
+    'cisco_ios': (-6.1, -2.3, 'up', 'UPLINK-TO-CORE-01 Gi1/0/48'),
+    'cisco_nxos': (-5.87, -2.41, 'up', 'xcon:OLT C300A 1/19/1'),
+    'huawei': (-4.86, -2.26, 'up', 'to-AGG-02 XGE0/0/3'),
+    'zte': (-7.35, -2.88, 'up', 'uplink-to-core xgei-1/3/0/7'),
+    'mikrotik': (-6.021, -2.456, 'up', ''),
+    'fiberhome': (-9.44, -1.92, 'up', 'to-OLT-AN5516 uplink'),
+    'bdcom': (-8.02, -2.17, 'up', 'uplink-OLT-P3310'),
+    'raisecom': (-11.76, -3.02, 'up', 'to-ISCOM-core'),
+    'datacom': (-13.42, -1.97, 'up', 'to-DM4170 uplink'),
+}
+
+
+def test_patterns_are_compiled_once_per_vendor():
+    config = get_vendor_config('huawei')
+    assert config.patterns is config.patterns
+    assert all(isinstance(p, re.Pattern) for p in config.patterns.rx + config.patterns.tx)
+
+
+def test_first_value_keeps_pattern_priority():
+    patterns = [re.compile(r'Rx\s+Power[:\s]+(-?\d+\.\d+)'), re.compile(r'(-?\d+\.\d+)\s*dBm')]
+    assert PatternBank.first_value(patterns, 'Tx -2.10 dBm\nRx Power: -7.50') == -7.5
+    assert PatternBank.first_value(patterns, 'Tx -2.10 dBm') == -2.1
+    assert PatternBank.first_value(patterns, 'no readings') is None
+
+
+def test_first_value_skips_patterns_without_a_number():
+    patterns = [re.compile(r'Rx\s+Power'), re.compile(r'Rx\s+Power\s+(N/A|-?\d+\.\d+)'),
+                re.compile(r'(-?\d+\.\d+)\s*dBm')]
+    assert PatternBank.first_value(patterns, 'Rx Power N/A -3.00 dBm') == -3.0
+
+
+def test_default_pager_pattern_is_always_tried_last():
+    pager = get_vendor_config('mikrotik').patterns.pager
+    assert len(pager) >= 2
+    assert pager[-1].search('\n --More-- ')
+
+
+@pytest.mark.parametrize('vendor', sorted(EXPECTED))
+def test_vendor_fixtures(vendor):
+    rx, tx, status, description = EXPECTED[vendor]
+    outputs = fixtures.VENDOR_OUTPUTS[vendor]
+    parser = OpticalParser(vendor)
+
+    result = parser.parse_optical_power(outputs['optical'])
+    assert (result['rx_power'], result['tx_power']) == (rx, tx)
+    assert result['found']
+    assert parser.parse_interface_status(outputs['interface']) == status
+    assert parser.parse_description(outputs['interface']) == description
+
+
+def test_status_down_and_unknown():
+    bank = get_vendor_config('cisco_ios').patterns
+    assert bank.search_status('GigabitEthernet0/1 is down, line protocol is down') == 'down'
+    assert bank.search_status('') == 'unknown'
@@ -0,0 +1,131 @@
+"""InterfacePoller: one poll stores every device, off the event loop thread"""
+
+import asyncio
+import threading
+
+from database import DatabaseManager
+from fleet_sweep import DeviceSweepResult
+from poller import InterfacePoller
+
+
+class ThreadRecordingDB(DatabaseManager):
+    """Remembers which thread ran each call"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = {}
+
+    def get_all_devices(self):
+        self.threads.setdefault('get_all_devices', set()).add(threading.get_ident())
+        return super().get_all_devices()
+
+    def record_interface_samples(self, device_name, rows):
+        self.threads.setdefault('record_interface_samples', set()).add(threading.get_ident())
+        return super().record_interface_samples(device_name, rows)
+
+
+async def poll_worker(device):
+    return DeviceSweepResult(device=device.name, vendor=device.vendor, rows=[
+        {'interface': 'Gi0/1', 'status': 'up', 'rx_power': -4.2, 'tx_power': -2.1},
+        {'interface': 'Gi0/2', 'status': 'down'},
+    ])
+
+
+def make_db(tmp_path):
+    db = ThreadRecordingDB(str(tmp_path / 'poller.db'))
+    for name in ('sw-a', 'sw-b'):
+        db.add_device(name, '10.0.0.1', 'admin', 'secret', vendor='cisco_ios')
+    return db
+
+
+def test_results_are_written_off_the_event_loop(tmp_path):
+    db = make_db(tmp_path)
+    poller = InterfacePoller(db, poll_worker)
+
+    async def poll():
+        await poller.poll_once()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(poll())
+    assert loop_thread not in db.threads['get_all_devices']
+    assert loop_thread not in db.threads['record_interface_samples']
+
+    for name in ('sw-a', 'sw-b'):
+        assert [s.rx_power for s in db.get_interface_samples(name, 'Gi0/1')] == [-4.2]
+        assert {r.interface_name for r in db.get_device_interfaces(name)} == {'Gi0/1', 'Gi0/2'}
+    assert poller.last_poll is not None
+
+
+def test_failed_device_keeps_its_cached_interfaces(tmp_path):
+    db = make_db(tmp_path)
+    db.record_interface_samples('sw-b', [{'interface': 'Gi0/9', 'status': 'up', 'rx_power': -3.0}])
+
+    async def worker(device):
+        if device.name == 'sw-b':
+            return DeviceSweepResult(device=device.name, vendor=device.vendor, error='Connection failed')
+        return await poll_worker(device)
+
+    asyncio.run(InterfacePoller(db, worker).poll_once())
+    assert {r.interface_name for r in db.get_device_interfaces('sw-a')} == {'Gi0/1', 'Gi0/2'}
+    assert {r.interface_name for r in db.get_device_interfaces('sw-b')} == {'Gi0/9'}
+
+
+def test_concurrency_limit(tmp_path):
+    db = make_db(tmp_path)
+    for i in range(6):
+        db.add_device(f'sw-{i}', f'10.0.1.{i}', 'admin', 'secret', vendor='cisco_ios')
+    active, peak = 0, 0
+
+    async def worker(device):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return await poll_worker(device)
+
+    asyncio.run(InterfacePoller(db, worker, concurrency=3).poll_once())
+    assert peak == 3
+    assert len(db.get_interface_samples('sw-5', 'Gi0/1')) == 1
+
+
+def test_old_samples_are_pruned(tmp_path):
+    db = make_db(tmp_path)
+    db.record_interface_samples('sw-a', [{'interface': 'Gi0/1', 'status': 'up', 'rx_power': -9.9}])
+    with db._lock:
+        db.conn.execute("UPDATE interface_samples SET sampled_at = datetime('now', '-8 days')")
+        db.conn.commit()
+
+    asyncio.run(InterfacePoller(db, poll_worker, retention_days=7).poll_once())
+    assert [s.rx_power for s in db.get_interface_samples('sw-a', 'Gi0/1')] == [-4.2]
+
+
+def test_interval_jitter_and_disabled_poller(tmp_path):
+    db = make_db(tmp_path)
+    poller = InterfacePoller(db, poll_worker, interval=60, jitter=10)
+    assert all(50 <= poller._next_delay() <= 70 for _ in range(200))
+    assert InterfacePoller(db, poll_worker, interval=2, jitter=30)._next_delay() >= 1.0
+
+    disabled = InterfacePoller(db, poll_worker, interval=0)
+
+    async def start():
+        disabled.start()
+        return disabled._task
+
+    assert not disabled.enabled
+    assert asyncio.run(start()) is None
+
+
+def test_loop_polls_until_stopped(tmp_path):
+    db = make_db(tmp_path)
+    poller = InterfacePoller(db, poll_worker, interval=60, jitter=0)
+
+    async def run():
+        poller.start()
+        while poller.last_poll is None:
+            await asyncio.sleep(0.01)
+        await poller.stop()
+        return poller._task
+
+    assert asyncio.run(run()) is None
+    assert len(db.get_interface_samples('sw-a', 'Gi0/1')) == 1
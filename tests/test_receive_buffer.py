@@ -0,0 +1,34 @@
+"""ReceiveBuffer removes pager prompts by byte offset"""
+
+from botlinkmaster import ReceiveBuffer
+
+
+def strip_suffix(buffer, suffix):
+    tail = buffer.tail
+    assert tail.endswith(suffix)
+    buffer.truncate_tail(len(tail) - len(suffix))
+
+
+def test_truncate_after_multibyte_and_invalid_bytes():
+    buffer = ReceiveBuffer(256)
+    buffer.append("Gi0/1  up  Überlink São Paulo\r\n".encode('utf-8'))
+    buffer.append(b"Gi0/2  down  bad\xff\xfe name\x80 --More-- ")
+
+    strip_suffix(buffer, " --More-- ")
+    assert buffer.take_all() == "Gi0/1  up  Überlink São Paulo\r\nGi0/2  down  bad name"
+
+
+def test_truncate_counts_invalid_bytes_inside_the_suffix():
+    buffer = ReceiveBuffer(256)
+    buffer.append(b"line one\r\n-- more \xff--")
+
+    strip_suffix(buffer, "-- more \udcff--")
+    assert buffer.take_all() == "line one\r\n"
+
+
+def test_truncate_with_window_cutting_a_character():
+    buffer = ReceiveBuffer(8)
+    buffer.append("ééééé--More--".encode('utf-8'))
+
+    strip_suffix(buffer, "--More--")
+    assert buffer.take_all() == "ééééé"
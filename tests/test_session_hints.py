@@ -0,0 +1,86 @@
+"""Session hints learned by one session are applied to the next one"""
+
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'benchmarks'))
+
+import device_sim  # noqa: E402
+from botlinkmaster import BotLinkMaster, ConnectionConfig  # noqa: E402
+from database import DatabaseManager  # noqa: E402
+from session_pool import SessionPool  # noqa: E402
+
+
+def make_pool(tmp_path):
+    return SessionPool(db=DatabaseManager(str(tmp_path / 'hints.db')))
+
+
+def test_structured_rejection_is_persisted(tmp_path):
+    pool = make_pool(tmp_path)
+    config = ConnectionConfig(host='10.0.0.1', username='admin', password='secret',
+                              vendor='juniper', name='mx-edge')
+    bot = BotLinkMaster(pool._apply_session_hint('mx-edge', config))
+    assert not bot.config.structured_rejected
+
+    assert bot._parse_structured_output('show interfaces terse | display json',
+                                        'error: syntax error, expecting <command>') is None
+    pool._save_learned('mx-edge', bot)
+    assert pool.db.get_session_hint('mx-edge').structured_rejected
+
+    # Next session: the structured command is not sent at all
+    next_bot = BotLinkMaster(pool._apply_session_hint('mx-edge', config))
+    assert next_bot.config.structured_rejected
+    assert next_bot._get_structured_interfaces() is None
+    assert not next_bot.take_structured_update()
+
+
+def test_structured_hint_keeps_paging_mode(tmp_path):
+    pool = make_pool(tmp_path)
+    pool.db.save_paging_mode('mx-edge', 'pager')
+    pool.db.save_structured_rejected('mx-edge')
+
+    hint = pool.db.get_session_hint('mx-edge')
+    assert hint.paging_mode == 'pager'
+    assert hint.structured_rejected
+
+
+def test_negotiated_algorithms_are_saved_and_offered_first(tmp_path):
+    sim = device_sim.DeviceSimulator(device_sim.make_profile('cisco_ios'))
+    sim.start(ssh_port=0, telnet_port=None)
+    try:
+        pool = make_pool(tmp_path)
+        config = ConnectionConfig(host='127.0.0.1', port=sim.ssh_port, username='admin',
+                                  password='admin', vendor='cisco_ios', name='sw-acc')
+        with pool.session('sw-acc', config) as bot:
+            assert bot.connected
+            negotiated = dict(bot.negotiated_algorithms)
+        pool.close_all()
+    finally:
+        sim.stop()
+
+    hint = pool.db.get_session_hint('sw-acc')
+    assert (hint.connection_method, hint.cipher, hint.key_type) == (
+        'transport', negotiated['cipher'], negotiated['key_type'])
+    assert pool._apply_session_hint('sw-acc', config).preferred_algorithms == {
+        'cipher': hint.cipher, 'key_type': hint.key_type}
+
+
+def test_unused_kex_column_is_dropped(tmp_path):
+    path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE device_session_hints (
+            device_name TEXT PRIMARY KEY, connection_method TEXT, kex TEXT,
+            cipher TEXT, key_type TEXT, failures INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute("INSERT INTO device_session_hints (device_name, connection_method, cipher) "
+                 "VALUES ('sw-acc', 'standard', 'aes128-ctr')")
+    conn.commit()
+    conn.close()
+
+    hint = DatabaseManager(path).get_session_hint('sw-acc')
+    assert (hint.connection_method, hint.cipher) == ('standard', 'aes128-ctr')
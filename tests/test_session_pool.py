@@ -0,0 +1,142 @@
+"""Session pool: reuse, eviction, liveness probe and saving what a session learned"""
+
+from dataclasses import replace
+
+import pytest
+
+import session_pool
+from botlinkmaster import BotLinkMaster, ConnectionConfig
+from database import DatabaseManager
+from session_pool import SessionPool
+
+
+class FakeBot(BotLinkMaster):
+    """BotLinkMaster without a device: connect() always works"""
+    opened = 0
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.alive = True
+        self.probes = 0
+
+    def connect(self) -> bool:
+        FakeBot.opened += 1
+        self.connected = True
+        self.connection_method = 'transport'
+        return True
+
+    def is_alive(self, timeout: float = 5.0) -> bool:
+        self.probes += 1
+        return self.connected and self.alive
+
+    def disconnect(self):
+        self.connected = False
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_pool, 'BotLinkMaster', FakeBot)
+    FakeBot.opened = 0
+    pool = SessionPool(db=DatabaseManager(str(tmp_path / 'pool.db')))
+    yield pool
+    pool.close_all()
+
+
+CONFIG = ConnectionConfig(host='10.0.0.1', username='admin', password='secret',
+                          vendor='cisco_ios', name='sw-core')
+
+
+def test_learned_stats_are_saved_when_the_operation_fails(pool):
+    with pytest.raises(RuntimeError):
+        with pool.session('sw-core', CONFIG) as bot:
+            stats = bot._latency_stats_for('show interfaces status')
+            bot._record_latency(stats, 'prompt', 0.2, 0.05, 0.4)
+            bot._apply_paging_result('terminal length 0', '% Invalid input detected')
+            raise RuntimeError('read failed')
+
+    assert not bot.connected
+    saved = pool.db.get_latency_stats('sw-core')
+    assert [s.samples for s in saved] == [1]
+    assert pool.db.get_session_hint('sw-core').paging_mode == 'pager'
+
+
+def test_optical_command_is_saved_and_reused(pool):
+    with pool.session('sw-core', CONFIG) as bot:
+        bot._set_optical_command('show interfaces {interface} transceiver')
+    assert pool.db.get_session_hint('sw-core').optical_command == \
+        'show interfaces {interface} transceiver'
+
+    pool.close_all()
+    with pool.session('sw-core', CONFIG) as bot:
+        assert bot.optical_command == 'show interfaces {interface} transceiver'
+        bot._set_optical_command(None)
+    assert pool.db.get_session_hint('sw-core').optical_command is None
+
+
+def test_session_is_reused_without_a_probe_when_recently_used(pool):
+    with pool.session('sw-core', CONFIG) as first:
+        pass
+    with pool.session('sw-core', CONFIG) as second:
+        pass
+    assert second is first and first.connected
+    assert (FakeBot.opened, first.probes) == (1, 0)
+    assert pool.stats() == {'sessions': 1, 'in_use': 0}
+
+
+def test_idle_session_is_probed_and_replaced_when_dead(pool):
+    pool.probe_after = 0
+    with pool.session('sw-core', CONFIG) as first:
+        pass
+    with pool.session('sw-core', CONFIG) as bot:
+        assert bot is first and first.probes == 1
+    first.alive = False
+    with pool.session('sw-core', CONFIG) as bot:
+        assert bot is not first and bot.connected
+    assert not first.connected and FakeBot.opened == 2
+
+
+def test_closed_transport_reconnects_without_a_probe(pool):
+    with pool.session('sw-core', CONFIG) as first:
+        first.connected = False
+    with pool.session('sw-core', CONFIG) as bot:
+        assert bot is not first
+    assert first.probes == 0 and FakeBot.opened == 2
+
+
+def test_idle_and_old_sessions_are_evicted(pool):
+    with pool.session('sw-core', CONFIG) as bot:
+        pass
+    with pool.session('sw-edge', replace(CONFIG, name='sw-edge')) as other:
+        pass
+    entry, other_entry = pool._sessions['sw-core'], pool._sessions['sw-edge']
+
+    entry.last_used -= pool.max_idle
+    pool.evict_expired()
+    assert entry.bot is None and not bot.connected
+    assert other_entry.bot is other and other.connected
+
+    other_entry.created_at -= pool.max_lifetime
+    pool.evict_expired()
+    assert other_entry.bot is None
+
+
+def test_busy_session_is_not_evicted(pool):
+    with pool.session('sw-core', CONFIG) as bot:
+        pool._sessions['sw-core'].last_used -= pool.max_idle
+        pool.evict_expired()
+        assert bot.connected
+        pool.close('sw-core')
+        assert bot.connected
+    assert not bot.connected
+
+
+def test_config_change_and_disabled_pooling_reopen(pool):
+    with pool.session('sw-core', CONFIG) as first:
+        pass
+    with pool.session('sw-core', replace(CONFIG, password='rotated')) as second:
+        assert second is not first and not first.connected
+
+    pool.max_idle = 0
+    with pool.session('sw-core', replace(CONFIG, password='rotated')) as third:
+        pass
+    assert not third.connected and pool._sessions['sw-core'].bot is None
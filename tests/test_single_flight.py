@@ -0,0 +1,59 @@
+"""SingleFlight shares one in-flight call between identical requests"""
+
+import asyncio
+
+from device_executor import SingleFlight
+
+
+def make_worker(calls, release):
+    async def worker():
+        calls.append(1)
+        await release.wait()
+        return {'status': 'up'}
+    return worker
+
+
+def test_identical_calls_share_one_worker():
+    async def main():
+        flight = SingleFlight()
+        calls, release = [], asyncio.Event()
+        key = ('sw-a', 'status', 'gi0/1')
+
+        first = asyncio.ensure_future(flight.run(key, make_worker(calls, release)))
+        second = asyncio.ensure_future(flight.run(key, make_worker(calls, release)))
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1
+
+        release.set()
+        results = await asyncio.gather(first, second)
+        return flight, calls, results
+
+    flight, calls, (first, second) = asyncio.run(main())
+    assert len(calls) == 1
+    assert first == second == {'status': 'up'}
+    assert first is second
+    assert flight.coalesced == 1
+    assert flight.in_flight == 0
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    async def main():
+        flight = SingleFlight()
+        calls, release = [], asyncio.Event()
+        key = ('sw-a', 'optical', 'gi0/1')
+
+        first = asyncio.ensure_future(flight.run(key, make_worker(calls, release)))
+        second = asyncio.ensure_future(flight.run(key, make_worker(calls, release)))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await second
+        return flight, calls, first, result
+
+    flight, calls, first, result = asyncio.run(main())
+    assert len(calls) == 1
+    assert first.cancelled()
+    assert result == {'status': 'up'}
+    assert flight.in_flight == 0
@@ -0,0 +1,112 @@
+"""stream_command yields the same lines as execute_command, as they arrive"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import device_sim  # noqa: E402
+from async_botlinkmaster import AsyncBotLinkMaster, aiter_lines  # noqa: E402
+from botlinkmaster import BotLinkMaster, ConnectionConfig, Protocol, iter_lines  # noqa: E402
+
+COMMAND = 'show interface status'
+
+
+class Chunks:
+    """Iterable of chunks that records close()"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+
+def test_iter_lines_joins_chunks_and_strips_ansi():
+    chunks = ['Gi1/0/1  \x1b[3', '2mconnected\x1b[0m\r\nGi1/0/2', '  notconnect\r\n', 'SW#']
+    assert list(iter_lines(chunks)) == ['Gi1/0/1  connected', 'Gi1/0/2  notconnect', 'SW#']
+
+
+def test_iter_lines_closes_the_source_when_stopped_early():
+    chunks = Chunks(['first\nsecond\n', 'third\n'])
+    lines = iter_lines(chunks)
+    assert next(lines) == 'first'
+    lines.close()
+    assert chunks.closed
+
+
+def test_aiter_lines_matches_iter_lines():
+    chunks = ['a\x1b[1', 'mb\r\n', 'c\n\nd', 'e']
+
+    async def source():
+        for chunk in chunks:
+            yield chunk
+
+    async def collect():
+        return [line async for line in aiter_lines(source())]
+
+    assert asyncio.run(collect()) == list(iter_lines(chunks)) == ['ab', 'c', '', 'de']
+
+
+@pytest.fixture(scope='module')
+def simulator():
+    sim = device_sim.DeviceSimulator(device_sim.make_profile('cisco_ios', scale=30))
+    sim.start(ssh_port=0, telnet_port=0)
+    yield sim
+    sim.stop()
+
+
+def config(simulator, protocol):
+    port = simulator.ssh_port if protocol == Protocol.SSH else simulator.telnet_port
+    return ConnectionConfig(host='127.0.0.1', port=port, username='admin', password='admin',
+                            protocol=protocol, vendor='cisco_ios')
+
+
+@pytest.mark.parametrize('protocol', [Protocol.SSH, Protocol.TELNET])
+def test_stream_matches_execute_command(simulator, protocol):
+    bot = BotLinkMaster(config(simulator, protocol))
+    assert bot.connect()
+    try:
+        lines = list(bot.stream_command(COMMAND))
+        output = bot.execute_command(COMMAND)
+    finally:
+        bot.disconnect()
+
+    assert len(lines) > 300
+    assert lines[0] == COMMAND and lines[-1] == 'SW-ACC-01#'
+    assert lines == output.replace('\r', '').split('\n')
+
+
+def test_closed_stream_does_not_leak_into_the_next_command(simulator):
+    bot = BotLinkMaster(config(simulator, Protocol.SSH))
+    assert bot.connect()
+    try:
+        expected = bot.execute_command(COMMAND)
+        lines = bot.stream_command(COMMAND)
+        assert next(lines) == COMMAND
+        lines.close()
+        assert bot.execute_command(COMMAND) == expected
+    finally:
+        bot.disconnect()
+
+
+def test_async_stream_matches_sync(simulator):
+    sync_bot = BotLinkMaster(config(simulator, Protocol.TELNET))
+    assert sync_bot.connect()
+    try:
+        expected = list(sync_bot.stream_command(COMMAND))
+    finally:
+        sync_bot.disconnect()
+
+    async def stream():
+        async with AsyncBotLinkMaster(config(simulator, Protocol.TELNET)) as bot:
+            return [line async for line in bot.stream_command(COMMAND)]
+
+    assert asyncio.run(stream()) == expected
@@ -0,0 +1,95 @@
+"""NX-OS / Junos JSON interface listings: full descriptions, no column scraping"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import fixtures  # noqa: E402
+from vendor_commands import (  # noqa: E402
+    parse_cisco_nxos_interfaces, parse_junos_json_interfaces, parse_nxos_json_interfaces,
+    parse_structured_interfaces
+)
+
+# The text table cuts states to 9 characters
+NXOS_STATES = {'notconnec': 'notconnect'}
+LONG_DESCRIPTION = 'uplink to BRAS-JKT-01 via ODC ring B (backup)'
+
+
+def nxos_json(rows, prompt='NX-CORE-01# '):
+    data = {'TABLE_interface': {'ROW_interface': rows}}
+    return f"show interface status | json\n{json.dumps(data, indent=1)}\n{prompt}"
+
+
+def nxos_rows_from_text(table: str):
+    """Rows of the fixed-width fixture (Port 0-14, Name 14-33, Status 33-43)"""
+    rows = []
+    for line in table.splitlines():
+        if not line.startswith('Eth'):
+            continue
+        state = line[33:43].strip()
+        rows.append({'interface': line[:14].strip(), 'name': line[14:33].strip(),
+                     'state': NXOS_STATES.get(state, state), 'vlan': 'trunk', 'type': '10Gbase-SR'})
+    return rows
+
+
+def test_nxos_json_matches_the_text_table():
+    table = fixtures.nxos_chassis_status()
+    rows = nxos_rows_from_text(table)
+    rows[0]['name'] = LONG_DESCRIPTION
+
+    interfaces = parse_nxos_json_interfaces(nxos_json(rows))
+    text = parse_cisco_nxos_interfaces(table)
+    assert len(interfaces) == 384
+    assert [(i['name'], i['status']) for i in interfaces] == [(t['name'], t['status']) for t in text]
+    assert [i['description'] for i in interfaces[1:]] == [t['description'] for t in text[1:]]
+    assert interfaces[0]['description'] == LONG_DESCRIPTION
+
+
+def test_nxos_single_row_and_unknown_state():
+    row = {'interface': 'Ethernet1/1', 'name': None, 'state': 'linkFlapErrDisabled'}
+    assert parse_nxos_json_interfaces(nxos_json(row)) == [
+        {'name': 'Ethernet1/1', 'status': 'unknown', 'description': ''},
+    ]
+
+
+def test_nxos_rejected_command():
+    output = "show interface status | json\n                          ^\n% Invalid command at '^' marker.\n"
+    assert parse_nxos_json_interfaces(output) is None
+    assert parse_structured_interfaces('nxos_json', output) is None
+
+
+def junos_json():
+    """JUNIPER_TABLE as "show interfaces terse | display json" (leaves wrapped in [{"data": ...}])"""
+    physical = []
+    for line in fixtures.JUNIPER_TABLE.splitlines()[2:]:
+        words = line.split()
+        if len(words) < 3:
+            continue
+        name, admin, link = words[:3]
+        leaf = {'name': [{'data': name}], 'admin-status': [{'data': admin}],
+                'oper-status': [{'data': link}]}
+        if '.' in name:
+            physical[-1].setdefault('logical-interface', []).append(leaf)
+        else:
+            physical.append(leaf)
+    physical[0]['description'] = [{'data': 'to PE-02 (core ring)'}]
+    data = {'interface-information': [{'physical-interface': physical}]}
+    return f"show interfaces terse | display json\n{{master:0}}\n{json.dumps(data)}\n\n{{master}}\nnoc@MX-PE-01> "
+
+
+def test_junos_json_physical_interfaces():
+    assert parse_junos_json_interfaces(junos_json()) == [
+        {'name': 'xe-0/0/0', 'status': 'up', 'description': 'to PE-02 (core ring)'},
+        {'name': 'xe-0/0/1', 'status': 'down', 'description': ''},
+        {'name': 'xe-0/0/2', 'status': 'down', 'description': ''},
+        {'name': 'ge-0/0/0', 'status': 'up', 'description': ''},
+        {'name': 'lo0', 'status': 'up', 'description': ''},
+    ]
+    assert parse_structured_interfaces('junos_json', junos_json()) == parse_junos_json_interfaces(junos_json())
+
+
+def test_junos_text_output_is_not_json():
+    assert parse_junos_json_interfaces(fixtures.JUNIPER_TABLE) is None
+    assert parse_structured_interfaces('unknown_format', junos_json()) is None
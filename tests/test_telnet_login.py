@@ -0,0 +1,48 @@
+"""Telnet login on a plain socket against the simulated device"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'benchmarks'))
+
+import device_sim  # noqa: E402
+from botlinkmaster import BotLinkMaster, ConnectionConfig, Protocol  # noqa: E402
+
+
+@pytest.fixture
+def simulator():
+    sim = device_sim.DeviceSimulator(device_sim.make_profile('cisco_ios'))
+    sim.start(ssh_port=None, telnet_port=0)
+    yield sim
+    sim.stop()
+
+
+def telnet_bot(sim, password='admin'):
+    return BotLinkMaster(ConnectionConfig(host='127.0.0.1', port=sim.telnet_port,
+                                          username='admin', password=password,
+                                          protocol=Protocol.TELNET, vendor='cisco_ios'))
+
+
+def test_login_without_fixed_sleeps(simulator):
+    bot = telnet_bot(simulator)
+    start = time.time()
+    try:
+        assert bot.connect()
+        assert time.time() - start < 1.0
+        assert bot.prompt == 'SW-ACC-01#'
+        assert bot.get_interfaces()
+        assert bot.is_alive()
+    finally:
+        bot.disconnect()
+
+
+def test_rejected_login_fails_fast(simulator):
+    bot = telnet_bot(simulator, password='wrong')
+    start = time.time()
+    assert not bot.connect()
+    assert time.time() - start < 5.0
+    assert not bot.connected
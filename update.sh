@@ -1,6 +1,6 @@
 #!/bin/bash
 #
-# BotLinkMaster v4.8.8 - Update Script
+# BotLinkMaster v4.9.0 - Update Script
 # 
 # Features:
 # - Version checking (local vs remote)
@@ -29,7 +29,7 @@ GITHUB_BRANCH="main"
 # ============================================
 
 REPO_URL="https://raw.githubusercontent.com/${GITHUB_USER}/${GITHUB_REPO}/${GITHUB_BRANCH}"
-SCRIPT_VERSION="4.8.8"
+SCRIPT_VERSION="4.9.0"
 
 # Colors
 RED='\033[0;31m'
@@ -49,6 +49,13 @@ UPDATE_FILES=(
     "vendor_commands.py"
     "database.py"
     "timezone_config.py"
+    "device_executor.py"
+    "session_pool.py"
+    "fleet_sweep.py"
+    "poller.py"
+    "metrics.py"
+    "async_botlinkmaster.py"
+    "adaptive_timeouts.py"
 )
 
 # Script files to update
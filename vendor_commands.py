@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """
-BotLinkMaster - Vendor Commands v4.8.8
+BotLinkMaster - Vendor Commands v4.9.0
 Multi-vendor support for routers and switches
 
+CHANGELOG v4.9.0:
+- Vendor regex patterns precompiled once per VendorConfig (PatternBank)
+- Bulk optical tables, structured interface output, column-offset tables
+- Per-vendor pager prompt patterns
+
 CHANGELOG v4.8.8:
 - FIX: Huawei VRP/Quidway (non-CloudEngine) status UNKNOWN
        Added patterns for "Physical state" and "Line protocol current state"
@@ -16,11 +21,14 @@ CHANGELOG v4.8.7:
 Note: OLT support will be available in v5.0.0
 
 Author: BotLinkMaster
-Version: 4.8.8
+Version: 4.9.0
 """
 
+import bisect
+import json
 import re
-from typing import Dict, Any, List
+import unicodedata
+from typing import Callable, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -66,6 +74,75 @@ class VendorConfig:
     description_pattern: str = ""
     interface_parser: str = "default"
     notes: str = ""
+    # v4.9.0: Machine-readable interface listing, tried before text scraping
+    # structured_format selects the decoder in STRUCTURED_PARSERS
+    structured_interface_command: str = ""
+    structured_format: str = ""
+    # v4.9.0: Pager prompts answered with a space while paging is on,
+    # tried before DEFAULT_PAGER_PATTERNS (matched at the end of the output)
+    pager_patterns: List[str] = field(default_factory=list)
+    # v4.9.0: Compiled patterns, built on first use (see PatternBank)
+    _patterns: Optional['PatternBank'] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def patterns(self) -> 'PatternBank':
+        if self._patterns is None:
+            self._patterns = PatternBank(self)
+        return self._patterns
+
+
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# v4.9.0: "--More--", " --More-- ", "---- More ----", "-- MORE --"
+DEFAULT_PAGER_PATTERNS = [
+    r"-+\s*More\s*-+\s*$",
+]
+
+
+class PatternBank:
+    """
+    v4.9.0: Precompiled patterns of one VendorConfig
+    
+    Compiled once per vendor instead of re.search(pattern_string, ...)
+    on every call (the re module cache is too small for all vendors).
+    Patterns are tried in priority order and stop at the first match.
+    """
+    
+    def __init__(self, config: 'VendorConfig'):
+        self.rx = [re.compile(p, PATTERN_FLAGS) for p in config.rx_power_patterns]
+        self.tx = [re.compile(p, PATTERN_FLAGS) for p in config.tx_power_patterns]
+        self.status_up = [re.compile(p, PATTERN_FLAGS) for p in config.status_up_patterns]
+        self.status_down = [re.compile(p, PATTERN_FLAGS) for p in config.status_down_patterns]
+        self.description = (
+            re.compile(config.description_pattern, re.IGNORECASE)
+            if config.description_pattern else None
+        )
+        self.pager = [re.compile(p, re.IGNORECASE)
+                      for p in config.pager_patterns + DEFAULT_PAGER_PATTERNS]
+    
+    @staticmethod
+    def first_value(patterns: List[Pattern], output: str) -> Optional[float]:
+        """Value (group 1) of the first pattern that matches"""
+        for pattern in patterns:
+            match = pattern.search(output)
+            if match:
+                try:
+                    return float(match.group(1))
+                except (IndexError, TypeError, ValueError):
+                    continue
+        return None
+    
+    def search_optical(self, output: str) -> Dict[str, Optional[float]]:
+        """RX/TX power - {'rx': float|None, 'tx': float|None}"""
+        return {'rx': self.first_value(self.rx, output), 'tx': self.first_value(self.tx, output)}
+    
+    def search_status(self, output: str) -> str:
+        """'up' if any up pattern matches, else 'down' if any down pattern, else 'unknown'"""
+        if any(p.search(output) for p in self.status_up):
+            return 'up'
+        if any(p.search(output) for p in self.status_down):
+            return 'down'
+        return 'unknown'
 
 
 VENDOR_CONFIGS: Dict[str, VendorConfig] = {
@@ -146,6 +223,8 @@ VENDOR_CONFIGS: Dict[str, VendorConfig] = {
         ],
         description_pattern=r"Description[:\s]+(.+?)(?:\n|$)",
         notes="Cisco Nexus switches",
+        structured_interface_command="show interface status | json",
+        structured_format="nxos_json",
     ),
     
     # ==========================================================================
@@ -266,6 +345,9 @@ VENDOR_CONFIGS: Dict[str, VendorConfig] = {
         status_down_patterns=[r"Physical link is Down"],
         description_pattern=r"Description[:\s]+(.+?)(?:\n|$)",
         notes="Juniper routers and switches",
+        structured_interface_command="show interfaces terse | display json",
+        structured_format="junos_json",
+        pager_patterns=[r"---\(more(?: \d+%)?\)---\s*$"],
     ),
     
     # ==========================================================================
@@ -308,6 +390,10 @@ VENDOR_CONFIGS: Dict[str, VendorConfig] = {
         ],
         description_pattern=r"comment[:\s]+(.+?)(?:\n|$)",
         notes="MikroTik RouterOS v4.8.7 - CRS326 compatibility fix",
+        structured_interface_command="/interface ethernet print terse without-paging",
+        structured_format="mikrotik_terse",
+        # v4.9.0: "monitor ... once" has no without-paging
+        pager_patterns=[r"-- \[Q quit\|[^\]]*\]\s*$"],
     ),
     
     # ==========================================================================
@@ -329,6 +415,7 @@ VENDOR_CONFIGS: Dict[str, VendorConfig] = {
         status_down_patterns=[r"Oper\s+State[:\s]+Down"],
         description_pattern=r"Description[:\s]+(.+?)(?:\n|$)",
         notes="Nokia SR-OS routers",
+        pager_patterns=[r"Press any key to continue \(Q to quit\)\s*$"],
     ),
     
     # ==========================================================================
@@ -350,6 +437,7 @@ VENDOR_CONFIGS: Dict[str, VendorConfig] = {
         status_down_patterns=[r"Status.+?Down", r"Link[:\s]+Down"],
         description_pattern=r"Name[:\s]+(.+?)(?:\n|$)",
         notes="HP ProCurve and Aruba switches",
+        pager_patterns=[r"-- MORE --, next page: Space.*$"],
     ),
     
     # ==========================================================================
@@ -609,27 +697,53 @@ def get_supported_vendors() -> List[str]:
     return [v.value for v in Vendor]
 
 
-def get_optical_commands(vendor: str, interface: str) -> List[str]:
-    """Get list of optical commands for a vendor and interface"""
+def get_optical_command_templates(vendor: str) -> List[str]:
+    """v4.9.0: Per-interface optical command templates ({interface}) in the order to try"""
     config = get_vendor_config(vendor)
-    commands = []
+    templates = []
     
     if config.show_optical_interface:
-        commands.append(config.show_optical_interface.format(interface=interface))
+        templates.append(config.show_optical_interface)
     if config.show_optical_detail:
-        cmd = config.show_optical_detail.format(interface=interface)
+        templates.append(config.show_optical_detail)
+    templates.extend(alt_cmd for alt_cmd in config.alt_optical_commands if '{interface}' in alt_cmd)
+    
+    return templates
+
+
+def get_optical_commands(vendor: str, interface: str) -> List[str]:
+    """Get list of optical commands for a vendor and interface"""
+    commands = []
+    for template in get_optical_command_templates(vendor):
+        cmd = template.format(interface=interface)
         if cmd not in commands:
             commands.append(cmd)
-    
-    for alt_cmd in config.alt_optical_commands:
-        if '{interface}' in alt_cmd:
-            cmd = alt_cmd.format(interface=interface)
-            if cmd not in commands:
-                commands.append(cmd)
-    
     return commands
 
 
+# v4.9.0: Module level patterns compiled once
+DBM_VALUE = re.compile(r'(-?\d+\.?\d*)\s*dBm', re.IGNORECASE)
+MIKROTIK_LINK_OK = re.compile(r'status[:\s]+link-ok', re.IGNORECASE)
+MIKROTIK_NO_LINK = re.compile(r'status[:\s]+no-link', re.IGNORECASE)
+
+
+def classify_signal(rx_power: Optional[float]) -> str:
+    """Signal status from RX power (dBm)"""
+    if rx_power is None:
+        return 'unknown'
+    if rx_power >= -8:
+        return 'excellent'
+    elif rx_power >= -14:
+        return 'good'
+    elif rx_power >= -20:
+        return 'fair'
+    elif rx_power >= -25:
+        return 'weak'
+    elif rx_power >= -30:
+        return 'very_weak'
+    return 'critical'
+
+
 class OpticalParser:
     """Parser for optical power readings"""
     
@@ -648,33 +762,20 @@ class OpticalParser:
         if not output:
             return result
         
-        # Try RX patterns
-        for pattern in self.config.rx_power_patterns:
-            match = re.search(pattern, output, re.IGNORECASE | re.MULTILINE)
-            if match:
-                try:
-                    result['rx_power'] = float(match.group(1))
-                    result['rx_power_dbm'] = f"{result['rx_power']:.2f} dBm"
-                    result['found'] = True
-                    break
-                except:
-                    continue
-        
-        # Try TX patterns
-        for pattern in self.config.tx_power_patterns:
-            match = re.search(pattern, output, re.IGNORECASE | re.MULTILINE)
-            if match:
-                try:
-                    result['tx_power'] = float(match.group(1))
-                    result['tx_power_dbm'] = f"{result['tx_power']:.2f} dBm"
-                    result['found'] = True
-                    break
-                except:
-                    continue
+        # v4.9.0: Precompiled RX/TX patterns (PatternBank)
+        values = self.config.patterns.search_optical(output)
+        if values['rx'] is not None:
+            result['rx_power'] = values['rx']
+            result['rx_power_dbm'] = f"{result['rx_power']:.2f} dBm"
+            result['found'] = True
+        if values['tx'] is not None:
+            result['tx_power'] = values['tx']
+            result['tx_power_dbm'] = f"{result['tx_power']:.2f} dBm"
+            result['found'] = True
         
         # Fallback: find any dBm values
         if not result['found']:
-            dbm_matches = re.findall(r'(-?\d+\.?\d*)\s*dBm', output, re.IGNORECASE)
+            dbm_matches = DBM_VALUE.findall(output)
             if len(dbm_matches) >= 2:
                 try:
                     result['tx_power'] = float(dbm_matches[0])
@@ -693,23 +794,46 @@ class OpticalParser:
                     pass
         
         # Signal status
-        if result['rx_power'] is not None:
-            rx = result['rx_power']
-            if rx >= -8:
-                result['signal_status'] = 'excellent'
-            elif rx >= -14:
-                result['signal_status'] = 'good'
-            elif rx >= -20:
-                result['signal_status'] = 'fair'
-            elif rx >= -25:
-                result['signal_status'] = 'weak'
-            elif rx >= -30:
-                result['signal_status'] = 'very_weak'
-            else:
-                result['signal_status'] = 'critical'
+        result['signal_status'] = classify_signal(result['rx_power'])
         
         return result
     
+    def iter_optical_records(self, lines: Union[str, Iterable[str]]) -> Iterator['OpticalRecord']:
+        """
+        v4.9.0: Stream OpticalRecord for every port of a bulk optical output
+        
+        Accepts the output text or any iterable of lines (single pass).
+        See iter_optical_records() for the supported layouts.
+        """
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+        return iter_optical_records(lines, self.config.patterns)
+    
+    def parse_optical_table(self, output: str) -> Dict[str, Dict[str, Any]]:
+        """
+        v4.9.0: Parse bulk optical output ("all transceivers") per interface
+        
+        Returns {interface_name: result} with the parse_optical_power() keys
+        plus temperature, bias and voltage. Only interfaces with an RX or
+        TX reading are included.
+        """
+        results = {}
+        if not output:
+            return results
+        
+        for record in self.iter_optical_records(output):
+            result = {
+                'rx_power': record.rx_power, 'tx_power': record.tx_power,
+                'rx_power_dbm': f"{record.rx_power:.2f} dBm" if record.rx_power is not None else 'N/A',
+                'tx_power_dbm': f"{record.tx_power:.2f} dBm" if record.tx_power is not None else 'N/A',
+                'temperature': record.temperature, 'bias': record.bias, 'voltage': record.voltage,
+                'signal_status': classify_signal(record.rx_power),
+                'raw_output': '', 'found': True,
+            }
+            results.setdefault(record.interface, result)
+        
+        return results
+    
     def parse_interface_status(self, output: str) -> str:
         """Parse interface status from output"""
         if not output:
@@ -717,24 +841,19 @@ class OpticalParser:
         
         # MikroTik special handling
         if self.vendor.lower() == 'mikrotik':
-            if re.search(r'status[:\s]+link-ok', output, re.IGNORECASE):
+            if MIKROTIK_LINK_OK.search(output):
                 return 'up'
-            if re.search(r'status[:\s]+no-link', output, re.IGNORECASE):
+            if MIKROTIK_NO_LINK.search(output):
                 return 'down'
         
-        for pattern in self.config.status_up_patterns:
-            if re.search(pattern, output, re.IGNORECASE | re.MULTILINE):
-                return 'up'
-        for pattern in self.config.status_down_patterns:
-            if re.search(pattern, output, re.IGNORECASE | re.MULTILINE):
-                return 'down'
-        return 'unknown'
+        return self.config.patterns.search_status(output)
     
     def parse_description(self, output: str) -> str:
         """Parse interface description from output"""
-        if not output or not self.config.description_pattern:
+        description = self.config.patterns.description
+        if not output or not description:
             return ''
-        match = re.search(self.config.description_pattern, output, re.IGNORECASE)
+        match = description.search(output)
         return match.group(1).strip() if match else ''
 
 
@@ -742,53 +861,77 @@ class OpticalParser:
 # MIKROTIK OUTPUT CLEANER - v4.8.7
 # =============================================================================
 
-def clean_mikrotik_output(output: str) -> str:
-    """Clean MikroTik output - remove prompts, paging, and command echoes"""
-    if not output:
-        return output
-    
-    # Remove ANSI escape codes
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    output = ansi_escape.sub('', output)
-    
-    # Remove carriage returns
-    output = output.replace('\r', '')
-    
-    lines = output.split('\n')
-    cleaned_lines = []
-    
+ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+MIKROTIK_PROMPT_LINE = re.compile(r'^\s*\[[\w\-@]+\]\s*[/\w]*[>#]\s*$')
+MIKROTIK_PROMPT_SUFFIX = re.compile(r'\s*\[[\w\-@]+\]\s*[/\w]*[>#]\s*$')
+
+
+def as_lines(output: Union[str, Iterable[str]]) -> Iterable[str]:
+    """v4.9.0: Parsers accept the whole output or a stream of lines"""
+    if isinstance(output, str):
+        return output.split('\n')
+    return output
+
+
+def iter_clean_mikrotik_lines(lines: Iterable[str], prompt: Optional[str] = None) -> Iterator[str]:
+    """v4.9.0: Line by line version of clean_mikrotik_output()"""
     for line in lines:
+        # Remove ANSI escape codes and carriage returns
+        line = ANSI_ESCAPE.sub('', line).replace('\r', '')
+        
         # Skip paging prompt lines
         if line.strip().startswith('-- [') or line.strip() == '-- more --':
             continue
         
+        if prompt:
+            stripped = line.rstrip()
+            if stripped.endswith(prompt):
+                # Skip pure prompt lines, remove prompt from END of line only
+                if not stripped[:-len(prompt)].strip():
+                    continue
+                line = stripped[:-len(prompt)].rstrip()
+            yield line
+            continue
+        
         # Skip pure prompt lines
-        if re.match(r'^\s*\[[\w\-@]+\]\s*[/\w]*[>#]\s*$', line):
+        if MIKROTIK_PROMPT_LINE.match(line):
             continue
         
         # Remove prompt from END of line only
-        line = re.sub(r'\s*\[[\w\-@]+\]\s*[/\w]*[>#]\s*$', '', line)
-        
-        cleaned_lines.append(line)
+        yield MIKROTIK_PROMPT_SUFFIX.sub('', line)
+
+
+def clean_mikrotik_output(output: str, prompt: Optional[str] = None) -> str:
+    """
+    Clean MikroTik output - remove prompts, paging, and command echoes
+    
+    v4.9.0: If the literal session prompt is known (BotLinkMaster.prompt),
+    prompts are stripped with plain string comparison instead of regex.
+    """
+    if not output:
+        return output
     
-    return '\n'.join(cleaned_lines)
+    return '\n'.join(iter_clean_mikrotik_lines(output.split('\n'), prompt))
 
 
 # =============================================================================
 # MIKROTIK INTERFACE PARSER - v4.8.7
 # =============================================================================
 
-def parse_mikrotik_interfaces(output: str) -> List[Dict[str, Any]]:
-    """Parse MikroTik /interface ethernet print without-paging output - v4.8.7"""
+def parse_mikrotik_interfaces(output: Union[str, Iterable[str]],
+                              prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Parse MikroTik /interface ethernet print without-paging output - v4.8.7
+    
+    v4.9.0: output may be a stream of lines (BotLinkMaster.stream_command)
+    """
     interfaces = []
     
     if not output:
         return interfaces
     
     # Clean output
-    output = clean_mikrotik_output(output)
-    
-    lines = output.split('\n')
+    lines = iter_clean_mikrotik_lines(as_lines(output), prompt)
     current_comment = ''
     
     for line in lines:
@@ -890,44 +1033,310 @@ def parse_mikrotik_interfaces(output: str) -> List[Dict[str, Any]]:
     return interfaces
 
 
-# =============================================================================
-# CISCO NX-OS INTERFACE PARSER (v4.8.7 baseline - unchanged)
-# =============================================================================
+# v4.9.0: "/interface print terse" row: " 0 RS name=ether1 default-name=ether1 ..."
+MIKROTIK_TERSE_ROW = re.compile(r'^\s*(\d+)\s+(?:([A-Za-z]+)\s+)?(\S+=.*)$')
+MIKROTIK_TERSE_KEY = re.compile(r'(?:^|\s)([\w\-.]+)=')
 
-def parse_cisco_nxos_interfaces(output: str) -> List[Dict[str, Any]]:
-    """Parse Cisco NX-OS show interface status output"""
+
+def parse_mikrotik_terse(output: Union[str, Iterable[str]],
+                         prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    v4.9.0: Parse MikroTik "print terse" output (one key=value row per item)
+    
+    Same result format as parse_mikrotik_interfaces(). Values are not
+    quoted in terse mode, so a value runs until the next " key=".
+    """
     interfaces = []
     
     if not output:
         return interfaces
     
-    lines = output.split('\n')
-    in_data = False
+    for line in iter_clean_mikrotik_lines(as_lines(output), prompt):
+        match = MIKROTIK_TERSE_ROW.match(line)
+        if not match:
+            continue
+        
+        flags = (match.group(2) or '').upper()
+        body = match.group(3)
+        keys = list(MIKROTIK_TERSE_KEY.finditer(body))
+        values = {}
+        for i, key in enumerate(keys):
+            end = keys[i + 1].start() if i + 1 < len(keys) else len(body)
+            values[key.group(1)] = body[key.end():end].strip()
+        
+        name = values.get('name')
+        if not name:
+            continue
+        
+        interfaces.append({
+            'name': name,
+            'status': 'up' if 'R' in flags else 'down',
+            'description': values.get('comment', ''),
+            'flags': flags,
+            'type': values.get('type', ''),
+        })
+    
+    return interfaces
+
+
+# =============================================================================
+# INTERFACE TABLE PARSER - v4.9.0
+# =============================================================================
+# Fixed-width "show interface status/brief/description" tables. Column
+# offsets are taken once from the header (or from a separator line with
+# one dash run per column); every row is then split by position, so
+# multi-word descriptions and states ("administratively down") stay whole.
+#
+#   Port      Name               Status       Vlan       Duplex  Speed Type
+#   Gi1/0/1   Uplink to core     connected    trunk      a-full a-1000 10/100/1000BaseTX
+
+INTERFACE_COLUMN_HEADERS = ('port', 'ports', 'interface', 'interfaces', 'intf')
+# Ruijie prints the slot after a space: "GigabitEthernet 0/1"
+INTERFACE_ROW_NAME = re.compile(r'^[A-Za-z0-9][\w\-/:.()]*(?: \d+(?:[/:.]\d+)*)?$')
+INTERFACE_DOWN_STATES = (
+    'notconnec', 'disabled', 'err-disabled', 'sfp', 'xcvr', 'notpresent',
+    'inactive', 'suspended', 'linkflap',
+)
+# CJK characters take two terminal columns; the device pads the table by
+# columns, so each one is followed by this filler while splitting a row
+WIDE_CHAR_FILLER = '\x00'
+
+
+def pad_wide_chars(line: str) -> str:
+    """Line with string offsets equal to terminal columns"""
+    return ''.join(
+        c + WIDE_CHAR_FILLER if unicodedata.east_asian_width(c) in 'WF' else c for c in line
+    )
+
+
+def classify_interface_column(header: str) -> Optional[str]:
+    """Field of an interface table column from its header text (None = ignored)"""
+    h = header.lower().strip()
+    if not h:
+        return None
+    if h in INTERFACE_COLUMN_HEADERS:
+        return 'interface'
+    if h.startswith(('desc', 'alias', 'name')):
+        return 'description'
+    if h.startswith(('status', 'phy', 'link', 'state')):
+        return 'status'
+    if h.startswith('protocol'):
+        return 'protocol'
+    for name in ('vlan', 'duplex', 'speed', 'type'):
+        if h.startswith(name):
+            return name
+    return None
+
+
+def build_interface_table(header: str, separator: Optional[str] = None
+                          ) -> Optional[List[Tuple[int, Optional[str]]]]:
+    """
+    Columns [(start offset, field)] of an interface table
+    
+    Uses the dash runs of the separator line when it has one per column,
+    otherwise the header words. Adjacent columns of the same field
+    ("Alias Name") are merged. Returns None unless the first column is
+    the interface and there is a status, protocol or description column.
+    """
+    runs = [m.span() for m in DASH_RUN.finditer(separator)] if separator else []
+    
+    if len(runs) >= 2:
+        spans = [(start, header[start:runs[i + 1][0] if i + 1 < len(runs) else None])
+                 for i, (start, _) in enumerate(runs)]
+    else:
+        spans = [(m.start(), m.group()) for m in ROW_TOKEN.finditer(header)]
+    
+    columns: List[Tuple[int, Optional[str]]] = []
+    for start, text in spans:
+        name = classify_interface_column(text)
+        if columns and name and columns[-1][1] == name:
+            continue
+        if columns and name == 'interface':
+            # Nokia "Port State", "Port Mode" - only the first is the name
+            name = None
+        columns.append((start, name))
+    
+    if not columns or columns[0][1] != 'interface':
+        return None
+    if not {name for _, name in columns} & {'status', 'protocol', 'description'}:
+        return None
+    return columns
+
+
+def interface_state(value: str) -> str:
+    """'up' / 'down' / 'unknown' from a status or protocol cell"""
+    v = value.lower().lstrip('*^#')
+    if not v:
+        return 'unknown'
+    if v.startswith(('up', 'connected', 'running')) or v == 'yes':
+        return 'up'
+    # H3C "ADM" = administratively down, Nokia Link "No"
+    if 'down' in v or v in ('adm', 'no') or v.startswith(INTERFACE_DOWN_STATES):
+        return 'down'
+    return 'unknown'
+
+
+def parse_interface_row(line: str, columns: List[Tuple[int, Optional[str]]],
+                        starts: Optional[List[int]] = None) -> Optional[Dict[str, Any]]:
+    """
+    One table row -> interface dict (None if the line is not a row)
+    
+    Each word goes to the column its center falls in, so values that
+    start a little before their header (right aligned speeds) or overflow
+    it (long interface names) still land in the right column.
+    """
+    if starts is None:
+        starts = [start for start, _ in columns]
+    
+    padded = not line.isascii()
+    if padded:
+        line = pad_wide_chars(line)
+    
+    length = len(line)
+    aligned = all(
+        b >= length or line[b].isspace() or line[b - 1].isspace() for b in starts[1:]
+    )
+    
+    if aligned:
+        # Fast path: no word crosses a column start - plain slicing
+        cells = {}
+        for i, (start, name) in enumerate(columns):
+            if name:
+                value = line[start:starts[i + 1] if i + 1 < len(starts) else None].strip()
+                if value:
+                    cells[name] = value
+    else:
+        spans: Dict[str, List[int]] = {}
+        for m in ROW_TOKEN.finditer(line):
+            index = max(0, bisect.bisect_right(starts, (m.start() + m.end()) // 2) - 1)
+            name = columns[index][1]
+            if not name:
+                continue
+            span = spans.get(name)
+            if span:
+                span[1] = m.end()
+            else:
+                spans[name] = [m.start(), m.end()]
+        cells = {name: line[a:b] for name, (a, b) in spans.items()}
+    
+    if padded:
+        cells = {name: value.replace(WIDE_CHAR_FILLER, '') for name, value in cells.items()}
+    
+    iface_name = cells.pop('interface', '')
+    if not INTERFACE_ROW_NAME.match(iface_name) or not any(c.isdigit() for c in iface_name):
+        return None
+    
+    status = interface_state(cells.pop('status', ''))
+    protocol = cells.pop('protocol', '')
+    if status == 'unknown' and protocol:
+        status = interface_state(protocol)
+    
+    description = cells.pop('description', '')
+    interface = {
+        'name': iface_name,
+        'status': status,
+        'description': '' if description == '--' else description,
+    }
+    interface.update(cells)
+    return interface
+
+
+def iter_interface_table(lines: Iterable[str],
+                         fallback: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
+                         ) -> Iterator[Dict[str, Any]]:
+    """
+    Single pass over interface table output, yielding one dict per row
+    
+    Lines outside a recognised table are given to fallback (the old
+    whitespace-split parser of the caller), if any.
+    """
+    header = None
+    columns = None
+    starts: List[int] = []
+    rows = 0
     
     for line in lines:
-        line = line.strip()
+        line = line.rstrip('\r\n')
+        stripped = line.strip()
+        if not stripped:
+            continue
+        
+        if columns is not None and TABLE_SEPARATOR.match(line):
+            # Segmented separator under the header refines the offsets
+            if not rows and len(DASH_RUN.findall(line)) >= 2:
+                columns = build_interface_table(header, line) or columns
+                starts = [start for start, _ in columns]
+            continue
+        
+        first = stripped.split(None, 1)[0].lower()
+        if first in INTERFACE_COLUMN_HEADERS:
+            table = build_interface_table(line)
+            if table:
+                header, columns, rows = line, table, 0
+                starts = [start for start, _ in columns]
+                continue
         
-        if not line:
+        if columns is not None:
+            row = parse_interface_row(line, columns, starts)
+            if row:
+                rows += 1
+                yield row
             continue
         
+        if fallback:
+            row = fallback(line)
+            if row:
+                yield row
+
+
+def parse_interface_table(output: Union[str, Iterable[str]],
+                          fallback: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
+                          ) -> List[Dict[str, Any]]:
+    """Parse a fixed-width interface table (see iter_interface_table)"""
+    if not output:
+        return []
+    return list(iter_interface_table(as_lines(output), fallback))
+
+
+# =============================================================================
+# CISCO NX-OS INTERFACE PARSER (v4.8.7 baseline)
+# =============================================================================
+
+def parse_cisco_nxos_interfaces(output: Union[str, Iterable[str]]) -> List[Dict[str, Any]]:
+    """
+    Parse Cisco NX-OS show interface status output
+    
+    v4.9.0: output may be a stream of lines (BotLinkMaster.stream_command)
+    v4.9.0: Rows are split by the header column offsets (iter_interface_table),
+            the whitespace split below is only used without a header
+    """
+    if not output:
+        return []
+    
+    in_data = False
+    
+    def legacy_row(line: str) -> Optional[Dict[str, Any]]:
+        nonlocal in_data
+        line = line.strip()
+        
         if '----' in line:
             in_data = True
-            continue
+            return None
         
         if 'Port' in line and 'Status' in line:
-            continue
+            return None
         
         if not in_data:
-            continue
+            return None
         
         parts = line.split()
         if len(parts) < 3:
-            continue
+            return None
         
         iface_name = parts[0]
         
         if not any(c.isdigit() for c in iface_name):
-            continue
+            return None
         
         status = 'unknown'
         description = ''
@@ -950,15 +1359,398 @@ def parse_cisco_nxos_interfaces(output: str) -> List[Dict[str, Any]]:
             if desc != '--':
                 description = desc
         
-        interfaces.append({
+        return {
             'name': iface_name,
             'status': status,
             'description': description,
+        }
+    
+    return parse_interface_table(output, legacy_row)
+
+
+# =============================================================================
+# STRUCTURED OUTPUT PARSERS - v4.9.0
+# =============================================================================
+# Decoders for VendorConfig.structured_interface_command. They return the
+# same interface dicts as the text parsers, or None if the output is not
+# in the expected format (device rejected the command) so the caller can
+# fall back to text scraping.
+
+NXOS_STATE_STATUS = {
+    'connected': 'up',
+    'up': 'up',
+    'notconnect': 'down',
+    'disabled': 'down',
+    'down': 'down',
+    'err-disabled': 'down',
+    'sfpabsent': 'down',
+    'xcvrabsent': 'down',
+    'noopermembers': 'down',
+}
+
+
+def extract_json(output: str) -> Optional[Any]:
+    """
+    First JSON object in output
+    
+    Skips the command echo, prompts and non-JSON braces such as the
+    Junos "{master:0}" banner.
+    """
+    if not output:
+        return None
+    decoder = json.JSONDecoder()
+    start = output.find('{')
+    while start >= 0:
+        try:
+            value, _ = decoder.raw_decode(output, start)
+            return value
+        except ValueError:
+            start = output.find('{', start + 1)
+    return None
+
+
+def _as_list(value: Any) -> List[Any]:
+    """NX-OS returns a dict instead of a list for single-row tables"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def parse_nxos_json_interfaces(output: str) -> Optional[List[Dict[str, Any]]]:
+    """Parse "show interface status | json" (full descriptions, no columns)"""
+    data = extract_json(output)
+    if not isinstance(data, dict) or 'TABLE_interface' not in data:
+        return None
+    
+    interfaces = []
+    for row in _as_list((data.get('TABLE_interface') or {}).get('ROW_interface')):
+        name = str(row.get('interface', '')).strip()
+        if not name:
+            continue
+        state = str(row.get('state', '')).strip().lower()
+        description = str(row.get('name', '') or '').strip()
+        interfaces.append({
+            'name': name,
+            'status': NXOS_STATE_STATUS.get(state, 'unknown'),
+            'description': '' if description == '--' else description,
         })
+    return interfaces
+
+
+def _junos_value(item: Dict[str, Any], key: str) -> str:
+    """Junos JSON wraps every leaf as [{"data": value}]"""
+    value = item.get(key)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get('data')
+    return str(value).strip() if value is not None else ''
+
+
+def parse_junos_json_interfaces(output: str) -> Optional[List[Dict[str, Any]]]:
+    """Parse "show interfaces terse | display json" (physical interfaces)"""
+    data = extract_json(output)
+    if not isinstance(data, dict) or 'interface-information' not in data:
+        return None
     
+    interfaces = []
+    for info in _as_list(data.get('interface-information')):
+        for phy in _as_list(info.get('physical-interface')):
+            name = _junos_value(phy, 'name')
+            if not name:
+                continue
+            oper = _junos_value(phy, 'oper-status').lower()
+            interfaces.append({
+                'name': name,
+                'status': oper if oper in ('up', 'down') else 'unknown',
+                'description': _junos_value(phy, 'description'),
+            })
     return interfaces
 
 
+def parse_mikrotik_terse_interfaces(output: str) -> Optional[List[Dict[str, Any]]]:
+    """Parse "print terse" - None if no key=value rows came back"""
+    return parse_mikrotik_terse(output) or None
+
+
+STRUCTURED_PARSERS = {
+    'nxos_json': parse_nxos_json_interfaces,
+    'junos_json': parse_junos_json_interfaces,
+    'mikrotik_terse': parse_mikrotik_terse_interfaces,
+}
+
+
+def parse_structured_interfaces(structured_format: str, output: str) -> Optional[List[Dict[str, Any]]]:
+    """Decode a structured interface listing (None = use text scraping)"""
+    parser = STRUCTURED_PARSERS.get(structured_format)
+    if not parser or not output:
+        return None
+    return parser(output)
+
+
+# =============================================================================
+# OPTICAL TABLE PARSER - v4.9.0
+# =============================================================================
+
+class OpticalRecord(NamedTuple):
+    interface: str
+    rx_power: Optional[float]
+    tx_power: Optional[float]
+    temperature: Optional[float]
+    bias: Optional[float]
+    voltage: Optional[float]
+
+
+OPTICAL_FIELDS = ('rx_power', 'tx_power', 'temperature', 'bias', 'voltage')
+
+# Interface header line of a per-interface block in bulk output
+# e.g. "Ethernet1/1", "XGigabitEthernet0/0/1 transceiver information:",
+#      "Physical interface: xe-0/0/0", "10GE1/0/1 transceiver information:"
+INTERFACE_HEADER = re.compile(
+    r'^(?:Physical\s+interface:\s*)?(\d*[A-Za-z][A-Za-z\-]*\d+(?:[/:]\d+)*(?:\.\d+)?)(?:\s|:|$)'
+)
+INTERFACE_TOKEN = re.compile(r'^\d*[A-Za-z][\w\-]*\d+(?:[/:.]\d+)*$')
+
+TABLE_SEPARATOR = re.compile(r'^[\s=+|]*-{3,}[\s\-=+|]*$')
+DASH_RUN = re.compile(r'-{2,}')
+HEADER_TOKEN = re.compile(r'\S+(?: \S+)*')
+ROW_TOKEN = re.compile(r'\S+')
+NUMBER = re.compile(r'[-+]?\d+(?:\.\d+)?')
+
+# Readings in a per-interface block (RX/TX use the vendor patterns)
+BLOCK_VALUE_PATTERNS = {
+    'temperature': re.compile(r'Temp(?:erature)?\s*(?:\([^)]*\))?[:\s|]+(-?\d+\.?\d*)', re.IGNORECASE),
+    'bias': re.compile(r'(?:Bias(?:\s+Current)?|Current)\s*(?:\(\s*mA\s*\))?[:\s|]+(-?\d+\.?\d*)', re.IGNORECASE),
+    'voltage': re.compile(r'(?:Voltage|Vcc)\s*(?:\(\s*V\s*\))?[:\s|]+(-?\d+\.?\d*)', re.IGNORECASE),
+}
+
+# MikroTik "/interface ethernet monitor [find] once" - one column per port
+MIKROTIK_MONITOR_LINE = re.compile(r'^\s*([\w\-]+):(?:\s+|$)')
+MIKROTIK_MONITOR_KEYS = {
+    'sfp-rx-power': 'rx_power',
+    'sfp-tx-power': 'tx_power',
+    'sfp-temperature': 'temperature',
+    'sfp-tx-bias-current': 'bias',
+    'sfp-supply-voltage': 'voltage',
+}
+
+
+def classify_optical_column(header: str) -> Optional[str]:
+    """Field of a table column from its header text (None = ignored)"""
+    h = header.lower().replace(' ', '')
+    if not h:
+        return None
+    if h.startswith(('port', 'interface', 'intf', 'name')):
+        return 'interface'
+    power = 'power' in h or 'dbm' in h or 'pwr' in h
+    if 'bias' in h or '(ma)' in h or ('current' in h and not power):
+        return 'bias'
+    if 'temp' in h:
+        return 'temperature'
+    if 'volt' in h or 'vcc' in h:
+        return 'voltage'
+    if ('rx' in h or 'receive' in h) and (power or h in ('rx', 'rx(dbm)')):
+        return 'rx_power'
+    if ('tx' in h or 'transmit' in h) and (power or h in ('tx', 'tx(dbm)')):
+        return 'tx_power'
+    return None
+
+
+def build_optical_table(header_lines: List[str], separator: Optional[str] = None
+                        ) -> Optional[List[Tuple[int, Optional[str]]]]:
+    """
+    Columns [(start offset, field)] of a bulk optical table
+    
+    Column positions come from the dash runs of the separator line when
+    it has one per column (Cisco), otherwise from the header words
+    separated by 2+ spaces. Returns None unless the table has an
+    interface column and an RX or TX column.
+    """
+    runs = [m.span() for m in DASH_RUN.finditer(separator)] if separator else []
+    
+    if len(runs) >= 2:
+        columns = []
+        for i, (start, end) in enumerate(runs):
+            stop = runs[i + 1][0] if i + 1 < len(runs) else None
+            text = ' '.join(line[start:stop].strip() for line in header_lines)
+            columns.append((start, classify_optical_column(text)))
+    elif header_lines:
+        columns = [(m.start(), classify_optical_column(m.group()))
+                   for m in HEADER_TOKEN.finditer(header_lines[-1])]
+    else:
+        return None
+    
+    fields = {f for _, f in columns}
+    if 'interface' not in fields or not fields & {'rx_power', 'tx_power'}:
+        return None
+    return columns
+
+
+def parse_optical_row(line: str, columns: List[Tuple[int, Optional[str]]]) -> Optional[OpticalRecord]:
+    """One table row -> OpticalRecord (None if the line is not a row)"""
+    tokens = [(m.start(), m.group()) for m in ROW_TOKEN.finditer(line)]
+    if not tokens:
+        return None
+    
+    values: Dict[str, str] = {}
+    if len(tokens) == len(columns):
+        for (_, token), (_, name) in zip(tokens, columns):
+            if name:
+                values[name] = token
+    else:
+        # Misaligned row (alarm flags, empty cells) - place tokens by offset
+        for start, token in tokens:
+            center = start + len(token) // 2
+            index = 0
+            for i, (col_start, _) in enumerate(columns):
+                if col_start <= center:
+                    index = i
+            name = columns[index][1]
+            if name and name not in values:
+                values[name] = token
+    
+    interface = values.get('interface', '')
+    if not INTERFACE_TOKEN.match(interface):
+        return None
+    
+    readings = {}
+    for name in OPTICAL_FIELDS:
+        match = NUMBER.search(values.get(name, ''))
+        readings[name] = float(match.group()) if match else None
+    return OpticalRecord(interface, **readings)
+
+
+def _block_record(interface: str, block: List[str], bank: 'PatternBank') -> Optional[OpticalRecord]:
+    text = '\n'.join(block)
+    rx = bank.first_value(bank.rx, text)
+    tx = bank.first_value(bank.tx, text)
+    if rx is None and tx is None:
+        return None
+    extra = {}
+    for name, pattern in BLOCK_VALUE_PATTERNS.items():
+        match = pattern.search(text)
+        extra[name] = float(match.group(1)) if match else None
+    return OpticalRecord(interface, rx, tx, **extra)
+
+
+def _mikrotik_records(names: List[Tuple[int, str]], values: Dict[str, List[str]]) -> Iterator[OpticalRecord]:
+    for i, (_, name) in enumerate(names):
+        readings = {}
+        for field_name in OPTICAL_FIELDS:
+            column = values.get(field_name, [])
+            match = NUMBER.search(column[i]) if i < len(column) else None
+            readings[field_name] = float(match.group()) if match else None
+        if readings['rx_power'] is not None or readings['tx_power'] is not None:
+            yield OpticalRecord(name, **readings)
+
+
+def _mikrotik_columns(line: str, offsets: List[int]) -> List[str]:
+    return [line[start:offsets[i + 1] if i + 1 < len(offsets) else None].strip()
+            for i, start in enumerate(offsets)]
+
+
+def iter_optical_records(lines: Iterable[str], bank: 'PatternBank') -> Iterator[OpticalRecord]:
+    """
+    Single pass over bulk optical output, yielding one OpticalRecord per port
+    
+    Layouts:
+    - Tables with a header row, e.g. Cisco "show interface transceiver",
+      Huawei "display transceiver brief" (one row per port)
+    - Per-interface blocks, e.g. NX-OS "show interface transceiver details",
+      Huawei "display transceiver", Juniper "show interfaces diagnostics optics"
+    - MikroTik "/interface ethernet monitor [find] once" (one column per port)
+    """
+    recent: List[str] = []          # candidate table header lines
+    columns = None                  # active table
+    table_rows = 0
+    block_name = None               # active per-interface block
+    block: List[str] = []
+    mt_names: List[Tuple[int, str]] = []    # active MikroTik group
+    mt_values: Dict[str, List[str]] = {}
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
+        
+        # MikroTik monitor group: "name:" line, then one "key:" line per field
+        key_match = MIKROTIK_MONITOR_LINE.match(line)
+        if key_match and key_match.group(1) == 'name':
+            if mt_names:
+                yield from _mikrotik_records(mt_names, mt_values)
+            start = key_match.end()
+            mt_names = [(start + m.start(), m.group()) for m in ROW_TOKEN.finditer(line[start:])]
+            mt_values = {}
+            continue
+        if mt_names:
+            if key_match:
+                field_name = MIKROTIK_MONITOR_KEYS.get(key_match.group(1))
+                if field_name:
+                    mt_values[field_name] = _mikrotik_columns(line, [o for o, _ in mt_names])
+                continue
+            yield from _mikrotik_records(mt_names, mt_values)
+            mt_names = []
+        
+        # Table rows
+        if columns is not None:
+            if TABLE_SEPARATOR.match(line):
+                if not table_rows and len(DASH_RUN.findall(line)) >= 2:
+                    columns = build_optical_table(recent, line) or columns
+                continue
+            record = parse_optical_row(line, columns)
+            if record:
+                table_rows += 1
+                if record.rx_power is not None or record.tx_power is not None:
+                    yield record
+                continue
+            columns = None
+            recent = []
+        
+        if not line.strip():
+            recent = []
+            if block_name:
+                block.append(line)
+            continue
+        
+        # Table header: separator under header text, or a header row
+        if TABLE_SEPARATOR.match(line):
+            table = build_optical_table(recent, line)
+            if table:
+                if block_name:
+                    record = _block_record(block_name, block, bank)
+                    if record:
+                        yield record
+                    block_name, block = None, []
+                columns, table_rows = table, 0
+            continue
+        
+        if not line[0].isspace():
+            table = build_optical_table([line])
+            if table and not INTERFACE_HEADER.match(line):
+                recent = [line]
+                columns, table_rows = table, 0
+                continue
+            
+            match = INTERFACE_HEADER.match(line)
+            if match:
+                if block_name:
+                    record = _block_record(block_name, block, bank)
+                    if record:
+                        yield record
+                block_name, block = match.group(1), []
+                recent = [line]
+                continue
+        
+        recent = (recent + [line])[-3:]
+        if block_name:
+            block.append(line)
+    
+    if mt_names:
+        yield from _mikrotik_records(mt_names, mt_values)
+    if block_name:
+        record = _block_record(block_name, block, bank)
+        if record:
+            yield record
+
+
 # =============================================================================
 # INTERFACE NAME EXPANSION
 # =============================================================================